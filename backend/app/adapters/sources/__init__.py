@@ -6,11 +6,20 @@ This module provides:
 - JobSourceAdapter base class
 - Concrete adapters for Adzuna, RemoteOK, The Muse, USAJobs
 - Factory function to get adapters by source name
+- Shared HTTP client lifecycle (get/close_source_http_client)
+- Shared response cache (get_source_response_cache)
+- Per-source rate limiters (get_source_rate_limiter)
 """
 
 from app.adapters.sources.adzuna import AdzunaAdapter
 from app.adapters.sources.base import JobSourceAdapter, RawJob, SearchParams
+from app.adapters.sources.http_client import (
+    close_source_http_client,
+    get_source_http_client,
+)
+from app.adapters.sources.rate_limit import get_source_rate_limiter
 from app.adapters.sources.remoteok import RemoteOKAdapter
+from app.adapters.sources.response_cache import get_source_response_cache
 from app.adapters.sources.themuse import TheMuseAdapter
 from app.adapters.sources.usajobs import USAJobsAdapter
 
@@ -32,7 +41,8 @@ def get_source_adapter(source_name: str) -> JobSourceAdapter:
             Case-insensitive matching.
 
     Returns:
-        Instantiated adapter for the specified source.
+        Instantiated adapter for the specified source, using the shared
+        source HTTP client, response cache, and source rate limiter.
 
     Raises:
         ValueError: If source_name is not a known source.
@@ -43,12 +53,20 @@ def get_source_adapter(source_name: str) -> JobSourceAdapter:
         raise ValueError(
             f"Unknown source: '{source_name}'. Known sources: {known_sources}"
         )
-    return adapter_class()
+    return adapter_class(
+        http_client=get_source_http_client(),
+        response_cache=get_source_response_cache(),
+        rate_limiter=get_source_rate_limiter(adapter_class.rate_budget),
+    )
 
 
 __all__ = [
     "AdzunaAdapter",
+    "close_source_http_client",
     "get_source_adapter",
+    "get_source_http_client",
+    "get_source_rate_limiter",
+    "get_source_response_cache",
     "JobSourceAdapter",
     "RawJob",
     "RemoteOKAdapter",
@@ -7,20 +7,24 @@ Coverage: Good US/UK job market coverage.
 
 Coordinates with:
   - adapters/sources/base.py (JobSourceAdapter, RawJob, SearchParams)
+  - adapters/sources/pagination.py (fetch_pages)
+  - adapters/sources/rate_limit.py (RateBudget)
   - services/discovery/scouter_errors.py (SourceError, SourceErrorType, RateLimitInfo)
   - core/config.py (settings — adzuna_app_id, adzuna_app_key)
 
 Called by: services/discovery/job_fetch_service.py (AdzunaAdapter).
 """
 
-import asyncio
 import logging
+import math
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
 
 from app.adapters.sources.base import JobSourceAdapter, RawJob, SearchParams
+from app.adapters.sources.pagination import fetch_pages
+from app.adapters.sources.rate_limit import RateBudget
 from app.core.config import settings
 from app.services.discovery.scouter_errors import (
     RateLimitInfo,
@@ -31,7 +35,6 @@ from app.services.discovery.scouter_errors import (
 logger = logging.getLogger(__name__)
 
 _ADZUNA_BASE_URL = "https://api.adzuna.com/v1/api/jobs/us/search"
-_RATE_LIMIT_SLEEP_SECONDS = 2.4  # 25 req/min cap → 1 request per 2.4s
 _REQUEST_TIMEOUT_SECONDS = 30.0
 _MAX_PAGES = (
     10  # Hard ceiling: 250 results max per poll (25 × 10) to protect weekly quota
@@ -69,6 +72,10 @@ class AdzunaAdapter(JobSourceAdapter):
     - Free tier sufficient at MVP scale
     """
 
+    # 25 req/min cap, shared by every concurrent poll in the process
+    rate_budget = RateBudget(source="Adzuna", requests_per_second=25 / 60)
+    max_pages_in_flight = 3
+
     @property
     def source_name(self) -> str:
         """Return 'Adzuna' as the canonical source name."""
@@ -78,8 +85,10 @@ class AdzunaAdapter(JobSourceAdapter):
         """Fetch jobs from Adzuna API.
 
         REQ-034 §5.3: Paginates until 0 results or partial page, up to
-        _MAX_PAGES pages. Rate-limits to 25 req/min via asyncio.sleep(2.4)
-        between pages. Returns [] if credentials are not configured.
+        _MAX_PAGES pages. Once page 1 reports the total ``count``, the
+        remaining pages are requested concurrently; every request takes a
+        token from the shared Adzuna rate limiter (25 req/min across all
+        polls). Returns [] if credentials are not configured.
 
         Args:
             params: Search parameters — keywords, location, remote_only,
@@ -99,90 +108,116 @@ class AdzunaAdapter(JobSourceAdapter):
             )
             return []
 
-        app_id = settings.adzuna_app_id
-        app_key = settings.adzuna_app_key.get_secret_value()
+        query_params: dict[str, Any] = {
+            "app_id": settings.adzuna_app_id,
+            "app_key": settings.adzuna_app_key.get_secret_value(),
+            "results_per_page": params.results_per_page,
+            "what": " ".join(params.keywords),
+        }
+
+        if params.remote_only:
+            query_params["where"] = "remote"
+        elif params.location:
+            query_params["where"] = params.location
+
+        if params.max_days_old is not None:
+            query_params["max_days_old"] = params.max_days_old
+
+        def last_page(page: int, results: list[dict[str, Any]], count: Any) -> int:
+            # Stop when empty page or partial page (fewer than requested)
+            if len(results) == 0 or len(results) < params.results_per_page:
+                return page
+            if isinstance(count, int) and count > 0:
+                return max(page, math.ceil(count / params.results_per_page))
+            return page + 1
+
+        async with self._http_session(_REQUEST_TIMEOUT_SECONDS) as client:
+            pages = await fetch_pages(
+                lambda page: self._fetch_page(client, page, query_params),
+                lambda page, data: last_page(
+                    page, data.get("results", []), data.get("count")
+                ),
+                first_page=1,
+                max_pages=_MAX_PAGES,
+                max_in_flight=self.max_pages_in_flight,
+            )
 
         jobs: list[RawJob] = []
-        page = 1
-
-        async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT_SECONDS) as client:
-            while page <= _MAX_PAGES:
-                query_params: dict[str, Any] = {
-                    "app_id": app_id,
-                    "app_key": app_key,
-                    "results_per_page": params.results_per_page,
-                    "what": " ".join(params.keywords),
-                }
-
-                if params.remote_only:
-                    query_params["where"] = "remote"
-                elif params.location:
-                    query_params["where"] = params.location
-
-                if params.max_days_old is not None:
-                    query_params["max_days_old"] = params.max_days_old
-
+        for data in pages:
+            for item in data.get("results", []):
                 try:
-                    response = await client.get(
-                        f"{_ADZUNA_BASE_URL}/{page}",
-                        params=query_params,
-                    )
-                except httpx.TimeoutException as exc:
-                    # Security: do not include exc in message — httpx exception
-                    # repr can embed the full request URL including api_key.
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.TIMEOUT,
-                        message=f"Adzuna request timed out on page {page}",
-                    ) from exc
-                except httpx.RequestError as exc:
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.NETWORK_ERROR,
-                        message=f"Adzuna network error on page {page}",
-                    ) from exc
-
-                if response.status_code == 429:
-                    retry_after_raw = response.headers.get("Retry-After")
-                    rate_limit_info: RateLimitInfo | None = None
-                    if retry_after_raw:
-                        clamped = min(int(retry_after_raw), _MAX_RETRY_AFTER_SECONDS)
-                        rate_limit_info = RateLimitInfo(retry_after_seconds=clamped)
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.RATE_LIMITED,
-                        message="Adzuna rate limit exceeded",
-                        rate_limit_info=rate_limit_info,
+                    jobs.append(self.normalize(item))
+                except (KeyError, ValueError) as exc:
+                    logger.warning(
+                        "Failed to normalize Adzuna job (id=%s): %s; skipping",
+                        item.get("id", "unknown"),
+                        exc,
                     )
 
-                if response.status_code >= 400:
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.API_DOWN,
-                        message=f"Adzuna API error: HTTP {response.status_code}",
-                    )
+        return jobs
 
-                data = response.json()
-                results: list[dict[str, Any]] = data.get("results", [])
+    async def _fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        page: int,
+        query_params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Fetch and decode one Adzuna results page.
 
-                for item in results:
-                    try:
-                        jobs.append(self.normalize(item))
-                    except (KeyError, ValueError) as exc:
-                        logger.warning(
-                            "Failed to normalize Adzuna job (id=%s): %s; skipping",
-                            item.get("id", "unknown"),
-                            exc,
-                        )
+        Args:
+            client: Client from _http_session().
+            page: 1-indexed page number.
+            query_params: Query parameters shared by all pages.
 
-                # Stop when empty page or partial page (fewer than requested)
-                if len(results) == 0 or len(results) < params.results_per_page:
-                    break
+        Returns:
+            Decoded response body.
 
-                page += 1
-                await asyncio.sleep(_RATE_LIMIT_SLEEP_SECONDS)
+        Raises:
+            SourceError: On API failure (see fetch_jobs).
+        """
+        try:
+            response = await self._get(
+                client,
+                f"{_ADZUNA_BASE_URL}/{page}",
+                params=query_params,
+            )
+        except httpx.TimeoutException as exc:
+            # Security: do not include exc in message — httpx exception
+            # repr can embed the full request URL including api_key.
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.TIMEOUT,
+                message=f"Adzuna request timed out on page {page}",
+            ) from exc
+        except httpx.RequestError as exc:
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.NETWORK_ERROR,
+                message=f"Adzuna network error on page {page}",
+            ) from exc
+
+        if response.status_code == 429:
+            retry_after_raw = response.headers.get("Retry-After")
+            rate_limit_info: RateLimitInfo | None = None
+            if retry_after_raw:
+                clamped = min(int(retry_after_raw), _MAX_RETRY_AFTER_SECONDS)
+                rate_limit_info = RateLimitInfo(retry_after_seconds=clamped)
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.RATE_LIMITED,
+                message="Adzuna rate limit exceeded",
+                rate_limit_info=rate_limit_info,
+            )
 
-        return jobs
+        if response.status_code >= 400:
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.API_DOWN,
+                message=f"Adzuna API error: HTTP {response.status_code}",
+            )
+
+        data: dict[str, Any] = response.json()
+        return data
 
     def normalize(self, raw_response: dict[str, Any]) -> RawJob:
         """Convert Adzuna API response to RawJob format.
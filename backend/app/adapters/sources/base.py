@@ -3,7 +3,10 @@
 REQ-007 §6.3: JobSourceAdapter interface with fetch_jobs() and normalize().
 
 Coordinates with:
-  - (standalone — no app-internal imports)
+  - adapters/sources/response_cache.py (SourceResponseCache, SourceResponse)
+  - adapters/sources/rate_limit.py (RateBudget, TokenBucket)
+  - adapters receive the shared client from adapters/sources/http_client.py,
+    the shared cache, and their source's token bucket via their constructor
 
 Called by:
   - adapters/sources/adzuna.py, adapters/sources/remoteok.py,
@@ -15,9 +18,16 @@ Called by:
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
+
+import httpx
+
+from app.adapters.sources.rate_limit import RateBudget, TokenBucket
+from app.adapters.sources.response_cache import SourceResponse, SourceResponseCache
 
 # Valid remoteok tag format: alphanumeric with dots, underscores, hyphens (max 64 chars).
 _TAG_RE = re.compile(r"^[a-zA-Z0-9._-]{1,64}$")
@@ -142,8 +152,95 @@ class JobSourceAdapter(ABC):
     - Enforces consistent interface across sources
     - Enables type checking and IDE support
     - Makes testing via mock implementations straightforward
+
+    Args:
+        http_client: Shared long-lived client (adapters/sources/http_client.py).
+            When None, each fetch opens and closes its own client.
+        response_cache: Shared response cache
+            (adapters/sources/response_cache.py). When None, every request
+            goes to the network.
+        rate_limiter: Token bucket for this source shared by all polls
+            (adapters/sources/rate_limit.py). When None, requests are not
+            throttled.
+
+    Attributes:
+        rate_budget: Source request budget the factories build the shared
+            token bucket from; None for sources without pacing.
+        max_pages_in_flight: Concurrent page requests per fetch_jobs() call.
     """
 
+    rate_budget: ClassVar[RateBudget | None] = None
+    max_pages_in_flight: ClassVar[int] = 1
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        response_cache: SourceResponseCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+    ) -> None:
+        self._http_client = http_client
+        self._response_cache = response_cache
+        self._rate_limiter = rate_limiter
+
+    @asynccontextmanager
+    async def _http_session(self, timeout: float) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the client for one fetch_jobs() call.
+
+        The shared client is yielded as-is (its pool outlives the call and
+        its timeouts apply); otherwise a per-call client is opened with
+        the adapter's timeout and closed afterwards.
+
+        Args:
+            timeout: Request timeout in seconds for a per-call client.
+
+        Yields:
+            httpx.AsyncClient to issue requests with.
+        """
+        if self._http_client is not None:
+            yield self._http_client
+            return
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            yield client
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        params: Mapping[str, Any],
+        headers: Mapping[str, str] | None = None,
+    ) -> SourceResponse:
+        """Issue a GET request, through the response cache when configured.
+
+        Every request that reaches the network first takes a token from
+        the source's rate limiter; cache hits do not.
+
+        Args:
+            client: Client from _http_session().
+            url: Request URL without query string.
+            params: Query parameters.
+            headers: Optional request headers.
+
+        Returns:
+            httpx.Response from the network, or a CachedResponse.
+
+        Raises:
+            httpx.RequestError: On timeout or network failure.
+        """
+        if self._response_cache is not None:
+            return await self._response_cache.get(
+                client,
+                url,
+                params=params,
+                headers=headers,
+                rate_limiter=self._rate_limiter,
+            )
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        if headers is None:
+            return await client.get(url, params=params)
+        return await client.get(url, params=params, headers=headers)
+
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -0,0 +1,79 @@
+"""Shared HTTP client for job source adapters.
+
+REQ-034 §5.3: Every persona poll calls several source APIs. Opening a new
+httpx.AsyncClient per fetch_jobs() call paid DNS and TLS handshakes on
+every poll. One long-lived client is shared by all adapters instead:
+httpx keeps a keep-alive connection pool per origin, so repeated polls
+against the same API reuse warm connections.
+
+HTTP/2 is enabled through the ``h2`` package (declared via the
+``httpx[http2]`` extra in pyproject.toml); httpx negotiates it per host
+via ALPN and falls back to HTTP/1.1. Environments installed without the
+extra keep working over HTTP/1.1.
+
+The client is created lazily on first use and closed by the application
+lifespan (close_source_http_client).
+
+Coordinates with:
+  - adapters/sources/base.py — JobSourceAdapter accepts the client
+
+Called by: services/discovery/job_fetch_service.py, adapters/sources/__init__.py,
+main.py (shutdown), and unit tests.
+"""
+
+import importlib.util
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Shared defaults for all source APIs (adapters used 30s per request)
+_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# Pool sizing: the poll scheduler runs up to 5 persona polls at once, each
+# fanning out to 4 sources; keep-alive connections idle out after a minute.
+_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client: httpx.AsyncClient | None = None
+
+
+def create_source_http_client() -> httpx.AsyncClient:
+    """Create an HTTP client configured for source adapter traffic.
+
+    Returns:
+        New httpx.AsyncClient with shared timeouts, pool limits, and
+        HTTP/2 when available. The caller owns closing it.
+    """
+    return httpx.AsyncClient(
+        timeout=_TIMEOUT,
+        limits=_LIMITS,
+        http2=_HTTP2_AVAILABLE,
+    )
+
+
+def get_source_http_client() -> httpx.AsyncClient:
+    """Return the process-wide source HTTP client, creating it if needed.
+
+    Returns:
+        Shared httpx.AsyncClient. Adapters must not close it.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_source_http_client()
+        logger.debug("Created source HTTP client (http2=%s)", _HTTP2_AVAILABLE)
+    return _client
+
+
+async def close_source_http_client() -> None:
+    """Close the shared source HTTP client (application shutdown)."""
+    global _client
+    client, _client = _client, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
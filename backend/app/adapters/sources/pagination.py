@@ -0,0 +1,88 @@
+"""Concurrent page fetching for paginated job source adapters.
+
+REQ-034 §5.3: Adzuna, USAJobs, and The Muse report how many pages a
+query has on the first page. Instead of walking the remaining pages one
+at a time, fetch_pages() keeps several page requests in flight; the
+per-source token bucket (adapters/sources/rate_limit.py) still decides
+when each request may go out.
+
+Coordinates with:
+  - (standalone — no app-internal imports)
+
+Called by: adapters/sources/adzuna.py, adapters/sources/usajobs.py,
+adapters/sources/themuse.py, and unit tests.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+PageT = TypeVar("PageT")
+
+
+async def fetch_pages(
+    fetch_page: Callable[[int], Awaitable[PageT]],
+    last_page: Callable[[int, PageT], int],
+    *,
+    first_page: int,
+    max_pages: int | None,
+    max_in_flight: int,
+) -> list[PageT]:
+    """Fetch a paginated result set with bounded concurrency.
+
+    The first page is fetched alone. Each page result then names the last
+    page number it implies (from a reported page count, or page + 1 while
+    the source only signals "more"), and all pages up to that number are
+    fetched concurrently. Results after a page that ends the set (e.g. an
+    empty page) are dropped.
+
+    Args:
+        fetch_page: Fetches and parses one page by page number.
+        last_page: Returns the last page number implied by a page result.
+        first_page: Number of the first page (0 or 1).
+        max_pages: Hard ceiling on pages fetched, or None for no ceiling.
+        max_in_flight: Maximum concurrent page requests.
+
+    Returns:
+        Page results in page order.
+
+    Raises:
+        Whatever fetch_page raises; pending page requests are cancelled.
+    """
+    cap = None if max_pages is None else first_page + max_pages - 1
+
+    def bounded(page: int, result: PageT) -> int:
+        last = last_page(page, result)
+        return last if cap is None else min(last, cap)
+
+    first = await fetch_page(first_page)
+    results = [first]
+    last = bounded(first_page, first)
+    next_page = first_page + 1
+
+    semaphore = asyncio.Semaphore(max(1, max_in_flight))
+
+    async def fetch(page: int) -> PageT:
+        async with semaphore:
+            return await fetch_page(page)
+
+    while next_page <= last:
+        batch = range(next_page, last + 1)
+        tasks = [asyncio.ensure_future(fetch(page)) for page in batch]
+        try:
+            fetched = await asyncio.gather(*tasks)
+        except BaseException:
+            # WHY: one failed page fails the fetch; don't leave the other
+            # requests running (and spending rate-limit tokens).
+            for task in tasks:
+                task.cancel()
+            raise
+
+        for page, result in zip(batch, fetched, strict=True):
+            results.append(result)
+            next_page = page + 1
+            last = bounded(page, result)
+            if page >= last:
+                break
+
+    return results
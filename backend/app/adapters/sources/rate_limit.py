@@ -0,0 +1,125 @@
+"""Per-source token-bucket rate limiting for job source adapters.
+
+REQ-034 §5.3: Source APIs publish request budgets (Adzuna: 25 req/min).
+Adapters used to pace themselves with a fixed sleep between pages, which
+under-used the budget for one poll and overran it as soon as the poll
+scheduler ran several polls at once. Each source now has one token
+bucket shared by every poll in the process; every network request takes
+a token first.
+
+Buckets are per process, and the poll scheduler and user-triggered
+refreshes run in every API and worker process. Each bucket therefore
+gets 1/N of the published budget, N being settings.source_request_processes,
+so the whole fleet stays within it. Adding processes without raising
+that setting multiplies the request rate sent to every source.
+
+Coordinates with:
+  - core/config.py (settings.source_request_processes)
+
+Called by: adapters/sources/base.py, adapters/sources/response_cache.py,
+adapters/sources/__init__.py, services/discovery/job_fetch_service.py,
+and unit tests.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class RateBudget:
+    """Request budget of one source API.
+
+    Attributes:
+        source: Source the budget belongs to (one bucket per source).
+        requests_per_second: Sustained request rate.
+        burst: Requests that may be issued back to back after idling.
+    """
+
+    source: str
+    requests_per_second: float
+    burst: int = 1
+
+
+class TokenBucket:
+    """Async token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Waiters are served in arrival order.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum stored tokens (burst size).
+        clock: Monotonic time source (injectable for tests).
+        sleep: Async sleep function (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        # WHY: the lock is held while sleeping so waiters queue FIFO
+        # instead of racing for each refilled token.
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await self._sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+
+_buckets: dict[str, TokenBucket] = {}
+
+
+def get_source_rate_limiter(
+    budget: RateBudget | None,
+    *,
+    processes: int | None = None,
+) -> TokenBucket | None:
+    """Return the process-wide token bucket for a source budget.
+
+    Args:
+        budget: Source request budget, or None for unthrottled sources.
+        processes: Processes sharing the budget; defaults to
+            settings.source_request_processes. Only read when the
+            source's bucket is first created.
+
+    Returns:
+        Shared TokenBucket for budget.source, or None when budget is None.
+    """
+    if budget is None:
+        return None
+    bucket = _buckets.get(budget.source)
+    if bucket is None:
+        share = (
+            processes if processes is not None else settings.source_request_processes
+        )
+        bucket = TokenBucket(
+            budget.requests_per_second / share, max(1, budget.burst // share)
+        )
+        _buckets[budget.source] = bucket
+    return bucket
@@ -100,9 +100,10 @@ class RemoteOKAdapter(JobSourceAdapter):
         if params.remoteok_tags:
             query_params["tag"] = params.remoteok_tags[0]
 
-        async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT_SECONDS) as client:
+        async with self._http_session(_REQUEST_TIMEOUT_SECONDS) as client:
             try:
-                response = await client.get(
+                response = await self._get(
+                    client,
                     _REMOTEOK_BASE_URL,
                     params=query_params,
                 )
@@ -0,0 +1,384 @@
+"""HTTP response cache for job source adapters.
+
+REQ-034 §5.3: Every persona poll queries the same few source APIs, and
+many personas send identical queries (RemoteOK without tags always
+returns the same feed, which its CDN caches for an hour). This cache
+sits between the adapters and the shared HTTP client:
+
+- Responses are keyed by the normalized request (URL + sorted query
+  params). Keys are SHA-256 digests, so API keys in query params are
+  never held or logged in plain text.
+- Fresh entries (Cache-Control max-age, or a short default TTL when the
+  source sends none) are served without a network call.
+- Stale entries with an ETag or Last-Modified are revalidated with a
+  conditional request; a 304 reuses the stored body without
+  downloading it again.
+- Concurrent identical requests share one in-flight fetch, so a feed is
+  fetched once per poll pass even when several persona polls run at once.
+- Bodies are stored zlib-compressed under a total byte budget with LRU
+  eviction. ``Cache-Control: no-store`` responses and non-200 responses
+  are never stored.
+- The parsed JSON payload is memoized on its entry the first time a
+  cached response is decoded, so later fresh hits and 304s skip both
+  decompression and json.loads. A parsed entry is charged its
+  uncompressed size against the byte budget as well.
+
+Coordinates with:
+  - adapters/sources/rate_limit.py (TokenBucket — network requests only)
+  - adapters reach the cache through JobSourceAdapter._get in
+    adapters/sources/base.py
+
+Called by: adapters/sources/base.py, adapters/sources/__init__.py,
+services/discovery/job_fetch_service.py, and unit tests.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+
+from app.adapters.sources.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# TTL when the source sends no Cache-Control: long enough to cover one
+# scheduler pass, short enough that polls still see new postings.
+_DEFAULT_TTL_SECONDS = 5 * 60
+
+# Ceiling on a source-provided max-age (RemoteOK's CDN uses 1 hour)
+_MAX_TTL_SECONDS = 60 * 60
+
+# How long an expired entry with validators is kept for revalidation
+_MAX_STALE_SECONDS = 24 * 60 * 60
+
+# Bodies larger than this are not cached (matches the adapters' 10 MB guard)
+_MAX_BODY_BYTES = 10 * 1024 * 1024
+
+# Total budget for compressed bodies across all entries
+_MAX_TOTAL_BYTES = 64 * 1024 * 1024
+
+_CACHED_HEADERS = ("content-type", "etag", "last-modified")
+
+# Marks an entry whose body has not been decoded yet (None is valid JSON)
+_UNPARSED: Any = object()
+
+
+@dataclass
+class _Entry:
+    """One stored response."""
+
+    body: bytes  # zlib-compressed
+    headers: dict[str, str]
+    expires_at: float
+    discard_at: float
+    payload: Any = field(default=_UNPARSED, repr=False)  # memoized json()
+    payload_bytes: int = 0  # uncompressed size, charged once parsed
+
+    @property
+    def size(self) -> int:
+        """Bytes charged against the cache budget."""
+        return len(self.body) + self.payload_bytes
+
+    @property
+    def has_validators(self) -> bool:
+        return "etag" in self.headers or "last-modified" in self.headers
+
+
+class CachedResponse:
+    """Response served from the cache.
+
+    Exposes the subset of httpx.Response used by the adapters. Every
+    response for an entry shares its parsed payload: callers must treat
+    the result of json() as read-only.
+
+    Args:
+        entry: Stored entry backing the response.
+        on_parse: Called once when json() first decodes the entry.
+
+    Attributes:
+        status_code: Always 200 (only successful responses are stored).
+        headers: Content-Type and validator headers of the stored response.
+    """
+
+    status_code = 200
+
+    def __init__(self, entry: _Entry, on_parse: Callable[[_Entry], None]) -> None:
+        self.headers: Mapping[str, str] = dict(entry.headers)
+        self._entry = entry
+        self._on_parse = on_parse
+
+    @property
+    def content(self) -> bytes:
+        """Decompressed response body."""
+        return zlib.decompress(self._entry.body)
+
+    def json(self) -> Any:
+        """Decode the body as JSON, memoized on the stored entry."""
+        entry = self._entry
+        if entry.payload is _UNPARSED:
+            content = self.content
+            entry.payload = json.loads(content)
+            entry.payload_bytes = len(content)
+            self._on_parse(entry)
+        return entry.payload
+
+
+SourceResponse = httpx.Response | CachedResponse
+
+
+def cache_key(url: str, params: Mapping[str, Any] | None = None) -> str:
+    """Compute the cache key of a GET request.
+
+    Args:
+        url: Request URL without query string.
+        params: Query parameters; order does not matter.
+
+    Returns:
+        64-char SHA-256 hex digest of the normalized request.
+    """
+    query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return hashlib.sha256(f"GET {url}?{query}".encode()).hexdigest()
+
+
+def _freshness_seconds(headers: httpx.Headers) -> int | None:
+    """Return how long a response may be reused, or None if not storable.
+
+    Args:
+        headers: Response headers.
+
+    Returns:
+        Seconds of freshness (0 means revalidate on every use), or None
+        for ``no-store``.
+    """
+    directives: dict[str, str] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    if "max-age" in directives:
+        try:
+            return max(0, min(int(directives["max-age"]), _MAX_TTL_SECONDS))
+        except ValueError:
+            return 0
+    return _DEFAULT_TTL_SECONDS
+
+
+class SourceResponseCache:
+    """In-process response cache shared by all source adapters.
+
+    Args:
+        max_total_bytes: Budget for compressed bodies; least recently
+            used entries are evicted beyond it.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        max_total_bytes: int = _MAX_TOTAL_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_total_bytes = max_total_bytes
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._total_bytes = 0
+        self._inflight: dict[str, asyncio.Future[SourceResponse]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        rate_limiter: TokenBucket | None = None,
+    ) -> SourceResponse:
+        """Issue a GET through the cache.
+
+        Args:
+            client: HTTP client for network requests.
+            url: Request URL without query string.
+            params: Query parameters (part of the cache key).
+            headers: Request headers (not part of the key; sources
+                send the same headers for every request).
+            rate_limiter: Source token bucket, acquired only before a
+                network request (fresh hits cost no token).
+
+        Returns:
+            A CachedResponse for fresh hits and 304 revalidations;
+            otherwise the network httpx.Response, whatever its status.
+
+        Raises:
+            httpx.RequestError: Propagated from the network request.
+        """
+        key = cache_key(url, params)
+        entry = self._lookup(key)
+        if entry is not None and entry.expires_at > self._clock():
+            return CachedResponse(entry, functools.partial(self._charge, key))
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # WHY: shield — a cancelled waiter must not cancel the fetch
+            # other polls are waiting on.
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(
+            self._fetch(
+                client,
+                key,
+                url,
+                params=params,
+                headers=headers,
+                rate_limiter=rate_limiter,
+            )
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        client: httpx.AsyncClient,
+        key: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        rate_limiter: TokenBucket | None,
+    ) -> SourceResponse:
+        """Fetch from the network, revalidating a stale entry if possible."""
+        request_headers = dict(headers or {})
+        entry = self._lookup(key)
+        if entry is not None:
+            if "etag" in entry.headers:
+                request_headers["If-None-Match"] = entry.headers["etag"]
+            if "last-modified" in entry.headers:
+                request_headers["If-Modified-Since"] = entry.headers["last-modified"]
+
+        kwargs: dict[str, Any] = {"params": params}
+        if request_headers:
+            kwargs["headers"] = request_headers
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        response = await client.get(url, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self._refresh(key, entry, response.headers)
+            return CachedResponse(entry, functools.partial(self._charge, key))
+        if response.status_code == 200:
+            self._store(key, response)
+        return response
+
+    def _lookup(self, key: str) -> _Entry | None:
+        """Return a usable entry (fresh, or stale but revalidatable)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        now = self._clock()
+        if entry.expires_at <= now and (
+            not entry.has_validators or entry.discard_at <= now
+        ):
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _refresh(self, key: str, entry: _Entry, headers: httpx.Headers) -> None:
+        """Extend an entry's freshness after a 304."""
+        ttl = _freshness_seconds(headers)
+        if ttl is None:
+            self._remove(key)
+            return
+        for name in ("etag", "last-modified"):
+            if name in headers:
+                entry.headers[name] = headers[name]
+        now = self._clock()
+        entry.expires_at = now + ttl
+        entry.discard_at = now + max(ttl, _MAX_STALE_SECONDS)
+
+    def _store(self, key: str, response: httpx.Response) -> None:
+        """Store a 200 response if its headers and size allow it."""
+        ttl = _freshness_seconds(response.headers)
+        content = response.content
+        if ttl is None or len(content) > _MAX_BODY_BYTES:
+            self._remove(key)
+            return
+        headers = {
+            name: response.headers[name]
+            for name in _CACHED_HEADERS
+            if name in response.headers
+        }
+        if ttl == 0 and "etag" not in headers and "last-modified" not in headers:
+            # Must revalidate but cannot: nothing worth keeping.
+            self._remove(key)
+            return
+
+        body = zlib.compress(content)
+        if len(body) > self._max_total_bytes:
+            self._remove(key)
+            return
+        now = self._clock()
+        self._remove(key)
+        self._entries[key] = _Entry(
+            body=body,
+            headers=headers,
+            expires_at=now + ttl,
+            discard_at=now + max(ttl, _MAX_STALE_SECONDS),
+        )
+        self._total_bytes += len(body)
+        self._evict()
+
+    def _charge(self, key: str, entry: _Entry) -> None:
+        """Charge a newly parsed payload against the budget."""
+        # An entry evicted or replaced meanwhile is no longer counted.
+        if self._entries.get(key) is entry:
+            self._total_bytes += entry.payload_bytes
+            self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within the budget."""
+        while self._total_bytes > self._max_total_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+
+_cache: SourceResponseCache | None = None
+
+
+def get_source_response_cache() -> SourceResponseCache:
+    """Return the process-wide source response cache, creating it if needed.
+
+    Returns:
+        Shared SourceResponseCache.
+    """
+    global _cache
+    if _cache is None:
+        _cache = SourceResponseCache()
+    return _cache
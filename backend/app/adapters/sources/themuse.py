@@ -7,6 +7,8 @@ Coverage: Curated companies, often with culture info.
 
 Coordinates with:
   - adapters/sources/base.py (JobSourceAdapter, RawJob, SearchParams)
+  - adapters/sources/pagination.py (fetch_pages)
+  - adapters/sources/rate_limit.py (RateBudget)
   - services/discovery/scouter_errors.py (SourceError, SourceErrorType, RateLimitInfo)
   - core/config.py (settings — the_muse_api_key)
 
@@ -20,6 +22,8 @@ from urllib.parse import urlparse
 import httpx
 
 from app.adapters.sources.base import JobSourceAdapter, RawJob, SearchParams
+from app.adapters.sources.pagination import fetch_pages
+from app.adapters.sources.rate_limit import RateBudget
 from app.core.config import settings
 from app.services.discovery.scouter_errors import (
     RateLimitInfo,
@@ -65,6 +69,10 @@ class TheMuseAdapter(JobSourceAdapter):
     - No credentials required (unauthenticated 500/hr tier available)
     """
 
+    # 3,600 req/hr authenticated tier, shared by every concurrent poll
+    rate_budget = RateBudget(source="The Muse", requests_per_second=1.0, burst=3)
+    max_pages_in_flight = 3
+
     @property
     def source_name(self) -> str:
         """Return 'The Muse' as the canonical source name."""
@@ -76,7 +84,9 @@ class TheMuseAdapter(JobSourceAdapter):
         REQ-034 §5.3: Paginates using zero-indexed page param until
         page >= page_count. Applies client-side keyword filter on title
         (case-insensitive). Omits api_key when not configured (falls back
-        to 500/hr unauthenticated tier — not an error condition).
+        to 500/hr unauthenticated tier — not an error condition). Pages
+        after the first are requested concurrently, paced by the shared
+        The Muse rate limiter.
 
         Args:
             params: Search parameters — keywords used for client-side
@@ -91,9 +101,6 @@ class TheMuseAdapter(JobSourceAdapter):
             SourceError: On 4xx/5xx (API_DOWN), 429 (RATE_LIMITED, with
                 retry_after), timeout (TIMEOUT), or network error (NETWORK_ERROR).
         """
-        jobs: list[RawJob] = []
-        page = 0
-
         # Build base query params — api_key is optional (unauthenticated fallback)
         base_params: dict[str, Any] = {}
         if settings.the_muse_api_key is not None:
@@ -101,83 +108,110 @@ class TheMuseAdapter(JobSourceAdapter):
 
         lowered_keywords = [kw.lower() for kw in params.keywords]
 
-        async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT_SECONDS) as client:
-            while True:
-                request_params = {**base_params, "page": page}
+        def last_page(page: int, data: dict[str, Any]) -> int:
+            # Stop when all pages exhausted or no results
+            if not data.get("results", []):
+                return page
+            page_count: int = data.get("page_count", 0)
+            return max(page, page_count - 1)
+
+        async with self._http_session(_REQUEST_TIMEOUT_SECONDS) as client:
+            pages = await fetch_pages(
+                lambda page: self._fetch_page(client, page, base_params),
+                last_page,
+                first_page=0,
+                max_pages=None,
+                max_in_flight=self.max_pages_in_flight,
+            )
 
+        jobs: list[RawJob] = []
+        for data in pages:
+            results: list[dict[str, Any]] = data.get("results", [])
+            for item in results:
                 try:
-                    response = await client.get(
-                        _THEMUSE_BASE_URL,
-                        params=request_params,
-                    )
-                except httpx.TimeoutException as exc:
-                    # Security: do not include exc in message — httpx exception
-                    # repr can embed the full request URL including api_key.
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.TIMEOUT,
-                        message=f"{self.source_name} request timed out on page {page}",
-                    ) from exc
-                except httpx.RequestError as exc:
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.NETWORK_ERROR,
-                        message=f"{self.source_name} network error on page {page}",
-                    ) from exc
-
-                if response.status_code == 429:
-                    retry_after_raw = response.headers.get("Retry-After")
-                    rate_limit_info: RateLimitInfo | None = None
-                    if retry_after_raw:
-                        try:
-                            clamped = min(
-                                int(retry_after_raw), _MAX_RETRY_AFTER_SECONDS
-                            )
-                            rate_limit_info = RateLimitInfo(retry_after_seconds=clamped)
-                        except ValueError:
-                            pass  # Non-integer Retry-After (e.g. HTTP-date) — skip
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.RATE_LIMITED,
-                        message=f"{self.source_name} rate limit exceeded",
-                        rate_limit_info=rate_limit_info,
-                    )
-
-                if response.status_code >= 400:
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.API_DOWN,
-                        message=f"{self.source_name} API error: HTTP {response.status_code}",
+                    raw_job = self.normalize(item)
+                except (KeyError, ValueError) as exc:
+                    logger.warning(
+                        "Failed to normalize %s job (id=%s): %s; skipping",
+                        self.source_name,
+                        item.get("id", "unknown"),
+                        exc,
                     )
+                    continue
 
-                data = response.json()
-                results: list[dict[str, Any]] = data.get("results", [])
-                page_count: int = data.get("page_count", 0)
-
-                for item in results:
-                    try:
-                        raw_job = self.normalize(item)
-                    except (KeyError, ValueError) as exc:
-                        logger.warning(
-                            "Failed to normalize %s job (id=%s): %s; skipping",
-                            self.source_name,
-                            item.get("id", "unknown"),
-                            exc,
-                        )
-                        continue
-
-                    # Client-side keyword filter: keep only title-matching jobs.
-                    # The Muse has no server-side keyword/text search parameter.
-                    if any(kw in raw_job.title.lower() for kw in lowered_keywords):
-                        jobs.append(raw_job)
-
-                # Advance page and stop when all pages exhausted or no results
-                page += 1
-                if not results or page >= page_count:
-                    break
+                # Client-side keyword filter: keep only title-matching jobs.
+                # The Muse has no server-side keyword/text search parameter.
+                if any(kw in raw_job.title.lower() for kw in lowered_keywords):
+                    jobs.append(raw_job)
 
         return jobs
 
+    async def _fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        page: int,
+        base_params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Fetch and decode one The Muse results page.
+
+        Args:
+            client: Client from _http_session().
+            page: 0-indexed page number.
+            base_params: Query parameters shared by all pages.
+
+        Returns:
+            Decoded response body.
+
+        Raises:
+            SourceError: On API failure (see fetch_jobs).
+        """
+        try:
+            response = await self._get(
+                client,
+                _THEMUSE_BASE_URL,
+                params={**base_params, "page": page},
+            )
+        except httpx.TimeoutException as exc:
+            # Security: do not include exc in message — httpx exception
+            # repr can embed the full request URL including api_key.
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.TIMEOUT,
+                message=f"{self.source_name} request timed out on page {page}",
+            ) from exc
+        except httpx.RequestError as exc:
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.NETWORK_ERROR,
+                message=f"{self.source_name} network error on page {page}",
+            ) from exc
+
+        if response.status_code == 429:
+            retry_after_raw = response.headers.get("Retry-After")
+            rate_limit_info: RateLimitInfo | None = None
+            if retry_after_raw:
+                try:
+                    clamped = min(int(retry_after_raw), _MAX_RETRY_AFTER_SECONDS)
+                    rate_limit_info = RateLimitInfo(retry_after_seconds=clamped)
+                except ValueError:
+                    pass  # Non-integer Retry-After (e.g. HTTP-date) — skip
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.RATE_LIMITED,
+                message=f"{self.source_name} rate limit exceeded",
+                rate_limit_info=rate_limit_info,
+            )
+
+        if response.status_code >= 400:
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.API_DOWN,
+                message=f"{self.source_name} API error: HTTP {response.status_code}",
+            )
+
+        data: dict[str, Any] = response.json()
+        return data
+
     def normalize(self, raw_response: dict[str, Any]) -> RawJob:
         """Convert The Muse API response to RawJob format.
 
@@ -7,6 +7,8 @@ Coverage: US federal government jobs
 
 Coordinates with:
   - adapters/sources/base.py (JobSourceAdapter, RawJob, SearchParams)
+  - adapters/sources/pagination.py (fetch_pages)
+  - adapters/sources/rate_limit.py (RateBudget)
   - services/discovery/scouter_errors.py (SourceError, SourceErrorType, RateLimitInfo)
   - core/config.py (settings — usajobs_user_agent, usajobs_email)
 
@@ -20,6 +22,8 @@ from urllib.parse import urlparse
 import httpx
 
 from app.adapters.sources.base import JobSourceAdapter, RawJob, SearchParams
+from app.adapters.sources.pagination import fetch_pages
+from app.adapters.sources.rate_limit import RateBudget
 from app.core.config import settings
 from app.services.discovery.scouter_errors import (
     RateLimitInfo,
@@ -74,6 +78,11 @@ class USAJobsAdapter(JobSourceAdapter):
     - Important for users seeking government employment
     """
 
+    # No published burst limit; pace requests so 20-page polls from
+    # several personas don't hammer the API (daily quota: 200 requests).
+    rate_budget = RateBudget(source="USAJobs", requests_per_second=2.0, burst=4)
+    max_pages_in_flight = 4
+
     @property
     def source_name(self) -> str:
         """Return 'USAJobs' as the canonical source name."""
@@ -85,6 +94,8 @@ class USAJobsAdapter(JobSourceAdapter):
         REQ-034 §5.3: Header-based auth (Authorization: USAJOBS-DEMO-TOKEN,
         User-Agent, Email-Address, Host). Paginates using 1-indexed Page param
         until NumberOfPages is exhausted, hard-capped at _MAX_PAGES (20).
+        Pages after the first are requested concurrently, paced by the
+        shared USAJobs rate limiter.
         ResultsPerPage capped at 500. Sends DatePosted when max_days_old is set.
 
         Args:
@@ -113,102 +124,127 @@ class USAJobsAdapter(JobSourceAdapter):
             "Host": "data.usajobs.gov",
         }
 
-        jobs: list[RawJob] = []
-        page = 1
-
-        async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT_SECONDS) as client:
-            while page <= _MAX_PAGES:
-                query_params: dict[str, Any] = {
-                    "Keyword": " ".join(params.keywords),
-                    "ResultsPerPage": min(
-                        params.results_per_page, _MAX_RESULTS_PER_PAGE
-                    ),
-                    "Page": page,
-                }
-
-                if params.remote_only:
-                    query_params["RemoteIndicator"] = "True"
-                elif params.location:
-                    query_params["LocationName"] = params.location
-
-                if params.max_days_old is not None:
-                    query_params["DatePosted"] = params.max_days_old
+        query_params: dict[str, Any] = {
+            "Keyword": " ".join(params.keywords),
+            "ResultsPerPage": min(params.results_per_page, _MAX_RESULTS_PER_PAGE),
+        }
 
+        if params.remote_only:
+            query_params["RemoteIndicator"] = "True"
+        elif params.location:
+            query_params["LocationName"] = params.location
+
+        if params.max_days_old is not None:
+            query_params["DatePosted"] = params.max_days_old
+
+        def last_page(page: int, search_result: dict[str, Any]) -> int:
+            # Stop when all pages exhausted or empty page
+            if not search_result.get("SearchResultItems", []):
+                return page
+            try:
+                number_of_pages = int(
+                    search_result.get("UserArea", {}).get("NumberOfPages", 1)
+                )
+            except (ValueError, TypeError):
+                number_of_pages = 1
+            return max(page, number_of_pages)
+
+        async with self._http_session(_REQUEST_TIMEOUT_SECONDS) as client:
+            pages = await fetch_pages(
+                lambda page: self._fetch_page(client, page, query_params, headers),
+                last_page,
+                first_page=1,
+                max_pages=_MAX_PAGES,
+                max_in_flight=self.max_pages_in_flight,
+            )
+
+        jobs: list[RawJob] = []
+        for search_result in pages:
+            items: list[dict[str, Any]] = search_result.get("SearchResultItems", [])
+            for item in items:
                 try:
-                    response = await client.get(
-                        _USAJOBS_BASE_URL,
-                        params=query_params,
-                        headers=headers,
-                    )
-                except httpx.TimeoutException as exc:
-                    # Security: do not include exc in message — httpx exception
-                    # repr can embed the full request URL including credentials.
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.TIMEOUT,
-                        message=f"{self.source_name} request timed out on page {page}",
-                    ) from exc
-                except httpx.RequestError as exc:
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.NETWORK_ERROR,
-                        message=f"{self.source_name} network error on page {page}",
-                    ) from exc
-
-                if response.status_code == 429:
-                    retry_after_raw = response.headers.get("Retry-After")
-                    rate_limit_info: RateLimitInfo | None = None
-                    if retry_after_raw:
-                        try:
-                            clamped = max(
-                                0,
-                                min(int(retry_after_raw), _MAX_RETRY_AFTER_SECONDS),
-                            )
-                            rate_limit_info = RateLimitInfo(retry_after_seconds=clamped)
-                        except ValueError:
-                            pass  # Non-integer Retry-After (e.g. HTTP-date) — skip
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.RATE_LIMITED,
-                        message=f"{self.source_name} rate limit exceeded",
-                        rate_limit_info=rate_limit_info,
+                    jobs.append(self.normalize(item))
+                except (KeyError, ValueError) as exc:
+                    logger.warning(
+                        "Failed to normalize %s job (id=%s): %s; skipping",
+                        self.source_name,
+                        item.get("MatchedObjectId", "unknown"),
+                        exc,
                     )
 
-                if response.status_code >= 400:
-                    raise SourceError(
-                        source_name=self.source_name,
-                        error_type=SourceErrorType.API_DOWN,
-                        message=f"{self.source_name} API error: HTTP {response.status_code}",
-                    )
+        return jobs
 
-                data = response.json()
-                search_result = data.get("SearchResult", {})
-                items: list[dict[str, Any]] = search_result.get("SearchResultItems", [])
+    async def _fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        page: int,
+        query_params: dict[str, Any],
+        headers: dict[str, str],
+    ) -> dict[str, Any]:
+        """Fetch one USAJobs results page.
+
+        Args:
+            client: Client from _http_session().
+            page: 1-indexed page number.
+            query_params: Query parameters shared by all pages.
+            headers: Auth headers.
+
+        Returns:
+            The response's SearchResult object.
+
+        Raises:
+            SourceError: On API failure (see fetch_jobs).
+        """
+        try:
+            response = await self._get(
+                client,
+                _USAJOBS_BASE_URL,
+                params={**query_params, "Page": page},
+                headers=headers,
+            )
+        except httpx.TimeoutException as exc:
+            # Security: do not include exc in message — httpx exception
+            # repr can embed the full request URL including credentials.
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.TIMEOUT,
+                message=f"{self.source_name} request timed out on page {page}",
+            ) from exc
+        except httpx.RequestError as exc:
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.NETWORK_ERROR,
+                message=f"{self.source_name} network error on page {page}",
+            ) from exc
+
+        if response.status_code == 429:
+            retry_after_raw = response.headers.get("Retry-After")
+            rate_limit_info: RateLimitInfo | None = None
+            if retry_after_raw:
                 try:
-                    number_of_pages = int(
-                        search_result.get("UserArea", {}).get("NumberOfPages", 1)
+                    clamped = max(
+                        0,
+                        min(int(retry_after_raw), _MAX_RETRY_AFTER_SECONDS),
                     )
-                except (ValueError, TypeError):
-                    number_of_pages = 1
-
-                for item in items:
-                    try:
-                        jobs.append(self.normalize(item))
-                    except (KeyError, ValueError) as exc:
-                        logger.warning(
-                            "Failed to normalize %s job (id=%s): %s; skipping",
-                            self.source_name,
-                            item.get("MatchedObjectId", "unknown"),
-                            exc,
-                        )
-
-                # Stop when all pages exhausted or empty page
-                if not items or page >= min(number_of_pages, _MAX_PAGES):
-                    break
-
-                page += 1
+                    rate_limit_info = RateLimitInfo(retry_after_seconds=clamped)
+                except ValueError:
+                    pass  # Non-integer Retry-After (e.g. HTTP-date) — skip
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.RATE_LIMITED,
+                message=f"{self.source_name} rate limit exceeded",
+                rate_limit_info=rate_limit_info,
+            )
 
-        return jobs
+        if response.status_code >= 400:
+            raise SourceError(
+                source_name=self.source_name,
+                error_type=SourceErrorType.API_DOWN,
+                message=f"{self.source_name} API error: HTTP {response.status_code}",
+            )
+
+        search_result: dict[str, Any] = response.json().get("SearchResult", {})
+        return search_result
 
     def normalize(self, raw_response: dict[str, Any]) -> RawJob:
         """Convert USAJobs API response to RawJob format.
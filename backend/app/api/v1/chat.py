@@ -19,7 +19,8 @@ Coordinates with:
   - core/config.py (settings)
   - core/rate_limiting.py (limiter)
   - core/responses.py (DataResponse)
-  - schemas/chat.py (ChatMessageRequest, HeartbeatEvent)
+  - schemas/chat.py (ChatMessageRequest, HeartbeatEvent, SSEEvent)
+  - services/user_event_broker.py (get_event_broker)
 
 Called by: api/v1/router.py.
 """
@@ -35,7 +36,8 @@ from app.api.deps import CurrentUserId
 from app.core.config import settings
 from app.core.rate_limiting import limiter
 from app.core.responses import DataResponse
-from app.schemas.chat import ChatMessageRequest, HeartbeatEvent
+from app.schemas.chat import ChatMessageRequest, HeartbeatEvent, SSEEvent
+from app.services.user_event_broker import get_event_broker
 
 router = APIRouter()
 
@@ -81,21 +83,50 @@ async def send_chat_message(
     )
 
 
+async def _next_event(
+    queue: asyncio.Queue[SSEEvent] | None,
+    heartbeat_interval: float,
+) -> SSEEvent:
+    """Wait for the next published event, or a heartbeat when idle.
+
+    Args:
+        queue: Subscription queue, or None for heartbeats only.
+        heartbeat_interval: Seconds to wait before sending a heartbeat.
+
+    Returns:
+        The next published event, or a HeartbeatEvent.
+    """
+    if queue is None:
+        await asyncio.sleep(heartbeat_interval)
+        return HeartbeatEvent()
+    try:
+        return await asyncio.wait_for(queue.get(), timeout=heartbeat_interval)
+    except TimeoutError:
+        return HeartbeatEvent()
+
+
 async def event_generator(
     max_duration: float = _SSE_MAX_CONNECTION_SECONDS,
     heartbeat_interval: float = _SSE_HEARTBEAT_INTERVAL_SECONDS,
+    *,
+    user_id: uuid.UUID | None = None,
 ) -> AsyncIterator[str]:
     """Generate SSE events for the connected client.
 
-    Yields heartbeat events periodically and terminates after max_duration
-    seconds. The initial heartbeat is sent immediately to confirm connection.
-    After max_duration, the generator exits cleanly via asyncio.timeout().
+    Yields events published for the user (e.g. data_changed when a
+    background rescore completes), with a heartbeat whenever the stream
+    has been idle for heartbeat_interval, and terminates after
+    max_duration seconds. The initial heartbeat is sent immediately to
+    confirm connection. After max_duration, the generator exits cleanly
+    via asyncio.timeout().
 
     Args:
         max_duration: Maximum connection lifetime in seconds (default 30 min).
             Must be positive.
         heartbeat_interval: Seconds between heartbeat events (default 30s).
             Must be positive.
+        user_id: User whose published events to stream. None sends
+            heartbeats only.
 
     Yields:
         SSE-formatted event strings.
@@ -111,14 +142,18 @@ async def event_generator(
     # Send initial heartbeat to confirm connection
     yield HeartbeatEvent().to_sse()
 
-    # Phase 2: Will subscribe to agent events for this user and yield
-    # chat_token, tool_start, tool_result, data_changed events.
-    # For now, we send periodic heartbeats to keep connection alive.
+    # Phase 2: The LangGraph agent will publish chat_token, tool_start and
+    # tool_result events through the same broker.
     try:
         async with asyncio.timeout(max_duration):
-            while True:
-                await asyncio.sleep(heartbeat_interval)
-                yield HeartbeatEvent().to_sse()
+            if user_id is None:
+                while True:
+                    yield (await _next_event(None, heartbeat_interval)).to_sse()
+            else:
+                async with get_event_broker().subscribe(user_id) as queue:
+                    while True:
+                        event = await _next_event(queue, heartbeat_interval)
+                        yield event.to_sse()
     except TimeoutError:
         # Max connection duration reached — terminate cleanly
         pass
@@ -126,7 +161,7 @@ async def event_generator(
 
 @router.get("/stream")
 async def chat_stream(
-    _user_id: CurrentUserId,
+    user_id: CurrentUserId,
 ) -> StreamingResponse:
     """Establish SSE connection for chat and data events.
 
@@ -149,7 +184,7 @@ async def chat_stream(
         StreamingResponse with text/event-stream content type.
     """
     return StreamingResponse(
-        event_generator(),
+        event_generator(user_id=user_id),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
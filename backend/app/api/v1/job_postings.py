@@ -15,7 +15,8 @@ Endpoints:
 - /job-postings/ingest/confirm - Confirm ingest preview to create job
 - /job-postings/bulk-dismiss - Bulk dismiss jobs
 - /job-postings/bulk-favorite - Bulk favorite/unfavorite jobs
-- /job-postings/rescore - Re-run Strategist scoring
+- /job-postings/rescore - Queue Strategist rescoring (background worker)
+- /job-postings/rescore/{id} - Rescore progress
 
 Coordinates with:
   - api/deps.py (BalanceCheck, CurrentUserId, DbSession, MeteredProvider)
@@ -30,13 +31,16 @@ Coordinates with:
   - models/persona_job.py (PersonaJob)
   - repositories/job_posting_repository.py (JobPostingRepository)
   - repositories/persona_job_repository.py (PersonaJobRepository)
+  - repositories/rescore_job_repository.py (RescoreJobRepository)
   - schemas/bulk.py (BulkDismissRequest, BulkFavoriteRequest,
     BulkFailedItem, BulkOperationResult)
   - schemas/ingest.py (ingest request/response models)
   - schemas/job_posting.py (CreateJobPostingRequest, PersonaJobResponse,
-    UpdatePersonaJobRequest)
+    RescoreJobResponse, UpdatePersonaJobRequest)
   - services/discovery/content_security.py (build_quarantine_fields,
     check_manual_submission_rate, validate_job_content)
+  - services/discovery/description_minhash.py (description_minhash_fields)
+  - services/discovery/extraction_cache.py (ExtractionCache for ingest)
   - services/discovery/job_extraction.py (extract_job_data)
   - services/ingest_token_store.py (get_token_store)
 
@@ -69,6 +73,7 @@ from app.models.persona import Persona
 from app.models.persona_job import PersonaJob
 from app.repositories.job_posting_repository import JobPostingRepository
 from app.repositories.persona_job_repository import PersonaJobRepository
+from app.repositories.rescore_job_repository import RescoreJobRepository
 from app.schemas.bulk import (
     BulkDismissRequest,
     BulkFailedItem,
@@ -85,6 +90,7 @@ from app.schemas.ingest import (
 from app.schemas.job_posting import (
     CreateJobPostingRequest,
     PersonaJobResponse,
+    RescoreJobResponse,
     UpdatePersonaJobRequest,
 )
 from app.services.discovery.content_security import (
@@ -92,6 +98,8 @@ from app.services.discovery.content_security import (
     check_manual_submission_rate,
     validate_job_content,
 )
+from app.services.discovery.description_minhash import description_minhash_fields
+from app.services.discovery.extraction_cache import ExtractionCache
 from app.services.discovery.job_extraction import extract_job_data
 from app.services.ingest_token_store import get_token_store
 
@@ -364,6 +372,7 @@ async def create_job_posting(
                     is_quarantined=quarantine["is_quarantined"],
                     quarantined_at=quarantine["quarantined_at"],
                     quarantine_expires_at=quarantine["quarantine_expires_at"],
+                    **description_minhash_fields(request.description),
                 )
         except IntegrityError as exc:
             if _HASH_CONSTRAINT not in str(exc.orig):
@@ -543,7 +552,9 @@ async def ingest_job_posting(
             )
 
     # Extract job data from raw text
-    extracted = await extract_job_data(body.raw_text, provider)
+    extracted = await extract_job_data(
+        body.raw_text, provider, cache=ExtractionCache(db)
+    )
 
     # Build preview from extracted data
     preview = IngestPreview(
@@ -674,6 +685,7 @@ async def confirm_ingest_job_posting(
                 is_quarantined=quarantine["is_quarantined"],
                 quarantined_at=quarantine["quarantined_at"],
                 quarantine_expires_at=quarantine["quarantine_expires_at"],
+                **description_minhash_fields(description),
             )
             db.add(job_posting)
             await db.flush()
@@ -813,11 +825,48 @@ async def bulk_favorite_job_postings(
 @limiter.limit(settings.rate_limit_llm)
 async def rescore_job_postings(
     request: Request,  # noqa: ARG001
-    _user_id: CurrentUserId,
+    user_id: CurrentUserId,
+    db: DbSession,
+    _balance: BalanceCheck,
 ) -> DataResponse[dict]:
-    """Re-run Strategist scoring on all Discovered jobs.
+    """Queue Strategist rescoring of all Discovered jobs.
 
     REQ-006 §5.2: Trigger after persona changes to update fit scores.
-    Security: Rate limited to prevent LLM cost abuse.
+    REQ-017 §6.2: Enqueues one rescore job per persona for the background
+    RescoreWorker; a persona with a rescore already queued reuses it.
+    Progress is readable via GET /rescore/{id}, and completion is pushed
+    as a data_changed event on the chat SSE stream.
+    Security: Rate limited and balance-gated to prevent LLM cost abuse.
     """
-    return DataResponse(data={"status": "queued"})
+    rescore_jobs = await RescoreJobRepository.enqueue_for_user(db, user_id=user_id)
+    await db.commit()
+    return DataResponse(
+        data={
+            "status": "queued",
+            "rescore_jobs": [
+                RescoreJobResponse.model_validate(job).model_dump(mode="json")
+                for job in rescore_jobs
+            ],
+        }
+    )
+
+
+@router.get("/rescore/{rescore_job_id}")
+async def get_rescore_job(
+    rescore_job_id: uuid.UUID,
+    user_id: CurrentUserId,
+    db: DbSession,
+) -> DataResponse[RescoreJobResponse]:
+    """Get progress of a queued or running rescore.
+
+    REQ-017 §6.2: Polling fallback for clients without an SSE connection.
+
+    Raises:
+        NotFoundError: If the rescore job does not exist or is not owned.
+    """
+    rescore_job = await RescoreJobRepository.get_by_id(
+        db, rescore_job_id, user_id=user_id
+    )
+    if rescore_job is None:
+        raise NotFoundError("RescoreJob", str(rescore_job_id))
+    return DataResponse(data=RescoreJobResponse.model_validate(rescore_job))
@@ -114,6 +114,14 @@ class Settings(BaseSettings):
     reservation_ttl_seconds: int = 300
     reservation_sweep_interval_seconds: int = 300
 
+    # Background workers
+    # Set to False on API processes when workers run separately
+    # (python -m app.worker). Pool surfacing and reservation sweep have one
+    # leader across all processes (core/leader_election.py); the poll
+    # scheduler and rescore workers run in every process.
+    run_background_workers: bool = True
+    worker_leader_retry_seconds: int = 5
+
     # Rate Limiting (Security)
     # Limits LLM-calling endpoints to prevent abuse and cost explosion
     # Format: "count/period" (e.g., "10/minute", "100/hour")
@@ -128,6 +136,12 @@ class Settings(BaseSettings):
     the_muse_api_key: SecretStr | None = None  # From themuse.com/developers/api/v2
     usajobs_user_agent: str | None = None  # App name string, e.g. "ZentropyScout/1.0"
     usajobs_email: str | None = None  # Email used at developer.usajobs.gov registration
+    # Processes that call source APIs: every API process plus every
+    # python -m app.worker process. Source token buckets are per process,
+    # so each gets 1/N of a source's published budget (adapters/sources/
+    # rate_limit.py). Raise this whenever processes are added, or the
+    # fleet sends N times the budget.
+    source_request_processes: int = 1
 
     @property
     def database_url(self) -> str:
@@ -152,6 +166,7 @@ class Settings(BaseSettings):
         Security: Prevents deployment with known insecure defaults.
         Checks:
         - Metering minimum balance must be non-negative (all environments)
+        - Source request process count must be at least 1 (all environments)
         - Database password must not be the default in production
         - AUTH_SECRET must be set and >= 32 chars when auth is enabled in production
         - CORS must not use wildcard origin (incompatible with credentials)
@@ -187,6 +202,14 @@ class Settings(BaseSettings):
             )
             raise ValueError(msg)
 
+        # Source budgets are split across processes (all environments)
+        if self.source_request_processes < 1:
+            msg = (
+                "SOURCE_REQUEST_PROCESSES must be at least 1. "
+                f"Got: {self.source_request_processes}"
+            )
+            raise ValueError(msg)
+
         # CORS wildcard with credentials is invalid (all environments)
         if "*" in self.allowed_origins:
             msg = (
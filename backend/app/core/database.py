@@ -7,7 +7,8 @@ Coordinates with:
   - core/config.py — imports settings for database_url and environment
 
 Called by: main.py (async_session_factory for lifespan), api/deps.py (get_db
-for endpoint dependency injection).
+for endpoint dependency injection), worker.py (lock_engine for leader
+election).
 """
 
 from collections.abc import AsyncGenerator
@@ -17,6 +18,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
@@ -32,6 +34,11 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Leader-election locks (core/leader_election.py) pin one connection per
+# worker for as long as it leads. NullPool keeps those connections out of
+# the request pool, and closing one always ends its database session.
+lock_engine = create_async_engine(settings.database_url, poolclass=NullPool)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency that provides a database session."""
@@ -0,0 +1,273 @@
+"""Leader election for background workers via Postgres advisory locks.
+
+Every API process (and every standalone worker process) starts the same
+background workers. Without coordination, N processes run N copies of
+each loop against the same rows. Each worker type instead competes for a
+session-level advisory lock named after it; only the process holding the
+lock runs the worker, the others stand by and retry.
+
+Failover: the lock lives on one dedicated connection. When the leader
+process exits or crashes, Postgres drops the connection and releases
+the lock, and a standby takes over on its next retry (within
+retry_seconds). The leader re-checks its connection on the same cadence
+and stops its worker as soon as the lock connection is lost, so two
+leaders never run side by side for longer than one retry interval.
+
+Coordinates with:
+  - core/database.py — lock_engine (NullPool: lock connections never
+    enter the request pool)
+
+Called by: app/worker.py and unit tests.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+from typing import Protocol
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Seconds between lock attempts (standby) and lock checks (leader)
+DEFAULT_RETRY_SECONDS = 5
+
+_LOCK_NAMESPACE = "zentropy_scout:worker:"
+
+
+class BackgroundWorker(Protocol):
+    """Lifecycle shared by the background workers (see PoolSurfacingWorker)."""
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker's loop is active."""
+        ...
+
+    def start(self) -> None:
+        """Start the worker's loop."""
+        ...
+
+    async def stop(self) -> None:
+        """Stop the worker's loop and wait for it to finish."""
+        ...
+
+
+def advisory_lock_key(name: str) -> int:
+    """Derive a stable advisory lock key from a worker name.
+
+    Args:
+        name: Worker name (unique per worker type).
+
+    Returns:
+        Signed 64-bit integer, as pg_try_advisory_lock(bigint) expects.
+    """
+    digest = hashlib.sha256(f"{_LOCK_NAMESPACE}{name}".encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class AdvisoryLockLease:
+    """A session-level advisory lock held on a dedicated connection.
+
+    Args:
+        engine: Engine to open the lock connection from.
+        name: Lock name (see advisory_lock_key).
+    """
+
+    def __init__(self, engine: AsyncEngine, name: str) -> None:
+        self._engine = engine
+        self._name = name
+        self._key = advisory_lock_key(name)
+        self._conn: AsyncConnection | None = None
+
+    @property
+    def held(self) -> bool:
+        """Whether this lease currently holds the lock."""
+        return self._conn is not None
+
+    async def acquire(self) -> bool:
+        """Try to take the lock without waiting.
+
+        Returns:
+            True if the lock is now held by this lease.
+
+        Raises:
+            sqlalchemy.exc.DBAPIError: If the database is unreachable.
+        """
+        if self._conn is not None:
+            return True
+        conn = await self._engine.connect()
+        try:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            acquired = await conn.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self._key}
+            )
+        except BaseException:
+            await conn.invalidate()
+            raise
+        if not acquired:
+            await conn.close()
+            return False
+        self._conn = conn
+        return True
+
+    async def check(self) -> bool:
+        """Verify the lock connection is still alive.
+
+        Returns:
+            True if the lock is still held; False (and the lease is
+            dropped) if the connection was lost.
+        """
+        if self._conn is None:
+            return False
+        try:
+            await self._conn.scalar(text("SELECT 1"))
+        except Exception:  # noqa: BLE001
+            logger.warning("Lost advisory lock connection for %s", self._name)
+            await self._discard()
+            return False
+        return True
+
+    async def release(self) -> None:
+        """Release the lock and close its connection. Safe when not held."""
+        if self._conn is None:
+            return
+        conn = self._conn
+        self._conn = None
+        try:
+            await conn.scalar(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": self._key}
+            )
+        except Exception:  # noqa: BLE001
+            # Invalidating closes the connection, which releases the lock.
+            logger.warning("Failed to unlock advisory lock for %s", self._name)
+            await conn.invalidate()
+            return
+        await conn.close()
+
+    async def _discard(self) -> None:
+        """Drop a broken lock connection without returning it to a pool."""
+        conn = self._conn
+        self._conn = None
+        if conn is not None:
+            # WHY: a pooled connection keeps session-level locks; never
+            # hand one back to a pool in an unknown state.
+            with contextlib.suppress(Exception):
+                await conn.invalidate()
+
+
+class LeaderElectedWorker:
+    """Runs a background worker only while holding its leader lock.
+
+    Lifecycle mirrors PoolSurfacingWorker:
+    - start() creates an asyncio task running the election loop.
+    - stop() stops the inner worker (if leading), releases the lock,
+      and waits for the loop to finish.
+
+    Args:
+        name: Worker name; one leader per name across all processes.
+        worker: The background worker to run while leading.
+        engine: Engine for the lock connection.
+        retry_seconds: Seconds between lock attempts and lock checks.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        worker: BackgroundWorker,
+        engine: AsyncEngine,
+        *,
+        retry_seconds: float = DEFAULT_RETRY_SECONDS,
+    ) -> None:
+        self._name = name
+        self._worker = worker
+        self._lease = AdvisoryLockLease(engine, name)
+        self._retry_seconds = retry_seconds
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+
+    @property
+    def worker(self) -> BackgroundWorker:
+        """The wrapped background worker."""
+        return self._worker
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the election loop is active (leading or standing by)."""
+        return self._running and self._task is not None and not self._task.done()
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this process currently holds the leader lock."""
+        return self._lease.held
+
+    def start(self) -> None:
+        """Start the election loop.
+
+        Creates an asyncio task. No-op if already running.
+        Must be called from an async context (running event loop).
+        """
+        if self.is_running:
+            logger.warning("Leader election for %s already running", self._name)
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self) -> None:
+        """Stop the election loop, the inner worker, and release the lock."""
+        self._running = False
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    async def run_once(self) -> None:
+        """Execute one election step.
+
+        Standby: try to take the lock and start the worker. Leader:
+        check the lock, stopping the worker if it was lost and
+        restarting it if its loop died.
+        """
+        if not self._lease.held:
+            if await self._lease.acquire():
+                logger.info("Acquired leadership for %s", self._name)
+                self._worker.start()
+            return
+
+        if not await self._lease.check():
+            logger.warning("Lost leadership for %s; stopping worker", self._name)
+            await self._worker.stop()
+            return
+
+        if not self._worker.is_running:
+            logger.warning("%s worker exited while leading; restarting", self._name)
+            self._worker.start()
+
+    async def _run_loop(self) -> None:
+        """Background loop: run_once → sleep → repeat; step down on exit."""
+        try:
+            while self._running:
+                try:
+                    await self.run_once()
+                # WHY BLE001: a database outage must not end the election
+                # loop — the next attempt retries.
+                except Exception:  # noqa: BLE001
+                    logger.exception("Error in leader election for %s", self._name)
+                await asyncio.sleep(self._retry_seconds)
+        except asyncio.CancelledError:
+            logger.debug("Leader election loop for %s cancelled", self._name)
+            raise
+        finally:
+            # WHY: shield — the worker must be stopped before the lock is
+            # released, even if stop() itself is cancelled meanwhile.
+            await asyncio.shield(self._step_down())
+
+    async def _step_down(self) -> None:
+        """Stop the inner worker, then release the lock."""
+        await self._worker.stop()
+        if self._lease.held:
+            await self._lease.release()
+            logger.info("Released leadership for %s", self._name)
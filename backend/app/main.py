@@ -8,18 +8,19 @@ This module creates and configures the FastAPI application, including:
 - Health check endpoint
 - Pool surfacing background worker (REQ-015 §7)
 - Poll scheduler background worker (REQ-034 §7.2)
+- Rescore queue background worker (REQ-017 §6.2)
 
 Coordinates with:
   - api/v1/router.py — imports v1_router for API route mounting
   - core/config.py — imports settings for CORS, environment, and auth config
-  - core/database.py — imports async_session_factory for lifespan session
+  - core/database.py — imports async_session_factory for lifespan session,
+    lock_engine for the user event listener
   - core/errors.py — imports APIError for exception handler registration
   - core/null_byte_middleware.py — imports NullByteMiddleware for CWE-158 defense
   - core/rate_limiting.py — imports limiter and rate_limit_exceeded_handler
   - core/responses.py — imports ErrorDetail, ErrorResponse for error formatting
-  - services/billing/reservation_sweep.py — imports ReservationSweepWorker for lifespan
-  - services/discovery/pool_surfacing_worker.py — imports PoolSurfacingWorker for lifespan
-  - services/discovery/poll_scheduler_worker.py — imports PollSchedulerWorker for lifespan
+  - services/user_event_broker.py — imports UserEventListener for lifespan
+  - worker.py — imports create_background_workers for lifespan
 
 Called by: uvicorn (entry point: ``uvicorn app.main:app``).
 """
@@ -35,16 +36,16 @@ from fastapi.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
+from app.adapters.sources.http_client import close_source_http_client
 from app.api.v1.router import router as v1_router
 from app.core.config import settings
-from app.core.database import async_session_factory
+from app.core.database import async_session_factory, lock_engine
 from app.core.errors import APIError
 from app.core.null_byte_middleware import NullByteMiddleware
 from app.core.rate_limiting import limiter, rate_limit_exceeded_handler
 from app.core.responses import ErrorDetail, ErrorResponse
-from app.services.billing.reservation_sweep import ReservationSweepWorker
-from app.services.discovery.poll_scheduler_worker import PollSchedulerWorker
-from app.services.discovery.pool_surfacing_worker import PoolSurfacingWorker
+from app.services.user_event_broker import UserEventListener
+from app.worker import create_background_workers
 
 logger = structlog.get_logger()
 
@@ -200,26 +201,35 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     REQ-015 §7.1: Starts the pool surfacing worker on startup.
     REQ-030 §11.1: Starts the reservation sweep worker on startup.
     REQ-034 §7.2: Starts the poll scheduler worker on startup.
-    All are stopped gracefully on shutdown.
+    REQ-017 §6.2: Starts the rescore queue worker on startup.
+    Surfacing and sweep run under leader election, so only one API or
+    worker process in the fleet runs each of them.
+    Skipped entirely when RUN_BACKGROUND_WORKERS=false (workers run in
+    a separate ``python -m app.worker`` process). All are stopped
+    gracefully on shutdown, then the shared source adapter HTTP client
+    is closed.
+
+    REQ-006 §2.5: The user event listener always runs, so this process's
+    SSE streams receive events published by workers in any process.
     """
-    surfacing_worker = PoolSurfacingWorker(async_session_factory)
-    app.state.surfacing_worker = surfacing_worker
-    surfacing_worker.start()
-
-    sweep_worker = ReservationSweepWorker(async_session_factory)
-    app.state.sweep_worker = sweep_worker
-    sweep_worker.start()
-
-    poll_scheduler_worker = PollSchedulerWorker(async_session_factory)
-    app.state.poll_scheduler_worker = poll_scheduler_worker
-    poll_scheduler_worker.start()
+    listener = UserEventListener(lock_engine)
+    listener.start()
+    workers = None
+    if settings.run_background_workers:
+        workers = create_background_workers(async_session_factory)
+        app.state.surfacing_worker = workers.surfacing
+        app.state.sweep_worker = workers.sweep
+        app.state.poll_scheduler_worker = workers.poll_scheduler
+        app.state.rescore_worker = workers.rescore
+        workers.start()
 
     try:
         yield
     finally:
-        await poll_scheduler_worker.stop()
-        await sweep_worker.stop()
-        await surfacing_worker.stop()
+        if workers is not None:
+            await workers.stop()
+        await listener.stop()
+        await close_source_http_client()
 
 
 def create_app() -> FastAPI:
@@ -16,6 +16,7 @@ Models are organized by domain:
 - resume_template.py: ResumeTemplate (Tier 1 - templates)
 - resume.py: ResumeFile, BaseResume, JobVariant, SubmittedResumePDF
 - job_posting.py: JobPosting, ExtractedSkill
+- extraction_cache.py: ExtractionCacheEntry (Tier 0 - shared LLM extraction results)
 - cover_letter.py: CoverLetter, SubmittedCoverLetterPDF
 - application.py: Application, TimelineEvent
 - usage.py: LLMUsageRecord, CreditTransaction (Tier 2 - metering)
@@ -23,6 +24,7 @@ Models are organized by domain:
 - stripe.py: StripePurchase (Tier 2 - Stripe checkout lifecycle)
 - admin_config.py: ModelRegistry, PricingConfig, TaskRoutingConfig, FundingPack, SystemConfig
 - search_profile.py: SearchProfile (Tier 2 - AI-generated search criteria per persona)
+- rescore_job.py: RescoreJob (Tier 2 - durable persona rescore queue)
 """
 
 from app.models.account import Account
@@ -36,6 +38,7 @@ from app.models.admin_config import (
 from app.models.application import Application, TimelineEvent
 from app.models.base import Base, EmbeddingColumnsMixin, SoftDeleteMixin, TimestampMixin
 from app.models.cover_letter import CoverLetter, SubmittedCoverLetterPDF
+from app.models.extraction_cache import ExtractionCacheEntry
 from app.models.job_posting import ExtractedSkill, JobEmbedding, JobPosting
 from app.models.job_source import JobSource, PollingConfiguration, UserSourcePreference
 from app.models.persona import Persona
@@ -54,6 +57,7 @@ from app.models.persona_settings import (
     PersonaEmbedding,
     VoiceProfile,
 )
+from app.models.rescore_job import RescoreJob
 from app.models.resume import BaseResume, JobVariant, ResumeFile, SubmittedResumePDF
 from app.models.resume_template import ResumeTemplate
 from app.models.search_profile import SearchProfile
@@ -74,6 +78,7 @@ __all__ = [
     "User",
     "VerificationToken",
     "JobSource",
+    "ExtractionCacheEntry",
     # Tier 1 - Auth
     "Account",
     "Session",
@@ -104,6 +109,8 @@ __all__ = [
     "JobPosting",
     # Tier 2 - Per-user job relationship
     "PersonaJob",
+    # Tier 2 - Rescore queue
+    "RescoreJob",
     # Tier 2 - Metering
     "LLMUsageRecord",
     "CreditTransaction",
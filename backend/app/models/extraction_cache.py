@@ -0,0 +1,66 @@
+"""ExtractionCacheEntry ORM model — shared LLM extraction results.
+
+REQ-007 §6.4, REQ-016 §6.3: The same job description reaches the system
+many times (several aggregators, every persona's poll, manual ingest).
+Extraction output depends only on the description text, the prompt, and
+the model, so results are stored once per (description_hash,
+prompt_version, model_name) and reused across all users (Tier 0, no
+user scoping).
+
+Coordinates with:
+  - models/base.py — imports Base
+
+Called by / Used by:
+  - repositories/extraction_cache_repository.py: bulk lookup and insert
+  - services/discovery/extraction_cache.py: read-through cache
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ExtractionCacheEntry(Base):
+    """Stored extraction result for one description, prompt, and model.
+
+    Entries are immutable: a new prompt version or model produces a new
+    key instead of overwriting an old result.
+
+    Attributes:
+        description_hash: SHA-256 hex digest of the full description text
+            (same as job_postings.description_hash).
+        prompt_version: Extraction prompt identifier and version
+            (e.g. 'skills_culture:1').
+        model_name: Model that produced the result.
+        result: Parsed extraction output as JSON.
+        created_at: When the result was stored.
+    """
+
+    __tablename__ = "extraction_cache"
+
+    description_hash: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+    )
+    prompt_version: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+    )
+    model_name: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+    )
+    result: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
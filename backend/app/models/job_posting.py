@@ -20,6 +20,7 @@ from datetime import date, datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     CheckConstraint,
     Date,
@@ -27,11 +28,12 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, EmbeddingColumnsMixin, TimestampMixin
@@ -188,6 +190,18 @@ class JobPosting(Base, TimestampMixin):
         nullable=False,
         unique=True,
     )
+    # MinHash signature and LSH band keys of the description
+    # (services/discovery/description_minhash.py). NULL for rows created
+    # before migration 036; those stay repost candidates via the fallback
+    # in JobPostingRepository.get_by_company_for_similarity.
+    description_minhash: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+    )
+    description_lsh_bands: Mapped[list[int] | None] = mapped_column(
+        ARRAY(BigInteger),
+        nullable=True,
+    )
     repost_count: Mapped[int] = mapped_column(
         Integer,
         server_default=text("0"),
@@ -230,6 +244,14 @@ class JobPosting(Base, TimestampMixin):
         nullable=True,
     )
 
+    # Pool surfacing cursor (REQ-015 §7): set once the job has been
+    # evaluated against every persona. Active, non-quarantined NULL rows
+    # are the surfacing backlog.
+    surfaced_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
     __table_args__ = (
         CheckConstraint(
             "work_model IN ('Remote', 'Hybrid', 'Onsite') OR work_model IS NULL",
@@ -250,6 +272,19 @@ class JobPosting(Base, TimestampMixin):
             unique=True,
             postgresql_where=text("external_id IS NOT NULL"),
         ),
+        Index(
+            "ix_job_postings_lsh_bands",
+            "description_lsh_bands",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_job_postings_surfacing_backlog",
+            "created_at",
+            "id",
+            postgresql_where=text(
+                "surfaced_at IS NULL AND is_active IS true AND is_quarantined IS false"
+            ),
+        ),
     )
 
     # Relationships
@@ -338,7 +373,9 @@ class ExtractedSkill(Base):
 class JobEmbedding(Base, EmbeddingColumnsMixin):
     """Vector embeddings for job matching.
 
-    Stores requirements and culture embeddings.
+    Stores requirements, culture, and title embeddings. Unique per
+    (job_posting_id, embedding_type, model_name) so scoring can reuse one
+    embedding per shared pool job across all personas.
     Tier 3 - references JobPosting.
     """
 
@@ -357,9 +394,16 @@ class JobEmbedding(Base, EmbeddingColumnsMixin):
 
     __table_args__ = (
         CheckConstraint(
-            "embedding_type IN ('requirements', 'culture')",
+            "embedding_type IN ('requirements', 'culture', 'title')",
             name="ck_jobembedding_type",
         ),
+        Index(
+            "uq_jobembedding_posting_type_model",
+            "job_posting_id",
+            "embedding_type",
+            "model_name",
+            unique=True,
+        ),
     )
 
     # Relationships
@@ -176,6 +176,12 @@ class PollingConfiguration(Base):
         DateTime(timezone=True),
         nullable=True,
     )
+    # Scheduler claim lease (REQ-034 §7.2): a scheduler that claimed this
+    # row owns its poll until then; NULL or past means unclaimed.
+    claimed_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
 
     # Relationships
     persona: Mapped["Persona"] = relationship(
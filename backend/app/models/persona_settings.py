@@ -19,6 +19,7 @@ from sqlalchemy import (
     CheckConstraint,
     DateTime,
     ForeignKey,
+    Index,
     String,
     Text,
     func,
@@ -158,7 +159,9 @@ class CustomNonNegotiable(Base):
 class PersonaEmbedding(Base, EmbeddingColumnsMixin):
     """Vector embeddings for persona matching.
 
-    Stores hard_skills, soft_skills, logistics embeddings.
+    Stores hard_skills, soft_skills, logistics embeddings. Unique per
+    (persona_id, embedding_type, model_name); durable tier of the persona
+    embedding cache used by scoring.
     Tier 2 - references Persona.
     """
 
@@ -180,6 +183,13 @@ class PersonaEmbedding(Base, EmbeddingColumnsMixin):
             "embedding_type IN ('hard_skills', 'soft_skills', 'logistics')",
             name="ck_personaembedding_type",
         ),
+        Index(
+            "uq_personaembedding_persona_type_model",
+            "persona_id",
+            "embedding_type",
+            "model_name",
+            unique=True,
+        ),
     )
 
     # Relationships
@@ -0,0 +1,118 @@
+"""RescoreJob ORM model — durable queue of persona rescore requests.
+
+REQ-006 §5.2, REQ-017 §6.2: POST /job-postings/rescore enqueues a row;
+the rescore worker claims it (FOR UPDATE SKIP LOCKED), rescores the
+persona's Discovered jobs in chunks, and records progress after each
+chunk. At most one queued row exists per persona (partial unique index),
+so repeated requests coalesce onto the pending job, and at most one
+running row (a second partial unique index), so two workers never rescore
+one persona at once.
+
+Coordinates with:
+  - models/base.py: Base, TimestampMixin
+
+Called by / Used by:
+  - repositories/rescore_job_repository.py: enqueue, claim, progress
+  - services/scoring/rescore_worker.py: background processing
+  - api/v1/job_postings.py: POST /rescore, GET /rescore/{id}
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+
+
+class RescoreJob(Base, TimestampMixin):
+    """Queued or processed rescore of a persona's Discovered jobs.
+
+    Status lifecycle: queued -> running -> completed | failed. A running
+    job whose updated_at stops advancing (worker crash) is requeued by
+    the worker's stale-claim recovery.
+
+    Attributes:
+        id: UUID primary key.
+        user_id: FK to users.id (tenant isolation, CASCADE delete).
+        persona_id: FK to personas.id (CASCADE delete).
+        status: queued | running | completed | failed.
+        total_jobs: Discovered jobs to rescore; None until claimed.
+        processed_jobs: Jobs rescored so far.
+        attempts: Times the job has been claimed.
+        error: Failure summary when status is failed.
+        started_at: When the current attempt was claimed.
+        finished_at: When the job completed or failed.
+        created_at: Enqueue timestamp (from TimestampMixin).
+        updated_at: Last progress heartbeat (from TimestampMixin).
+    """
+
+    __tablename__ = "rescore_jobs"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('queued', 'running', 'completed', 'failed')",
+            name="ck_rescorejob_status_valid",
+        ),
+        CheckConstraint(
+            "processed_jobs >= 0",
+            name="ck_rescorejob_processed_nonneg",
+        ),
+        # Coalescing: one pending request per persona
+        Index(
+            "uq_rescorejob_persona_queued",
+            "persona_id",
+            unique=True,
+            postgresql_where=text("status = 'queued'"),
+        ),
+        # Serialized claims: one running job per persona
+        Index(
+            "uq_rescorejob_persona_running",
+            "persona_id",
+            unique=True,
+            postgresql_where=text("status = 'running'"),
+        ),
+        # Claim order for the worker
+        Index(
+            "ix_rescorejob_queued_created",
+            "created_at",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index("ix_rescorejob_user_persona", "user_id", "persona_id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    persona_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("personas.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default=text("'queued'"),
+    )
+    total_jobs: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    processed_jobs: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("0"),
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("0"),
+    )
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(nullable=True)
@@ -4,12 +4,14 @@ REQ-009 §9.2: MockEmbeddingProvider enables unit testing without hitting real A
 
 Coordinates with:
   - providers/embedding/base.py (EmbeddingProvider, EmbeddingResult)
+  - providers/config.py (ProviderConfig — default embedding model name)
 
 Called by: test fixtures (not used in app/ at runtime).
 """
 
 from typing import Any
 
+from app.providers.config import ProviderConfig
 from app.providers.embedding.base import EmbeddingProvider, EmbeddingResult
 
 
@@ -36,8 +38,10 @@ class MockEmbeddingProvider(EmbeddingProvider):
     def __init__(self) -> None:
         """Initialize mock embedding provider.
 
-        Note: Does not call super().__init__() - we don't need a config for mock.
+        Note: Does not call super().__init__() - no API keys needed. A
+        default config is still exposed so callers can read embedding_model.
         """
+        self.config = ProviderConfig()
         self.calls: list[dict[str, Any]] = []
 
     async def embed(self, texts: list[str]) -> EmbeddingResult:
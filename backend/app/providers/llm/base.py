@@ -320,3 +320,18 @@ class LLMProvider(ABC):
                 Model identifier string (e.g., "claude-3-5-sonnet-20241022").
         """
         ...
+
+    async def resolve_model_for_task(self, task: TaskType) -> str:
+        """Return the model that complete() will actually use for a task.
+
+        Unlike get_model_for_task(), wrappers that route calls at request
+        time (MeteredLLMProvider) resolve their routing here, so callers
+        can key cached model output by the model that would produce it.
+
+        Args:
+                task: The task type to resolve the model for.
+
+        Returns:
+                Model identifier string.
+        """
+        return self.get_model_for_task(task)
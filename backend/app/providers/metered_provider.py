@@ -22,6 +22,7 @@ Coordinates with:
 Called by: api/deps.py (MeteredLLMProvider, MeteredEmbeddingProvider).
 """
 
+import asyncio
 import logging
 import uuid
 from collections.abc import AsyncGenerator
@@ -86,6 +87,11 @@ class MeteredLLMProvider(LLMProvider):
         self._admin_config = admin_config
         self._user_id = user_id
         self._credits_enabled = credits_enabled
+        # WHY LOCK: metering and routing share the request's AsyncSession,
+        # which does not allow concurrent operations. Callers that overlap
+        # complete() calls (e.g. batch rationale generation) still run the
+        # LLM calls in parallel; only the DB bookkeeping is serialized.
+        self._db_lock = asyncio.Lock()
 
     @property
     def provider_name(self) -> str:
@@ -161,16 +167,17 @@ class MeteredLLMProvider(LLMProvider):
             NoPricingConfigError: If no routing/pricing exists.
             UnregisteredModelError: If routed model not in registry.
         """
-        # 1. Resolve cross-provider routing from DB
-        routing = await self._admin_config.get_routing_for_task(task.value)
-        adapter, model_override = self._resolve_adapter(routing)
-
-        # 2. Reserve estimated cost (fail-closed: no reservation = no LLM call)
-        reservation = await self._metering_service.reserve(
-            user_id=self._user_id,
-            task_type=task.value,
-            max_tokens=max_tokens,
-        )
+        async with self._db_lock:
+            # 1. Resolve cross-provider routing from DB
+            routing = await self._admin_config.get_routing_for_task(task.value)
+            adapter, model_override = self._resolve_adapter(routing)
+
+            # 2. Reserve estimated cost (fail-closed: no reservation = no LLM call)
+            reservation = await self._metering_service.reserve(
+                user_id=self._user_id,
+                task_type=task.value,
+                max_tokens=max_tokens,
+            )
 
         # 3. Make the LLM call (release hold on any adapter failure)
         try:
@@ -185,38 +192,40 @@ class MeteredLLMProvider(LLMProvider):
                 model_override=model_override,
             )
         except Exception:
-            try:
-                await self._metering_service.release(reservation)
-            except Exception:
-                logger.exception(_RELEASE_FAILED_LOG, self._user_id)
+            async with self._db_lock:
+                try:
+                    await self._metering_service.release(reservation)
+                except Exception:
+                    logger.exception(_RELEASE_FAILED_LOG, self._user_id)
             raise
 
-        # 4. Persist response metadata (outbox pattern — REQ-030 §5.8).
-        # Best-effort: failure must not block settle() or response return.
-        try:
-            await self._metering_service.persist_response_metadata(
-                reservation=reservation,
-                model=response.model,
-                input_tokens=max(0, response.input_tokens),
-                output_tokens=max(0, response.output_tokens),
-            )
-        except Exception:
-            logger.exception(_PERSIST_FAILED_LOG, self._user_id)
+        async with self._db_lock:
+            # 4. Persist response metadata (outbox pattern — REQ-030 §5.8).
+            # Best-effort: failure must not block settle() or response return.
+            try:
+                await self._metering_service.persist_response_metadata(
+                    reservation=reservation,
+                    model=response.model,
+                    input_tokens=max(0, response.input_tokens),
+                    output_tokens=max(0, response.output_tokens),
+                )
+            except Exception:
+                logger.exception(_PERSIST_FAILED_LOG, self._user_id)
 
-        # 5. Settle with actual cost. settle() catches expected errors
-        # (SQLAlchemyError, pricing errors) internally. Unexpected errors
-        # (AF-07: programming bugs) propagate — catch them here so the
-        # LLM response is still returned to the user.
-        try:
-            await self._metering_service.settle(
-                reservation=reservation,
-                provider=adapter.provider_name,
-                model=response.model,
-                input_tokens=max(0, response.input_tokens),
-                output_tokens=max(0, response.output_tokens),
-            )
-        except Exception:
-            logger.exception(_SETTLE_FAILED_LOG, self._user_id, "response")
+            # 5. Settle with actual cost. settle() catches expected errors
+            # (SQLAlchemyError, pricing errors) internally. Unexpected errors
+            # (AF-07: programming bugs) propagate — catch them here so the
+            # LLM response is still returned to the user.
+            try:
+                await self._metering_service.settle(
+                    reservation=reservation,
+                    provider=adapter.provider_name,
+                    model=response.model,
+                    input_tokens=max(0, response.input_tokens),
+                    output_tokens=max(0, response.output_tokens),
+                )
+            except Exception:
+                logger.exception(_SETTLE_FAILED_LOG, self._user_id, "response")
 
         return response
 
@@ -270,6 +279,24 @@ class MeteredLLMProvider(LLMProvider):
         """Return inner provider's model for the given task."""
         return self._inner.get_model_for_task(task)
 
+    async def resolve_model_for_task(self, task: TaskType) -> str:
+        """Return the model complete() routes the task to.
+
+        Uses the DB routing table, falling back to the inner provider's
+        model when the task has no routing.
+
+        Args:
+            task: Task type to resolve.
+
+        Returns:
+            Model identifier string.
+        """
+        async with self._db_lock:
+            routing = await self._admin_config.get_routing_for_task(task.value)
+        if routing is None:
+            return self._inner.get_model_for_task(task)
+        return routing[1]
+
 
 class MeteredEmbeddingProvider(EmbeddingProvider):
     """Proxy that records embedding usage and debits the user's balance.
@@ -298,6 +325,9 @@ class MeteredEmbeddingProvider(EmbeddingProvider):
         # _admin_config accepted for DI symmetry with MeteredLLMProvider
         # but not stored — pricing lookups happen via MeteringService.
         self._inner = inner
+        # Expose the inner config so callers can read embedding_model
+        # (e.g. JobEmbeddingStore keys stored vectors by model name).
+        self.config = inner.config
         self._metering_service = metering_service
         self._user_id = user_id
 
@@ -0,0 +1,88 @@
+"""Repository for ExtractionCacheEntry persistence.
+
+REQ-007 §6.4, REQ-016 §6.3: Bulk lookup and insert of shared extraction
+results. Entries belong to Tier 0 (no user scoping) — one stored result
+per (description_hash, prompt_version, model_name) serves every user.
+
+Coordinates with:
+  - models/extraction_cache.py (ExtractionCacheEntry ORM model)
+
+Called by: services/discovery/extraction_cache.py.
+"""
+
+from collections.abc import Collection, Sequence
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.extraction_cache import ExtractionCacheEntry
+
+
+class ExtractionCacheRepository:
+    """Stateless repository for ExtractionCacheEntry bulk operations.
+
+    All methods are static — no instance state. Pass an AsyncSession
+    for every call so the caller controls transaction boundaries.
+    """
+
+    @staticmethod
+    async def get_many(
+        db: AsyncSession,
+        description_hashes: Collection[str],
+        *,
+        prompt_version: str,
+        model_name: str,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch stored results for many descriptions in one query.
+
+        Args:
+            db: Async database session.
+            description_hashes: SHA-256 hex digests to look up.
+            prompt_version: Extraction prompt identifier and version.
+            model_name: Model the results must come from.
+
+        Returns:
+            Stored result by description hash (missing hashes omitted).
+        """
+        if not description_hashes:
+            return {}
+
+        stmt = select(
+            ExtractionCacheEntry.description_hash, ExtractionCacheEntry.result
+        ).where(
+            ExtractionCacheEntry.description_hash.in_(description_hashes),
+            ExtractionCacheEntry.prompt_version == prompt_version,
+            ExtractionCacheEntry.model_name == model_name,
+        )
+        result = await db.execute(stmt)
+        return {row.description_hash: row.result for row in result}
+
+    @staticmethod
+    async def insert_many(
+        db: AsyncSession,
+        rows: Sequence[dict[str, Any]],
+    ) -> None:
+        """Insert results with a single statement, keeping existing rows.
+
+        A concurrent poll may store the same key first; its result is
+        equivalent, so conflicts are ignored.
+
+        Args:
+            db: Async database session.
+            rows: Dicts with description_hash, prompt_version, model_name,
+                and result.
+        """
+        if not rows:
+            return
+
+        stmt = pg_insert(ExtractionCacheEntry).values(list(rows))
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=[
+                ExtractionCacheEntry.description_hash,
+                ExtractionCacheEntry.prompt_version,
+                ExtractionCacheEntry.model_name,
+            ]
+        )
+        await db.execute(stmt)
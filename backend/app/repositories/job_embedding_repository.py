@@ -0,0 +1,94 @@
+"""Repository for JobEmbedding persistence.
+
+REQ-008 §6.5, §10.1: Bulk load and upsert of shared job embeddings.
+Job embeddings belong to the Tier 0 shared pool, so no user scoping —
+one stored vector per (job, embedding type, model) serves every persona.
+
+Coordinates with:
+  - models/job_posting.py (JobEmbedding ORM model)
+
+Called by: services/embedding/job_embedding_store.py.
+"""
+
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job_posting import JobEmbedding
+
+
+class JobEmbeddingRepository:
+    """Stateless repository for JobEmbedding bulk operations.
+
+    All methods are static — no instance state. Pass an AsyncSession
+    for every call so the caller controls transaction boundaries.
+    """
+
+    @staticmethod
+    async def get_for_jobs(
+        db: AsyncSession,
+        job_posting_ids: Sequence[uuid.UUID],
+        *,
+        model_name: str,
+        embedding_types: Sequence[str],
+    ) -> list[JobEmbedding]:
+        """Fetch stored embeddings for many jobs in one query.
+
+        Args:
+            db: Async database session.
+            job_posting_ids: Job posting UUIDs to load.
+            model_name: Embedding model the vectors must come from.
+            embedding_types: Embedding types to load (e.g. 'title', 'culture').
+
+        Returns:
+            Matching JobEmbedding rows (at most one per job/type/model).
+        """
+        if not job_posting_ids or not embedding_types:
+            return []
+
+        stmt = select(JobEmbedding).where(
+            JobEmbedding.job_posting_id.in_(job_posting_ids),
+            JobEmbedding.embedding_type.in_(embedding_types),
+            JobEmbedding.model_name == model_name,
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def upsert_many(
+        db: AsyncSession,
+        rows: Sequence[dict[str, Any]],
+    ) -> None:
+        """Insert or replace embeddings with a single statement.
+
+        Conflicts on (job_posting_id, embedding_type, model_name) overwrite
+        the stored vector and source_hash — the caller only upserts rows
+        that were missing or stale.
+
+        Args:
+            db: Async database session.
+            rows: Dicts with job_posting_id, embedding_type, vector,
+                model_name, model_version, and source_hash.
+        """
+        if not rows:
+            return
+
+        stmt = pg_insert(JobEmbedding).values(list(rows))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                JobEmbedding.job_posting_id,
+                JobEmbedding.embedding_type,
+                JobEmbedding.model_name,
+            ],
+            set_={
+                "vector": stmt.excluded.vector,
+                "model_version": stmt.excluded.model_version,
+                "source_hash": stmt.excluded.source_hash,
+                "created_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
@@ -1,12 +1,15 @@
 """Repository for shared job pool operations.
 
 REQ-016 §6.4: Pool check, save, link, and source resolution.
-Standalone repository for shared pool operations.
+Standalone repository for shared pool operations. Batch variants
+(check_jobs_in_pool, save_jobs_to_pool, link_existing_jobs) handle a
+whole poll result with set-based queries.
 
 Coordinates with:
   - models/job_source.py (JobSource ORM model)
   - repositories/job_posting_repository.py (JobPostingRepository for CRUD)
-  - services/discovery/global_dedup_service.py (deduplicate_and_save)
+  - services/discovery/global_dedup_service.py (deduplicate_and_save,
+    deduplicate_and_save_batch)
 
 Called by: services/discovery/job_fetch_service.py.
 """
@@ -14,6 +17,7 @@ Called by: services/discovery/job_fetch_service.py.
 import hashlib
 import logging
 import uuid
+from collections.abc import Sequence
 from datetime import date
 from typing import Any
 
@@ -21,9 +25,14 @@ from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.job_posting import JobPosting
 from app.models.job_source import JobSource
 from app.repositories.job_posting_repository import JobPostingRepository
-from app.services.discovery.global_dedup_service import deduplicate_and_save
+from app.services.discovery.global_dedup_service import (
+    DeduplicationOutcome,
+    deduplicate_and_save,
+    deduplicate_and_save_batch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +87,84 @@ def _build_dedup_job_data(
     }
 
 
+def _pool_check_result(
+    job: dict[str, Any],
+    source_id: uuid.UUID,
+    existing: JobPosting | None,
+) -> tuple[bool, dict[str, Any]]:
+    """Build the (is_existing, enriched_job) result of a pool check."""
+    if existing is not None:
+        logger.debug(
+            "Job %s already in pool (id=%s)",
+            job.get("external_id") or "(no ext_id)",
+            existing.id,
+        )
+        return True, {
+            **job,
+            "pool_job_posting_id": str(existing.id),
+            "source_id": str(source_id),
+        }
+
+    return False, {**job, "source_id": str(source_id)}
+
+
+async def _deduplicate_batch(
+    db: AsyncSession,
+    jobs: Sequence[dict[str, Any]],
+    persona_id: uuid.UUID,
+    user_id: uuid.UUID,
+) -> list[DeduplicationOutcome | None] | None:
+    """Run the batch dedup pipeline for pool jobs inside a savepoint.
+
+    Args:
+        db: Async database session.
+        jobs: Job dicts with source_id and dedup-ready fields.
+        persona_id: Persona UUID for the persona_jobs links.
+        user_id: User UUID for ownership.
+
+    Returns:
+        One outcome per job (None for jobs with invalid data or when the
+        persona is not owned), or None if the batch failed on a database
+        error and the caller should fall back to per-job saves.
+    """
+    outcomes: list[DeduplicationOutcome | None] = [None] * len(jobs)
+    valid: list[int] = []
+    jobs_data: list[dict[str, Any]] = []
+    for i, job in enumerate(jobs):
+        try:
+            jobs_data.append(_build_dedup_job_data(job, uuid.UUID(job["source_id"])))
+        except (ValueError, KeyError) as e:
+            logger.warning("Invalid job data for %s: %s", job.get("external_id"), e)
+            continue
+        valid.append(i)
+    if not jobs_data:
+        return outcomes
+
+    try:
+        async with db.begin_nested():
+            batch = await deduplicate_and_save_batch(
+                db,
+                jobs_data=jobs_data,
+                persona_id=persona_id,
+                user_id=user_id,
+                discovery_method="scouter",
+            )
+    except ValueError as e:
+        logger.warning("Invalid job batch for persona %s: %s", persona_id, e)
+        return outcomes
+    except SQLAlchemyError as e:
+        logger.warning(
+            "Batch save of %d jobs failed, retrying one at a time: %s",
+            len(jobs_data),
+            e,
+        )
+        return None
+
+    for i, outcome in zip(valid, batch, strict=True):
+        outcomes[i] = outcome
+    return outcomes
+
+
 class JobPoolRepository:
     """Repository for shared job pool check, save, and link operations.
 
@@ -124,19 +211,60 @@ class JobPoolRepository:
                     db, desc_hash
                 )
 
-        if existing is not None:
-            logger.debug(
-                "Job %s already in pool (id=%s)",
-                external_id or "(no ext_id)",
-                existing.id,
+        return _pool_check_result(job, source_id, existing)
+
+    @staticmethod
+    async def check_jobs_in_pool(
+        db: AsyncSession,
+        jobs: Sequence[tuple[dict[str, Any], uuid.UUID]],
+    ) -> list[tuple[bool, dict[str, Any]]]:
+        """Check many jobs against the shared pool with two bulk queries.
+
+        Same two tiers and results as check_job_in_pool, with one query
+        per tier for the whole batch.
+
+        Args:
+            db: Async database session.
+            jobs: (job, source_id) pairs; jobs have external_id and description.
+
+        Returns:
+            One (is_existing, enriched_job) result per job, in input order.
+        """
+        # Tier 1: source_id + external_id
+        by_source_key = await JobPostingRepository.get_by_source_and_external_ids(
+            db,
+            {
+                (source_id, job["external_id"])
+                for job, source_id in jobs
+                if job.get("external_id")
+            },
+        )
+
+        # Tier 2: description_hash, for jobs without a tier-1 match
+        hashes: list[str | None] = []
+        for job, source_id in jobs:
+            external_id = job.get("external_id")
+            description = job.get("description", "")
+            tier1_hit = bool(external_id) and (source_id, external_id) in by_source_key
+            hashes.append(
+                _compute_description_hash(description)
+                if description and not tier1_hit
+                else None
             )
-            return True, {
-                **job,
-                "pool_job_posting_id": str(existing.id),
-                "source_id": str(source_id),
-            }
+        by_hash = await JobPostingRepository.get_by_description_hashes(
+            db, {h for h in hashes if h is not None}
+        )
 
-        return False, {**job, "source_id": str(source_id)}
+        results: list[tuple[bool, dict[str, Any]]] = []
+        for (job, source_id), desc_hash in zip(jobs, hashes, strict=True):
+            external_id = job.get("external_id")
+            existing = (
+                by_source_key.get((source_id, external_id)) if external_id else None
+            )
+            if existing is None and desc_hash is not None:
+                existing = by_hash.get(desc_hash)
+            results.append(_pool_check_result(job, source_id, existing))
+        return results
 
     @staticmethod
     async def resolve_source_id(
@@ -219,6 +347,70 @@ class JobPoolRepository:
             logger.warning("Failed to save job %s: %s", job.get("external_id"), e)
             return None
 
+    @staticmethod
+    async def save_jobs_to_pool(
+        db: AsyncSession,
+        jobs: Sequence[dict[str, Any]],
+        persona_id: uuid.UUID,
+        user_id: uuid.UUID,
+    ) -> list[str | None]:
+        """Save many new jobs to the shared pool via the batch dedup pipeline.
+
+        Falls back to save_job_to_pool per job if the batch hits a
+        database error (the batch savepoint is rolled back first).
+
+        Args:
+            db: Async database session.
+            jobs: Job dicts with source_id and dedup-ready fields.
+            persona_id: Persona UUID for the persona_jobs links.
+            user_id: User UUID for ownership.
+
+        Returns:
+            One job posting ID string (or None on failure) per job.
+        """
+        outcomes = await _deduplicate_batch(db, jobs, persona_id, user_id)
+        if outcomes is None:
+            return [
+                await JobPoolRepository.save_job_to_pool(db, job, persona_id, user_id)
+                for job in jobs
+            ]
+        return [
+            str(outcome.job_posting.id) if outcome is not None else None
+            for outcome in outcomes
+        ]
+
+    @staticmethod
+    async def link_existing_jobs(
+        db: AsyncSession,
+        jobs: Sequence[dict[str, Any]],
+        persona_id: uuid.UUID,
+        user_id: uuid.UUID,
+    ) -> list[str | None]:
+        """Create persona_jobs links for many existing pool jobs.
+
+        Batch version of link_existing_job, with the same per-job fallback
+        as save_jobs_to_pool.
+
+        Args:
+            db: Async database session.
+            jobs: Job dicts with pool_job_posting_id and source_id.
+            persona_id: Persona UUID for the persona_jobs links.
+            user_id: User UUID for ownership.
+
+        Returns:
+            One pool job posting ID string (or None on failure) per job.
+        """
+        outcomes = await _deduplicate_batch(db, jobs, persona_id, user_id)
+        if outcomes is None:
+            return [
+                await JobPoolRepository.link_existing_job(db, job, persona_id, user_id)
+                for job in jobs
+            ]
+        return [
+            job.get("pool_job_posting_id") if outcome is not None else None
+            for job, outcome in zip(jobs, outcomes, strict=True)
+        ]
+
     @staticmethod
     async def link_existing_job(
         db: AsyncSession,
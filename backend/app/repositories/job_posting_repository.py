@@ -11,10 +11,29 @@ services/discovery/global_dedup_service.py, api/v1/job_postings.py.
 """
 
 import uuid
+from collections.abc import Collection, Mapping, Sequence
 from datetime import date, datetime
-
-from sqlalchemy import func, select
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    String,
+    cast,
+    column,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    true,
+    tuple_,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.models.job_posting import JobPosting
 
@@ -41,9 +60,45 @@ CREATABLE_OPTIONAL_FIELDS: frozenset[str] = frozenset(
         "is_quarantined",
         "quarantined_at",
         "quarantine_expires_at",
+        "description_minhash",
+        "description_lsh_bands",
     }
 )
 
+# Fields of each row passed to JobPostingRepository.create_many(): the
+# required create() fields, an explicit id, the optional create() fields,
+# and the repost chain (set directly so reposts need no follow-up UPDATE).
+_REQUIRED_CREATE_FIELDS: frozenset[str] = frozenset(
+    {
+        "source_id",
+        "job_title",
+        "company_name",
+        "description",
+        "description_hash",
+        "first_seen_date",
+    }
+)
+_BULK_CREATE_FIELDS: frozenset[str] = (
+    _REQUIRED_CREATE_FIELDS
+    | CREATABLE_OPTIONAL_FIELDS
+    | {"id", "repost_count", "previous_posting_ids"}
+)
+
+# Multi-row INSERT needs the same columns in every row, so absent fields
+# are sent explicitly: server defaults for NOT NULL columns, SQL NULL
+# otherwise (JSONB would store a JSON 'null' for Python None).
+_BULK_CREATE_DEFAULTS: dict[str, Any] = {
+    "is_quarantined": False,
+    "repost_count": 0,
+    "previous_posting_ids": null(),
+}
+
+# Rows per INSERT statement (~30 bind parameters each; asyncpg caps a
+# statement at 32767).
+_BULK_CREATE_CHUNK_SIZE = 500
+
+_BAND_KEYS_TYPE = ARRAY(BigInteger)
+
 # Fields that may be updated via JobPostingRepository.update().
 # Security: Never allow updating id, source_id, or created_at.
 # - id: primary key, immutable
@@ -77,6 +132,8 @@ _UPDATABLE_FIELDS: frozenset[str] = frozenset(
         "ghost_signals",
         "ghost_score",
         "description_hash",
+        "description_minhash",
+        "description_lsh_bands",
         "repost_count",
         "previous_posting_ids",
         "also_found_on",
@@ -143,6 +200,35 @@ class JobPostingRepository:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_by_source_and_external_ids(
+        db: AsyncSession,
+        pairs: Collection[tuple[uuid.UUID, str]],
+    ) -> dict[tuple[uuid.UUID, str], JobPosting]:
+        """Fetch job postings for many source + external ID pairs at once.
+
+        REQ-015 §6 dedup step 1, batched: one query for a whole poll result.
+
+        Args:
+            db: Async database session.
+            pairs: (source_id, external_id) pairs to look up.
+
+        Returns:
+            Dict mapping each matched pair to its JobPosting. Pairs with
+            no posting are absent.
+        """
+        if not pairs:
+            return {}
+        stmt = select(JobPosting).where(
+            tuple_(JobPosting.source_id, JobPosting.external_id).in_(list(pairs))
+        )
+        result = await db.execute(stmt)
+        return {
+            (jp.source_id, jp.external_id): jp
+            for jp in result.scalars().all()
+            if jp.external_id is not None
+        }
+
     @staticmethod
     async def get_by_description_hash(
         db: AsyncSession, description_hash: str
@@ -162,11 +248,35 @@ class JobPostingRepository:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_by_description_hashes(
+        db: AsyncSession, description_hashes: Collection[str]
+    ) -> dict[str, JobPosting]:
+        """Fetch job postings for many description hashes at once.
+
+        REQ-015 §6 dedup step 2, batched: one query for a whole poll result.
+
+        Args:
+            db: Async database session.
+            description_hashes: SHA-256 hashes to look up.
+
+        Returns:
+            Dict mapping each matched hash to its JobPosting.
+        """
+        if not description_hashes:
+            return {}
+        stmt = select(JobPosting).where(
+            JobPosting.description_hash.in_(list(description_hashes))
+        )
+        result = await db.execute(stmt)
+        return {jp.description_hash: jp for jp in result.scalars().all()}
+
     @staticmethod
     async def get_by_company_for_similarity(
         db: AsyncSession,
         company_name: str,
         *,
+        band_keys: list[int] | None = None,
         limit: int = 100,
     ) -> list[JobPosting]:
         """Fetch active jobs by company for similarity matching.
@@ -174,24 +284,108 @@ class JobPostingRepository:
         REQ-015 §6 dedup step 3: Returns candidates for title + description
         similarity comparison. Case-insensitive company name match.
 
+        With band_keys, only jobs sharing at least one LSH band with the
+        incoming description are returned (GIN index on
+        description_lsh_bands), plus jobs with no bands yet (created
+        before MinHash signatures existed), which are ordered last.
+
         Args:
             db: Async database session.
             company_name: Company name to match (case-insensitive).
+            band_keys: LSH band keys of the incoming description, or None
+                to return any active job for the company.
             limit: Maximum number of candidates to return.
 
         Returns:
             List of active JobPosting records for the company.
         """
-        stmt = (
-            select(JobPosting)
+        stmt = select(JobPosting).where(
+            func.lower(JobPosting.company_name) == company_name.lower().strip(),
+            JobPosting.is_active.is_(True),
+        )
+        if band_keys is not None:
+            stmt = stmt.where(
+                or_(
+                    JobPosting.description_lsh_bands.overlap(band_keys),
+                    JobPosting.description_lsh_bands.is_(None),
+                )
+            ).order_by(JobPosting.description_lsh_bands.is_(None))
+        result = await db.execute(stmt.limit(limit))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_candidates_for_similarity_batch(
+        db: AsyncSession,
+        probes: Sequence[tuple[str, list[int] | None]],
+        *,
+        limit: int = 100,
+    ) -> list[list[JobPosting]]:
+        """Fetch repost candidates for many incoming jobs in one query.
+
+        Batched get_by_company_for_similarity(): each probe is a
+        (company_name, band_keys) pair and gets the same candidates that
+        method would return for it, via a LATERAL subquery per probe.
+
+        Args:
+            db: Async database session.
+            probes: (company_name, band_keys) of each incoming job.
+            limit: Maximum number of candidates per probe.
+
+        Returns:
+            One candidate list per probe, in probe order.
+        """
+        if not probes:
+            return []
+
+        # WHY cast: asyncpg infers untyped VALUES parameters as text, so
+        # the band key arrays need an explicit bigint[] type.
+        probe_rows = values(
+            column("probe", Integer),
+            column("company_key", String),
+            column("band_keys", _BAND_KEYS_TYPE),
+            name="probes",
+        ).data(
+            [
+                (
+                    i,
+                    company_name.lower().strip(),
+                    cast(literal(band_keys, _BAND_KEYS_TYPE), _BAND_KEYS_TYPE),
+                )
+                for i, (company_name, band_keys) in enumerate(probes)
+            ]
+        )
+        # WHY aliased: the outer query also selects JobPosting, which would
+        # auto-correlate an unaliased lateral FROM away.
+        candidate = aliased(JobPosting)
+        no_bands = candidate.description_lsh_bands.is_(None)
+        candidates = (
+            select(candidate.id, no_bands.label("no_bands"))
             .where(
-                func.lower(JobPosting.company_name) == company_name.lower().strip(),
-                JobPosting.is_active.is_(True),
+                func.lower(candidate.company_name) == probe_rows.c.company_key,
+                candidate.is_active.is_(True),
+                or_(
+                    probe_rows.c.band_keys.is_(None),
+                    candidate.description_lsh_bands.overlap(probe_rows.c.band_keys),
+                    no_bands,
+                ),
             )
+            .order_by(no_bands)
             .limit(limit)
+            .lateral("candidates")
+        )
+        stmt = (
+            select(probe_rows.c.probe, JobPosting)
+            .select_from(probe_rows)
+            .join(candidates, true())
+            .join(JobPosting, JobPosting.id == candidates.c.id)
+            .order_by(probe_rows.c.probe, candidates.c.no_bands)
         )
         result = await db.execute(stmt)
-        return list(result.scalars().all())
+
+        grouped: list[list[JobPosting]] = [[] for _ in probes]
+        for probe, job_posting in result.tuples():
+            grouped[probe].append(job_posting)
+        return grouped
 
     @staticmethod
     async def create(
@@ -203,7 +397,7 @@ class JobPostingRepository:
         description: str,
         description_hash: str,
         first_seen_date: date,
-        **optional: str | int | None,
+        **optional: str | int | bytes | list[int] | None,
     ) -> JobPosting:
         """Create a new job posting in the shared pool.
 
@@ -246,11 +440,113 @@ class JobPostingRepository:
         await db.refresh(job_posting)
         return job_posting
 
+    @staticmethod
+    async def create_many(
+        db: AsyncSession,
+        rows: Sequence[Mapping[str, Any]],
+    ) -> list[JobPosting]:
+        """Insert many job postings, skipping rows that hit a unique index.
+
+        REQ-015 §6 dedup step 4, batched: multi-row INSERT ... ON CONFLICT
+        DO NOTHING RETURNING, so a row racing a concurrent insert of the
+        same job is skipped instead of aborting the batch.
+
+        Each row has the required create() fields and an explicit id, plus
+        any of CREATABLE_OPTIONAL_FIELDS, repost_count, and
+        previous_posting_ids.
+
+        Args:
+            db: Async database session.
+            rows: Job posting field dicts.
+
+        Returns:
+            The inserted JobPostings. Rows whose id is missing were skipped.
+
+        Raises:
+            ValueError: If a row has an unknown field or lacks a required one.
+        """
+        for row in rows:
+            unknown = set(row) - _BULK_CREATE_FIELDS
+            if unknown:
+                msg = f"Unknown fields: {', '.join(sorted(unknown))}"
+                raise ValueError(msg)
+            missing = (_REQUIRED_CREATE_FIELDS | {"id"}) - set(row)
+            if missing:
+                msg = f"Missing fields: {', '.join(sorted(missing))}"
+                raise ValueError(msg)
+
+        created: list[JobPosting] = []
+        for start in range(0, len(rows), _BULK_CREATE_CHUNK_SIZE):
+            chunk = [
+                {
+                    field: _BULK_CREATE_DEFAULTS.get(field)
+                    if row.get(field) is None
+                    else row[field]
+                    for field in _BULK_CREATE_FIELDS
+                }
+                for row in rows[start : start + _BULK_CREATE_CHUNK_SIZE]
+            ]
+            stmt = (
+                pg_insert(JobPosting)
+                .values(chunk)
+                .on_conflict_do_nothing()
+                .returning(JobPosting)
+            )
+            result = await db.execute(
+                stmt, execution_options={"populate_existing": True}
+            )
+            created.extend(result.scalars().all())
+        return created
+
+    @staticmethod
+    async def update_many(
+        db: AsyncSession,
+        updates: Mapping[uuid.UUID, Mapping[str, Any]],
+    ) -> list[JobPosting]:
+        """Update fields on many job postings with a single flush.
+
+        Same field rules as update(). Postings already loaded in the
+        session (e.g. by the batch dedup lookups) cost no extra SELECT;
+        all of them are refreshed with one query after the flush.
+
+        Args:
+            db: Async database session.
+            updates: Field names and values to set, by job posting UUID.
+
+        Returns:
+            The updated JobPostings. Unknown UUIDs are skipped.
+
+        Raises:
+            ValueError: If an unknown field name is passed.
+        """
+        for fields in updates.values():
+            unknown = set(fields) - _UPDATABLE_FIELDS
+            if unknown:
+                msg = f"Unknown fields: {', '.join(sorted(unknown))}"
+                raise ValueError(msg)
+        if not updates:
+            return []
+
+        for job_posting_id, fields in updates.items():
+            job_posting = await db.get(JobPosting, job_posting_id)
+            if job_posting is None:
+                continue
+            for field, value in fields.items():
+                setattr(job_posting, field, value)
+        await db.flush()
+
+        result = await db.execute(
+            select(JobPosting)
+            .where(JobPosting.id.in_(list(updates)))
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
     @staticmethod
     async def update(
         db: AsyncSession,
         job_posting_id: uuid.UUID,
-        **kwargs: str | int | bool | date | datetime | dict | list | None,
+        **kwargs: str | int | bool | bytes | date | datetime | dict | list | None,
     ) -> JobPosting | None:
         """Update job posting fields.
 
@@ -0,0 +1,88 @@
+"""Repository for PersonaEmbedding persistence.
+
+REQ-008 §6.5, §10.2: Durable tier of the persona embedding cache.
+Callers pass personas already loaded with user ownership checks
+(see scoring/job_scoring_service._load_persona), so queries here are
+keyed by persona_id only.
+
+Coordinates with:
+  - models/persona_settings.py (PersonaEmbedding ORM model)
+
+Called by: services/embedding/persona_embedding_store.py.
+"""
+
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.persona_settings import PersonaEmbedding
+
+
+class PersonaEmbeddingRepository:
+    """Stateless repository for PersonaEmbedding operations.
+
+    All methods are static — no instance state. Pass an AsyncSession
+    for every call so the caller controls transaction boundaries.
+    """
+
+    @staticmethod
+    async def get_for_persona(
+        db: AsyncSession,
+        persona_id: uuid.UUID,
+        *,
+        model_name: str,
+    ) -> list[PersonaEmbedding]:
+        """Fetch all stored embeddings for a persona and model.
+
+        Args:
+            db: Async database session.
+            persona_id: Persona UUID (ownership already verified by caller).
+            model_name: Embedding model the vectors must come from.
+
+        Returns:
+            PersonaEmbedding rows (at most one per embedding type).
+        """
+        stmt = select(PersonaEmbedding).where(
+            PersonaEmbedding.persona_id == persona_id,
+            PersonaEmbedding.model_name == model_name,
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def upsert_many(
+        db: AsyncSession,
+        rows: Sequence[dict[str, Any]],
+    ) -> None:
+        """Insert or replace persona embeddings with a single statement.
+
+        Conflicts on (persona_id, embedding_type, model_name) overwrite the
+        stored vector and source_hash.
+
+        Args:
+            db: Async database session.
+            rows: Dicts with persona_id, embedding_type, vector, model_name,
+                model_version, and source_hash.
+        """
+        if not rows:
+            return
+
+        stmt = pg_insert(PersonaEmbedding).values(list(rows))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                PersonaEmbedding.persona_id,
+                PersonaEmbedding.embedding_type,
+                PersonaEmbedding.model_name,
+            ],
+            set_={
+                "vector": stmt.excluded.vector,
+                "model_version": stmt.excluded.model_version,
+                "source_hash": stmt.excluded.source_hash,
+                "created_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
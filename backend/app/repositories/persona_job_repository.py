@@ -8,17 +8,26 @@ Coordinates with:
   - models/persona_job.py (PersonaJob ORM model)
 
 Called by: services/scoring/job_scoring_service.py,
-services/discovery/global_dedup_service.py, api/v1/job_postings.py.
+services/discovery/global_dedup_service.py,
+services/discovery/pool_surfacing_service.py, api/v1/job_postings.py.
 """
 
 import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Literal, cast
 
-from sqlalchemy import select, update
+from sqlalchemy import Integer, column, literal, select, update, values
+from sqlalchemy import cast as sql_cast
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.types import TypeEngine
 
 from app.models.persona import Persona
 from app.models.persona_job import PersonaJob
@@ -45,6 +54,54 @@ _UPDATABLE_FIELDS: frozenset[str] = frozenset(
 )
 
 
+_SCORE_UPDATE_CHUNK_SIZE = 1000
+"""Rows per UPDATE ... FROM (VALUES ...) statement (5 bind params per row)."""
+
+_SCORE_JSONB = JSONB(none_as_null=True)
+
+_LINK_INSERT_CHUNK_SIZE = 1000
+"""Rows per INSERT ... ON CONFLICT statement (at most 7 bind params per row)."""
+
+
+def _typed(value: Any, type_: TypeEngine[Any]) -> ColumnElement[Any]:
+    """Bind a VALUES cell with an explicit SQL type (NULLs included)."""
+    return sql_cast(literal(value, type_), type_)
+
+
+@dataclass(frozen=True)
+class PersonaJobScoreUpdate:
+    """Score fields for one persona_jobs row in a bulk score write.
+
+    Attributes:
+        job_posting_id: Job the score belongs to (with the caller's persona).
+        fit_score: Fit score (0-100), or None if filtered.
+        stretch_score: Stretch score (0-100), or None if filtered.
+        score_details: JSONB component breakdown, or None if filtered.
+        failed_non_negotiables: Failed filter reasons, or None if scored.
+    """
+
+    job_posting_id: uuid.UUID
+    fit_score: int | None
+    stretch_score: int | None
+    score_details: dict[str, Any] | None
+    failed_non_negotiables: list[str] | None
+
+
+@dataclass(frozen=True)
+class PoolLinkCreate:
+    """One persona_jobs row to create from pool surfacing.
+
+    Attributes:
+        persona_id: Persona the job was surfaced to.
+        job_posting_id: Surfaced job.
+        fit_score: Lightweight fit score (0-100).
+    """
+
+    persona_id: uuid.UUID
+    job_posting_id: uuid.UUID
+    fit_score: int
+
+
 class PersonaJobRepository:
     """Stateless repository for PersonaJob per-user operations.
 
@@ -240,6 +297,128 @@ class PersonaJobRepository:
         await db.refresh(persona_job)
         return persona_job
 
+    @staticmethod
+    async def create_many(
+        db: AsyncSession,
+        *,
+        persona_id: uuid.UUID,
+        job_posting_ids: Sequence[uuid.UUID],
+        discovery_method: str,
+        user_id: uuid.UUID | None = None,
+        search_bucket: Literal["fit", "stretch", "manual", "pool"] | None = None,
+    ) -> dict[uuid.UUID, PersonaJob] | None:
+        """Link many job postings to a persona, keeping existing links.
+
+        Batched get-or-create: INSERT ... ON CONFLICT DO NOTHING on
+        (persona_id, job_posting_id), then one SELECT of the links. Existing
+        links are returned unchanged. Ownership is checked the same way as
+        in create().
+
+        Args:
+            db: Async database session.
+            persona_id: FK to personas.
+            job_posting_ids: FKs to job_postings (duplicates are ignored).
+            discovery_method: How the jobs were discovered (scouter/manual/pool).
+            user_id: Optional user UUID for ownership verification.
+                Pass None for system-level operations only.
+            search_bucket: Search bucket that surfaced the jobs
+                (fit/stretch/manual/pool), or None.
+
+        Returns:
+            Dict mapping each job_posting_id to its PersonaJob (new or
+            existing), or None if user_id is given and persona is not owned.
+        """
+        if user_id is not None:
+            ownership = await db.execute(
+                select(Persona.id).where(
+                    Persona.id == persona_id, Persona.user_id == user_id
+                )
+            )
+            if ownership.scalar_one_or_none() is None:
+                return None
+
+        unique_ids = list(dict.fromkeys(job_posting_ids))
+        if not unique_ids:
+            return {}
+
+        for start in range(0, len(unique_ids), _LINK_INSERT_CHUNK_SIZE):
+            chunk = unique_ids[start : start + _LINK_INSERT_CHUNK_SIZE]
+            stmt = (
+                pg_insert(PersonaJob)
+                .values(
+                    [
+                        {
+                            "persona_id": persona_id,
+                            "job_posting_id": job_posting_id,
+                            "discovery_method": discovery_method,
+                            "status": "Discovered",
+                            "is_favorite": False,
+                            "search_bucket": search_bucket,
+                        }
+                        for job_posting_id in chunk
+                    ]
+                )
+                .on_conflict_do_nothing(constraint="uq_persona_jobs_persona_job")
+            )
+            await db.execute(stmt)
+
+        result = await db.execute(
+            select(PersonaJob).where(
+                PersonaJob.persona_id == persona_id,
+                PersonaJob.job_posting_id.in_(unique_ids),
+            )
+        )
+        return {pj.job_posting_id: pj for pj in result.scalars().all()}
+
+    @staticmethod
+    async def create_pool_links(
+        db: AsyncSession,
+        links: Sequence[PoolLinkCreate],
+        *,
+        scored_at: datetime,
+    ) -> set[tuple[uuid.UUID, uuid.UUID]]:
+        """Insert pool-surfaced links across many personas and jobs.
+
+        System-level (no ownership check): the surfacing worker links
+        jobs to personas of every user. One INSERT ... ON CONFLICT DO
+        NOTHING RETURNING per _LINK_INSERT_CHUNK_SIZE rows; links that
+        already exist are left unchanged and not returned.
+
+        Args:
+            db: Async database session (caller commits).
+            links: Rows to insert (discovery_method='pool',
+                status='Discovered').
+            scored_at: Timestamp recorded with each fit score.
+
+        Returns:
+            (persona_id, job_posting_id) pairs that were inserted.
+        """
+        created: set[tuple[uuid.UUID, uuid.UUID]] = set()
+        for start in range(0, len(links), _LINK_INSERT_CHUNK_SIZE):
+            chunk = links[start : start + _LINK_INSERT_CHUNK_SIZE]
+            stmt = (
+                pg_insert(PersonaJob)
+                .values(
+                    [
+                        {
+                            "persona_id": link.persona_id,
+                            "job_posting_id": link.job_posting_id,
+                            "discovery_method": "pool",
+                            "status": "Discovered",
+                            "is_favorite": False,
+                            "fit_score": link.fit_score,
+                            "scored_at": scored_at,
+                        }
+                        for link in chunk
+                    ]
+                )
+                .on_conflict_do_nothing(constraint="uq_persona_jobs_persona_job")
+                .returning(PersonaJob.persona_id, PersonaJob.job_posting_id)
+            )
+            result = await db.execute(stmt)
+            created.update((row[0], row[1]) for row in result.all())
+        return created
+
     @staticmethod
     async def update(
         db: AsyncSession,
@@ -373,3 +552,83 @@ class PersonaJobRepository:
         result = cast(CursorResult[Any], await db.execute(stmt))
         row_count: int = result.rowcount
         return row_count
+
+    @staticmethod
+    async def bulk_update_scores(
+        db: AsyncSession,
+        *,
+        persona_id: uuid.UUID,
+        user_id: uuid.UUID,
+        scores: Sequence[PersonaJobScoreUpdate],
+        scored_at: datetime,
+    ) -> int:
+        """Write scores for many jobs of one persona in a single statement.
+
+        REQ-017 §6.2: Batch persistence for the scoring pipeline. Issues
+        UPDATE persona_jobs ... FROM (VALUES ...) joined on job_posting_id,
+        so a batch costs one round-trip instead of a SELECT, UPDATE, and
+        refresh per job. Rows without an existing persona_jobs link are
+        skipped (no insert).
+
+        Args:
+            db: Async database session.
+            persona_id: Persona the scores belong to.
+            user_id: Authenticated user's UUID (ownership filter).
+            scores: Per-job score fields.
+            scored_at: Timestamp recorded on every updated row.
+
+        Returns:
+            Number of records updated.
+        """
+        if not scores:
+            return 0
+
+        # Subquery: persona IDs owned by this user
+        owned_persona_ids = select(Persona.id).where(Persona.user_id == user_id)
+
+        updated = 0
+        for start in range(0, len(scores), _SCORE_UPDATE_CHUNK_SIZE):
+            chunk = scores[start : start + _SCORE_UPDATE_CHUNK_SIZE]
+            # WHY none_as_null: filtered jobs store SQL NULL (not JSON
+            # 'null') in score_details, matching the per-row ORM update.
+            # WHY cast: Postgres types a VALUES column that is NULL in
+            # every row as text, which the UPDATE then rejects.
+            rows = values(
+                column("job_posting_id", PG_UUID(as_uuid=True)),
+                column("fit_score", Integer),
+                column("stretch_score", Integer),
+                column("score_details", _SCORE_JSONB),
+                column("failed_non_negotiables", _SCORE_JSONB),
+                name="scores",
+            ).data(
+                [
+                    (
+                        score.job_posting_id,
+                        _typed(score.fit_score, Integer()),
+                        _typed(score.stretch_score, Integer()),
+                        _typed(score.score_details, _SCORE_JSONB),
+                        _typed(score.failed_non_negotiables, _SCORE_JSONB),
+                    )
+                    for score in chunk
+                ]
+            )
+
+            stmt = (
+                update(PersonaJob)
+                .where(
+                    PersonaJob.persona_id == persona_id,
+                    PersonaJob.persona_id.in_(owned_persona_ids),
+                    PersonaJob.job_posting_id == rows.c.job_posting_id,
+                )
+                .values(
+                    fit_score=rows.c.fit_score,
+                    stretch_score=rows.c.stretch_score,
+                    score_details=rows.c.score_details,
+                    failed_non_negotiables=rows.c.failed_non_negotiables,
+                    scored_at=scored_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            result = cast(CursorResult[Any], await db.execute(stmt))
+            updated += result.rowcount
+        return updated
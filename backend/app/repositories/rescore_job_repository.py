@@ -0,0 +1,287 @@
+"""Repository for the RescoreJob queue.
+
+REQ-006 §5.2, REQ-017 §6.2: Durable rescore queue behind
+POST /job-postings/rescore. API reads are scoped to user_id; worker
+methods (claim, progress, completion) are keyed by job ID only.
+
+Coordinates with:
+  - models/persona.py (Persona ORM model — ownership scoping)
+  - models/rescore_job.py (RescoreJob ORM model)
+
+Called by: services/scoring/rescore_worker.py, api/v1/job_postings.py.
+"""
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any, cast
+
+from sqlalchemy import func, literal, select, text, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.persona import Persona
+from app.models.rescore_job import RescoreJob
+
+_STATUS_QUEUED = "queued"
+_STATUS_RUNNING = "running"
+
+_MAX_ERROR_LENGTH = 1000
+"""Stored error summaries are truncated to this many characters."""
+
+
+class RescoreJobRepository:
+    """Stateless repository for RescoreJob operations.
+
+    All methods are static — no instance state. Pass an AsyncSession
+    for every call so the caller controls transaction boundaries.
+    """
+
+    @staticmethod
+    async def enqueue_for_user(
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID,
+    ) -> list[RescoreJob]:
+        """Queue a rescore for each of the user's personas.
+
+        A persona that already has a queued job keeps it (ON CONFLICT DO
+        NOTHING on the partial unique index), so repeated requests
+        coalesce. A running job does not block a new queued one — it may
+        have loaded the persona before the edit that triggered this call.
+
+        Args:
+            db: Async database session.
+            user_id: Authenticated user's UUID.
+
+        Returns:
+            The queued RescoreJob for each persona, oldest first.
+        """
+        stmt = (
+            pg_insert(RescoreJob)
+            .from_select(
+                ["user_id", "persona_id"],
+                select(
+                    literal(user_id, PG_UUID(as_uuid=True)),
+                    Persona.id,
+                ).where(Persona.user_id == user_id),
+            )
+            # WHY text(): a bound status parameter lets Postgres switch to
+            # a generic plan after five executions, which no longer
+            # matches the partial index's predicate for ON CONFLICT.
+            .on_conflict_do_nothing(
+                index_elements=[RescoreJob.persona_id],
+                index_where=text("status = 'queued'"),
+            )
+        )
+        await db.execute(stmt)
+
+        result = await db.execute(
+            select(RescoreJob)
+            .where(
+                RescoreJob.user_id == user_id,
+                RescoreJob.status == _STATUS_QUEUED,
+            )
+            .order_by(RescoreJob.created_at)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_by_id(
+        db: AsyncSession,
+        rescore_job_id: uuid.UUID,
+        *,
+        user_id: uuid.UUID,
+    ) -> RescoreJob | None:
+        """Fetch a rescore job owned by the user.
+
+        Args:
+            db: Async database session.
+            rescore_job_id: RescoreJob UUID.
+            user_id: Authenticated user's UUID (ownership filter).
+
+        Returns:
+            RescoreJob if found and owned, None otherwise.
+        """
+        result = await db.execute(
+            select(RescoreJob).where(
+                RescoreJob.id == rescore_job_id,
+                RescoreJob.user_id == user_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def recover_stale(
+        db: AsyncSession,
+        *,
+        stale_before: datetime,
+        max_attempts: int,
+    ) -> int:
+        """Requeue running jobs whose worker stopped sending heartbeats.
+
+        A stale job is failed instead when it has used max_attempts or
+        when its persona already has a queued job (which supersedes it).
+
+        Args:
+            db: Async database session.
+            stale_before: Running jobs last updated before this are stale.
+            max_attempts: Claims allowed before a stale job is failed.
+
+        Returns:
+            Number of stale jobs requeued or failed.
+        """
+        queued = aliased(RescoreJob)
+        superseded = (
+            select(queued.id)
+            .where(
+                queued.persona_id == RescoreJob.persona_id,
+                queued.status == _STATUS_QUEUED,
+            )
+            .exists()
+        )
+        stale = (
+            RescoreJob.status == _STATUS_RUNNING,
+            RescoreJob.updated_at < stale_before,
+        )
+
+        failed = cast(
+            CursorResult[Any],
+            await db.execute(
+                update(RescoreJob)
+                .where(
+                    *stale,
+                    (RescoreJob.attempts >= max_attempts) | superseded,
+                )
+                .values(
+                    status="failed",
+                    error="Worker stopped before the rescore finished",
+                    finished_at=func.now(),
+                )
+                .execution_options(synchronize_session=False)
+            ),
+        )
+        requeued = cast(
+            CursorResult[Any],
+            await db.execute(
+                update(RescoreJob)
+                .where(*stale)
+                .values(status=_STATUS_QUEUED, started_at=None)
+                .execution_options(synchronize_session=False)
+            ),
+        )
+        return failed.rowcount + requeued.rowcount
+
+    @staticmethod
+    async def claim_next(db: AsyncSession) -> RescoreJob | None:
+        """Claim the oldest queued job for this worker.
+
+        Uses FOR UPDATE SKIP LOCKED so concurrent workers never claim the
+        same row. Personas with a running job are skipped, so one persona
+        is never rescored by two workers at once. The claim is visible to
+        others once the caller commits.
+
+        The skip alone is racy under READ COMMITTED: two workers can both
+        see no running job and claim two queued jobs for one persona. The
+        uq_rescorejob_persona_running index rejects the second claim, which
+        then returns None; the worker retries on its next pass.
+
+        Args:
+            db: Async database session.
+
+        Returns:
+            The claimed RescoreJob (now running), or None if the queue is
+            empty.
+        """
+        running = aliased(RescoreJob)
+        persona_busy = (
+            select(running.id)
+            .where(
+                running.persona_id == RescoreJob.persona_id,
+                running.status == _STATUS_RUNNING,
+            )
+            .exists()
+        )
+        result = await db.execute(
+            select(RescoreJob)
+            .where(RescoreJob.status == _STATUS_QUEUED, ~persona_busy)
+            .order_by(RescoreJob.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = result.scalar_one_or_none()
+        if job is None:
+            return None
+
+        try:
+            async with db.begin_nested():
+                job.status = _STATUS_RUNNING
+                job.attempts += 1
+                job.processed_jobs = 0
+                job.total_jobs = None
+                job.error = None
+                job.started_at = datetime.now(UTC)
+        except IntegrityError:
+            # WHY: Another worker claimed a job for this persona after this
+            # statement's snapshot; its claim stands and this one is undone.
+            return None
+        return job
+
+    @staticmethod
+    async def record_progress(
+        db: AsyncSession,
+        rescore_job_id: uuid.UUID,
+        *,
+        processed_jobs: int,
+        total_jobs: int,
+    ) -> None:
+        """Record chunk progress; also refreshes the heartbeat (updated_at).
+
+        Args:
+            db: Async database session.
+            rescore_job_id: RescoreJob UUID.
+            processed_jobs: Jobs rescored so far.
+            total_jobs: Discovered jobs in this rescore.
+        """
+        await db.execute(
+            update(RescoreJob)
+            .where(RescoreJob.id == rescore_job_id)
+            .values(
+                processed_jobs=processed_jobs,
+                total_jobs=total_jobs,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def mark_finished(
+        db: AsyncSession,
+        rescore_job_id: uuid.UUID,
+        *,
+        error: str | None = None,
+    ) -> None:
+        """Mark a running job completed, or failed when error is given.
+
+        Args:
+            db: Async database session.
+            rescore_job_id: RescoreJob UUID.
+            error: User-safe failure message (returned by the API); None
+                marks the job completed.
+        """
+        await db.execute(
+            update(RescoreJob)
+            .where(
+                RescoreJob.id == rescore_job_id,
+                RescoreJob.status == _STATUS_RUNNING,
+            )
+            .values(
+                status="completed" if error is None else "failed",
+                error=error[:_MAX_ERROR_LENGTH] if error is not None else None,
+                finished_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
@@ -6,6 +6,8 @@ REQ-015 §8.3: Response models enforce privacy boundaries.
 REQ-015 §9: Request models for API endpoint updates.
 - UpdatePersonaJobRequest: per-user fields only (shared data immutable)
 - CreateJobPostingRequest: manual job creation with dedup
+REQ-017 §6.2: Background rescore queue.
+- RescoreJobResponse: queued/running rescore with progress
 
 Coordinates with:
   - (no internal app imports — standalone Pydantic schemas)
@@ -107,6 +109,38 @@ class PersonaJobResponse(BaseModel):
     dismissed_at: datetime | None = None
 
 
+class RescoreJobResponse(BaseModel):
+    """Background rescore of a persona's Discovered jobs.
+
+    REQ-017 §6.2: Returned by POST /job-postings/rescore and polled via
+    GET /job-postings/rescore/{id}. Completion is also pushed as a
+    data_changed event on the chat SSE stream.
+
+    Attributes:
+        id: RescoreJob UUID.
+        persona_id: Persona being rescored.
+        status: queued | running | completed | failed.
+        processed_jobs: Jobs rescored so far.
+        total_jobs: Discovered jobs to rescore (None until started).
+        error: Failure summary when status is failed.
+        created_at: When the rescore was queued.
+        started_at: When the current attempt started.
+        finished_at: When the rescore completed or failed.
+    """
+
+    model_config = ConfigDict(extra="forbid", from_attributes=True)
+
+    id: uuid.UUID
+    persona_id: uuid.UUID
+    status: Literal["queued", "running", "completed", "failed"]
+    processed_jobs: int
+    total_jobs: int | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
 class UpdatePersonaJobRequest(BaseModel):
     """Request body for PATCH /job-postings/{id}.
 
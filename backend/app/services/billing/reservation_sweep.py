@@ -24,7 +24,7 @@ Coordinates with:
   - admin/admin_config_service.py — imports AdminConfigService for pricing lookups
   - billing/metering_service.py — imports MeteringService for settlement retry
 
-Called by: app/main.py (FastAPI lifespan event) and unit tests.
+Called by: app/worker.py (API lifespan and worker process) and unit tests.
 """
 
 import asyncio
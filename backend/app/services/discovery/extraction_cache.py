@@ -0,0 +1,129 @@
+"""Read-through cache for LLM extraction results.
+
+REQ-007 §6.4, REQ-016 §6.3: The shared pool sees the same description
+from several aggregators, from every persona's poll, and from manual
+ingest. Extraction output depends only on the description text, the
+prompt, and the model, so results are keyed by (description_hash,
+prompt_version, model_name) and shared across all users.
+
+Callers look up every description they are about to extract in one
+query, call the LLM only for misses, and store the new results. Cache
+failures never fail the caller: lookups degrade to "all misses" and
+writes are dropped, each inside a SAVEPOINT so the caller's transaction
+stays usable.
+
+Coordinates with:
+  - repositories/extraction_cache_repository.py — bulk lookup and insert
+
+Called by: discovery/job_enrichment_service.py, discovery/job_extraction.py,
+discovery/job_fetch_service.py, api/v1/job_postings.py, and unit tests.
+"""
+
+import hashlib
+import logging
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.extraction_cache_repository import ExtractionCacheRepository
+
+logger = logging.getLogger(__name__)
+
+
+def compute_description_hash(description: str) -> str:
+    """Compute the cache key of a description.
+
+    Same digest as job_postings.description_hash, so a pool posting and
+    its cached extraction share a key.
+
+    Args:
+        description: Full description text (before any truncation).
+
+    Returns:
+        64-char SHA-256 hex digest.
+    """
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+class ExtractionCache:
+    """Extraction results stored in the extraction_cache table.
+
+    Args:
+        db: Async database session (caller controls transaction).
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def get_many(
+        self,
+        descriptions: Iterable[str],
+        *,
+        prompt_version: str,
+        model_name: str,
+    ) -> dict[str, dict[str, Any]]:
+        """Look up stored results for many descriptions in one query.
+
+        Args:
+            descriptions: Description texts about to be extracted.
+            prompt_version: Extraction prompt identifier and version.
+            model_name: Model that would serve the extraction.
+
+        Returns:
+            Stored result by description hash. Empty if the lookup fails.
+        """
+        hashes = {compute_description_hash(d) for d in descriptions if d}
+        if not hashes:
+            return {}
+        try:
+            async with self._db.begin_nested():
+                cached = await ExtractionCacheRepository.get_many(
+                    self._db,
+                    hashes,
+                    prompt_version=prompt_version,
+                    model_name=model_name,
+                )
+        except SQLAlchemyError as e:
+            logger.warning("Extraction cache lookup failed: %s", e)
+            return {}
+
+        logger.debug(
+            "Extraction cache (%s): %d of %d descriptions cached",
+            prompt_version,
+            len(cached),
+            len(hashes),
+        )
+        return cached
+
+    async def put_many(
+        self,
+        results: Mapping[str, dict[str, Any]],
+        *,
+        prompt_version: str,
+        model_name: str,
+    ) -> None:
+        """Store new extraction results.
+
+        Args:
+            results: Extraction result by description hash.
+            prompt_version: Extraction prompt identifier and version.
+            model_name: Model that produced the results.
+        """
+        if not results:
+            return
+        rows = [
+            {
+                "description_hash": description_hash,
+                "prompt_version": prompt_version,
+                "model_name": model_name,
+                "result": result,
+            }
+            for description_hash, result in results.items()
+        ]
+        try:
+            async with self._db.begin_nested():
+                await ExtractionCacheRepository.insert_many(self._db, rows)
+        except SQLAlchemyError as e:
+            logger.warning("Extraction cache write failed: %s", e)
@@ -4,13 +4,22 @@ REQ-015 §6: 4-step global dedup pipeline.
 1. source_id + external_id match → UPDATE existing
 2. description_hash match → ADD to also_found_on
 3. company + title + description similarity → LINK as repost
+   (candidates narrowed by MinHash LSH bands and a Jaccard-estimate
+   prefilter before the exact SequenceMatcher ratio)
 4. No match → CREATE new in shared pool
 
 After dedup: create persona_jobs link for discovering user.
 Race condition: savepoint + IntegrityError recovery.
 
+deduplicate_and_save_batch() runs the same pipeline for a whole poll
+result with set-based queries (bulk lookups, one multi-row INSERT ... ON
+CONFLICT, bulk links), falling back to deduplicate_and_save() for jobs
+that depend on another job of the same batch.
+
 Coordinates with:
   - discovery/content_security.py — calls lift_quarantine on confirmed jobs
+  - discovery/description_minhash.py — MinHash signatures, LSH band keys,
+    and estimate_jaccard for repost candidates
   - discovery/job_deduplication.py — imports dedup functions and similarity thresholds
 
 Called by: repositories/job_pool_repository.py (pool write path) and unit tests.
@@ -18,6 +27,7 @@ Called by: repositories/job_pool_repository.py (pool write path) and unit tests.
 
 import logging
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from typing import Any, Literal
@@ -33,6 +43,11 @@ from app.repositories.job_posting_repository import (
 )
 from app.repositories.persona_job_repository import PersonaJobRepository
 from app.services.discovery.content_security import lift_quarantine
+from app.services.discovery.description_minhash import (
+    MIN_JACCARD_ESTIMATE,
+    description_minhash_fields,
+    estimate_jaccard,
+)
 from app.services.discovery.job_deduplication import (
     DESCRIPTION_SIMILARITY_THRESHOLD_HIGH,
     DESCRIPTION_SIMILARITY_THRESHOLD_MEDIUM,
@@ -65,6 +80,8 @@ _SOURCE_UPDATE_FIELDS: frozenset[str] = frozenset(
         "salary_currency",
         "description",
         "description_hash",
+        "description_minhash",
+        "description_lsh_bands",
         "culture_text",
         "requirements",
         "raw_text",
@@ -100,6 +117,21 @@ class DeduplicationOutcome:
     matched_job_id: uuid.UUID | None
 
 
+@dataclass(frozen=True)
+class _BatchMatch:
+    """Dedup result of one batch job, before its persona link exists."""
+
+    action: Literal[
+        "update_existing",
+        "add_to_also_found_on",
+        "create_linked_repost",
+        "create_new",
+    ]
+    job_posting: JobPosting
+    confidence: Literal["High", "Medium"] | None
+    matched_job_id: uuid.UUID | None
+
+
 async def deduplicate_and_save(
     db: AsyncSession,
     *,
@@ -132,6 +164,9 @@ async def deduplicate_and_save(
         DeduplicationOutcome with action, job posting, persona link,
         and match confidence.
     """
+    # MinHash columns are computed once and flow through the create and
+    # same-source update paths with the other job fields
+    job_data = {**job_data, **description_minhash_fields(job_data["description"])}
     source_id: uuid.UUID = job_data["source_id"]
     external_id: str | None = job_data.get("external_id")
 
@@ -184,8 +219,9 @@ async def deduplicate_and_save(
 
     # Step 3: company + title + description similarity → LINK as repost
     company_name: str = job_data["company_name"]
+    band_keys: list[int] | None = job_data["description_lsh_bands"]
     candidates = await JobPostingRepository.get_by_company_for_similarity(
-        db, company_name
+        db, company_name, band_keys=band_keys
     )
     repost_result = _find_similarity_match(job_data, candidates)
     if repost_result is not None:
@@ -218,6 +254,198 @@ async def deduplicate_and_save(
     )
 
 
+async def deduplicate_and_save_batch(
+    db: AsyncSession,
+    *,
+    jobs_data: Sequence[dict[str, Any]],
+    persona_id: uuid.UUID,
+    user_id: uuid.UUID,
+    discovery_method: Literal["scouter", "manual", "pool"] = "scouter",
+    search_bucket: Literal["fit", "stretch", "manual", "pool"] | None = None,
+) -> list[DeduplicationOutcome]:
+    """Run the global dedup pipeline for a batch of jobs with bulk queries.
+
+    Same outcomes as calling deduplicate_and_save() per job, at a handful
+    of round-trips per batch instead of several per job:
+    - Steps 1 and 2: one lookup each, applied with a single flush.
+    - Step 3: repost candidates for all unmatched jobs in one query.
+    - Step 4: new postings inserted with multi-row INSERT ... ON CONFLICT.
+    - persona_jobs links created in bulk.
+
+    Jobs whose outcome depends on an earlier job of the batch (same
+    source + external_id or description_hash, same matched posting, or a
+    repost of a posting created by the batch) and jobs that lose an
+    insert race go through deduplicate_and_save() afterwards, so they see
+    the batch's writes.
+
+    Args:
+        db: Async database session (caller manages transaction).
+        jobs_data: Job posting data dicts (see deduplicate_and_save).
+        persona_id: UUID of the discovering persona.
+        user_id: UUID of the authenticated user (ownership check).
+        discovery_method: How the jobs were discovered.
+        search_bucket: Search bucket that surfaced the jobs, or None.
+
+    Returns:
+        One DeduplicationOutcome per job, in input order.
+
+    Raises:
+        ValueError: If the persona is not owned by the user.
+    """
+    jobs_data = [
+        {**job_data, **description_minhash_fields(job_data["description"])}
+        for job_data in jobs_data
+    ]
+    matches: dict[int, _BatchMatch] = {}
+    deferred: list[int] = []
+
+    # Steps 1 + 2: bulk lookups, then all updates in one flush
+    by_source_key = await JobPostingRepository.get_by_source_and_external_ids(
+        db,
+        {
+            (job_data["source_id"], job_data["external_id"])
+            for job_data in jobs_data
+            if job_data.get("external_id") is not None
+        },
+    )
+    by_hash = await JobPostingRepository.get_by_description_hashes(
+        db, {job_data["description_hash"] for job_data in jobs_data}
+    )
+
+    seen_source_keys: set[tuple[uuid.UUID, str]] = set()
+    seen_hashes: set[str] = set()
+    updates: dict[uuid.UUID, dict[str, Any]] = {}
+    unmatched: list[int] = []
+    now = datetime.now(UTC)
+    for i, job_data in enumerate(jobs_data):
+        external_id: str | None = job_data.get("external_id")
+        source_key = (
+            (job_data["source_id"], external_id) if external_id is not None else None
+        )
+        description_hash: str = job_data["description_hash"]
+        if source_key in seen_source_keys or description_hash in seen_hashes:
+            deferred.append(i)
+            continue
+        if source_key is not None:
+            seen_source_keys.add(source_key)
+        seen_hashes.add(description_hash)
+
+        existing = by_source_key.get(source_key) if source_key is not None else None
+        if existing is not None:
+            action: Literal["update_existing", "add_to_also_found_on"] = (
+                "update_existing"
+            )
+            fields = _extract_source_update_fields(job_data)
+            fields["last_verified_at"] = now
+        else:
+            existing = by_hash.get(description_hash)
+            if existing is None:
+                unmatched.append(i)
+                continue
+            action = "add_to_also_found_on"
+            fields = {"also_found_on": _build_updated_also_found_on(existing, job_data)}
+
+        if existing.id in updates:
+            deferred.append(i)
+            continue
+        updates[existing.id] = fields
+        matches[i] = _BatchMatch(
+            action=action,
+            job_posting=existing,
+            confidence="High",
+            matched_job_id=existing.id,
+        )
+
+    if updates:
+        await JobPostingRepository.update_many(db, updates)
+        for match in matches.values():
+            await _maybe_lift_quarantine(db, match.job_posting, discovery_method)
+
+    # Steps 3 + 4: one candidate query, one multi-row insert
+    candidate_lists = await JobPostingRepository.get_candidates_for_similarity_batch(
+        db,
+        [
+            (jobs_data[i]["company_name"], jobs_data[i]["description_lsh_bands"])
+            for i in unmatched
+        ],
+    )
+    new_rows: dict[int, dict[str, Any]] = {}
+    # Repost match (matched_job, confidence) of each new row, or None
+    planned: dict[int, tuple[JobPosting, Literal["High", "Medium"]] | None] = {}
+    # Transient postings for this batch's new rows, by normalized company
+    batch_postings: dict[str, list[JobPosting]] = {}
+    for i, candidates in zip(unmatched, candidate_lists, strict=True):
+        job_data = jobs_data[i]
+        company_postings = batch_postings.setdefault(
+            job_data["company_name"].lower().strip(), []
+        )
+        if _find_similarity_match(job_data, company_postings) is not None:
+            deferred.append(i)
+            continue
+
+        row = {"id": uuid.uuid4(), **_extract_create_fields(job_data)}
+        repost_result = _find_similarity_match(job_data, candidates)
+        if repost_result is not None:
+            row.update(_build_repost_fields(repost_result[0]))
+        planned[i] = repost_result
+        new_rows[i] = row
+        company_postings.append(JobPosting(**row))
+
+    created = {
+        jp.id: jp
+        for jp in await JobPostingRepository.create_many(db, list(new_rows.values()))
+    }
+    for i, row in new_rows.items():
+        job_posting = created.get(row["id"])
+        if job_posting is None:
+            # Lost an insert race — the sequential path recovers the winner
+            deferred.append(i)
+            continue
+        repost = planned[i]
+        matches[i] = _BatchMatch(
+            action="create_new" if repost is None else "create_linked_repost",
+            job_posting=job_posting,
+            confidence=None if repost is None else repost[1],
+            matched_job_id=None if repost is None else repost[0].id,
+        )
+
+    # persona_jobs links in bulk
+    outcomes: dict[int, DeduplicationOutcome] = {}
+    if matches:
+        links = await PersonaJobRepository.create_many(
+            db,
+            persona_id=persona_id,
+            job_posting_ids=[match.job_posting.id for match in matches.values()],
+            discovery_method=discovery_method,
+            user_id=user_id,
+            search_bucket=search_bucket,
+        )
+        if links is None:
+            logger.warning("Persona %s not owned by user %s", persona_id, user_id)
+            msg = "Persona not owned by authenticated user"
+            raise ValueError(msg)
+        for i, match in matches.items():
+            outcomes[i] = DeduplicationOutcome(
+                action=match.action,
+                job_posting=match.job_posting,
+                persona_job=links[match.job_posting.id],
+                confidence=match.confidence,
+                matched_job_id=match.matched_job_id,
+            )
+
+    for i in sorted(deferred):
+        outcomes[i] = await deduplicate_and_save(
+            db,
+            job_data=jobs_data[i],
+            persona_id=persona_id,
+            user_id=user_id,
+            discovery_method=discovery_method,
+            search_bucket=search_bucket,
+        )
+
+    return [outcomes[i] for i in range(len(jobs_data))]
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -297,17 +525,27 @@ def _find_similarity_match(
     """Find the best similarity match among candidates.
 
     Returns (matched_job, confidence) or None.
-    Descriptions are truncated to _MAX_SIMILARITY_DESC_LENGTH to bound
-    SequenceMatcher O(n²) comparison time.
+    Candidates whose MinHash Jaccard estimate is below MIN_JACCARD_ESTIMATE
+    are skipped without the exact ratio. Descriptions are truncated to
+    _MAX_SIMILARITY_DESC_LENGTH to bound SequenceMatcher O(n²) comparison
+    time.
     """
     new_title = job_data.get("job_title", "")
     new_description = job_data.get("description", "")[:_MAX_SIMILARITY_DESC_LENGTH]
+    new_minhash: bytes | None = job_data.get("description_minhash")
 
     best_medium: tuple[JobPosting | None, float] = (None, 0.0)
 
     for candidate in candidates:
         if not is_similar_title(new_title, candidate.job_title):
             continue
+        if (
+            new_minhash is not None
+            and candidate.description_minhash is not None
+            and estimate_jaccard(new_minhash, candidate.description_minhash)
+            < MIN_JACCARD_ESTIMATE
+        ):
+            continue
 
         candidate_desc = candidate.description[:_MAX_SIMILARITY_DESC_LENGTH]
         similarity = calculate_description_similarity(new_description, candidate_desc)
@@ -324,6 +562,15 @@ def _find_similarity_match(
     return None
 
 
+def _build_repost_fields(matched_job: JobPosting) -> dict[str, Any]:
+    """Build the repost chain fields for a repost of the matched job."""
+    prior_chain = matched_job.previous_posting_ids or []
+    return {
+        "previous_posting_ids": [str(matched_job.id), *list(prior_chain)],
+        "repost_count": (matched_job.repost_count or 0) + 1,
+    }
+
+
 async def _create_repost(
     db: AsyncSession,
     job_data: dict[str, Any],
@@ -332,12 +579,6 @@ async def _create_repost(
     """Create a new job posting linked as a repost of the matched job."""
     create_fields = _extract_create_fields(job_data)
 
-    # Build repost chain
-    matched_id = str(matched_job.id)
-    prior_chain = matched_job.previous_posting_ids or []
-    previous_posting_ids = [matched_id, *list(prior_chain)]
-    repost_count = (matched_job.repost_count or 0) + 1
-
     job_posting = await JobPostingRepository.create(
         db,
         **create_fields,
@@ -346,8 +587,7 @@ async def _create_repost(
     await JobPostingRepository.update(
         db,
         job_posting.id,
-        previous_posting_ids=previous_posting_ids,
-        repost_count=repost_count,
+        **_build_repost_fields(matched_job),
     )
     await db.refresh(job_posting)
     return job_posting
@@ -26,6 +26,7 @@ import re
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Any, Literal
 
 # WHY Any: Job data comes from various sources (API, database, agents) with
@@ -138,9 +139,19 @@ class DuplicateResult:
 # =============================================================================
 
 
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+# Distinct raw titles remembered by _normalize_title (titles repeat
+# heavily across the candidates of incoming jobs)
+_NORMALIZE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def _normalize_title(title: str) -> str:
     """Normalize title for comparison.
 
+    Results are memoized.
+
     Args:
         title: Raw job title.
 
@@ -152,40 +163,59 @@ def _normalize_title(title: str) -> str:
     # Remove all punctuation (including hyphens surrounded by spaces like " - ")
     # WHY: Punctuation variations like "/" vs "-" shouldn't affect similarity.
     # "Agile Coach / Scrum Master" and "Agile Coach - Scrum Master" are equivalent.
-    normalized = re.sub(r"[^\w\s]", " ", normalized)
+    normalized = _PUNCTUATION_RE.sub(" ", normalized)
     # Normalize whitespace
     normalized = " ".join(normalized.split())
     return normalized
 
 
-def _levenshtein_distance(s1: str, s2: str) -> int:
-    """Calculate Levenshtein edit distance between two strings.
+def _bounded_levenshtein_distance(s1: str, s2: str, max_distance: int) -> int:
+    """Calculate Levenshtein edit distance, giving up above max_distance.
+
+    Only the diagonal band |i - j| <= max_distance of the DP table is
+    computed (cells outside it are always > max_distance), and the scan
+    stops as soon as a whole row of the band exceeds max_distance.
+    Costs O(max_distance · len) instead of O(len1 · len2).
 
     Args:
         s1: First string.
         s2: Second string.
+        max_distance: Largest distance of interest (>= 0).
 
     Returns:
-        Minimum number of single-character edits to transform s1 into s2.
+        The edit distance if it is <= max_distance, otherwise
+        max_distance + 1.
     """
     if len(s1) < len(s2):
-        return _levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
+    over = max_distance + 1
 
-    if len(s2) == 0:
+    # Length difference alone is a lower bound on the distance
+    if len(s1) - len(s2) > max_distance:
+        return over
+    if not s2:
         return len(s1)
 
-    previous_row: list[int] = list(range(len(s2) + 1))
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
+    width = len(s2)
+    previous_row = [j if j <= max_distance else over for j in range(width + 1)]
+    for i, c1 in enumerate(s1, start=1):
+        low = max(1, i - max_distance)
+        high = min(width, i + max_distance)
+        current_row = [over] * (width + 1)
+        current_row[0] = i if i <= max_distance else over
+        for j in range(low, high + 1):
             # Cost is 0 if characters match, 1 otherwise
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
+            current_row[j] = min(
+                previous_row[j] + 1,  # deletion
+                current_row[j - 1] + 1,  # insertion
+                previous_row[j - 1] + (c1 != s2[j - 1]),  # substitution
+                over,
+            )
+        if min(current_row[low - 1 : high + 1]) > max_distance:
+            return over
         previous_row = current_row
 
-    return previous_row[-1]
+    return previous_row[width]
 
 
 def _word_overlap_ratio(title1: str, title2: str) -> float:
@@ -247,7 +277,10 @@ def is_similar_title(title1: str, title2: str) -> bool:
         return True
 
     # Check 3: Levenshtein distance <= 3
-    if _levenshtein_distance(norm1, norm2) <= LEVENSHTEIN_THRESHOLD:
+    if (
+        _bounded_levenshtein_distance(norm1, norm2, LEVENSHTEIN_THRESHOLD)
+        <= LEVENSHTEIN_THRESHOLD
+    ):
         return True
 
     # Check 4: Word overlap >= 80%
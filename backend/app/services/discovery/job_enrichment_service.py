@@ -3,26 +3,64 @@
 REQ-016 §6.3: Enriches raw job postings with extracted skills, culture
 signals, and ghost detection scores.
 
+Jobs are enriched with bounded concurrency (_MAX_CONCURRENT_JOBS), and a
+job's extraction and ghost-vagueness LLM calls run at the same time, so a
+poll with many new jobs no longer pays two serial LLM latencies per job.
+Each step has its own timeout and fails forward to its empty defaults.
+Short descriptions are extracted several per LLM call (one system prompt
+per batch); items a batch cannot extract fall back to single-job calls.
+Extractions are looked up in the shared extraction cache first, so a
+description already extracted for any user skips the extraction call.
+
 Coordinates with:
   - discovery/ghost_detection.py — calls calculate_ghost_score for freshness analysis
+  - discovery/extraction_cache.py — shared extraction results by description hash
 
 Called by: discovery/job_fetch_service.py and unit tests.
 """
 
+import asyncio
 import json
 import logging
-from typing import Any
+import secrets
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
 
 from app.core.llm_sanitization import sanitize_llm_input
 from app.providers.errors import ProviderError
 from app.providers.llm.base import LLMMessage, LLMProvider, TaskType
+from app.services.discovery.extraction_cache import (
+    ExtractionCache,
+    compute_description_hash,
+)
 from app.services.discovery.ghost_detection import calculate_ghost_score
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 # Max characters to send to LLM for skill extraction per REQ-007 §6.4.
 _MAX_DESCRIPTION_LENGTH = 15000
 
+# Max in-flight LLM calls of each kind (extraction, ghost vagueness).
+_MAX_CONCURRENT_JOBS = 8
+
+# Batched extraction: short descriptions share one JSON-mode request so
+# the system prompt is paid once per batch. Longer descriptions gain
+# little and risk truncated output, so they are extracted alone.
+_EXTRACTION_BATCH_SIZE = 8
+_MAX_BATCH_ITEM_LENGTH = 4000
+_BATCH_OUTPUT_TOKENS_PER_JOB = 600
+
+# Per-step budget for one job's extraction or ghost scoring. A step that
+# overruns falls back to the same defaults as a failed step.
+_STEP_TIMEOUT_SECONDS = 60.0
+
+# Extraction cache key component. Bump when either extraction prompt or
+# the response parsing changes so stale results are not reused.
+_EXTRACTION_PROMPT_VERSION = "skills_culture:1"
+
 _EXTRACTION_SYSTEM_PROMPT = """\
 You are a job posting parser. Extract structured information from the job description.
 
@@ -35,6 +73,22 @@ null if none present
 Keep skill names concise and normalized (e.g. "Python", "Docker", "machine learning").
 Return only the JSON object, no additional text."""
 
+_BATCH_EXTRACTION_SYSTEM_PROMPT = """\
+You are a job posting parser. The input contains several job descriptions. Each one \
+starts with a line "=== JOB <id> ===" and ends with "=== END JOB <id> ===".
+Extract structured information from each description independently.
+
+Return a JSON object with one field, "jobs": a list with one object per job, each with \
+exactly these fields:
+- id: string — the job's id, copied exactly from its delimiter line
+- required_skills: list of strings — skills explicitly required in the posting
+- preferred_skills: list of strings — skills listed as preferred, nice-to-have, or bonus
+- culture_text: string or null — key cultural signals (values, work style, team environment); \
+null if none present
+
+Keep skill names concise and normalized (e.g. "Python", "Docker", "machine learning").
+Return only the JSON object, no additional text."""
+
 
 def _empty_extraction() -> dict[str, Any]:
     """Return the default empty extraction result."""
@@ -63,113 +117,341 @@ def _coerce_string_list(value: Any) -> list[str]:
     return [item for item in value if isinstance(item, str)]
 
 
-async def _score_single_job(
+def _cacheable_extraction(job: dict[str, Any]) -> dict[str, Any] | None:
+    """Return an enriched job's extraction if it is worth caching.
+
+    Args:
+        job: Enriched job dict (extraction fields merged in).
+
+    Returns:
+        The three extraction fields, or None if the job had no
+        description, extraction failed, or the result is empty.
+    """
+    if not job.get("description") or job.get("extraction_failed"):
+        return None
+    extraction = {key: job[key] for key in _empty_extraction()}
+    if not any(extraction.values()):
+        return None
+    return extraction
+
+
+async def _ghost_fields(
     job: dict[str, Any],
     provider: LLMProvider | None = None,
 ) -> dict[str, Any]:
-    """Calculate ghost score for a single job, returning enriched copy.
+    """Calculate the ghost score fields for a single job.
 
     Args:
         job: Raw job dict with optional scoring fields.
         provider: Optional LLM provider for ghost detection.
 
     Returns:
-        Copy of job with ghost_score and ghost_signals added.
+        Dict with ghost_score and ghost_signals (both None on failure or
+        timeout).
     """
     try:
-        signals = await calculate_ghost_score(
-            posted_date=None,
-            first_seen_date=None,
-            repost_count=0,
-            salary_min=job.get("salary_min"),
-            salary_max=job.get("salary_max"),
-            application_deadline=job.get("application_deadline"),
-            location=job.get("location"),
-            seniority_level=job.get("seniority_level"),
-            years_experience_min=job.get("years_experience_min"),
-            description=job.get("description", ""),
-            provider=provider,
-        )
+        async with asyncio.timeout(_STEP_TIMEOUT_SECONDS):
+            signals = await calculate_ghost_score(
+                posted_date=None,
+                first_seen_date=None,
+                repost_count=0,
+                salary_min=job.get("salary_min"),
+                salary_max=job.get("salary_max"),
+                application_deadline=job.get("application_deadline"),
+                location=job.get("location"),
+                seniority_level=job.get("seniority_level"),
+                years_experience_min=job.get("years_experience_min"),
+                description=job.get("description", ""),
+                provider=provider,
+            )
         return {
-            **job,
             "ghost_score": signals.ghost_score,
             "ghost_signals": signals.to_dict(),
         }
     except Exception as e:  # noqa: BLE001
         logger.warning(
-            "Ghost score calculation failed for job %s: %s",
+            "Ghost score failed for job %s: %r",
             job.get("external_id"),
             e,
         )
-        return {
-            **job,
-            "ghost_score": None,
-            "ghost_signals": None,
-        }
+        return {"ghost_score": None, "ghost_signals": None}
 
 
-async def _enrich_single_job(
+async def _extraction_fields(
     job: dict[str, Any],
     provider: LLMProvider | None = None,
 ) -> dict[str, Any]:
-    """Run extraction + ghost scoring for a single job.
-
-    Errors in one step don't block the other.
+    """Extract the skill and culture fields for a single job.
 
     Args:
-        job: Raw job dict to enrich.
-        provider: Optional LLM provider for ghost detection.
+        job: Raw job dict to extract from.
+        provider: Optional LLM provider for extraction.
 
     Returns:
-        Enriched copy with extraction + ghost fields.
+        Dict with required_skills, preferred_skills, and culture_text;
+        empty defaults plus extraction_failed on failure or timeout.
     """
-    description = job.get("description", "")
-    current = dict(job)
-
-    # Step 1: Extract skills and culture
     try:
-        extraction = await JobEnrichmentService.extract_skills_and_culture(
-            description, provider
-        )
-        current["required_skills"] = extraction.get("required_skills", [])
-        current["preferred_skills"] = extraction.get("preferred_skills", [])
-        current["culture_text"] = extraction.get("culture_text")
+        async with asyncio.timeout(_STEP_TIMEOUT_SECONDS):
+            extraction = await JobEnrichmentService.extract_skills_and_culture(
+                job.get("description", ""), provider
+            )
+        return {
+            "required_skills": extraction.get("required_skills", []),
+            "preferred_skills": extraction.get("preferred_skills", []),
+            "culture_text": extraction.get("culture_text"),
+        }
     except Exception as e:  # noqa: BLE001
         logger.warning(
-            "Skill extraction failed for job %s: %s",
+            "Skill extraction failed for job %s: %r",
             job.get("external_id"),
             e,
         )
-        current.update(_empty_extraction())
-        current["extraction_failed"] = True
+        return {**_empty_extraction(), "extraction_failed": True}
+
+
+async def _score_single_job(
+    job: dict[str, Any],
+    provider: LLMProvider | None = None,
+) -> dict[str, Any]:
+    """Calculate ghost score for a single job, returning enriched copy.
+
+    Args:
+        job: Raw job dict with optional scoring fields.
+        provider: Optional LLM provider for ghost detection.
+
+    Returns:
+        Copy of job with ghost_score and ghost_signals added.
+    """
+    return {**job, **await _ghost_fields(job, provider)}
+
+
+# ---------------------------------------------------------------------------
+# Batched extraction
+# ---------------------------------------------------------------------------
+
+
+def _prepare_description(description: str) -> str:
+    """Truncate and sanitize a description for an extraction prompt.
+
+    Truncate BEFORE sanitize — injection patterns are stripped in-budget.
+    Do not swap: sanitization must see the same content the LLM will receive.
+    """
+    return sanitize_llm_input(description[:_MAX_DESCRIPTION_LENGTH])
+
+
+def _validated_extraction(item: Any) -> dict[str, Any] | None:
+    """Validate one extraction object from a batch response or the cache.
+
+    Stricter than the single-job parser: an item with wrongly typed
+    fields is rejected (and re-extracted alone) instead of coerced.
+
+    Args:
+        item: Parsed JSON value for one job.
+
+    Returns:
+        The three extraction fields, or None if the item is malformed.
+    """
+    if not isinstance(item, dict):
+        return None
+    required = item.get("required_skills")
+    preferred = item.get("preferred_skills")
+    culture = item.get("culture_text")
+    if not isinstance(required, list) or not isinstance(preferred, list):
+        return None
+    if culture is not None and not isinstance(culture, str):
+        return None
+    return {
+        "required_skills": _coerce_string_list(required),
+        "preferred_skills": _coerce_string_list(preferred),
+        "culture_text": culture,
+    }
+
+
+def _plan_batches(
+    jobs: Sequence[dict[str, Any]],
+    pending: Sequence[int],
+    batch_size: int,
+) -> list[list[int]]:
+    """Group pending jobs with short descriptions into extraction batches.
+
+    Jobs with empty or long descriptions, and batches that would hold a
+    single job, are left to single-job extraction.
+
+    Args:
+        jobs: All jobs being enriched.
+        pending: Indexes of jobs that still need extraction.
+        batch_size: Maximum jobs per batch.
+
+    Returns:
+        Batches of job indexes, in input order.
+    """
+    eligible = [
+        i
+        for i in pending
+        if 0 < len(jobs[i].get("description") or "") <= _MAX_BATCH_ITEM_LENGTH
+    ]
+    batches = [
+        eligible[start : start + batch_size]
+        for start in range(0, len(eligible), batch_size)
+    ]
+    return [batch for batch in batches if len(batch) > 1]
+
+
+async def _extract_batch(
+    descriptions: Sequence[str],
+    provider: LLMProvider,
+) -> list[dict[str, Any] | None]:
+    """Extract several descriptions with one JSON-mode LLM call.
+
+    Item ids carry a per-call random prefix so text inside one posting
+    cannot impersonate another posting's delimiter or id.
+
+    Args:
+        descriptions: Raw descriptions, one per job.
+        provider: LLM provider for extraction.
+
+    Returns:
+        One validated extraction per description, or None where the item
+        was missing, duplicated, or malformed (or the whole call failed).
+    """
+    nonce = secrets.token_hex(4)
+    ids = [f"{nonce}-{i}" for i in range(len(descriptions))]
+    content = "\n\n".join(
+        f"=== JOB {item_id} ===\n{_prepare_description(description)}\n"
+        f"=== END JOB {item_id} ==="
+        for item_id, description in zip(ids, descriptions, strict=True)
+    )
+    failed: list[dict[str, Any] | None] = [None] * len(descriptions)
 
-    # Step 2: Ghost score
     try:
-        signals = await calculate_ghost_score(
-            posted_date=None,
-            first_seen_date=None,
-            repost_count=0,
-            salary_min=job.get("salary_min"),
-            salary_max=job.get("salary_max"),
-            application_deadline=job.get("application_deadline"),
-            location=job.get("location"),
-            seniority_level=job.get("seniority_level"),
-            years_experience_min=job.get("years_experience_min"),
-            description=description,
-            provider=provider,
-        )
-        current["ghost_score"] = signals.ghost_score
-        current["ghost_signals"] = signals.to_dict()
-    except Exception as e:  # noqa: BLE001
-        logger.warning(
-            "Ghost score failed for job %s: %s",
-            job.get("external_id"),
-            e,
+        async with asyncio.timeout(_STEP_TIMEOUT_SECONDS):
+            response = await provider.complete(
+                messages=[
+                    LLMMessage(role="system", content=_BATCH_EXTRACTION_SYSTEM_PROMPT),
+                    LLMMessage(role="user", content=content),
+                ],
+                task=TaskType.EXTRACTION,
+                json_mode=True,
+                max_tokens=_BATCH_OUTPUT_TOKENS_PER_JOB * len(descriptions),
+            )
+        data = json.loads(response.content or "{}")
+    except (
+        ProviderError,
+        TimeoutError,
+        json.JSONDecodeError,
+        TypeError,
+        AttributeError,
+    ) as e:
+        logger.warning("Batched extraction of %d jobs failed: %r", len(descriptions), e)
+        return failed
+
+    items = data.get("jobs") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        logger.warning("Batched extraction response has no jobs list")
+        return failed
+
+    by_id: dict[str, Any] = {}
+    duplicated: set[str] = set()
+    for item in items:
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if not isinstance(item_id, str):
+            continue
+        if item_id in by_id:
+            duplicated.add(item_id)
+        by_id[item_id] = item
+
+    return [
+        None if item_id in duplicated else _validated_extraction(by_id.get(item_id))
+        for item_id in ids
+    ]
+
+
+async def _extract_all(
+    jobs: Sequence[dict[str, Any]],
+    provider: LLMProvider | None,
+    known: Sequence[dict[str, Any] | None],
+    batch_size: int,
+) -> list[dict[str, Any]]:
+    """Extract skills and culture for every job.
+
+    Jobs with a known (cached) extraction skip the LLM. Short pending
+    descriptions go through batched calls; anything a batch could not
+    extract, plus long descriptions, falls back to single-job calls.
+
+    Args:
+        jobs: Jobs being enriched.
+        provider: Optional LLM provider for extraction.
+        known: Already available extraction per job, or None.
+        batch_size: Maximum jobs per batched call (1 disables batching).
+
+    Returns:
+        Extraction fields per job, in input order.
+    """
+    results = list(known)
+    pending = [i for i, extraction in enumerate(results) if extraction is None]
+
+    if provider is not None and batch_size > 1:
+        batches = _plan_batches(jobs, pending, batch_size)
+        outputs = await _map_bounded(
+            batches,
+            lambda batch: _extract_batch(
+                [jobs[i]["description"] for i in batch], provider
+            ),
         )
-        current["ghost_score"] = None
-        current["ghost_signals"] = None
+        for batch, extractions in zip(batches, outputs, strict=True):
+            for i, extraction in zip(batch, extractions, strict=True):
+                results[i] = extraction
+        still_pending = [i for i in pending if results[i] is None]
+        if batches:
+            logger.debug(
+                "Batched extraction: %d batches, %d of %d jobs left for single calls",
+                len(batches),
+                len(still_pending),
+                len(pending),
+            )
+        pending = still_pending
+
+    singles = await _map_bounded(
+        pending, lambda i: _extraction_fields(jobs[i], provider)
+    )
+    for i, extraction in zip(pending, singles, strict=True):
+        results[i] = extraction
+    return [e if e is not None else _empty_extraction() for e in results]
 
-    return current
+
+async def _map_bounded(
+    items: Sequence[_T],
+    run_one: Callable[[_T], Awaitable[_R]],
+) -> list[_R]:
+    """Apply run_one to every item with bounded concurrency.
+
+    Args:
+        items: Inputs to process.
+        run_one: Per-item coroutine; must not raise for ordinary errors.
+
+    Returns:
+        One result per item, in input order.
+    """
+    if not items:
+        return []
+
+    sem = asyncio.Semaphore(_MAX_CONCURRENT_JOBS)
+
+    async def _with_limit(item: _T) -> _R:
+        async with sem:
+            return await run_one(item)
+
+    tasks = [asyncio.ensure_future(_with_limit(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # WHY: gather leaves sibling calls running when one raises an
+        # unexpected error (or the poll is cancelled); cancel them so no
+        # LLM call outlives the batch.
+        for task in tasks:
+            task.cancel()
+        raise
 
 
 class JobEnrichmentService:
@@ -204,12 +486,8 @@ class JobEnrichmentService:
         if not description:
             return _empty_extraction()
 
-        # Truncate BEFORE sanitize — injection patterns are stripped in-budget.
-        # Do not swap: sanitization must see the same content the LLM will receive.
-        truncated = description[:_MAX_DESCRIPTION_LENGTH]
-
         # Sanitize on read — all pool content through sanitize_llm_input()
-        truncated = sanitize_llm_input(truncated)
+        truncated = _prepare_description(description)
 
         logger.debug(
             "Skill extraction called (description length: %d, truncated: %d)",
@@ -250,8 +528,9 @@ class JobEnrichmentService:
     ) -> list[dict[str, Any]]:
         """Calculate ghost detection scores for a batch of jobs.
 
-        Delegates to ghost_detection.calculate_ghost_score() per job.
-        Errors are recorded per-job but do not fail the batch.
+        Delegates to ghost_detection.calculate_ghost_score() per job, up
+        to _MAX_CONCURRENT_JOBS jobs at a time. Errors and timeouts are
+        recorded per-job but do not fail the batch.
 
         Args:
             jobs: List of job dicts to score.
@@ -260,27 +539,80 @@ class JobEnrichmentService:
         Returns:
             List of jobs enriched with ghost_score and ghost_signals.
         """
-        return [await _score_single_job(job, provider=provider) for job in jobs]
+        return await _map_bounded(jobs, lambda job: _score_single_job(job, provider))
 
     @staticmethod
     async def enrich_jobs(
         jobs: list[dict[str, Any]],
         provider: LLMProvider | None = None,
+        *,
+        cache: ExtractionCache | None = None,
+        batch_size: int = _EXTRACTION_BATCH_SIZE,
     ) -> list[dict[str, Any]]:
         """Full enrichment pipeline: extraction + ghost scoring.
 
-        For each job:
-        1. Extract skills and culture text (LLM call)
-        2. Calculate ghost detection score
+        Concurrently:
+        1. Extract skills and culture text (LLM calls)
+        2. Calculate ghost detection scores (vagueness LLM call per job)
 
-        Errors in one step don't block the other. Per-job error handling
-        ensures partial failures don't fail the entire batch.
+        With a provider, short descriptions are extracted in batches of up
+        to batch_size per LLM call. Items a batch fails to return or that
+        do not validate, and long descriptions, use single-job calls.
+
+        Up to _MAX_CONCURRENT_JOBS calls of each kind run at a time and
+        the output keeps the input order. Each call has its own timeout;
+        errors or timeouts in one step don't block the other, and
+        per-job error handling ensures partial failures don't fail the
+        entire batch.
+
+        With a cache (and a provider), stored extractions for the batch's
+        descriptions are loaded in one query before any LLM call, and new
+        non-empty extractions are stored afterwards. Empty results are not
+        stored because a failed LLM call also yields an empty extraction.
 
         Args:
             jobs: List of raw job dicts to enrich.
-            provider: Optional LLM provider for ghost detection.
+            provider: Optional LLM provider for extraction and ghost detection.
+            cache: Optional shared extraction cache.
+            batch_size: Maximum jobs per batched extraction call; 1
+                disables batching.
 
         Returns:
             List of enriched job dicts with extraction + ghost fields.
         """
-        return [await _enrich_single_job(job, provider=provider) for job in jobs]
+        if not jobs:
+            return []
+
+        known: list[dict[str, Any] | None] = [None] * len(jobs)
+        hashes: list[str] = []
+        model_name = ""
+        if cache is not None and provider is not None:
+            model_name = await provider.resolve_model_for_task(TaskType.EXTRACTION)
+            descriptions = [job.get("description") or "" for job in jobs]
+            hashes = [compute_description_hash(d) for d in descriptions]
+            cached = await cache.get_many(
+                descriptions,
+                prompt_version=_EXTRACTION_PROMPT_VERSION,
+                model_name=model_name,
+            )
+            known = [_validated_extraction(cached.get(h)) for h in hashes]
+
+        extractions, ghosts = await asyncio.gather(
+            _extract_all(jobs, provider, known, batch_size),
+            _map_bounded(jobs, lambda job: _ghost_fields(job, provider)),
+        )
+        enriched = [
+            {**job, **extraction, **ghost}
+            for job, extraction, ghost in zip(jobs, extractions, ghosts, strict=True)
+        ]
+
+        if cache is not None and provider is not None:
+            fresh: dict[str, dict[str, Any]] = {}
+            for job, h, hit in zip(enriched, hashes, known, strict=True):
+                extraction = _cacheable_extraction(job)
+                if hit is None and extraction is not None:
+                    fresh[h] = extraction
+            await cache.put_many(
+                fresh, prompt_version=_EXTRACTION_PROMPT_VERSION, model_name=model_name
+            )
+        return enriched
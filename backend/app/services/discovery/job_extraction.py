@@ -7,6 +7,10 @@ WHY SEPARATE SERVICE:
 - Abstracted from LLM provider details
 - Easy to test with mocked responses
 
+Results are shared through the extraction cache (discovery/extraction_cache.py)
+when the caller passes one, so re-ingesting a description another user
+already submitted skips the LLM call.
+
 Called by: app/api/v1/job_postings.py (ingest preview endpoint) and unit tests.
 """
 
@@ -22,6 +26,10 @@ from app.core.llm_sanitization import sanitize_llm_input
 from app.providers import ProviderError
 from app.providers.llm.base import LLMMessage, LLMProvider, TaskType
 from app.schemas.ingest import ExtractedJobData
+from app.services.discovery.extraction_cache import (
+    ExtractionCache,
+    compute_description_hash,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +38,15 @@ _EXTRACTED_JOB_DATA_ADAPTER = TypeAdapter(ExtractedJobData)
 _MAX_EXTRACTED_SKILLS = 100
 """Safety cap on extracted skills from LLM response."""
 
+_EXTRACTION_PROMPT_VERSION = "job_data:1"
+"""Extraction cache key component; bump when the prompt or parsing changes."""
+
 
-async def extract_job_data(raw_text: str, provider: LLMProvider) -> ExtractedJobData:
+async def extract_job_data(
+    raw_text: str,
+    provider: LLMProvider,
+    cache: ExtractionCache | None = None,
+) -> ExtractedJobData:
     """Extract structured job data from raw posting text.
 
     REQ-007 §6.4: Uses LLM to extract structured fields from raw text.
@@ -40,6 +55,9 @@ async def extract_job_data(raw_text: str, provider: LLMProvider) -> ExtractedJob
     Args:
         raw_text: Raw job posting text to extract from.
         provider: LLM provider for extraction (injected by caller).
+        cache: Optional shared extraction cache. A stored result for the
+            same text, prompt version, and model is used instead of the
+            LLM; a new non-empty LLM result is stored.
 
     Returns:
         ExtractedJobData with fields: job_title, company_name, location,
@@ -54,6 +72,14 @@ async def extract_job_data(raw_text: str, provider: LLMProvider) -> ExtractedJob
     if len(truncated_text) > 500:
         description_snippet += "..."
 
+    model_name = ""
+    if cache is not None:
+        model_name = await provider.resolve_model_for_task(TaskType.EXTRACTION)
+        cached = await _get_cached_extraction(cache, raw_text, model_name)
+        if cached is not None:
+            cached["description_snippet"] = description_snippet
+            return cached
+
     # Try LLM extraction
     try:
         response = await provider.complete(
@@ -71,6 +97,14 @@ async def extract_job_data(raw_text: str, provider: LLMProvider) -> ExtractedJob
         # Fallback to basic regex extraction if LLM fails
         logger.warning("LLM extraction failed (%s), using fallback regex extraction", e)
         extracted = _basic_extraction(truncated_text)
+    else:
+        # Parse failures yield an all-empty result; only cache real output
+        if cache is not None and any(extracted.values()):
+            await cache.put_many(
+                {compute_description_hash(raw_text): dict(extracted)},
+                prompt_version=_EXTRACTION_PROMPT_VERSION,
+                model_name=model_name,
+            )
 
     # Always include description snippet
     extracted["description_snippet"] = description_snippet
@@ -78,6 +112,33 @@ async def extract_job_data(raw_text: str, provider: LLMProvider) -> ExtractedJob
     return extracted
 
 
+async def _get_cached_extraction(
+    cache: ExtractionCache, raw_text: str, model_name: str
+) -> ExtractedJobData | None:
+    """Load a stored extraction for raw_text, if any.
+
+    Args:
+        cache: Shared extraction cache.
+        raw_text: Raw job posting text.
+        model_name: Model that would serve the extraction.
+
+    Returns:
+        Validated ExtractedJobData, or None on a miss or an entry that
+        no longer matches the schema.
+    """
+    cached = await cache.get_many(
+        [raw_text], prompt_version=_EXTRACTION_PROMPT_VERSION, model_name=model_name
+    )
+    entry = cached.get(compute_description_hash(raw_text))
+    if entry is None:
+        return None
+    try:
+        return _EXTRACTED_JOB_DATA_ADAPTER.validate_python(entry)
+    except PydanticValidationError:
+        logger.warning("Ignoring cached extraction that fails validation")
+        return None
+
+
 def _build_extraction_prompt(text: str) -> str:
     """Build the extraction prompt for LLM.
 
@@ -9,6 +9,7 @@ for the job discovery workflow.
 
 Coordinates with:
   - discovery/job_enrichment_service.py — calls JobEnrichmentService for skill extraction
+  - discovery/extraction_cache.py — ExtractionCache passed to enrichment
   - discovery/scouter_errors.py — imports SourceError and is_retryable_error
   - discovery/scouter_utils.py — imports calculate_next_poll_time, merge_results
   - scoring/job_scoring_service.py — imports JobScoringService for post-fetch scoring
@@ -31,12 +32,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 # persistence when creating JobPosting models via the dedup service.
 from app.adapters.sources.adzuna import AdzunaAdapter
 from app.adapters.sources.base import JobSourceAdapter, RawJob, SearchParams
+from app.adapters.sources.http_client import get_source_http_client
+from app.adapters.sources.rate_limit import get_source_rate_limiter
 from app.adapters.sources.remoteok import RemoteOKAdapter
+from app.adapters.sources.response_cache import get_source_response_cache
 from app.adapters.sources.themuse import TheMuseAdapter
 from app.adapters.sources.usajobs import USAJobsAdapter
 from app.providers.embedding.base import EmbeddingProvider
 from app.providers.llm.base import LLMProvider
 from app.repositories.job_pool_repository import JobPoolRepository
+from app.services.discovery.extraction_cache import ExtractionCache
 from app.services.discovery.job_enrichment_service import JobEnrichmentService
 from app.services.discovery.scouter_errors import SourceError, is_retryable_error
 from app.services.discovery.scouter_utils import calculate_next_poll_time, merge_results
@@ -86,6 +91,12 @@ _ADAPTER_REGISTRY: dict[str, type[JobSourceAdapter]] = {
 def get_source_adapter(source_name: str) -> JobSourceAdapter | None:
     """Get an adapter instance for a source name.
 
+    Adapters share the process-wide source HTTP client, so polls reuse
+    pooled keep-alive connections instead of reconnecting per fetch, and
+    the process-wide response cache, so identical queries from different
+    personas are fetched once. Each source's token bucket is shared too,
+    so concurrent polls stay within the source's request budget together.
+
     Args:
         source_name: Canonical source name (e.g., "Adzuna").
 
@@ -94,10 +105,108 @@ def get_source_adapter(source_name: str) -> JobSourceAdapter | None:
     """
     adapter_class = _ADAPTER_REGISTRY.get(source_name)
     if adapter_class:
-        return adapter_class()
+        return adapter_class(
+            http_client=get_source_http_client(),
+            response_cache=get_source_response_cache(),
+            rate_limiter=get_source_rate_limiter(adapter_class.rate_budget),
+        )
     return None
 
 
+def fallback_search_params() -> SearchParams:
+    """SearchParams for personas without an approved SearchProfile yet.
+
+    An empty keyword set rather than a hardcoded stub.
+
+    Returns:
+        SearchParams with empty keywords and ``results_per_page=25``.
+    """
+    return SearchParams(keywords=[], results_per_page=25)
+
+
+async def fetch_from_sources(
+    enabled_sources: list[str],
+    params: SearchParams | None = None,
+) -> tuple[dict[str, list[dict[str, Any]]], list[str]]:
+    """Fetch jobs from all enabled sources in parallel.
+
+    REQ-016 §6.2: Parallel fetch via asyncio.gather with fail-forward.
+    Source errors are logged and recorded; other sources continue.
+
+    Args:
+        enabled_sources: Source names to query.
+        params: SearchParams to pass to each adapter. When None,
+            fallback_search_params() is used.
+
+    Returns:
+        (source_results, error_sources) where source_results maps
+        source name to list of job dicts, and error_sources lists
+        names of sources that failed.
+    """
+    # Resolve adapters first — skip unknown sources
+    adapters: dict[str, JobSourceAdapter] = {}
+    for name in enabled_sources:
+        adapter = get_source_adapter(name)
+        if adapter:
+            adapters[name] = adapter
+        else:
+            logger.warning("Unknown source adapter: %s", name)
+
+    if not adapters:
+        return {}, []
+
+    if params is None:
+        params = fallback_search_params()
+
+    # Parallel fetch — return_exceptions so one failure doesn't cancel all
+    names = list(adapters.keys())
+    tasks = [adapters[name].fetch_jobs(params) for name in names]
+    gathered = await asyncio.gather(*tasks, return_exceptions=True)
+
+    results: dict[str, list[dict[str, Any]]] = {}
+    error_sources: list[str] = []
+
+    for name, outcome in zip(names, gathered, strict=True):
+        if isinstance(outcome, SourceError):
+            logger.warning(
+                "Source %s failed: %s (retryable: %s)",
+                name,
+                str(outcome),
+                is_retryable_error(outcome),
+            )
+            error_sources.append(name)
+        elif isinstance(outcome, Exception):
+            logger.warning(
+                "Unexpected error fetching from %s: %s: %s",
+                name,
+                type(outcome).__name__,
+                outcome,
+            )
+            error_sources.append(name)
+        else:
+            # WHY cast: gather(return_exceptions=True) returns T | BaseException;
+            # the isinstance checks above narrow away all exception types.
+            jobs = cast(list[RawJob], outcome)
+            results[name] = [
+                {
+                    "external_id": job.external_id,
+                    "title": job.title,
+                    "company": job.company,
+                    "description": job.description,
+                    "source_url": job.source_url,
+                    "location": job.location,
+                    "salary_min": job.salary_min,
+                    "salary_max": job.salary_max,
+                    "posted_date": job.posted_date,
+                    "source_name": name,
+                }
+                for job in jobs
+            ]
+            logger.info("Fetched %d jobs from %s", len(jobs), name)
+
+    return results, error_sources
+
+
 # ---------------------------------------------------------------------------
 # Service
 # ---------------------------------------------------------------------------
@@ -168,6 +277,29 @@ class JobFetchService:
                 enabled_sources
             )
 
+        return await self.process_fetched_results(
+            source_results, error_sources, polling_frequency
+        )
+
+    async def process_fetched_results(
+        self,
+        source_results: dict[str, list[dict[str, Any]]],
+        error_sources: list[str],
+        polling_frequency: str = "daily",
+    ) -> PollResult:
+        """Run the poll pipeline on results that were already fetched.
+
+        Steps 2-6 of run_poll. The poll scheduler calls this directly with
+        results from queries shared across personas (poll_planner.py).
+
+        Args:
+            source_results: Source name to list of job dicts.
+            error_sources: Sources that failed during fetch.
+            polling_frequency: "twice_daily", "daily", or "weekly".
+
+        Returns:
+            PollResult with all processed jobs and metadata.
+        """
         # Step 2: Merge into flat list
         merged_jobs = merge_results(source_results)
 
@@ -176,7 +308,7 @@ class JobFetchService:
 
         # Step 4: Enrich new jobs only
         enriched_new = await JobEnrichmentService.enrich_jobs(
-            new_jobs, provider=self._llm_provider
+            new_jobs, provider=self._llm_provider, cache=ExtractionCache(self.db)
         )
 
         # Step 5: Save new + link existing
@@ -206,83 +338,17 @@ class JobFetchService:
     ) -> tuple[dict[str, list[dict[str, Any]]], list[str]]:
         """Fetch jobs from all enabled sources in parallel.
 
-        REQ-016 §6.2: Parallel fetch via asyncio.gather with fail-forward.
-        Source errors are logged and recorded; other sources continue.
+        See the module-level fetch_from_sources().
 
         Args:
             enabled_sources: Source names to query.
-            params: SearchParams to pass to each adapter. When None, a
-                minimal default (empty keywords) is used.
+            params: SearchParams to pass to each adapter, or None for
+                fallback_search_params().
 
         Returns:
-            (source_results, error_sources) where source_results maps
-            source name to list of job dicts, and error_sources lists
-            names of sources that failed.
+            (source_results, error_sources).
         """
-        # Resolve adapters first — skip unknown sources
-        adapters: dict[str, JobSourceAdapter] = {}
-        for name in enabled_sources:
-            adapter = get_source_adapter(name)
-            if adapter:
-                adapters[name] = adapter
-            else:
-                logger.warning("Unknown source adapter: %s", name)
-
-        if not adapters:
-            return {}, []
-
-        if params is None:
-            # WHY: Fallback used when no approved SearchProfile exists yet —
-            # returns an empty keyword set rather than a hardcoded stub.
-            params = SearchParams(keywords=[], results_per_page=25)
-
-        # Parallel fetch — return_exceptions so one failure doesn't cancel all
-        names = list(adapters.keys())
-        tasks = [adapters[name].fetch_jobs(params) for name in names]
-        gathered = await asyncio.gather(*tasks, return_exceptions=True)
-
-        results: dict[str, list[dict[str, Any]]] = {}
-        error_sources: list[str] = []
-
-        for name, outcome in zip(names, gathered, strict=True):
-            if isinstance(outcome, SourceError):
-                logger.warning(
-                    "Source %s failed: %s (retryable: %s)",
-                    name,
-                    str(outcome),
-                    is_retryable_error(outcome),
-                )
-                error_sources.append(name)
-            elif isinstance(outcome, Exception):
-                logger.warning(
-                    "Unexpected error fetching from %s: %s: %s",
-                    name,
-                    type(outcome).__name__,
-                    outcome,
-                )
-                error_sources.append(name)
-            else:
-                # WHY cast: gather(return_exceptions=True) returns T | BaseException;
-                # the isinstance checks above narrow away all exception types.
-                jobs = cast(list[RawJob], outcome)
-                results[name] = [
-                    {
-                        "external_id": job.external_id,
-                        "title": job.title,
-                        "company": job.company,
-                        "description": job.description,
-                        "source_url": job.source_url,
-                        "location": job.location,
-                        "salary_min": job.salary_min,
-                        "salary_max": job.salary_max,
-                        "posted_date": job.posted_date,
-                        "source_name": name,
-                    }
-                    for job in jobs
-                ]
-                logger.info("Fetched %d jobs from %s", len(jobs), name)
-
-        return results, error_sources
+        return await fetch_from_sources(enabled_sources, params)
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -322,8 +388,9 @@ class JobFetchService:
     ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
         """Partition jobs into new and existing via pool check.
 
-        For each job: resolve source_id, then check pool via two-tier
-        dedup (external_id + description_hash).
+        Resolves each job's source_id, then checks the whole batch against
+        the pool via two-tier dedup (external_id + description_hash) with
+        one bulk query per tier.
 
         Args:
             merged_jobs: Flat list of job dicts with source_name.
@@ -331,11 +398,9 @@ class JobFetchService:
         Returns:
             (new_jobs, existing_jobs) partitioned by pool membership.
         """
-        new_jobs: list[dict[str, Any]] = []
-        existing_jobs: list[dict[str, Any]] = []
-
         # Cache resolved source IDs to avoid repeated DB lookups
         source_id_cache: dict[str, UUID | None] = {}
+        to_check: list[tuple[dict[str, Any], UUID]] = []
 
         for job in merged_jobs:
             source_name = job.get("source_name", "")
@@ -354,14 +419,16 @@ class JobFetchService:
                     source_name,
                 )
                 continue
+            to_check.append((job, source_id))
 
-            # Check pool
-            is_existing, checked_job = await JobPoolRepository.check_job_in_pool(
-                self.db,
-                job,
-                source_id,
-            )
+        new_jobs: list[dict[str, Any]] = []
+        existing_jobs: list[dict[str, Any]] = []
+        if not to_check:
+            return new_jobs, existing_jobs
 
+        # Check pool
+        checked = await JobPoolRepository.check_jobs_in_pool(self.db, to_check)
+        for is_existing, checked_job in checked:
             if is_existing:
                 existing_jobs.append(checked_job)
             else:
@@ -373,28 +440,25 @@ class JobFetchService:
         self,
         enriched_jobs: list[dict[str, Any]],
     ) -> tuple[int, list[str]]:
-        """Save enriched new jobs to the shared pool.
+        """Save enriched new jobs to the shared pool in one batch.
 
         Args:
             enriched_jobs: Jobs enriched with extraction + ghost scores.
 
         Returns:
             Tuple of (saved_count, saved_job_ids) where saved_job_ids are
-            the job posting ID strings returned by save_job_to_pool.
+            the job posting ID strings returned by save_jobs_to_pool.
         """
-        saved = 0
-        saved_ids: list[str] = []
-        for job in enriched_jobs:
-            result = await JobPoolRepository.save_job_to_pool(
-                self.db,
-                job,
-                self.persona_id,
-                self.user_id,
-            )
-            if result is not None:
-                saved += 1
-                saved_ids.append(result)
-        return saved, saved_ids
+        if not enriched_jobs:
+            return 0, []
+        results = await JobPoolRepository.save_jobs_to_pool(
+            self.db,
+            enriched_jobs,
+            self.persona_id,
+            self.user_id,
+        )
+        saved_ids = [result for result in results if result is not None]
+        return len(saved_ids), saved_ids
 
     async def _score_new_jobs(self, saved_ids: list[str]) -> None:
         """Score newly saved jobs (best-effort).
@@ -403,7 +467,7 @@ class JobFetchService:
         Failures are logged but do not fail the poll.
 
         Args:
-            saved_ids: Job posting ID strings from save_job_to_pool.
+            saved_ids: Job posting ID strings from save_jobs_to_pool.
         """
         if not saved_ids:
             return
@@ -432,7 +496,7 @@ class JobFetchService:
         self,
         existing_jobs: list[dict[str, Any]],
     ) -> int:
-        """Create persona_jobs links for existing pool jobs.
+        """Create persona_jobs links for existing pool jobs in one batch.
 
         Args:
             existing_jobs: Jobs already in pool needing persona links.
@@ -440,14 +504,12 @@ class JobFetchService:
         Returns:
             Count of successfully linked jobs.
         """
-        linked = 0
-        for job in existing_jobs:
-            result = await JobPoolRepository.link_existing_job(
-                self.db,
-                job,
-                self.persona_id,
-                self.user_id,
-            )
-            if result is not None:
-                linked += 1
-        return linked
+        if not existing_jobs:
+            return 0
+        results = await JobPoolRepository.link_existing_jobs(
+            self.db,
+            existing_jobs,
+            self.persona_id,
+            self.user_id,
+        )
+        return sum(1 for result in results if result is not None)
@@ -7,14 +7,21 @@ fetch pipeline, and updates PollingConfiguration timestamps.
 Each call opens its own DB session for fault isolation: one persona's
 failure does not affect other polls running concurrently.
 
+The scheduler first loads every due persona's plan (load_poll_plan),
+fetches shared queries once across personas (poll_planner.py), and then
+passes each persona its prefetched results.
+
 Coordinates with:
-  - discovery/job_fetch_service.py — imports JobFetchService, PollResult
+  - discovery/job_fetch_service.py — imports JobFetchService, PollResult,
+    fallback_search_params
+  - discovery/poll_planner.py — imports PersonaPollPlan, PrefetchedPoll
   - discovery/search_profile_service.py — imports build_search_params
   - repositories/search_profile_repository.py — imports SearchProfileRepository
   - models/persona.py — Persona (remote_preference, home_city for SearchParams)
   - models/job_source.py — PollingConfiguration, UserSourcePreference, JobSource
 
-Called by: discovery/poll_scheduler_worker.py (PollSchedulerWorker._poll_persona).
+Called by: discovery/poll_scheduler_worker.py (PollSchedulerWorker._poll_persona
+and _prefetch_shared_queries).
 """
 
 from __future__ import annotations
@@ -33,7 +40,12 @@ from app.models.job_source import JobSource, PollingConfiguration, UserSourcePre
 from app.models.persona import Persona
 from app.repositories.search_profile_repository import SearchProfileRepository
 from app.schemas.search_profile import SearchBucketSchema
-from app.services.discovery.job_fetch_service import JobFetchService, PollResult
+from app.services.discovery.job_fetch_service import (
+    JobFetchService,
+    PollResult,
+    fallback_search_params,
+)
+from app.services.discovery.poll_planner import PersonaPollPlan, PrefetchedPoll
 from app.services.discovery.search_profile_service import build_search_params
 
 if TYPE_CHECKING:
@@ -42,9 +54,37 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+async def load_poll_plan(
+    session_factory: async_sessionmaker[AsyncSession],
+    item: _DueItem,
+) -> PersonaPollPlan:
+    """Load what a persona's poll would fetch, without fetching it.
+
+    Args:
+        session_factory: Async session factory for DB access.
+        item: Due persona metadata from the scheduler query.
+
+    Returns:
+        PersonaPollPlan with enabled sources and per-bucket SearchParams
+        (the fallback params when there is no usable SearchProfile).
+    """
+    async with session_factory() as db:
+        enabled_sources = await _resolve_enabled_sources(db, item.persona_id)
+        search_params_list = None
+        if enabled_sources:
+            search_params_list = await _build_persona_search_params(db, item)
+
+    return PersonaPollPlan(
+        persona_id=item.persona_id,
+        enabled_sources=enabled_sources,
+        search_params_list=search_params_list or [fallback_search_params()],
+    )
+
+
 async def execute_persona_poll(
     session_factory: async_sessionmaker[AsyncSession],
     item: _DueItem,
+    prefetched: PrefetchedPoll | None = None,
 ) -> PollResult:
     """Execute a single persona's poll cycle.
 
@@ -54,11 +94,23 @@ async def execute_persona_poll(
     Args:
         session_factory: Async session factory for DB access.
         item: Due persona metadata from the scheduler query.
+        prefetched: Results fetched for this persona by the cross-persona
+            planner. When None, the persona's sources are fetched here.
 
     Returns:
-        PollResult from JobFetchService.run_poll().
+        PollResult from JobFetchService.
     """
     async with session_factory() as db:
+        service = JobFetchService(db, item.user_id, item.persona_id)
+        if prefetched is not None:
+            result = await service.process_fetched_results(
+                prefetched.source_results,
+                list(prefetched.error_sources),
+                polling_frequency=item.polling_frequency,
+            )
+            await _record_poll(db, item, result)
+            return result
+
         enabled_sources = await _resolve_enabled_sources(db, item.persona_id)
 
         if not enabled_sources:
@@ -77,25 +129,36 @@ async def execute_persona_poll(
 
         search_params_list = await _build_persona_search_params(db, item)
 
-        service = JobFetchService(db, item.user_id, item.persona_id)
         result = await service.run_poll(
             enabled_sources=enabled_sources,
             polling_frequency=item.polling_frequency,
             search_params_list=search_params_list,
         )
+        await _record_poll(db, item, result)
+        return result
 
-        # Update PollingConfiguration with new timestamps
-        config_stmt = select(PollingConfiguration).where(
-            PollingConfiguration.persona_id == item.persona_id
-        )
-        config_result = await db.execute(config_stmt)
-        config = config_result.scalar_one_or_none()
-        if config:
-            config.last_poll_at = result.last_polled_at
-            config.next_poll_at = result.next_poll_at
 
-        await db.commit()
-        return result
+async def _record_poll(db: AsyncSession, item: _DueItem, result: PollResult) -> None:
+    """Update PollingConfiguration with the poll's timestamps and commit.
+
+    Also releases the scheduler's claim on the row.
+
+    Args:
+        db: Async database session of the poll.
+        item: Due persona metadata.
+        result: Completed poll result.
+    """
+    config_stmt = select(PollingConfiguration).where(
+        PollingConfiguration.persona_id == item.persona_id
+    )
+    config_result = await db.execute(config_stmt)
+    config = config_result.scalar_one_or_none()
+    if config:
+        config.last_poll_at = result.last_polled_at
+        config.next_poll_at = result.next_poll_at
+        config.claimed_until = None
+
+    await db.commit()
 
 
 async def _resolve_enabled_sources(db: AsyncSession, persona_id: UUID) -> list[str]:
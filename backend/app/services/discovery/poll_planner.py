@@ -0,0 +1,285 @@
+"""Cross-persona poll planning for the scheduler.
+
+REQ-034 §7.2: Many due personas search for the same thing (same keywords,
+location, and remote flag), and each one used to call every enabled
+source with its own SearchParams. The planner groups the search buckets
+of all personas due in a pass by a canonical query key, fetches each
+distinct (source, query) pair once, and fans the results out to every
+persona whose buckets asked for it. Dedup then runs per persona as usual.
+
+Canonical key: keywords (stripped, case-folded, de-duplicated, sorted),
+location (case-folded), remote_only, remoteok_tags, page, and
+results_per_page. The date window is not part of the key: the shared
+fetch uses the widest max_days_old/posted_after of the group, and
+fan_out() drops postings older than each persona's own window
+(posted_after, or max_days_old back from now), so a narrower persona only receives what its own fetch would have returned.
+Postings without a parseable posted date are kept (sources that omit it
+never filter by date either).
+
+Coordinates with:
+  - discovery/job_fetch_service.py — imports fetch_from_sources
+  - adapters/sources/base.py — SearchParams
+
+Called by: discovery/poll_scheduler_worker.py, discovery/poll_execution.py,
+and unit tests.
+"""
+
+import asyncio
+import dataclasses
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from app.adapters.sources.base import SearchParams
+from app.services.discovery.job_fetch_service import fetch_from_sources
+
+logger = logging.getLogger(__name__)
+
+# Canonical query identity (see module docstring)
+QueryKey = tuple[tuple[str, ...], str | None, bool, tuple[str, ...], int, int]
+
+
+# ---------------------------------------------------------------------------
+# Data classes
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class PersonaPollPlan:
+    """What one due persona would fetch on its own.
+
+    Attributes:
+        persona_id: Persona being polled.
+        enabled_sources: Source names enabled for the persona.
+        search_params_list: One SearchParams per search bucket (the
+            fallback params when the persona has no approved profile).
+    """
+
+    persona_id: UUID
+    enabled_sources: list[str]
+    search_params_list: list[SearchParams]
+
+
+@dataclass(frozen=True)
+class PrefetchedPoll:
+    """Fetch results fanned out to one persona.
+
+    Attributes:
+        source_results: Source name to job dicts, across all of the
+            persona's buckets (same shape as JobFetchService.run_poll).
+        error_sources: Sources that failed for any of the persona's buckets.
+    """
+
+    source_results: dict[str, list[dict[str, Any]]]
+    error_sources: list[str]
+
+
+@dataclass
+class SharedQuery:
+    """A distinct query and the union of sources that need it.
+
+    Attributes:
+        params: SearchParams sent to the adapters (widest date window).
+        sources: Source names requested by at least one persona.
+    """
+
+    params: SearchParams
+    sources: set[str] = field(default_factory=set)
+
+
+# ---------------------------------------------------------------------------
+# Planning
+# ---------------------------------------------------------------------------
+
+
+def canonical_query_key(params: SearchParams) -> QueryKey:
+    """Canonical identity of a query, ignoring its date window.
+
+    Args:
+        params: SearchParams of one search bucket.
+
+    Returns:
+        Hashable key; equal keys fetch the same jobs from an adapter.
+    """
+    keywords = tuple(
+        sorted({kw.strip().casefold() for kw in params.keywords if kw.strip()})
+    )
+    location = params.location.strip().casefold() if params.location else None
+    tags = tuple(sorted({tag.casefold() for tag in params.remoteok_tags or []}))
+    return (
+        keywords,
+        location or None,
+        params.remote_only,
+        tags,
+        params.page,
+        params.results_per_page,
+    )
+
+
+def _widest_window(current: SearchParams, other: SearchParams) -> SearchParams:
+    """Widen current's date window to also cover other's.
+
+    None means no age limit, so it wins over any number of days.
+    """
+    if current.max_days_old is None or other.max_days_old is None:
+        max_days_old = None
+    else:
+        max_days_old = max(current.max_days_old, other.max_days_old)
+
+    if current.posted_after is None or other.posted_after is None:
+        posted_after = None
+    else:
+        posted_after = min(current.posted_after, other.posted_after)
+
+    if (max_days_old, posted_after) == (current.max_days_old, current.posted_after):
+        return current
+    return dataclasses.replace(
+        current, max_days_old=max_days_old, posted_after=posted_after
+    )
+
+
+def plan_shared_queries(
+    plans: Sequence[PersonaPollPlan],
+) -> dict[QueryKey, SharedQuery]:
+    """Group every persona's search buckets into distinct queries.
+
+    Args:
+        plans: Poll plans of the personas due in this pass.
+
+    Returns:
+        One SharedQuery per canonical query key.
+    """
+    queries: dict[QueryKey, SharedQuery] = {}
+    for plan in plans:
+        for params in plan.search_params_list:
+            key = canonical_query_key(params)
+            query = queries.get(key)
+            if query is None:
+                queries[key] = SharedQuery(
+                    params=params, sources=set(plan.enabled_sources)
+                )
+            else:
+                query.params = _widest_window(query.params, params)
+                query.sources.update(plan.enabled_sources)
+    return queries
+
+
+def _posted_date(job: dict[str, Any]) -> date | None:
+    """Calendar date a job was posted, or None if missing or unparseable."""
+    value = job.get("posted_date")
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
+
+
+def _within_window(
+    jobs: list[dict[str, Any]], params: SearchParams
+) -> list[dict[str, Any]]:
+    """Drop jobs posted before a bucket's own date window.
+
+    Compared by calendar date, so timezone differences between a source's
+    timestamps and posted_after never drop a same-day posting.
+    """
+    if params.posted_after is not None:
+        cutoff = params.posted_after.date()
+    elif params.max_days_old is not None:
+        cutoff = (datetime.now(UTC) - timedelta(days=params.max_days_old)).date()
+    else:
+        return jobs
+    return [
+        job for job in jobs if (posted := _posted_date(job)) is None or posted >= cutoff
+    ]
+
+
+def fan_out(
+    plan: PersonaPollPlan,
+    fetched: dict[QueryKey, tuple[dict[str, list[dict[str, Any]]], list[str]]],
+) -> PrefetchedPoll:
+    """Assemble one persona's results from the shared fetches.
+
+    Mirrors JobFetchService._fetch_all_buckets: jobs are concatenated per
+    source across buckets and error sources are de-duplicated. Only the
+    persona's own enabled sources are included, and only jobs inside each
+    bucket's own date window (the shared fetch may have used a wider one).
+
+    Args:
+        plan: The persona's poll plan.
+        fetched: (source_results, error_sources) per query key.
+
+    Returns:
+        PrefetchedPoll for the persona.
+    """
+    enabled = set(plan.enabled_sources)
+    source_results: dict[str, list[dict[str, Any]]] = {}
+    error_sources: set[str] = set()
+    for params in plan.search_params_list:
+        results, errors = fetched[canonical_query_key(params)]
+        for source_name, jobs in results.items():
+            if source_name in enabled:
+                source_results.setdefault(source_name, []).extend(
+                    _within_window(jobs, params)
+                )
+        error_sources.update(name for name in errors if name in enabled)
+    return PrefetchedPoll(
+        source_results=source_results, error_sources=sorted(error_sources)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fetching
+# ---------------------------------------------------------------------------
+
+
+async def prefetch_polls(
+    plans: Sequence[PersonaPollPlan],
+    *,
+    max_concurrent: int,
+) -> dict[UUID, PrefetchedPoll]:
+    """Fetch each distinct query once and fan results out to personas.
+
+    Personas without enabled sources are left out; their poll handles
+    that case on its own.
+
+    Args:
+        plans: Poll plans of the personas due in this pass.
+        max_concurrent: Maximum number of queries fetched at the same time.
+
+    Returns:
+        PrefetchedPoll by persona ID.
+    """
+    plans = [plan for plan in plans if plan.enabled_sources]
+    queries = plan_shared_queries(plans)
+    if not queries:
+        return {}
+
+    per_persona = sum(len(plan.search_params_list) for plan in plans)
+    logger.info(
+        "Poll plan: %d personas, %d shared queries (%d without sharing)",
+        len(plans),
+        len(queries),
+        per_persona,
+    )
+
+    sem = asyncio.Semaphore(max_concurrent)
+
+    async def _fetch(
+        query: SharedQuery,
+    ) -> tuple[dict[str, list[dict[str, Any]]], list[str]]:
+        async with sem:
+            return await fetch_from_sources(sorted(query.sources), query.params)
+
+    keys = list(queries)
+    results = await asyncio.gather(*[_fetch(queries[key]) for key in keys])
+    fetched = dict(zip(keys, results, strict=True))
+
+    return {plan.persona_id: fan_out(plan, fetched) for plan in plans}
@@ -2,15 +2,25 @@
 
 REQ-034 §7.2: asyncio background task that reads next_poll_at from
 PollingConfiguration and triggers polls on schedule. Wakes every 30
-minutes, queries due personas, and dispatches polls with a concurrency
+minutes, claims due personas, and dispatches polls with a concurrency
 limit of 5 via asyncio.Semaphore.
 
+Due rows are claimed with FOR UPDATE SKIP LOCKED and a lease
+(PollingConfiguration.claimed_until), so any number of scheduler
+processes can run side by side, each taking a disjoint share of the
+due backlog.
+
+Before dispatching, the pass loads every due persona's search plan and
+fetches each distinct query once across personas (poll_planner.py); each
+persona's poll then runs dedup on its share of the results.
+
 Coordinates with:
-  - discovery/poll_execution.py — imports execute_persona_poll
+  - discovery/poll_execution.py — imports execute_persona_poll, load_poll_plan
+  - discovery/poll_planner.py — imports prefetch_polls, PrefetchedPoll
   - models/persona.py — Persona (onboarding_complete, polling_frequency)
-  - models/job_source.py — PollingConfiguration (next_poll_at)
+  - models/job_source.py — PollingConfiguration (next_poll_at, claimed_until)
 
-Called by: app/main.py (FastAPI lifespan event) and unit tests.
+Called by: app/worker.py (API lifespan and worker process) and unit tests.
 """
 
 import asyncio
@@ -20,13 +30,22 @@ from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select, true
+from sqlalchemy import and_, exists, or_, select, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.job_source import PollingConfiguration
 from app.models.persona import Persona
 from app.services.discovery.job_fetch_service import PollResult
-from app.services.discovery.poll_execution import execute_persona_poll
+from app.services.discovery.poll_execution import (
+    execute_persona_poll,
+    load_poll_plan,
+)
+from app.services.discovery.poll_planner import (
+    PersonaPollPlan,
+    PrefetchedPoll,
+    prefetch_polls,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +59,13 @@ _MAX_CONCURRENT_POLLS = 5
 _CATCHUP_LOOKBACK = timedelta(hours=24)
 
 # Cap due personas per pass to bound memory and execution time.
-# Overflow is caught on the next scheduler cycle.
+# Overflow is caught on the next scheduler cycle (or by another scheduler).
 _MAX_DUE_PER_PASS = 100
 
+# How long a claimed persona is reserved for the claiming scheduler. Must
+# exceed a pass's duration; after it, a crashed or failed poll is retried.
+_CLAIM_LEASE = timedelta(hours=1)
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -87,8 +110,8 @@ class PollSchedulerWorker:
     """Background worker that triggers scheduled polls for due personas.
 
     REQ-034 §7.2: Reads PollingConfiguration.next_poll_at and fires
-    JobFetchService.run_poll() for each due persona. Concurrency capped
-    at 5 via asyncio.Semaphore. First run looks back 24hrs.
+    JobFetchService.run_poll() for each due persona it claims. Concurrency
+    capped at 5 via asyncio.Semaphore. First run looks back 24hrs.
 
     Lifecycle:
     - start() creates an asyncio task that runs the polling loop.
@@ -174,11 +197,12 @@ class PollSchedulerWorker:
                 finished_at=finished,
             )
 
+        prefetched = await self._prefetch_shared_queries(due_items)
         sem = asyncio.Semaphore(_MAX_CONCURRENT_POLLS)
 
         async def _poll_with_limit(item: _DueItem) -> PollResult:
             async with sem:
-                return await self._poll_persona(item)
+                return await self._poll_persona(item, prefetched.get(item.persona_id))
 
         results = await asyncio.gather(
             *[_poll_with_limit(item) for item in due_items],
@@ -232,53 +256,98 @@ class PollSchedulerWorker:
             raise
 
     async def _get_due_personas(self) -> list[_DueItem]:
-        """Query personas due for polling.
+        """Claim personas due for polling.
 
         REQ-034 §7.2: Filters onboarding_complete, excludes Manual Only.
         First run: 24hr lookback + NULL next_poll_at. Subsequent: all overdue.
         Ordered by next_poll_at ASC, capped at _MAX_DUE_PER_PASS.
+
+        Due rows are claimed atomically (FOR UPDATE SKIP LOCKED, then
+        claimed_until = now + _CLAIM_LEASE) and the claim is committed,
+        so concurrent schedulers split the backlog instead of polling
+        the same persona twice. _record_poll clears the claim; a poll
+        that fails keeps it until the lease passes, then is retried.
         """
         now = datetime.now(UTC)
         is_first_run = self._last_run_at is None
+        schedulable = and_(
+            Persona.onboarding_complete == true(),
+            Persona.polling_frequency != "Manual Only",
+        )
 
-        async with self._session_factory() as db:
-            stmt = (
-                select(
-                    Persona.id,
-                    Persona.user_id,
-                    Persona.polling_frequency,
-                    PollingConfiguration.last_poll_at,
-                )
-                .outerjoin(
-                    PollingConfiguration,
-                    PollingConfiguration.persona_id == Persona.id,
-                )
-                .where(
-                    Persona.onboarding_complete == true(),
-                    Persona.polling_frequency != "Manual Only",
-                )
+        if is_first_run:
+            lookback = now - _CATCHUP_LOOKBACK
+            due = or_(
+                and_(
+                    PollingConfiguration.next_poll_at <= now,
+                    PollingConfiguration.next_poll_at >= lookback,
+                ),
+                PollingConfiguration.next_poll_at.is_(None),
             )
+        else:
+            due = PollingConfiguration.next_poll_at <= now
+
+        claimable = (
+            select(PollingConfiguration.id)
+            .join(Persona, Persona.id == PollingConfiguration.persona_id)
+            .where(
+                schedulable,
+                due,
+                or_(
+                    PollingConfiguration.claimed_until.is_(None),
+                    PollingConfiguration.claimed_until <= now,
+                ),
+            )
+            .order_by(PollingConfiguration.next_poll_at.asc())
+            .limit(_MAX_DUE_PER_PASS)
+            .with_for_update(of=PollingConfiguration, skip_locked=True)
+            # WHY: the subquery reads the UPDATE's own tables; without this
+            # they would be correlated to the outer statement.
+            .correlate(None)
+        )
+        claimed = (
+            update(PollingConfiguration)
+            .where(
+                PollingConfiguration.id.in_(claimable),
+                Persona.id == PollingConfiguration.persona_id,
+            )
+            .values(claimed_until=now + _CLAIM_LEASE)
+            .returning(
+                PollingConfiguration.persona_id,
+                Persona.user_id,
+                Persona.polling_frequency,
+                PollingConfiguration.last_poll_at,
+                PollingConfiguration.next_poll_at,
+            )
+            .cte("claimed")
+        )
+        stmt = select(
+            claimed.c.persona_id,
+            claimed.c.user_id,
+            claimed.c.polling_frequency,
+            claimed.c.last_poll_at,
+        ).order_by(claimed.c.next_poll_at.asc())
 
+        async with self._session_factory() as db:
             if is_first_run:
-                lookback = now - _CATCHUP_LOOKBACK
-                stmt = stmt.where(
-                    or_(
-                        and_(
-                            PollingConfiguration.next_poll_at <= now,
-                            PollingConfiguration.next_poll_at >= lookback,
+                # Never-polled personas may have no polling_configurations
+                # row yet; create it so the persona can be claimed.
+                await db.execute(
+                    pg_insert(PollingConfiguration)
+                    .from_select(
+                        ["persona_id"],
+                        select(Persona.id).where(
+                            schedulable,
+                            ~exists().where(
+                                PollingConfiguration.persona_id == Persona.id
+                            ),
                         ),
-                        PollingConfiguration.next_poll_at.is_(None),
                     )
+                    .on_conflict_do_nothing(index_elements=["persona_id"])
                 )
-            else:
-                stmt = stmt.where(PollingConfiguration.next_poll_at <= now)
-
-            stmt = stmt.order_by(PollingConfiguration.next_poll_at.asc()).limit(
-                _MAX_DUE_PER_PASS
-            )
-
             result = await db.execute(stmt)
             rows = result.all()
+            await db.commit()
 
         return [
             _DueItem(
@@ -290,6 +359,47 @@ class PollSchedulerWorker:
             for row in rows
         ]
 
-    async def _poll_persona(self, item: _DueItem) -> PollResult:
+    async def _prefetch_shared_queries(
+        self, due_items: list[_DueItem]
+    ) -> dict[UUID, PrefetchedPoll]:
+        """Fetch each distinct query of the pass once, across personas.
+
+        A persona whose plan fails to load, or every persona if the shared
+        fetch fails, is left out and fetches its own sources in
+        _poll_persona instead.
+
+        Returns:
+            PrefetchedPoll by persona ID.
+        """
+        sem = asyncio.Semaphore(_MAX_CONCURRENT_POLLS)
+
+        async def _load_with_limit(item: _DueItem) -> PersonaPollPlan:
+            async with sem:
+                return await load_poll_plan(self._session_factory, item)
+
+        loaded = await asyncio.gather(
+            *[_load_with_limit(item) for item in due_items],
+            return_exceptions=True,
+        )
+        plans: list[PersonaPollPlan] = []
+        for item, plan in zip(due_items, loaded, strict=True):
+            if isinstance(plan, BaseException):
+                logger.warning(
+                    "Could not plan poll for persona %s: %s", item.persona_id, plan
+                )
+            else:
+                plans.append(plan)
+
+        try:
+            return await prefetch_polls(plans, max_concurrent=_MAX_CONCURRENT_POLLS)
+        # WHY BLE001: Sharing fetches is an optimization — on any failure
+        # each persona falls back to fetching its own sources.
+        except Exception:  # noqa: BLE001
+            logger.exception("Shared poll fetch failed; polling personas separately")
+            return {}
+
+    async def _poll_persona(
+        self, item: _DueItem, prefetched: PrefetchedPoll | None = None
+    ) -> PollResult:
         """Delegate to execute_persona_poll with fault-isolated session."""
-        return await execute_persona_poll(self._session_factory, item)
+        return await execute_persona_poll(self._session_factory, item, prefetched)
@@ -3,51 +3,75 @@
 REQ-015 §7: Background surfacing of pool jobs to matching personas.
 
 Flow per surfacing pass:
-1. Query new active jobs since last run (max 50).
-2. For each job, query all personas with loaded skills.
-3. Keyword pre-screen: skip if no skill overlap.
-4. Lightweight fit score: hard skills overlap, experience alignment,
-   work model alignment. Soft skills and role title use neutral score.
-5. If fit_score >= persona.minimum_fit_threshold → create persona_jobs
-   with discovery_method='pool'.
-6. UNIQUE constraint prevents re-surfacing.
+1. Take the oldest active jobs not yet surfaced
+   (job_postings.surfaced_at IS NULL), up to _MAX_JOBS_PER_PASS.
+   Whatever remains is drained by later passes, so bursts of new jobs
+   are delayed, never dropped.
+2. Stream all onboarded personas once, in keyset-paginated chunks
+   (ordered by id), and index each chunk's skills once (SkillIndex:
+   skill phrase → persona IDs).
+3. Match every persona chunk against the pass's jobs, one job chunk at
+   a time:
+   a. Keyword pre-screen: tokenize the job and look up the personas
+      sharing at least one skill; skip the rest.
+   b. Lightweight fit score: hard skills overlap, experience alignment,
+      work model alignment. Soft skills and role title use neutral score.
+   c. If fit_score >= persona.minimum_fit_threshold → collect a
+      persona_jobs match with discovery_method='pool'. Matching is pure,
+      in memory.
+   d. Write the job chunk's matches with one INSERT ... ON CONFLICT DO
+      NOTHING RETURNING (PersonaJobRepository.create_pool_links) and
+      commit; links that raced in since the existing-links lookup are
+      counted as existing.
+4. Stamp the pass's jobs surfaced_at and commit. A job whose matching
+   raises is logged, skipped for the rest of the pass, and stamped
+   with the others, so one bad posting cannot stall the backlog.
+5. UNIQUE constraint prevents re-surfacing: a pass interrupted before
+   step 4 is repeated by the next one without duplicating links.
+
+Memory is bounded by one pass's jobs, one persona chunk, and one job
+chunk's matches, however many personas there are.
 
 Cross-tenant: runs with system-level privileges (no user_id scope).
 
 Coordinates with:
   - discovery/content_security.py — calls release_expired_quarantines before surfacing
-  - scoring/pool_scoring.py — calls keyword_pre_screen and calculate_lightweight_fit
+  - scoring/pool_scoring.py — uses SkillIndex and calls calculate_lightweight_fit
+  - repositories/persona_job_repository.py — bulk-inserts pool links
 
 Called by: discovery/pool_surfacing_worker.py and unit tests.
 """
 
 import logging
 import uuid
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.job_posting import JobPosting
 from app.models.persona import Persona
 from app.models.persona_job import PersonaJob
-from app.services.discovery.content_security import release_expired_quarantines
-from app.services.scoring.pool_scoring import (
-    calculate_lightweight_fit,
-    keyword_pre_screen,
+from app.repositories.persona_job_repository import (
+    PersonaJobRepository,
+    PoolLinkCreate,
 )
+from app.services.discovery.content_security import release_expired_quarantines
+from app.services.scoring.pool_scoring import SkillIndex, calculate_lightweight_fit
 
 logger = logging.getLogger(__name__)
 
-# Rate limits (REQ-015 §7.4)
-_MAX_JOBS_PER_PASS = 50
-_MAX_PERSONAS_PER_JOB = 100
+# Jobs surfaced per transaction (REQ-015 §7.4)
+_JOBS_PER_CHUNK = 50
 
-# Bound persona query to prevent OOM with large user bases.
-_MAX_PERSONAS_PER_QUERY = 500
+# Bound on one pass's work; the rest of the backlog waits for the next pass.
+_MAX_JOBS_PER_PASS = 1000
+
+# Personas loaded per keyset page, to bound memory with large user bases.
+_PERSONAS_PER_CHUNK = 500
 
 
 @dataclass(frozen=True)
@@ -55,12 +79,13 @@ class SurfacingPassResult:
     """Result of a single surfacing pass.
 
     Attributes:
-        jobs_processed: Number of jobs evaluated.
+        jobs_processed: Number of jobs evaluated (including failed ones).
         links_created: Number of new persona_jobs links created.
         links_skipped_threshold: Skipped because fit_score < threshold.
         links_skipped_existing: Skipped because link already existed.
         started_at: When the pass started.
         finished_at: When the pass finished.
+        jobs_failed: Jobs whose matching raised; stamped without links.
     """
 
     jobs_processed: int
@@ -69,6 +94,7 @@ class SurfacingPassResult:
     links_skipped_existing: int
     started_at: datetime
     finished_at: datetime
+    jobs_failed: int = 0
 
 
 # ---------------------------------------------------------------------------
@@ -79,32 +105,32 @@ class SurfacingPassResult:
 async def get_unsurfaced_jobs(
     db: AsyncSession,
     *,
-    since: datetime,
-    limit: int = _MAX_JOBS_PER_PASS,
+    since: datetime | None = None,
+    limit: int = _JOBS_PER_CHUNK,
 ) -> list[JobPosting]:
-    """Query new active, non-quarantined job postings since a given timestamp.
+    """Query active, non-quarantined job postings not yet surfaced.
 
     REQ-015 §8.4: Surfacing worker skips quarantined jobs to prevent
-    pool poisoning from affecting other users.
+    pool poisoning from affecting other users. Released jobs are still
+    unsurfaced, so they are picked up once their quarantine ends.
 
     Args:
         db: Async database session.
-        since: Only include jobs created after this timestamp.
+        since: Optionally, only include jobs created after this timestamp.
         limit: Maximum number of jobs to return.
 
     Returns:
-        List of active, non-quarantined JobPosting records, newest first.
+        List of active, non-quarantined, unsurfaced JobPosting records,
+        oldest first so the backlog drains in arrival order.
     """
-    stmt = (
-        select(JobPosting)
-        .where(
-            JobPosting.is_active.is_(True),
-            JobPosting.is_quarantined.is_(False),
-            JobPosting.created_at >= since,
-        )
-        .order_by(JobPosting.created_at.desc())
-        .limit(limit)
+    stmt = select(JobPosting).where(
+        JobPosting.is_active.is_(True),
+        JobPosting.is_quarantined.is_(False),
+        JobPosting.surfaced_at.is_(None),
     )
+    if since is not None:
+        stmt = stmt.where(JobPosting.created_at >= since)
+    stmt = stmt.order_by(JobPosting.created_at, JobPosting.id).limit(limit)
     result = await db.execute(stmt)
     return list(result.scalars().all())
 
@@ -112,27 +138,59 @@ async def get_unsurfaced_jobs(
 async def get_active_personas_with_skills(
     db: AsyncSession,
     *,
-    limit: int = _MAX_PERSONAS_PER_QUERY,
+    limit: int = _PERSONAS_PER_CHUNK,
+    after_id: uuid.UUID | None = None,
 ) -> list[Persona]:
-    """Query personas that have completed onboarding, with skills loaded.
+    """Query one keyset page of onboarded personas, with skills loaded.
 
     Args:
         db: Async database session.
-        limit: Maximum personas to load (prevents OOM with large user bases).
+        limit: Maximum personas to load (page size).
+        after_id: Only include personas with a greater id (keyset cursor).
 
     Returns:
-        List of Persona records with skills eagerly loaded.
+        List of Persona records ordered by id, skills eagerly loaded.
     """
     stmt = (
         select(Persona)
         .where(Persona.onboarding_complete.is_(True))
         .options(selectinload(Persona.skills))
+        .order_by(Persona.id)
         .limit(limit)
     )
+    if after_id is not None:
+        stmt = stmt.where(Persona.id > after_id)
     result = await db.execute(stmt)
     return list(result.scalars().all())
 
 
+async def iter_persona_chunks(
+    db: AsyncSession,
+    *,
+    chunk_size: int = _PERSONAS_PER_CHUNK,
+) -> AsyncIterator[list[Persona]]:
+    """Stream all onboarded personas in keyset-paginated chunks.
+
+    Args:
+        db: Async database session.
+        chunk_size: Personas per chunk.
+
+    Yields:
+        Non-empty lists of personas (skills loaded), in id order.
+    """
+    after_id: uuid.UUID | None = None
+    while True:
+        chunk = await get_active_personas_with_skills(
+            db, limit=chunk_size, after_id=after_id
+        )
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < chunk_size:
+            return
+        after_id = chunk[-1].id
+
+
 async def get_existing_persona_ids_for_job(
     db: AsyncSession,
     job_posting_id: uuid.UUID,
@@ -153,38 +211,94 @@ async def get_existing_persona_ids_for_job(
     return {row[0] for row in result.all()}
 
 
+async def get_existing_persona_ids_for_jobs(
+    db: AsyncSession,
+    job_posting_ids: Sequence[uuid.UUID],
+    persona_ids: Sequence[uuid.UUID],
+) -> dict[uuid.UUID, set[uuid.UUID]]:
+    """Query existing links between a set of jobs and a set of personas.
+
+    Args:
+        db: Async database session.
+        job_posting_ids: Job postings to check.
+        persona_ids: Personas to check.
+
+    Returns:
+        Linked persona IDs by job posting ID (jobs without links omitted).
+    """
+    if not job_posting_ids or not persona_ids:
+        return {}
+    stmt = select(PersonaJob.job_posting_id, PersonaJob.persona_id).where(
+        PersonaJob.job_posting_id.in_(job_posting_ids),
+        PersonaJob.persona_id.in_(persona_ids),
+    )
+    result = await db.execute(stmt)
+    existing: dict[uuid.UUID, set[uuid.UUID]] = {}
+    for job_posting_id, persona_id in result.all():
+        existing.setdefault(job_posting_id, set()).add(persona_id)
+    return existing
+
+
+async def mark_jobs_surfaced(
+    db: AsyncSession,
+    job_posting_ids: Sequence[uuid.UUID],
+    *,
+    surfaced_at: datetime,
+) -> None:
+    """Advance the surfacing cursor past the given jobs.
+
+    Args:
+        db: Async database session (caller commits).
+        job_posting_ids: Jobs evaluated against every persona.
+        surfaced_at: Timestamp to record.
+    """
+    if not job_posting_ids:
+        return
+    await db.execute(
+        update(JobPosting)
+        .where(JobPosting.id.in_(job_posting_ids))
+        .values(surfaced_at=surfaced_at)
+    )
+
+
 # ---------------------------------------------------------------------------
 # Surfacing orchestration
 # ---------------------------------------------------------------------------
 
 
-async def surface_job_to_personas(
-    db: AsyncSession,
+def match_job_to_personas(
     job: JobPosting,
     personas: list[Persona],
     *,
-    max_personas: int = _MAX_PERSONAS_PER_JOB,
-) -> tuple[int, int, int]:
-    """Surface a single job to matching personas.
+    skill_index: SkillIndex,
+    existing_persona_ids: set[uuid.UUID],
+    max_personas: int | None = None,
+) -> tuple[list[PoolLinkCreate], int, int]:
+    """Compute which personas a job should be surfaced to.
+
+    Pure: no database access, so a whole chunk of jobs can be matched
+    before any link is written.
 
     Args:
-        db: Async database session.
         job: The job posting to surface.
-        personas: All candidate personas (with skills loaded).
-        max_personas: Maximum personas to evaluate per job.
+        personas: Candidate personas (with skills loaded).
+        skill_index: Skill index over personas.
+        existing_persona_ids: Personas already linked to the job.
+        max_personas: Maximum personas to evaluate, or None for all.
 
     Returns:
-        Tuple of (links_created, skipped_threshold, skipped_existing).
+        Tuple of (links to create, skipped_threshold, skipped_existing).
     """
-    existing_persona_ids = await get_existing_persona_ids_for_job(db, job.id)
+    # Keyword pre-screen for every persona at once: one pass over the job text
+    matched_persona_ids = skill_index.candidates(job.job_title, job.description or "")
 
-    created = 0
+    matches: list[PoolLinkCreate] = []
     skipped_threshold = 0
     skipped_existing = 0
 
     evaluated = 0
     for persona in personas:
-        if evaluated >= max_personas:
+        if max_personas is not None and evaluated >= max_personas:
             break
 
         # Skip already-linked personas
@@ -195,8 +309,7 @@ async def surface_job_to_personas(
         evaluated += 1
 
         # Keyword pre-screen
-        skill_names = [s.skill_name for s in persona.skills]
-        if not keyword_pre_screen(job.job_title, job.description or "", skill_names):
+        if persona.id not in matched_persona_ids:
             skipped_threshold += 1
             continue
 
@@ -207,33 +320,74 @@ async def surface_job_to_personas(
             skipped_threshold += 1
             continue
 
-        # Create persona_jobs link
-        link = await _create_pool_link(
-            db,
-            persona_id=persona.id,
-            job_posting_id=job.id,
-            fit_score=fit_result.total,
+        matches.append(
+            PoolLinkCreate(
+                persona_id=persona.id,
+                job_posting_id=job.id,
+                fit_score=fit_result.total,
+            )
         )
-        if link is not None:
-            created += 1
-        else:
-            skipped_existing += 1
 
-    return created, skipped_threshold, skipped_existing
+    return matches, skipped_threshold, skipped_existing
+
+
+async def surface_job_to_personas(
+    db: AsyncSession,
+    job: JobPosting,
+    personas: list[Persona],
+    *,
+    max_personas: int | None = None,
+    skill_index: SkillIndex | None = None,
+    existing_persona_ids: set[uuid.UUID] | None = None,
+) -> tuple[int, int, int]:
+    """Surface a single job to matching personas.
+
+    Args:
+        db: Async database session.
+        job: The job posting to surface.
+        personas: Candidate personas (with skills loaded).
+        max_personas: Maximum personas to evaluate, or None for all.
+        skill_index: Skill index over personas. Built from personas when
+            omitted.
+        existing_persona_ids: Personas already linked to the job, when
+            the caller looked them up in bulk. Queried when omitted.
+
+    Returns:
+        Tuple of (links_created, skipped_threshold, skipped_existing).
+    """
+    if existing_persona_ids is None:
+        existing_persona_ids = await get_existing_persona_ids_for_job(db, job.id)
+    if skill_index is None:
+        skill_index = _build_skill_index(personas)
+
+    matches, skipped_threshold, skipped_existing = match_job_to_personas(
+        job,
+        personas,
+        skill_index=skill_index,
+        existing_persona_ids=existing_persona_ids,
+        max_personas=max_personas,
+    )
+    created = await _write_pool_links(db, matches)
+    return created, skipped_threshold, skipped_existing + len(matches) - created
 
 
 async def run_surfacing_pass(
     db: AsyncSession,
     *,
-    since: datetime,
+    since: datetime | None = None,
+    max_jobs: int = _MAX_JOBS_PER_PASS,
 ) -> SurfacingPassResult:
     """Execute a single surfacing pass.
 
-    REQ-015 §7: Main entry point for the surfacing worker.
+    REQ-015 §7: Main entry point for the surfacing worker. Drains the
+    unsurfaced backlog oldest first. Personas are streamed and indexed
+    once per pass; links are committed one job chunk at a time, and the
+    pass's jobs are stamped surfaced once every persona has seen them.
 
     Args:
         db: Async database session.
-        since: Only evaluate jobs created after this timestamp.
+        since: Optionally, only evaluate jobs created after this timestamp.
+        max_jobs: Maximum jobs to surface in this pass.
 
     Returns:
         SurfacingPassResult with statistics.
@@ -243,50 +397,48 @@ async def run_surfacing_pass(
     # REQ-015 §8.4: Release expired quarantines before surfacing
     await release_expired_quarantines(db)
 
-    jobs = await get_unsurfaced_jobs(db, since=since)
-    if not jobs:
-        return SurfacingPassResult(
-            jobs_processed=0,
-            links_created=0,
-            links_skipped_threshold=0,
-            links_skipped_existing=0,
-            started_at=started_at,
-            finished_at=datetime.now(UTC),
-        )
-
-    personas = await get_active_personas_with_skills(db)
-    if not personas:
-        return SurfacingPassResult(
-            jobs_processed=len(jobs),
-            links_created=0,
-            links_skipped_threshold=0,
-            links_skipped_existing=0,
-            started_at=started_at,
-            finished_at=datetime.now(UTC),
-        )
+    jobs = await get_unsurfaced_jobs(db, since=since, limit=max_jobs)
+    job_chunks = [
+        jobs[i : i + _JOBS_PER_CHUNK] for i in range(0, len(jobs), _JOBS_PER_CHUNK)
+    ]
 
     total_created = 0
     total_skipped_threshold = 0
     total_skipped_existing = 0
-
-    for job in jobs:
-        created, skipped_thresh, skipped_exist = await surface_job_to_personas(
-            db, job, personas
+    failed_job_ids: set[uuid.UUID] = set()
+
+    if jobs:
+        async for personas in iter_persona_chunks(db):
+            skill_index = _build_skill_index(personas)
+            for job_chunk in job_chunks:
+                created, skipped_thresh, skipped_exist = await _surface_job_chunk(
+                    db,
+                    [job for job in job_chunk if job.id not in failed_job_ids],
+                    personas,
+                    skill_index=skill_index,
+                    failed_job_ids=failed_job_ids,
+                )
+                await db.commit()
+                total_created += created
+                total_skipped_threshold += skipped_thresh
+                total_skipped_existing += skipped_exist
+
+        await mark_jobs_surfaced(
+            db, [job.id for job in jobs], surfaced_at=datetime.now(UTC)
         )
-        total_created += created
-        total_skipped_threshold += skipped_thresh
-        total_skipped_existing += skipped_exist
-
-    await db.commit()
+        await db.commit()
 
     finished_at = datetime.now(UTC)
-    logger.info(
-        "Surfacing pass complete: %d jobs, %d links created, %d below threshold, %d existing",
-        len(jobs),
-        total_created,
-        total_skipped_threshold,
-        total_skipped_existing,
-    )
+    if jobs:
+        logger.info(
+            "Surfacing pass complete: %d jobs (%d failed), %d links created, "
+            "%d below threshold, %d existing",
+            len(jobs),
+            len(failed_job_ids),
+            total_created,
+            total_skipped_threshold,
+            total_skipped_existing,
+        )
 
     return SurfacingPassResult(
         jobs_processed=len(jobs),
@@ -295,6 +447,7 @@ async def run_surfacing_pass(
         links_skipped_existing=total_skipped_existing,
         started_at=started_at,
         finished_at=finished_at,
+        jobs_failed=len(failed_job_ids),
     )
 
 
@@ -303,43 +456,87 @@ async def run_surfacing_pass(
 # ---------------------------------------------------------------------------
 
 
-async def _create_pool_link(
+async def _surface_job_chunk(
     db: AsyncSession,
+    jobs: list[JobPosting],
+    personas: list[Persona],
     *,
-    persona_id: uuid.UUID,
-    job_posting_id: uuid.UUID,
-    fit_score: int,
-) -> PersonaJob | None:
-    """Create a persona_jobs link with discovery_method='pool'.
+    skill_index: SkillIndex,
+    failed_job_ids: set[uuid.UUID],
+) -> tuple[int, int, int]:
+    """Surface a chunk of jobs to one persona chunk and write the links.
 
-    Uses savepoint + IntegrityError recovery for UNIQUE constraint races.
+    A job whose matching raises is logged and added to failed_job_ids
+    instead of failing the chunk, so the caller can skip it for the rest
+    of the pass.
 
     Args:
-        db: Async database session.
-        persona_id: FK to personas.
-        job_posting_id: FK to job_postings.
-        fit_score: Calculated lightweight fit score.
+        db: Async database session (caller commits).
+        jobs: Jobs to surface.
+        personas: Persona chunk (with skills loaded).
+        skill_index: Skill index over personas.
+        failed_job_ids: Jobs whose matching raised; updated in place.
 
     Returns:
-        Created PersonaJob, or None if link already exists.
+        Tuple of (links_created, skipped_threshold, skipped_existing).
     """
-    try:
-        async with db.begin_nested():
-            persona_job = PersonaJob(
-                persona_id=persona_id,
-                job_posting_id=job_posting_id,
-                discovery_method="pool",
-                status="Discovered",
-                fit_score=fit_score,
-                scored_at=datetime.now(UTC),
+    if not jobs:
+        return 0, 0, 0
+
+    existing = await get_existing_persona_ids_for_jobs(
+        db, [job.id for job in jobs], [persona.id for persona in personas]
+    )
+    matches: list[PoolLinkCreate] = []
+    skipped_threshold = 0
+    skipped_existing = 0
+    for job in jobs:
+        try:
+            job_matches, job_skipped_thresh, job_skipped_exist = match_job_to_personas(
+                job,
+                personas,
+                skill_index=skill_index,
+                existing_persona_ids=existing.get(job.id, set()),
             )
-            db.add(persona_job)
-            await db.flush()
-        return persona_job
-    except IntegrityError:
-        logger.debug(
-            "Pool link already exists: persona=%s job=%s",
-            persona_id,
-            job_posting_id,
-        )
-        return None
+        # WHY BLE001: a malformed posting must not block every later job;
+        # it is stamped surfaced with the rest of the pass.
+        except Exception:  # noqa: BLE001
+            logger.exception("Surfacing failed for job %s; skipping it", job.id)
+            failed_job_ids.add(job.id)
+            continue
+        matches.extend(job_matches)
+        skipped_threshold += job_skipped_thresh
+        skipped_existing += job_skipped_exist
+
+    created = await _write_pool_links(db, matches)
+    return created, skipped_threshold, skipped_existing + len(matches) - created
+
+
+def _build_skill_index(personas: list[Persona]) -> SkillIndex:
+    """Index the skills of every persona (skills must be loaded)."""
+    index = SkillIndex()
+    for persona in personas:
+        index.add(persona.id, (skill.skill_name for skill in persona.skills))
+    return index
+
+
+async def _write_pool_links(
+    db: AsyncSession,
+    matches: list[PoolLinkCreate],
+) -> int:
+    """Insert matched pool links, ignoring links that already exist.
+
+    Args:
+        db: Async database session (caller commits).
+        matches: Links to create.
+
+    Returns:
+        Number of links actually inserted.
+    """
+    if not matches:
+        return 0
+    created = await PersonaJobRepository.create_pool_links(
+        db, matches, scored_at=datetime.now(UTC)
+    )
+    if len(created) < len(matches):
+        logger.debug("%d pool links already existed", len(matches) - len(created))
+    return len(created)
@@ -1,18 +1,20 @@
 """Pool surfacing background worker.
 
 REQ-015 §7.1: asyncio background task via FastAPI lifespan event.
-Runs the surfacing pass on a configurable interval (~15 min).
+Runs the surfacing pass on a configurable interval (~15 min). Progress is
+tracked durably per job (job_postings.surfaced_at), so a restart or a
+backlog larger than one pass resumes where the previous pass stopped.
 
 Coordinates with:
   - discovery/pool_surfacing_service.py — imports SurfacingPassResult and run_surfacing_pass
 
-Called by: app/main.py (FastAPI lifespan event) and unit tests.
+Called by: app/worker.py (API lifespan and worker process) and unit tests.
 """
 
 import asyncio
 import contextlib
 import logging
-from datetime import UTC, datetime, timedelta
+from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -26,9 +28,6 @@ logger = logging.getLogger(__name__)
 # Default interval: 15 minutes (REQ-015 §7.1)
 DEFAULT_INTERVAL_SECONDS = 15 * 60
 
-# On first run, look back 24 hours to catch up on missed jobs.
-_INITIAL_LOOKBACK = timedelta(hours=24)
-
 
 class PoolSurfacingWorker:
     """Background worker that periodically surfaces pool jobs to personas.
@@ -102,9 +101,8 @@ class PoolSurfacingWorker:
         Returns:
             SurfacingPassResult with statistics from the pass.
         """
-        since = self._get_since()
         async with self._session_factory() as db:
-            result = await run_surfacing_pass(db, since=since)
+            result = await run_surfacing_pass(db)
         self._last_run_at = result.finished_at
         return result
 
@@ -125,9 +123,3 @@ class PoolSurfacingWorker:
         except asyncio.CancelledError:
             logger.debug("Surfacing loop cancelled")
             raise
-
-    def _get_since(self) -> datetime:
-        """Determine the 'since' timestamp for the next pass."""
-        if self._last_run_at is not None:
-            return self._last_run_at
-        return datetime.now(UTC) - _INITIAL_LOOKBACK
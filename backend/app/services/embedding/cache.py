@@ -21,7 +21,8 @@ Coordinates with:
   - embedding/persona_generator.py — imports PersonaEmbeddingsResult for cache values
   - embedding/storage.py — imports compute_source_hash for freshness validation
 
-Called by: Unit tests. Intended for scoring pipeline (pending wiring).
+Called by: embedding/persona_embedding_store.py (L1 tier in front of the
+persona_embeddings table) and unit tests.
 """
 
 import uuid
@@ -322,3 +323,36 @@ class PersonaEmbeddingCache:
             invalidations=self._invalidations,
             evictions=self._evictions,
         )
+
+
+# =============================================================================
+# Process-wide Instance
+# =============================================================================
+
+_persona_embedding_cache: PersonaEmbeddingCache | None = None
+
+
+def get_persona_embedding_cache() -> PersonaEmbeddingCache:
+    """Get or create the process-wide persona embedding cache.
+
+    WHY SINGLETON: JobScoringService is created per request/poll, so a
+    per-instance cache would never be hit across scoring runs. One cache
+    per process lets every scoring path share warm entries.
+
+    Returns:
+        The shared PersonaEmbeddingCache instance.
+    """
+    global _persona_embedding_cache
+
+    if _persona_embedding_cache is None:
+        _persona_embedding_cache = PersonaEmbeddingCache()
+    return _persona_embedding_cache
+
+
+def reset_persona_embedding_cache() -> None:
+    """Reset the process-wide cache.
+
+    Used in tests to ensure isolation between test cases.
+    """
+    global _persona_embedding_cache
+    _persona_embedding_cache = None
@@ -0,0 +1,196 @@
+"""Job embedding store for the scoring pipeline.
+
+REQ-008 §6.5-6.6, §10.1: Reuse persisted job embeddings during scoring.
+
+Job postings live in the shared pool (Tier 0), so a title or culture
+embedding computed once serves every persona that links to the job.
+The store bulk-loads stored vectors from job_embeddings, checks them
+against the current source text via source_hash, embeds only missing or
+stale texts (one batched provider call per embedding type), and upserts
+the new vectors so the next persona scoring the same job pays nothing.
+
+Jobs are embedded when first scored, which for polled jobs is the step
+immediately after they enter the pool (JobFetchService._score_new_jobs).
+
+Coordinates with:
+  - repositories/job_embedding_repository.py — bulk load and upsert
+  - embedding/job_generator.py — text builders, neutral embedding,
+    JobScoringEmbeddings
+  - embedding/storage.py — compute_source_hash for freshness
+  - embedding/types.py — JobEmbeddingType values
+
+Called by: scoring/job_scoring_service.py and unit tests.
+"""
+
+import logging
+import uuid
+from collections.abc import Sequence
+from typing import Any, Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.providers.embedding.base import EmbeddingProvider
+from app.repositories.job_embedding_repository import JobEmbeddingRepository
+from app.services.embedding.job_generator import (
+    JobScoringEmbeddings,
+    build_culture_text,
+    build_title_text,
+    get_neutral_embedding,
+)
+from app.services.embedding.storage import compute_source_hash
+from app.services.embedding.types import JobEmbeddingType
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+_MODEL_VERSION = "1"
+"""Stored model_version for rows written by the store (matches reembed_all)."""
+
+_SCORING_TYPES = (JobEmbeddingType.TITLE.value, JobEmbeddingType.CULTURE.value)
+"""Embedding types batch scoring consumes."""
+
+
+# =============================================================================
+# Type Definitions
+# =============================================================================
+
+
+class ScoringJobLike(Protocol):
+    """Protocol for job objects the store can embed."""
+
+    id: uuid.UUID
+    job_title: str
+    culture_text: str | None
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+
+class JobEmbeddingStore:
+    """Load-or-generate job embeddings backed by the job_embeddings table.
+
+    REQ-008 §10.1: One embed per shared pool job, reused across personas.
+
+    Args:
+        db: Async database session (caller controls transaction).
+        embedding_provider: Provider used for missing or stale vectors.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        embedding_provider: EmbeddingProvider,
+    ) -> None:
+        self.db = db
+        self._provider = embedding_provider
+        self._model_name = embedding_provider.config.embedding_model
+
+    async def get_scoring_embeddings(
+        self,
+        jobs: Sequence[ScoringJobLike],
+    ) -> dict[uuid.UUID, JobScoringEmbeddings]:
+        """Return title and culture vectors for every job.
+
+        Stored vectors are used when their source_hash matches the current
+        text; everything else is embedded in one batch per type and
+        written back.
+
+        Args:
+            jobs: Jobs about to be scored.
+
+        Returns:
+            Mapping of job ID to its scoring embeddings.
+
+        Raises:
+            ProviderError: If the embedding provider fails.
+            ValueError: If the provider returns the wrong number of vectors.
+        """
+        if not jobs:
+            return {}
+
+        stored = await JobEmbeddingRepository.get_for_jobs(
+            self.db,
+            [job.id for job in jobs],
+            model_name=self._model_name,
+            embedding_types=_SCORING_TYPES,
+        )
+        stored_by_key = {
+            (row.job_posting_id, row.embedding_type): row for row in stored
+        }
+
+        titles: dict[uuid.UUID, list[float] | None] = {}
+        cultures: dict[uuid.UUID, list[float]] = {}
+        pending: dict[str, list[tuple[uuid.UUID, str]]] = {
+            embedding_type: [] for embedding_type in _SCORING_TYPES
+        }
+
+        for job in jobs:
+            for embedding_type, text in (
+                (JobEmbeddingType.TITLE.value, build_title_text(job.job_title)),
+                (JobEmbeddingType.CULTURE.value, build_culture_text(job.culture_text)),
+            ):
+                if not text:
+                    continue
+                row = stored_by_key.get((job.id, embedding_type))
+                if row is not None and row.source_hash == compute_source_hash(text):
+                    vector = [float(v) for v in row.vector]
+                    if embedding_type == JobEmbeddingType.TITLE.value:
+                        titles[job.id] = vector
+                    else:
+                        cultures[job.id] = vector
+                else:
+                    pending[embedding_type].append((job.id, text))
+
+        new_rows: list[dict[str, Any]] = []
+        for embedding_type, items in pending.items():
+            if not items:
+                continue
+            vectors = await self._embed([text for _, text in items])
+            for (job_id, text), vector in zip(items, vectors, strict=True):
+                if embedding_type == JobEmbeddingType.TITLE.value:
+                    titles[job_id] = vector
+                else:
+                    cultures[job_id] = vector
+                new_rows.append(
+                    {
+                        "job_posting_id": job_id,
+                        "embedding_type": embedding_type,
+                        "vector": vector,
+                        "model_name": self._model_name,
+                        "model_version": _MODEL_VERSION,
+                        "source_hash": compute_source_hash(text),
+                    }
+                )
+
+        if new_rows:
+            await JobEmbeddingRepository.upsert_many(self.db, new_rows)
+            logger.debug(
+                "Stored %d job embeddings (%d loaded from table)",
+                len(new_rows),
+                len(stored),
+            )
+
+        return {
+            job.id: JobScoringEmbeddings(
+                title=titles.get(job.id),
+                culture=cultures.get(job.id) or get_neutral_embedding(),
+            )
+            for job in jobs
+        }
+
+    async def _embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in one provider call, validating the response count."""
+        result = await self._provider.embed(texts)
+        # Defense-in-depth: vectors are matched to jobs by position
+        if len(result.vectors) != len(texts):
+            msg = (
+                f"Embedding response count mismatch: "
+                f"got {len(result.vectors)}, expected {len(texts)}"
+            )
+            raise ValueError(msg)
+        return result.vectors
@@ -13,10 +13,14 @@ Key Principle (REQ-008 §6.1):
     technical keywords polluting soft skill similarity matches.
 
 Coordinates with:
-  - scoring/batch_scoring.py — imports build_culture_text and get_neutral_embedding
+  - scoring/batch_scoring.py — imports build_culture_text, build_title_text,
+    get_neutral_embedding and JobScoringEmbeddings
+  - embedding/job_embedding_store.py — imports the same text builders for
+    source hashing, and returns JobScoringEmbeddings
   - scripts/reembed_all.py — imports generate_job_embeddings for batch re-embedding
 
-Called by: scoring/batch_scoring.py, scripts/reembed_all.py, and unit tests.
+Called by: scoring/batch_scoring.py, embedding/job_embedding_store.py,
+scripts/reembed_all.py, and unit tests.
 """
 
 import uuid
@@ -100,6 +104,22 @@ class JobEmbeddingsResult:
     model_name: str
 
 
+@dataclass
+class JobScoringEmbeddings:
+    """Job vectors consumed by batch scoring.
+
+    REQ-008 §10.1: Loaded from job_embeddings (or freshly generated) so
+    batch_score_jobs does not re-embed jobs whose vectors are stored.
+
+    Attributes:
+        title: Job title embedding, or None if the job has no title.
+        culture: Culture embedding (neutral zero vector if no culture text).
+    """
+
+    title: list[float] | None
+    culture: list[float]
+
+
 # =============================================================================
 # Text Building Functions
 # =============================================================================
@@ -189,6 +209,20 @@ def build_culture_text(culture_text: str | None) -> str:
     return culture_text
 
 
+def build_title_text(job_title: str | None) -> str:
+    """Build embedding text from a job title.
+
+    Args:
+        job_title: Raw job title.
+
+    Returns:
+        The stripped title, or empty string if missing/blank.
+    """
+    if not job_title or not job_title.strip():
+        return ""
+    return job_title.strip()
+
+
 def get_neutral_embedding() -> list[float]:
     """Return a neutral (zero) embedding vector.
 
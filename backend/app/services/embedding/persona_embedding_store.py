@@ -0,0 +1,187 @@
+"""Two-tier persona embedding store for the scoring pipeline.
+
+REQ-008 §6.5-6.6, §10.2: Cache persona embeddings until persona update.
+
+Lookup order for a persona's three embeddings (hard_skills, soft_skills,
+logistics):
+
+1. L1 — process-wide PersonaEmbeddingCache (LRU, keyed by user + persona),
+   validated against hashes of the current source texts.
+2. L2 — persona_embeddings table, validated per type via source_hash.
+3. Provider — only the missing or stale types, in a single batched call.
+
+Fresh results are written back to both tiers, so rescoring a persona in
+500-job chunks embeds at most once per persona edit.
+
+Coordinates with:
+  - embedding/cache.py — get_persona_embedding_cache for the L1 tier
+  - repositories/persona_embedding_repository.py — L2 load and upsert
+  - embedding/persona_generator.py — text builders and result dataclasses
+  - embedding/storage.py — compute_source_hash for freshness
+
+Called by: scoring/job_scoring_service.py and unit tests.
+"""
+
+import logging
+import uuid
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.providers.embedding.base import EmbeddingProvider
+from app.repositories.persona_embedding_repository import (
+    PersonaEmbeddingRepository,
+)
+from app.services.embedding.cache import (
+    PersonaEmbeddingCache,
+    get_persona_embedding_cache,
+)
+from app.services.embedding.persona_generator import (
+    PersonaEmbeddingData,
+    PersonaEmbeddingsResult,
+    PersonaLike,
+    build_hard_skills_text,
+    build_logistics_text,
+    build_soft_skills_text,
+)
+from app.services.embedding.storage import compute_source_hash
+from app.services.embedding.types import PersonaEmbeddingType
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+_MODEL_VERSION = "1"
+"""Stored model_version for rows written by the store (matches reembed_all)."""
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+
+class PersonaEmbeddingStore:
+    """Load-or-generate persona embeddings through the L1 cache and L2 table.
+
+    REQ-008 §10.2: Persona embeddings are reused until the persona changes.
+
+    Args:
+        db: Async database session (caller controls transaction).
+        embedding_provider: Provider used for missing or stale vectors.
+        cache: L1 cache. Defaults to the process-wide instance.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        embedding_provider: EmbeddingProvider,
+        cache: PersonaEmbeddingCache | None = None,
+    ) -> None:
+        self.db = db
+        self._provider = embedding_provider
+        self._model_name = embedding_provider.config.embedding_model
+        self._cache = cache if cache is not None else get_persona_embedding_cache()
+
+    async def get_embeddings(
+        self,
+        persona: PersonaLike,
+        user_id: uuid.UUID,
+    ) -> PersonaEmbeddingsResult:
+        """Return fresh embeddings for a persona, embedding only what changed.
+
+        Args:
+            persona: Persona with skills and logistics fields loaded.
+            user_id: Owning user's UUID (L1 tenant isolation).
+
+        Returns:
+            PersonaEmbeddingsResult with all three embedding types.
+
+        Raises:
+            ProviderError: If the embedding provider fails.
+            ValueError: If the provider returns the wrong number of vectors.
+        """
+        texts = {
+            PersonaEmbeddingType.HARD_SKILLS.value: build_hard_skills_text(
+                persona.skills
+            ),
+            PersonaEmbeddingType.SOFT_SKILLS.value: build_soft_skills_text(
+                persona.skills
+            ),
+            PersonaEmbeddingType.LOGISTICS.value: build_logistics_text(persona),
+        }
+
+        # L1: in-process cache
+        cached = self._cache.get_if_fresh(
+            user_id,
+            persona.id,
+            hard_skills_text=texts[PersonaEmbeddingType.HARD_SKILLS.value],
+            soft_skills_text=texts[PersonaEmbeddingType.SOFT_SKILLS.value],
+            logistics_text=texts[PersonaEmbeddingType.LOGISTICS.value],
+        )
+        if cached is not None and cached.embeddings.model_name == self._model_name:
+            return cached.embeddings
+
+        # L2: persona_embeddings table
+        rows = await PersonaEmbeddingRepository.get_for_persona(
+            self.db, persona.id, model_name=self._model_name
+        )
+        vectors: dict[str, list[float]] = {}
+        for row in rows:
+            text = texts.get(row.embedding_type)
+            if text is not None and row.source_hash == compute_source_hash(text):
+                vectors[row.embedding_type] = [float(v) for v in row.vector]
+
+        # Provider: only missing/stale types, one batched call
+        stale_types = [t for t in texts if t not in vectors]
+        if stale_types:
+            stale_texts = [texts[t] for t in stale_types]
+            result = await self._provider.embed(stale_texts)
+            # Defense-in-depth: vectors are matched to types by position
+            if len(result.vectors) != len(stale_texts):
+                msg = (
+                    f"Embedding response count mismatch: "
+                    f"got {len(result.vectors)}, expected {len(stale_texts)}"
+                )
+                raise ValueError(msg)
+
+            new_rows: list[dict[str, Any]] = []
+            for embedding_type, vector in zip(stale_types, result.vectors, strict=True):
+                vectors[embedding_type] = vector
+                new_rows.append(
+                    {
+                        "persona_id": persona.id,
+                        "embedding_type": embedding_type,
+                        "vector": vector,
+                        "model_name": self._model_name,
+                        "model_version": _MODEL_VERSION,
+                        "source_hash": compute_source_hash(texts[embedding_type]),
+                    }
+                )
+            await PersonaEmbeddingRepository.upsert_many(self.db, new_rows)
+            logger.debug(
+                "Re-embedded %d persona embedding types for persona %s",
+                len(stale_types),
+                persona.id,
+            )
+
+        embeddings = PersonaEmbeddingsResult(
+            persona_id=persona.id,
+            hard_skills=PersonaEmbeddingData(
+                vector=vectors[PersonaEmbeddingType.HARD_SKILLS.value],
+                source_text=texts[PersonaEmbeddingType.HARD_SKILLS.value],
+            ),
+            soft_skills=PersonaEmbeddingData(
+                vector=vectors[PersonaEmbeddingType.SOFT_SKILLS.value],
+                source_text=texts[PersonaEmbeddingType.SOFT_SKILLS.value],
+            ),
+            logistics=PersonaEmbeddingData(
+                vector=vectors[PersonaEmbeddingType.LOGISTICS.value],
+                source_text=texts[PersonaEmbeddingType.LOGISTICS.value],
+            ),
+            version=persona.updated_at,
+            model_name=self._model_name,
+        )
+        self._cache.put(user_id, persona.id, embeddings)
+        return embeddings
@@ -18,12 +18,13 @@ Zentropy Scout uses five embedding types for semantic matching:
 5. **culture**: Company values, team description, benefits. CRITICAL:
    This requires LLM extraction from the raw description - NOT the entire
    description text (which would pollute the vector with technical keywords)
+6. **title**: The job title, used for role title and target role matching
 
 Key Principle (REQ-008 §6.1):
     Job culture embedding must be SEPARATED from requirements to avoid
     technical keywords polluting soft skill similarity matches.
 
-Called by: Unit tests. Defines canonical embedding type enums for future use by embedding pipeline.
+Called by: embedding/job_embedding_store.py and unit tests.
 """
 
 from enum import Enum
@@ -55,7 +56,7 @@ class PersonaEmbeddingType(str, Enum):
 class JobEmbeddingType(str, Enum):
     """Job-only embedding types.
 
-    REQ-008 §6.1: Two job embedding types (structured + LLM-extracted).
+    REQ-008 §6.1: Job embedding types (structured + LLM-extracted + title).
 
     Values use unprefixed form for JSON serialization and DB storage
     (matches CHECK constraints on job_embeddings.embedding_type).
@@ -63,10 +64,12 @@ class JobEmbeddingType(str, Enum):
     Values:
         REQUIREMENTS: Required/preferred skills with experience levels.
         CULTURE: Company values and culture text.
+        TITLE: Job title (role title / target role matching).
     """
 
     REQUIREMENTS = "requirements"
     CULTURE = "culture"
+    TITLE = "title"
 
 
 # Union type for any embedding type (REQ-031 §6.2: Union alias)
@@ -118,6 +121,13 @@ EMBEDDING_CONFIGS: dict[EmbeddingType, dict[str, str]] = {
             "to avoid keyword pollution. See REQ-007 §6.4 for extraction logic."
         ),
     },
+    JobEmbeddingType.TITLE: {
+        "source": "JobPosting.job_title",
+        "description": (
+            "Stripped job title, embedded on its own for semantic title matching. "
+            "Example: 'Senior Backend Engineer'"
+        ),
+    },
 }
 
 
@@ -4,43 +4,62 @@ REQ-008 §10.1: Batch Scoring — score multiple jobs efficiently.
 
 Key optimizations:
 1. Load persona embeddings once (not per job)
-2. Generate job embeddings in batch (single API call instead of N calls)
-3. Score sequentially (CPU-bound calculation, no benefit from async)
+2. Generate job embeddings in batch (single API call instead of N calls),
+   skipping jobs whose stored vectors are passed in
+3. Score sequentially (CPU-bound calculation, no benefit from async);
+   persona hard skills are compiled into a skill index once per batch
+4. Optional vectorized mode: embedding similarities for the whole batch
+   are computed in one matrix-vector product instead of per-job loops
+5. Optional incremental mode: components passed in reused_components are
+   not recomputed, and jobs reusing every embedding-based component are
+   not embedded at all
 
 Coordinates with:
   - scoring/fit_score.py — imports FitScoreResult and calculate_fit_score for aggregation
   - scoring/stretch_score.py — imports StretchScoreResult and sub-component calculators
-  - scoring/hard_skills_match.py — calls calculate_hard_skills_score
-  - scoring/soft_skills_match.py — calls calculate_soft_skills_score
+  - scoring/hard_skills_match.py — calls compile_persona_skill_index,
+    compile_job_skills, and score_compiled_hard_skills
+  - scoring/soft_skills_match.py — calls calculate_soft_skills_score, or
+    calculate_soft_skills_scores_batch in vectorized mode
   - scoring/experience_level.py — calls calculate_experience_score
   - scoring/location_logistics.py — calls calculate_logistics_score
   - scoring/role_title_match.py — calls calculate_role_title_score
-  - embedding/job_generator.py — imports build_culture_text, get_neutral_embedding
+  - scoring/component_fingerprints.py — imports EMBEDDING_COMPONENTS
+  - embedding/job_generator.py — imports build_culture_text, build_title_text,
+    get_neutral_embedding, JobScoringEmbeddings
   - embedding/persona_generator.py — imports PersonaEmbeddingsResult
 
 Called by: scoring/job_scoring_service.py.
 """
 
 import uuid
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any, Protocol
 
 from app.services.embedding.job_generator import (
+    JobScoringEmbeddings,
     build_culture_text,
+    build_title_text,
     get_neutral_embedding,
 )
 from app.services.embedding.persona_generator import PersonaEmbeddingsResult
+from app.services.scoring.component_fingerprints import EMBEDDING_COMPONENTS
 from app.services.scoring.experience_level import calculate_experience_score
 from app.services.scoring.fit_score import FitScoreResult, calculate_fit_score
 from app.services.scoring.hard_skills_match import (
     JobSkillInput,
     PersonaSkillInput,
-    calculate_hard_skills_score,
+    compile_job_skills,
+    compile_persona_skill_index,
+    score_compiled_hard_skills,
 )
 from app.services.scoring.location_logistics import calculate_logistics_score
 from app.services.scoring.role_title_match import calculate_role_title_score
-from app.services.scoring.soft_skills_match import calculate_soft_skills_score
+from app.services.scoring.soft_skills_match import (
+    calculate_soft_skills_score,
+    calculate_soft_skills_scores_batch,
+)
 from app.services.scoring.stretch_score import (
     StretchScoreResult,
     calculate_growth_trajectory,
@@ -190,9 +209,7 @@ def _get_job_skill_names(skills: list[Any]) -> list[str]:
 
 def _build_job_titles_text(job: JobPostingLike) -> str:
     """Build text for job title embedding."""
-    if not job.job_title or not job.job_title.strip():
-        return ""
-    return job.job_title.strip()
+    return build_title_text(job.job_title)
 
 
 # =============================================================================
@@ -203,8 +220,12 @@ def _build_job_titles_text(job: JobPostingLike) -> str:
 async def batch_score_jobs(
     jobs: Sequence[JobPostingLike],
     persona: PersonaLike,
-    persona_embeddings: PersonaEmbeddingsResult,
+    persona_embeddings: PersonaEmbeddingsResult | None,
     embedding_provider: EmbeddingProviderLike,
+    *,
+    vectorized: bool = False,
+    job_embeddings: Mapping[uuid.UUID, JobScoringEmbeddings] | None = None,
+    reused_components: Mapping[uuid.UUID, Mapping[str, float]] | None = None,
 ) -> list[ScoredJob]:
     """Score multiple jobs efficiently against a persona.
 
@@ -212,21 +233,36 @@ async def batch_score_jobs(
 
     Optimizations:
     1. Persona embeddings are passed in (loaded once, reused across calls)
-    2. Job embeddings generated in batch (single API call for all jobs)
+    2. Job embeddings generated in batch (single API call for all jobs);
+       jobs with precomputed vectors in job_embeddings are not re-embedded
     3. Component scoring is sequential (CPU-bound, no async benefit)
+    4. With vectorized=True, culture embeddings for the batch are stacked
+       into one matrix and soft skills similarities are computed with a
+       single matrix-vector product (scores match the scalar path to
+       floating-point rounding)
 
     Args:
         jobs: Sequence of job postings to score.
         persona: User's persona with skills, experience, and preferences.
         persona_embeddings: Pre-computed persona embeddings (avoids re-generation).
+            May be None only if every job reuses its soft_skills component.
         embedding_provider: Embedding provider for generating job embeddings.
+        vectorized: Compute embedding similarities for the whole batch with
+            NumPy instead of one pure-Python cosine per job.
+        job_embeddings: Precomputed title/culture vectors keyed by job ID
+            (e.g. from JobEmbeddingStore). Only jobs missing from the
+            mapping are sent to embedding_provider.
+        reused_components: Stored component scores keyed by job ID, from
+            find_reusable_components. Listed components are taken as-is;
+            the rest are recomputed and all are re-aggregated.
 
     Returns:
         List of ScoredJob results, one per input job, in the same order.
 
     Raises:
         ValueError: If persona_embeddings.persona_id doesn't match persona.id,
-            or if batch size exceeds maximum (_MAX_BATCH_SIZE).
+            if persona_embeddings is None but a job needs soft skills, or
+            if batch size exceeds maximum (_MAX_BATCH_SIZE).
     """
     # Validate batch size (DoS protection)
     if len(jobs) > _MAX_BATCH_SIZE:
@@ -234,7 +270,7 @@ async def batch_score_jobs(
         raise ValueError(msg)
 
     # Validate persona embeddings match persona
-    if persona_embeddings.persona_id != persona.id:
+    if persona_embeddings is not None and persona_embeddings.persona_id != persona.id:
         msg = (
             f"persona_id mismatch: embeddings for {persona_embeddings.persona_id}, "
             f"persona is {persona.id}"
@@ -245,23 +281,50 @@ async def batch_score_jobs(
     if not jobs:
         return []
 
+    reused = reused_components or {}
+    no_reuse: Mapping[str, float] = {}
+    job_reuse = [reused.get(job.id, no_reuse) for job in jobs]
+
+    soft_skills_indices = [
+        i for i, reuse in enumerate(job_reuse) if "soft_skills" not in reuse
+    ]
+    if soft_skills_indices and persona_embeddings is None:
+        msg = "persona_embeddings is required when soft skills must be recomputed"
+        raise ValueError(msg)
+
     # -------------------------------------------------------------------------
     # Step 1: Generate job embeddings in batch (optimization #2)
     # -------------------------------------------------------------------------
+    # Jobs with precomputed vectors (e.g. from the job_embeddings table)
+    # are not re-embedded.
+    precomputed = job_embeddings or {}
+    job_title_embeddings: list[list[float] | None] = [None] * len(jobs)
+    job_culture_embeddings: list[list[float]] = [get_neutral_embedding()] * len(jobs)
+
     # Collect texts for batch embedding
     job_titles_texts: list[str] = []
     job_culture_texts: list[str] = []
 
-    for job in jobs:
-        job_titles_texts.append(_build_job_titles_text(job))
-        job_culture_texts.append(build_culture_text(job.culture_text))
+    for i, job in enumerate(jobs):
+        stored = precomputed.get(job.id)
+        if job_reuse[i].keys() >= EMBEDDING_COMPONENTS:
+            # Incremental mode: no embedding-based component to recompute
+            job_titles_texts.append("")
+            job_culture_texts.append("")
+        elif stored is not None:
+            job_title_embeddings[i] = stored.title
+            job_culture_embeddings[i] = stored.culture
+            job_titles_texts.append("")
+            job_culture_texts.append("")
+        else:
+            job_titles_texts.append(_build_job_titles_text(job))
+            job_culture_texts.append(build_culture_text(job.culture_text))
 
     # Generate title embeddings for all jobs at once
     # Filter out empty texts and track indices
     non_empty_title_indices = [i for i, t in enumerate(job_titles_texts) if t]
     non_empty_titles = [job_titles_texts[i] for i in non_empty_title_indices]
 
-    job_title_embeddings: list[list[float] | None] = [None] * len(jobs)
     if non_empty_titles:
         title_result = await embedding_provider.embed(non_empty_titles)
         # Validate response count matches request (defense-in-depth)
@@ -278,7 +341,6 @@ async def batch_score_jobs(
     non_empty_culture_indices = [i for i, t in enumerate(job_culture_texts) if t]
     non_empty_cultures = [job_culture_texts[i] for i in non_empty_culture_indices]
 
-    job_culture_embeddings: list[list[float]] = [get_neutral_embedding()] * len(jobs)
     if non_empty_cultures:
         culture_result = await embedding_provider.embed(non_empty_cultures)
         # Validate response count matches request (defense-in-depth)
@@ -294,55 +356,85 @@ async def batch_score_jobs(
     # -------------------------------------------------------------------------
     # Step 2: Score each job (sequential, CPU-bound)
     # -------------------------------------------------------------------------
-    # Pre-convert persona skills once
-    persona_skills_dict = _convert_persona_skills(persona.skills)
+    # Compile persona hard skills once (normalized name → years)
+    persona_skill_index = compile_persona_skill_index(
+        _convert_persona_skills(persona.skills)
+    )
+
+    # Vectorized mode: all soft skills similarities in one matrix product
+    batch_soft_skills_scores: dict[int, float] | None = None
+    if vectorized and soft_skills_indices and persona_embeddings is not None:
+        batch_scores = calculate_soft_skills_scores_batch(
+            persona_embeddings.soft_skills.vector,
+            [job_culture_embeddings[i] for i in soft_skills_indices],
+        )
+        batch_soft_skills_scores = dict(
+            zip(soft_skills_indices, batch_scores, strict=True)
+        )
 
     results: list[ScoredJob] = []
     for i, job in enumerate(jobs):
-        # Convert job skills
-        job_skills_dict = _convert_job_skills(job.extracted_skills)
+        reuse = job_reuse[i]
         job_skill_names = _get_job_skill_names(job.extracted_skills)
 
         # ---------------------------------------------------------------------
         # Calculate Fit Score components
         # ---------------------------------------------------------------------
         # Hard skills (40%)
-        hard_skills_score = calculate_hard_skills_score(
-            persona_skills_dict,
-            job_skills_dict,
-        )
+        if "hard_skills" in reuse:
+            hard_skills_score = reuse["hard_skills"]
+        else:
+            hard_skills_score = score_compiled_hard_skills(
+                persona_skill_index,
+                compile_job_skills(_convert_job_skills(job.extracted_skills)),
+            )
 
         # Soft skills (15%) - using embeddings
-        soft_skills_score = calculate_soft_skills_score(
-            persona_embeddings.soft_skills.vector,
-            job_culture_embeddings[i],
-        )
+        if "soft_skills" in reuse:
+            soft_skills_score = reuse["soft_skills"]
+        elif batch_soft_skills_scores is not None:
+            soft_skills_score = batch_soft_skills_scores[i]
+        else:
+            assert persona_embeddings is not None, "validated above"
+            soft_skills_score = calculate_soft_skills_score(
+                persona_embeddings.soft_skills.vector,
+                job_culture_embeddings[i],
+            )
 
         # Experience level (25%)
-        experience_score = calculate_experience_score(
-            persona.years_experience,
-            job.years_experience_min,
-            job.years_experience_max,
-        )
+        if "experience_level" in reuse:
+            experience_score = reuse["experience_level"]
+        else:
+            experience_score = calculate_experience_score(
+                persona.years_experience,
+                job.years_experience_min,
+                job.years_experience_max,
+            )
 
         # Role title (10%) - using embeddings
         # Build user titles embedding (simplified: just use persona embedding for now)
         # In production, this would use a pre-computed user titles embedding
-        role_title_score = calculate_role_title_score(
-            persona.current_role,
-            None,  # work_history_titles - not available in this interface
-            job.job_title,
-            None,  # user_titles_embedding - would need pre-computation
-            job_title_embeddings[i],
-        )
+        if "role_title" in reuse:
+            role_title_score = reuse["role_title"]
+        else:
+            role_title_score = calculate_role_title_score(
+                persona.current_role,
+                None,  # work_history_titles - not available in this interface
+                job.job_title,
+                None,  # user_titles_embedding - would need pre-computation
+                job_title_embeddings[i],
+            )
 
         # Location/logistics (10%)
-        logistics_score = calculate_logistics_score(
-            persona.remote_preference,
-            persona.commutable_cities,
-            job.work_model,
-            job.location,
-        )
+        if "location_logistics" in reuse:
+            logistics_score = reuse["location_logistics"]
+        else:
+            logistics_score = calculate_logistics_score(
+                persona.remote_preference,
+                persona.commutable_cities,
+                job.work_model,
+                job.location,
+            )
 
         # Aggregate Fit Score
         fit_result = calculate_fit_score(
@@ -358,24 +450,33 @@ async def batch_score_jobs(
         # ---------------------------------------------------------------------
         # Target role alignment (50%)
         # Uses job title embedding for semantic matching
-        target_role_score = calculate_target_role_alignment(
-            persona.target_roles,
-            job.job_title,
-            None,  # target_roles_embedding - would need pre-computation
-            job_title_embeddings[i],
-        )
+        if "target_role" in reuse:
+            target_role_score = reuse["target_role"]
+        else:
+            target_role_score = calculate_target_role_alignment(
+                persona.target_roles,
+                job.job_title,
+                None,  # target_roles_embedding - would need pre-computation
+                job_title_embeddings[i],
+            )
 
         # Target skills exposure (40%)
-        target_skills_score = calculate_target_skills_exposure(
-            persona.target_skills,
-            job_skill_names,
-        )
+        if "target_skills" in reuse:
+            target_skills_score = reuse["target_skills"]
+        else:
+            target_skills_score = calculate_target_skills_exposure(
+                persona.target_skills,
+                job_skill_names,
+            )
 
         # Growth trajectory (10%)
-        growth_trajectory_score = calculate_growth_trajectory(
-            persona.current_role,
-            job.job_title,
-        )
+        if "growth_trajectory" in reuse:
+            growth_trajectory_score = reuse["growth_trajectory"]
+        else:
+            growth_trajectory_score = calculate_growth_trajectory(
+                persona.current_role,
+                job.job_title,
+            )
 
         # Aggregate Stretch Score
         stretch_result = calculate_stretch_score(
@@ -0,0 +1,206 @@
+"""Per-component input fingerprints for incremental rescoring.
+
+REQ-008 §10.1, REQ-017 §6.2: Rescore after a persona edit without
+recomputing components whose inputs did not change.
+
+Each Fit and Stretch component gets a fingerprint: a SHA-256 over the
+persona fields and job fields that component reads, plus the embedding
+model for embedding-based components and a scoring version. Fingerprints
+are stored in persona_jobs.score_details["fingerprints"]; on rescore,
+a component whose fingerprint still matches reuses its stored value and
+only the rest are recomputed before re-aggregation.
+
+Coordinates with:
+  - embedding/persona_generator.py — imports build_soft_skills_text
+  - embedding/job_generator.py — imports build_culture_text, build_title_text
+
+Called by: scoring/batch_scoring.py, scoring/job_scoring_service.py,
+and unit tests.
+"""
+
+import hashlib
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any, Protocol
+
+from app.services.embedding.job_generator import build_culture_text, build_title_text
+from app.services.embedding.persona_generator import build_soft_skills_text
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+SCORING_VERSION = "1"
+"""Bump when a component calculation changes so stored values are recomputed."""
+
+EMBEDDING_COMPONENTS: frozenset[str] = frozenset(
+    {"soft_skills", "role_title", "target_role"}
+)
+"""Components that need persona or job embeddings to recompute."""
+
+
+# =============================================================================
+# Type Definitions
+# =============================================================================
+
+
+class PersonaInputsLike(Protocol):
+    """Protocol for the persona fields component scoring reads."""
+
+    skills: Sequence[Any]
+    years_experience: int | None
+    current_role: str | None
+    target_roles: list[str]
+    target_skills: list[str]
+    remote_preference: str
+    commutable_cities: list[str]
+
+
+class JobInputsLike(Protocol):
+    """Protocol for the job fields component scoring reads."""
+
+    job_title: str
+    extracted_skills: Sequence[Any]
+    culture_text: str | None
+    years_experience_min: int | None
+    years_experience_max: int | None
+    work_model: str | None
+    location: str | None
+
+
+# =============================================================================
+# Fingerprints
+# =============================================================================
+
+
+def _digest(component: str, inputs: object) -> str:
+    """Hash a component's inputs together with the scoring version."""
+    payload = json.dumps(
+        [SCORING_VERSION, component, inputs], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def compute_component_fingerprints(
+    persona: PersonaInputsLike,
+    job: JobInputsLike,
+    *,
+    embedding_model: str,
+) -> dict[str, str]:
+    """Fingerprint the inputs of every Fit and Stretch component.
+
+    Skill lists are sorted so relationship load order does not cause
+    spurious recomputes.
+
+    Args:
+        persona: Persona with skills and scoring fields loaded.
+        job: Job posting with extracted skills loaded.
+        embedding_model: Embedding model behind the embedding components.
+
+    Returns:
+        Mapping of component name to hex fingerprint.
+    """
+    persona_skills = sorted(
+        (s.skill_name, s.skill_type, s.proficiency) for s in persona.skills
+    )
+    job_skills = sorted(
+        (
+            s.skill_name,
+            s.skill_type,
+            s.is_required,
+            getattr(s, "years_requested", None),
+        )
+        for s in job.extracted_skills
+    )
+    job_skill_names = sorted(s.skill_name for s in job.extracted_skills)
+    job_title_text = build_title_text(job.job_title)
+
+    return {
+        # Fit components
+        "hard_skills": _digest("hard_skills", [persona_skills, job_skills]),
+        "soft_skills": _digest(
+            "soft_skills",
+            [
+                build_soft_skills_text(persona.skills),
+                build_culture_text(job.culture_text),
+                embedding_model,
+            ],
+        ),
+        "experience_level": _digest(
+            "experience_level",
+            [
+                persona.years_experience,
+                job.years_experience_min,
+                job.years_experience_max,
+            ],
+        ),
+        "role_title": _digest(
+            "role_title",
+            [persona.current_role, job.job_title, job_title_text, embedding_model],
+        ),
+        "location_logistics": _digest(
+            "location_logistics",
+            [
+                persona.remote_preference,
+                list(persona.commutable_cities or []),
+                job.work_model,
+                job.location,
+            ],
+        ),
+        # Stretch components
+        "target_role": _digest(
+            "target_role",
+            [
+                list(persona.target_roles or []),
+                job.job_title,
+                job_title_text,
+                embedding_model,
+            ],
+        ),
+        "target_skills": _digest(
+            "target_skills",
+            [list(persona.target_skills or []), job_skill_names],
+        ),
+        "growth_trajectory": _digest(
+            "growth_trajectory", [persona.current_role, job.job_title]
+        ),
+    }
+
+
+def find_reusable_components(
+    previous_details: Mapping[str, Any] | None,
+    fingerprints: Mapping[str, str],
+) -> dict[str, float]:
+    """Return stored component values whose fingerprints still match.
+
+    Args:
+        previous_details: score_details from the last scoring run, or None.
+        fingerprints: Current fingerprints from compute_component_fingerprints.
+
+    Returns:
+        Mapping of component name to its stored score (0-100). Components
+        that changed, or were never fingerprinted, are omitted.
+    """
+    if not previous_details:
+        return {}
+
+    stored_fingerprints = previous_details.get("fingerprints")
+    if not isinstance(stored_fingerprints, dict):
+        return {}
+
+    stored_values: dict[str, Any] = {}
+    for section in ("fit", "stretch"):
+        components = (previous_details.get(section) or {}).get("components")
+        if isinstance(components, dict):
+            stored_values.update(components)
+
+    reusable: dict[str, float] = {}
+    for name, fingerprint in fingerprints.items():
+        value = stored_values.get(name)
+        if (
+            stored_fingerprints.get(name) == fingerprint
+            and isinstance(value, int | float)
+            and not isinstance(value, bool)
+        ):
+            reusable[name] = float(value)
+    return reusable
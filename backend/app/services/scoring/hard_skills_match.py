@@ -11,6 +11,12 @@ Key formula:
 Where required_score and nice_to_have_score are weighted averages (0-100)
 based on proficiency match between user skills and job requirements.
 
+Batch scoring compiles the persona's hard skills once into a
+PersonaSkillIndex (normalized name → proficiency years) and each job's
+hard skills into CompiledJobSkills (pre-normalized, interned names), so
+scoring a job is a dict lookup per job skill instead of re-normalizing
+every persona skill for every job.
+
 Coordinates with:
   - scoring/fit_score.py — imports FIT_NEUTRAL_SCORE for missing-data default
   - scoring/batch_scoring.py — calls calculate_hard_skills_score for batch fit scoring
@@ -20,6 +26,10 @@ Coordinates with:
 Called by: scoring/batch_scoring.py, scoring/stretch_score.py, scoring/explanation_generation.py, and unit tests.
 """
 
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TypedDict
 
 from app.services.scoring.fit_score import FIT_NEUTRAL_SCORE
@@ -52,6 +62,31 @@ class JobSkillInput(TypedDict, total=False):
     years_requested: int | None  # Years of experience if specified
 
 
+@dataclass(frozen=True)
+class PersonaSkillIndex:
+    """Persona hard skills compiled for repeated scoring.
+
+    Attributes:
+        years_by_skill: Normalized skill name → approximate years of
+            experience derived from proficiency.
+    """
+
+    years_by_skill: dict[str, float]
+
+
+@dataclass(frozen=True)
+class CompiledJobSkills:
+    """Job hard skills with names pre-normalized.
+
+    Attributes:
+        required: (normalized name, years requested) per required skill.
+        nice_to_have: (normalized name, years requested) per nice-to-have skill.
+    """
+
+    required: tuple[tuple[str, int | None], ...]
+    nice_to_have: tuple[tuple[str, int | None], ...]
+
+
 # =============================================================================
 # Skill Normalization (REQ-008 §4.2.2)
 # =============================================================================
@@ -92,6 +127,11 @@ _SKILL_SYNONYMS: dict[str, str] = {
 }
 
 
+# Distinct raw skill names remembered by normalize_skill
+_NORMALIZE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_skill(skill_name: str) -> str:
     """Normalize skill name for matching.
 
@@ -102,6 +142,10 @@ def normalize_skill(skill_name: str) -> str:
     - Whitespace stripping
     - Common synonyms (JS → javascript, AWS → aws, etc.)
 
+    Results are memoized and interned: the same few thousand skill names
+    recur across every job in a batch, and interned names make the dict
+    lookups in scoring compare by identity.
+
     Args:
         skill_name: Raw skill name from user or job.
 
@@ -111,12 +155,8 @@ def normalize_skill(skill_name: str) -> str:
     # Lowercase and strip whitespace
     normalized = skill_name.lower().strip()
 
-    # Check synonym dictionary
-    if normalized in _SKILL_SYNONYMS:
-        return _SKILL_SYNONYMS[normalized]
-
-    # Return as-is if no synonym found
-    return normalized
+    # Check synonym dictionary; return as-is if no synonym found
+    return sys.intern(_SKILL_SYNONYMS.get(normalized, normalized))
 
 
 # =============================================================================
@@ -167,13 +207,17 @@ def get_proficiency_weight(
     Returns:
         Weight factor 0.2-1.0 for this skill match.
     """
+    # Map proficiency to approximate years
+    user_years = _PROFICIENCY_YEARS.get(persona_proficiency, _DEFAULT_PROFICIENCY_YEARS)
+    return _years_weight(user_years, job_years_requested)
+
+
+def _years_weight(user_years: float, job_years_requested: int | None) -> float:
+    """Weight for a skill match given the user's approximate years."""
     # If job doesn't specify years, any proficiency counts as full match
     if job_years_requested is None:
         return 1.0
 
-    # Map proficiency to approximate years
-    user_years = _PROFICIENCY_YEARS.get(persona_proficiency, _DEFAULT_PROFICIENCY_YEARS)
-
     # User meets or exceeds requirement
     if user_years >= job_years_requested:
         return 1.0
@@ -193,6 +237,111 @@ def get_proficiency_weight(
 _MAX_SKILLS = 500
 
 
+def compile_persona_skill_index(
+    persona_skills: Iterable[PersonaSkillInput],
+) -> PersonaSkillIndex:
+    """Compile a persona's hard skills for scoring many jobs.
+
+    Build once per batch and pass to score_compiled_hard_skills for each
+    job. When two skills normalize to the same name, the later one wins
+    (same as calculate_hard_skills_score).
+
+    Args:
+        persona_skills: User's skills matching PersonaSkillInput structure.
+
+    Returns:
+        PersonaSkillIndex over the persona's hard skills.
+
+    Raises:
+        ValueError: If the skill list exceeds maximum size (_MAX_SKILLS).
+    """
+    skills = list(persona_skills)
+    if len(skills) > _MAX_SKILLS:
+        msg = f"Skill lists exceed maximum size of {_MAX_SKILLS}"
+        raise ValueError(msg)
+    return PersonaSkillIndex(
+        years_by_skill={
+            normalize_skill(s.get("skill_name", "")): _PROFICIENCY_YEARS.get(
+                s.get("proficiency", ""), _DEFAULT_PROFICIENCY_YEARS
+            )
+            for s in skills
+            if s.get("skill_type") == "Hard"
+        }
+    )
+
+
+def compile_job_skills(job_skills: Iterable[JobSkillInput]) -> CompiledJobSkills:
+    """Pre-normalize a job's hard skills, split into required and nice-to-have.
+
+    Args:
+        job_skills: Job's extracted skills matching JobSkillInput structure.
+
+    Returns:
+        CompiledJobSkills for the job's hard skills.
+
+    Raises:
+        ValueError: If the skill list exceeds maximum size (_MAX_SKILLS).
+    """
+    skills = list(job_skills)
+    if len(skills) > _MAX_SKILLS:
+        msg = f"Skill lists exceed maximum size of {_MAX_SKILLS}"
+        raise ValueError(msg)
+    required: list[tuple[str, int | None]] = []
+    nice_to_have: list[tuple[str, int | None]] = []
+    for s in skills:
+        if s.get("skill_type") != "Hard":
+            continue
+        entry = (normalize_skill(s.get("skill_name", "")), s.get("years_requested"))
+        if s.get("is_required", True):
+            required.append(entry)
+        else:
+            nice_to_have.append(entry)
+    return CompiledJobSkills(required=tuple(required), nice_to_have=tuple(nice_to_have))
+
+
+def score_compiled_hard_skills(
+    index: PersonaSkillIndex,
+    job: CompiledJobSkills,
+) -> float:
+    """Calculate hard skills match score (0-100) from compiled inputs.
+
+    Same result as calculate_hard_skills_score on the uncompiled inputs.
+
+    Args:
+        index: Persona hard skills from compile_persona_skill_index.
+        job: Job hard skills from compile_job_skills.
+
+    Returns:
+        Hard skills score 0-100.
+    """
+    # No hard skills specified → neutral score
+    if not job.required and not job.nice_to_have:
+        return FIT_NEUTRAL_SCORE
+
+    # Required skills are critical (80% of component);
+    # no required skills = full credit for required portion
+    if job.required:
+        required_score = (
+            _weighted_match_score(job.required, index.years_by_skill)
+            / len(job.required)
+            * 80
+        )
+    else:
+        required_score = 80
+
+    # Nice-to-have adds bonus (20% of component)
+    if job.nice_to_have:
+        nice_score = (
+            _weighted_match_score(job.nice_to_have, index.years_by_skill)
+            / len(job.nice_to_have)
+            * 20
+        )
+    else:
+        nice_score = 0
+
+    return required_score + nice_score
+
+
 def calculate_hard_skills_score(
     persona_skills: list[PersonaSkillInput],
     job_skills: list[JobSkillInput],
@@ -202,7 +351,9 @@ def calculate_hard_skills_score(
     REQ-008 §4.2.1: Calculation Method.
 
     Compares user's hard skills against job's hard skill requirements,
-    applying proficiency weighting.
+    applying proficiency weighting. When scoring many jobs for one
+    persona, compile the persona once with compile_persona_skill_index
+    and use score_compiled_hard_skills instead.
 
     Score formula:
     - Required skills: 80% of component (weighted by proficiency)
@@ -222,60 +373,20 @@ def calculate_hard_skills_score(
     if len(persona_skills) > _MAX_SKILLS or len(job_skills) > _MAX_SKILLS:
         msg = f"Skill lists exceed maximum size of {_MAX_SKILLS}"
         raise ValueError(msg)
-    # Filter to hard skills only
-    required_skills = [
-        s
-        for s in job_skills
-        if s.get("is_required", True) and s.get("skill_type") == "Hard"
-    ]
-    nice_to_have_skills = [
-        s
-        for s in job_skills
-        if not s.get("is_required", True) and s.get("skill_type") == "Hard"
-    ]
-
-    # No hard skills specified → neutral score
-    if not required_skills and not nice_to_have_skills:
-        return FIT_NEUTRAL_SCORE
-
-    # Build persona skill lookup: {normalized_name: skill}
-    persona_skill_map: dict[str, PersonaSkillInput] = {}
-    for skill in persona_skills:
-        if skill.get("skill_type") == "Hard":
-            norm_name = normalize_skill(skill.get("skill_name", ""))
-            persona_skill_map[norm_name] = skill
-
-    # Calculate weighted matches
-    required_weighted_score = _weighted_match_score(required_skills, persona_skill_map)
-    nice_weighted_score = _weighted_match_score(nice_to_have_skills, persona_skill_map)
-
-    # Required skills are critical (80% of component)
-    if required_skills:
-        required_score = (required_weighted_score / len(required_skills)) * 80
-    else:
-        required_score = 80  # No required skills = full credit for required portion
-
-    # Nice-to-have adds bonus (20% of component)
-    if nice_to_have_skills:
-        nice_score = (nice_weighted_score / len(nice_to_have_skills)) * 20
-    else:
-        nice_score = 0
-
-    return required_score + nice_score
+    return score_compiled_hard_skills(
+        compile_persona_skill_index(persona_skills),
+        compile_job_skills(job_skills),
+    )
 
 
 def _weighted_match_score(
-    job_skills_subset: list[JobSkillInput],
-    persona_skill_map: dict[str, PersonaSkillInput],
+    job_skills_subset: tuple[tuple[str, int | None], ...],
+    years_by_skill: dict[str, float],
 ) -> float:
     """Calculate weighted score for a subset of job skills against persona skills."""
     total = 0.0
-    for job_skill in job_skills_subset:
-        norm_name = normalize_skill(job_skill.get("skill_name", ""))
-        if norm_name in persona_skill_map:
-            persona_skill = persona_skill_map[norm_name]
-            total += get_proficiency_weight(
-                persona_proficiency=persona_skill.get("proficiency", ""),
-                job_years_requested=job_skill.get("years_requested"),
-            )
+    for norm_name, years_requested in job_skills_subset:
+        user_years = years_by_skill.get(norm_name)
+        if user_years is not None:
+            total += _years_weight(user_years, years_requested)
     return total
@@ -4,25 +4,37 @@ REQ-017 §6: Single orchestrator wrapping existing scoring services.
 
 Orchestrates the complete scoring pipeline:
 1. Load persona data with skills
-2. Generate/cache persona embeddings
-3. Load job postings
-4. Non-negotiables filter (pass/fail gate)
-5. Calculate fit/stretch scores via batch_score_jobs
-6. Generate LLM rationale (if fit >= RATIONALE_SCORE_THRESHOLD)
-7. Build score_details JSONB for frontend drill-down
-8. Save scores to persona_jobs
-9. Check auto-draft threshold (no-op at MVP)
+2. Load job postings
+3. Non-negotiables filter (pass/fail gate)
+4. Fingerprint each component's inputs; in incremental mode, reuse
+   stored components whose fingerprints match score_details
+5. Load persona embeddings (L1 cache -> persona_embeddings -> provider)
+   and job embeddings (job_embeddings via JobEmbeddingStore), skipped
+   when no job needs an embedding-based component recomputed
+6. Calculate fit/stretch scores via batch_score_jobs
+7. Generate LLM rationale (if fit >= RATIONALE_SCORE_THRESHOLD), with
+   bounded concurrency, reusing the rationale cached in score_details
+   when its prompt fingerprint is unchanged
+8. Build score_details JSONB for frontend drill-down
+9. Save scores to persona_jobs (one bulk UPDATE per batch)
+10. Check auto-draft threshold (no-op at MVP)
 
 Coordinates with:
   - scoring/batch_scoring.py — calls batch_score_jobs for fit/stretch calculation
   - scoring/scoring_flow.py — calls filter_jobs_batch and result builders
   - scoring/score_types.py — imports ScoreResult for score dict format
-  - embedding/persona_generator.py — calls generate_persona_embeddings
+  - scoring/component_fingerprints.py — fingerprints component inputs
+  - embedding/persona_embedding_store.py — loads/stores persona embeddings
+  - embedding/job_embedding_store.py — loads/stores job title and culture vectors
 
 Called by: discovery/job_fetch_service.py (Strategist scoring pipeline).
 """
 
+import asyncio
+import hashlib
 import logging
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -42,10 +54,24 @@ from app.prompts.strategist import (
 from app.providers import ProviderError, factory
 from app.providers.embedding.base import EmbeddingProvider
 from app.providers.llm.base import LLMMessage, LLMProvider, TaskType
-from app.repositories.persona_job_repository import PersonaJobRepository
+from app.repositories.persona_job_repository import (
+    PersonaJobRepository,
+    PersonaJobScoreUpdate,
+)
 from app.schemas.prompt_params import ScoreData
-from app.services.embedding.persona_generator import generate_persona_embeddings
+from app.services.embedding.job_embedding_store import JobEmbeddingStore
+from app.services.embedding.job_generator import JobScoringEmbeddings
+from app.services.embedding.persona_embedding_store import PersonaEmbeddingStore
+from app.services.embedding.persona_generator import (
+    PersonaEmbeddingsResult,
+    PersonaLike,
+)
 from app.services.scoring.batch_scoring import ScoredJob, batch_score_jobs
+from app.services.scoring.component_fingerprints import (
+    EMBEDDING_COMPONENTS,
+    compute_component_fingerprints,
+    find_reusable_components,
+)
 from app.services.scoring.score_types import ScoreResult
 from app.services.scoring.scoring_flow import (
     build_filtered_score_result,
@@ -74,6 +100,82 @@ _LOW_MATCH_RATIONALE = (
 _NOT_AVAILABLE = "N/A"
 """Fallback for missing persona/job attributes in rationale prompts."""
 
+_DEFAULT_RATIONALE_CONCURRENCY = 8
+"""Max in-flight rationale LLM calls per process for unlisted providers."""
+
+_PROVIDER_RATIONALE_CONCURRENCY: dict[str, int] = {
+    "claude": 8,
+    "openai": 16,
+    "gemini": 16,
+}
+"""Per-provider ceilings on concurrent rationale calls (API rate limits).
+
+Enforced per process across every concurrent batch (see
+_provider_rationale_semaphore); N API/worker processes may have N times
+as many calls in flight.
+"""
+
+_provider_rationale_semaphores: dict[str, asyncio.Semaphore] = {}
+"""Process-wide rationale semaphores by provider name."""
+
+
+def _provider_rationale_semaphore(provider_name: str) -> asyncio.Semaphore:
+    """Return the process-wide rationale semaphore for a provider.
+
+    WHY MODULE-LEVEL: The rescore worker, the poll scheduler and request
+    handlers score batches concurrently; a semaphore per batch would let
+    each of them use the provider's full ceiling at once.
+
+    Args:
+        provider_name: LLMProvider.provider_name.
+
+    Returns:
+        Semaphore sized to the provider's ceiling, shared by every batch.
+    """
+    sem = _provider_rationale_semaphores.get(provider_name)
+    if sem is None:
+        sem = asyncio.Semaphore(
+            _PROVIDER_RATIONALE_CONCURRENCY.get(
+                provider_name, _DEFAULT_RATIONALE_CONCURRENCY
+            )
+        )
+        _provider_rationale_semaphores[provider_name] = sem
+    return sem
+
+
+# =============================================================================
+# Result Types
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _Rationale:
+    """Rationale text plus the fingerprint it was generated for.
+
+    Attributes:
+        text: Rationale shown to the user.
+        fingerprint: Prompt-input fingerprint when the text came from the
+            LLM (cacheable); None for threshold and error fallbacks.
+    """
+
+    text: str
+    fingerprint: str | None = None
+
+
+@dataclass(frozen=True)
+class RescoreChunk:
+    """One chunk of a rescore, with cumulative progress.
+
+    Attributes:
+        results: ScoreResults for the jobs in this chunk.
+        processed: Jobs rescored so far, including this chunk.
+        total: Discovered jobs in the whole rescore.
+    """
+
+    results: list[ScoreResult]
+    processed: int
+    total: int
+
 
 # =============================================================================
 # Module-level helpers (enables clean test patching)
@@ -181,55 +283,118 @@ async def _load_discovered_job_ids(
     return list(result.scalars().all())
 
 
-async def _save_score(
+async def _get_persona_embeddings(
+    db: AsyncSession,
+    persona: PersonaLike,
+    user_id: UUID,
+    embedding_provider: EmbeddingProvider,
+) -> PersonaEmbeddingsResult:
+    """Load persona embeddings, re-embedding only types whose text changed.
+
+    Args:
+        db: Async database session.
+        persona: Persona with skills loaded.
+        user_id: Owner's user UUID (cache tenant isolation).
+        embedding_provider: Provider for missing or stale vectors.
+
+    Returns:
+        PersonaEmbeddingsResult for batch_score_jobs.
+    """
+    store = PersonaEmbeddingStore(db, embedding_provider)
+    return await store.get_embeddings(persona, user_id)
+
+
+async def _load_previous_score_details(
+    db: AsyncSession,
+    persona_id: UUID,
+    job_posting_ids: list[UUID],
+    user_id: UUID,
+) -> dict[UUID, dict[str, Any]]:
+    """Load score_details stored by the previous scoring run.
+
+    Supplies the cached rationale entries and, in incremental mode, the
+    component values and fingerprints to reuse.
+
+    Args:
+        db: Async database session.
+        persona_id: Persona UUID.
+        job_posting_ids: Job posting UUIDs about to be scored.
+        user_id: Owner's user UUID for tenant isolation.
+
+    Returns:
+        Mapping of job posting ID to its stored score_details. Jobs never
+        scored (or filtered) are omitted.
+    """
+    result = await db.execute(
+        select(PersonaJob.job_posting_id, PersonaJob.score_details).where(
+            PersonaJob.persona_id == persona_id,
+            PersonaJob.job_posting_id.in_(job_posting_ids),
+            PersonaJob.persona_id.in_(
+                select(Persona.id).where(Persona.user_id == user_id)
+            ),
+        )
+    )
+    return {
+        job_posting_id: score_details
+        for job_posting_id, score_details in result.all()
+        if isinstance(score_details, dict)
+    }
+
+
+async def _load_job_embeddings(
+    db: AsyncSession,
+    jobs: list[JobPosting],
+    embedding_provider: EmbeddingProvider,
+) -> dict[UUID, JobScoringEmbeddings]:
+    """Load stored job embeddings, embedding and persisting any missing ones.
+
+    Args:
+        db: Async database session.
+        jobs: Job postings about to be scored.
+        embedding_provider: Provider for missing or stale vectors.
+
+    Returns:
+        Mapping of job ID to title/culture vectors for batch_score_jobs.
+    """
+    store = JobEmbeddingStore(db, embedding_provider)
+    return await store.get_scoring_embeddings(jobs)
+
+
+async def _save_scores(
     db: AsyncSession,
     *,
     persona_id: UUID,
-    job_posting_id: UUID,
     user_id: UUID,
-    fit_score: int | None,
-    stretch_score: int | None,
-    score_details: dict[str, Any] | None,
-    filtered_reason: str | None,
+    scores: list[PersonaJobScoreUpdate],
 ) -> None:
-    """Persist score to the persona_jobs table.
+    """Persist a batch of scores to the persona_jobs table.
 
-    Updates existing record if found, otherwise logs a warning.
+    One bulk UPDATE for the whole batch; jobs without a persona_jobs
+    link are skipped with a warning.
 
     Args:
         db: Async database session.
         persona_id: Persona UUID.
-        job_posting_id: Job posting UUID.
         user_id: Owner's user UUID.
-        fit_score: Fit score (0-100) or None if filtered.
-        stretch_score: Stretch score (0-100) or None if filtered.
-        score_details: JSONB component breakdown for frontend drill-down.
-        filtered_reason: Why the job was filtered (None if scored).
+        scores: Per-job score fields (scored and filtered).
     """
-    existing = await PersonaJobRepository.get_by_persona_and_job(
+    if not scores:
+        return
+
+    updated = await PersonaJobRepository.bulk_update_scores(
         db,
         persona_id=persona_id,
-        job_posting_id=job_posting_id,
         user_id=user_id,
+        scores=scores,
+        scored_at=datetime.now(UTC),
     )
-    if existing:
-        await PersonaJobRepository.update(
-            db,
-            existing.id,
-            user_id=user_id,
-            fit_score=fit_score,
-            stretch_score=stretch_score,
-            score_details=score_details,
-            failed_non_negotiables=(
-                filtered_reason.split("|") if filtered_reason else None
-            ),
-            scored_at=datetime.now(UTC),
-        )
-    else:
+    if updated < len(scores):
         logger.warning(
-            "No persona_job found for persona=%s job=%s — skipping score save",
+            "No persona_job found for %d of %d jobs (persona=%s) — "
+            "skipping those score saves",
+            len(scores) - updated,
+            len(scores),
             persona_id,
-            job_posting_id,
         )
 
 
@@ -247,6 +412,14 @@ class JobScoringService:
 
     Args:
         db: Async database session (caller controls transaction).
+        llm_provider: LLM provider for rationale (factory default if None).
+        embedding_provider: Embedding provider (factory default if None).
+        rationale_concurrency: Max concurrent rationale calls per batch.
+            Every batch in the process also shares the provider's limit in
+            _PROVIDER_RATIONALE_CONCURRENCY; None applies that limit only.
+
+    Raises:
+        ValueError: If rationale_concurrency is not positive.
     """
 
     def __init__(
@@ -254,10 +427,17 @@ class JobScoringService:
         db: AsyncSession,
         llm_provider: LLMProvider | None = None,
         embedding_provider: EmbeddingProvider | None = None,
+        *,
+        rationale_concurrency: int | None = None,
     ) -> None:
+        if rationale_concurrency is not None and rationale_concurrency <= 0:
+            msg = f"rationale_concurrency must be positive, got {rationale_concurrency}"
+            raise ValueError(msg)
+
         self.db = db
         self._llm_provider = llm_provider
         self._embedding_provider = embedding_provider
+        self._rationale_concurrency = rationale_concurrency
 
     async def score_job(
         self,
@@ -290,16 +470,21 @@ class JobScoringService:
         persona_id: UUID,
         job_posting_ids: list[UUID],
         user_id: UUID,
+        *,
+        incremental: bool = False,
     ) -> list[ScoreResult]:
         """Score multiple jobs. Loads persona embeddings once, reuses for all.
 
-        REQ-017 §6.2: Pipeline — load persona -> embeddings -> load jobs ->
-        non-negotiables filter -> fit/stretch -> rationale -> save.
+        REQ-017 §6.2: Pipeline — load persona -> load jobs -> non-negotiables
+        filter -> embeddings -> fit/stretch -> rationale -> save.
 
         Args:
             persona_id: Persona to score against.
             job_posting_ids: Job posting UUIDs to score.
             user_id: Owner's user UUID for tenant isolation.
+            incremental: Reuse stored component scores whose input
+                fingerprints are unchanged, and skip embedding work when
+                no embedding-based component needs recomputing.
 
         Returns:
             List of ScoreResult (one per input job).
@@ -321,48 +506,106 @@ class JobScoringService:
         # Step 1: Load persona with skills
         persona = await _load_persona(self.db, persona_id, user_id)
 
-        # Step 2: Generate persona embeddings (once for entire batch)
-        embedding_provider = (
-            self._embedding_provider or factory.get_embedding_provider()
-        )
-
-        async def _embed_fn(text: str) -> list[list[float]]:
-            result = await embedding_provider.embed([text])
-            return result.vectors
-
-        # WHY type: ignore: Persona ORM model satisfies PersonaLike protocol
-        # structurally, but mypy sees list[Skill] vs list[SkillLike] as
-        # incompatible due to invariant generic list typing.
-        persona_embeddings = await generate_persona_embeddings(persona, _embed_fn)  # type: ignore[arg-type]
-
-        # Step 3: Load job postings (user_id for tenant isolation)
+        # Step 2: Load job postings (user_id for tenant isolation)
         jobs = await _load_jobs(self.db, job_posting_ids, user_id)
 
-        # Step 4: Non-negotiables filter
+        # Step 3: Non-negotiables filter
         # WHY type: ignore: JobPosting satisfies JobFilterDataLike structurally
         # but mypy can't verify Protocol conformance for ORM models.
         passing_jobs, filtered_results = filter_jobs_batch(persona, jobs)  # type: ignore[type-var]
 
         # Build results for filtered jobs
         results: list[ScoreResult] = []
+        score_updates: list[PersonaJobScoreUpdate] = []
         for fr in filtered_results:
             result = build_filtered_score_result(fr)
             results.append(result)
-            await _save_score(
+            filtered_reason = result.get("filtered_reason")
+            score_updates.append(
+                PersonaJobScoreUpdate(
+                    job_posting_id=fr.job_id,
+                    fit_score=None,
+                    stretch_score=None,
+                    score_details=None,
+                    failed_non_negotiables=(
+                        filtered_reason.split("|") if filtered_reason else None
+                    ),
+                )
+            )
+
+        if not passing_jobs:
+            await _save_scores(
                 self.db,
                 persona_id=persona_id,
-                job_posting_id=fr.job_id,
                 user_id=user_id,
-                fit_score=None,
-                stretch_score=None,
-                score_details=None,
-                filtered_reason=result.get("filtered_reason"),
+                scores=score_updates,
             )
-
-        if not passing_jobs:
             return results
 
-        # Steps 5-6: Calculate fit/stretch scores
+        embedding_provider = (
+            self._embedding_provider or factory.get_embedding_provider()
+        )
+
+        # Step 4: Fingerprint component inputs; the previous score_details
+        # supply cached rationales and, when incremental, reusable components
+        # WHY type: ignore: the ORM models satisfy PersonaInputsLike and
+        # JobInputsLike structurally, but mypy treats the protocols' mutable
+        # skill list attributes as invariant, so list[Skill] and
+        # list[ExtractedSkill] are rejected.
+        fingerprints = {
+            job.id: compute_component_fingerprints(
+                persona,  # type: ignore[arg-type]
+                job,  # type: ignore[arg-type]
+                embedding_model=embedding_provider.config.embedding_model,
+            )
+            for job in passing_jobs
+        }
+        previous_details = await _load_previous_score_details(
+            self.db, persona_id, list(fingerprints), user_id
+        )
+        reused_components: dict[UUID, dict[str, float]] = {}
+        if incremental:
+            for job_id, job_fingerprints in fingerprints.items():
+                reusable = find_reusable_components(
+                    previous_details.get(job_id), job_fingerprints
+                )
+                if reusable:
+                    reused_components[job_id] = reusable
+
+        # Step 5: Load embeddings only for components being recomputed
+        # (persona embeddings cached until the persona changes; job
+        # embeddings from the shared pool — one embed per job)
+        persona_embeddings: PersonaEmbeddingsResult | None = None
+        if any(
+            "soft_skills" not in reused_components.get(job.id, {})
+            for job in passing_jobs
+        ):
+            # WHY type: ignore: Persona ORM model satisfies PersonaLike protocol
+            # structurally, but mypy sees list[Skill] vs list[SkillLike] as
+            # incompatible due to invariant generic list typing.
+            persona_embeddings = await _get_persona_embeddings(
+                self.db,
+                persona,  # type: ignore[arg-type]
+                user_id,
+                embedding_provider,
+            )
+
+        embedding_jobs = [
+            job
+            for job in passing_jobs
+            if not reused_components.get(job.id, {}).keys() >= EMBEDDING_COMPONENTS
+        ]
+        job_embeddings = (
+            await _load_job_embeddings(
+                self.db,
+                embedding_jobs,
+                embedding_provider,
+            )
+            if embedding_jobs
+            else {}
+        )
+
+        # Step 6: Calculate fit/stretch scores
         # WHY type: ignore on jobs: passing_jobs came from filter_jobs_batch which
         # returns list[JobFilterDataLike]; batch_score_jobs expects list[JobPostingLike].
         # Both are satisfied by JobPosting ORM model.
@@ -374,43 +617,60 @@ class JobScoringService:
             persona=persona,  # pyright: ignore[reportArgumentType]
             persona_embeddings=persona_embeddings,
             embedding_provider=embedding_provider,
+            vectorized=True,
+            job_embeddings=job_embeddings,
+            reused_components=reused_components,
         )
 
         # Build lookup for rationale generation
         job_lookup: dict[UUID, JobPosting] = {j.id: j for j in jobs}
 
-        # Steps 7-9: Rationale, details, save for each scored job
-        for scored in scored_jobs:
-            job = job_lookup.get(scored.job_id)
-
-            # Step 7: Generate rationale (conditional on threshold)
-            explanation = await self._generate_rationale(scored, persona, job)
+        # Step 7: Generate rationales concurrently (conditional on threshold),
+        # reusing stored rationales whose prompt inputs are unchanged
+        cached_rationales = {
+            job_id: entry
+            for job_id, details in previous_details.items()
+            if isinstance(entry := details.get("rationale"), dict)
+        }
+        rationales = await self._generate_rationales(
+            scored_jobs, persona, job_lookup, cached_rationales
+        )
 
+        # Steps 8-9: Details and results for each scored job
+        for scored, rationale in zip(scored_jobs, rationales, strict=True):
             # Step 8: Build score_details JSONB
-            score_details = _build_score_details(scored)
+            score_details = _build_score_details(
+                scored, rationale, fingerprints.get(scored.job_id)
+            )
 
             # Step 9: Build ScoreResult
             result = build_scored_result(
                 job_id=scored.job_id,
                 fit_score=float(scored.fit_score.total),
                 stretch_score=float(scored.stretch_score.total),
-                explanation=explanation,
+                explanation=rationale.text,
                 score_details=score_details,
             )
             results.append(result)
 
-            # Save to persona_jobs
-            await _save_score(
-                self.db,
-                persona_id=persona_id,
-                job_posting_id=scored.job_id,
-                user_id=user_id,
-                fit_score=scored.fit_score.total,
-                stretch_score=scored.stretch_score.total,
-                score_details=score_details,
-                filtered_reason=None,
+            score_updates.append(
+                PersonaJobScoreUpdate(
+                    job_posting_id=scored.job_id,
+                    fit_score=scored.fit_score.total,
+                    stretch_score=scored.stretch_score.total,
+                    score_details=score_details,
+                    failed_non_negotiables=None,
+                )
             )
 
+        # Save filtered and scored results to persona_jobs in one statement
+        await _save_scores(
+            self.db,
+            persona_id=persona_id,
+            user_id=user_id,
+            scores=score_updates,
+        )
+
         # Step 10: Auto-draft check (no-op at MVP per REQ-018 §3.2)
 
         return results
@@ -419,15 +679,22 @@ class JobScoringService:
         self,
         persona_id: UUID,
         user_id: UUID,
+        *,
+        incremental: bool = True,
     ) -> list[ScoreResult]:
         """Re-score all Discovered jobs for a persona.
 
         REQ-017 §6.2: Called after persona updates to refresh scores.
-        Regenerates persona embeddings, then rescores all active jobs.
+        Persona embeddings are re-embedded only for changed source texts
+        and reused across the 500-job chunks. By default only components
+        whose inputs changed are recomputed, so e.g. editing a commutable
+        city re-runs location logistics without any embedding work.
 
         Args:
             persona_id: Persona to rescore for.
             user_id: Owner's user UUID for tenant isolation.
+            incremental: Reuse unchanged components (see score_batch).
+                False recomputes every component.
 
         Returns:
             List of ScoreResult for all discovered jobs.
@@ -435,123 +702,285 @@ class JobScoringService:
         Raises:
             NotFoundError: If persona not found.
         """
+        all_results: list[ScoreResult] = []
+        async for chunk in self.rescore_discovered_in_chunks(
+            persona_id, user_id, incremental=incremental
+        ):
+            all_results.extend(chunk.results)
+        return all_results
+
+    async def rescore_discovered_in_chunks(
+        self,
+        persona_id: UUID,
+        user_id: UUID,
+        *,
+        incremental: bool = True,
+        chunk_size: int = _MAX_BATCH_SIZE,
+    ) -> AsyncIterator[RescoreChunk]:
+        """Re-score all Discovered jobs for a persona, one chunk at a time.
+
+        Lets background callers commit and report progress between
+        chunks without holding every result in memory.
+
+        Args:
+            persona_id: Persona to rescore for.
+            user_id: Owner's user UUID for tenant isolation.
+            incremental: Reuse unchanged components (see score_batch).
+            chunk_size: Jobs per score_batch call (at most _MAX_BATCH_SIZE).
+
+        Yields:
+            RescoreChunk per scored chunk, in order.
+
+        Raises:
+            NotFoundError: If persona not found.
+            ValueError: If chunk_size is not in 1.._MAX_BATCH_SIZE.
+        """
+        if not 0 < chunk_size <= _MAX_BATCH_SIZE:
+            msg = f"chunk_size must be between 1 and {_MAX_BATCH_SIZE}"
+            raise ValueError(msg)
+
         # Verify persona exists
         await _load_persona(self.db, persona_id, user_id)
 
         # Load discovered job IDs
         job_ids = await _load_discovered_job_ids(self.db, persona_id, user_id)
-        if not job_ids:
-            return []
 
         # Chunk to respect _MAX_BATCH_SIZE (DoS protection)
-        all_results: list[ScoreResult] = []
-        for i in range(0, len(job_ids), _MAX_BATCH_SIZE):
-            chunk = job_ids[i : i + _MAX_BATCH_SIZE]
-            chunk_results = await self.score_batch(persona_id, chunk, user_id)
-            all_results.extend(chunk_results)
-        return all_results
+        for i in range(0, len(job_ids), chunk_size):
+            chunk = job_ids[i : i + chunk_size]
+            chunk_results = await self.score_batch(
+                persona_id, chunk, user_id, incremental=incremental
+            )
+            yield RescoreChunk(
+                results=chunk_results,
+                processed=i + len(chunk),
+                total=len(job_ids),
+            )
+
+    def _rationale_limit(self, llm: LLMProvider) -> int:
+        """Resolve the rationale concurrency limit for a provider.
+
+        Args:
+            llm: Provider that will serve the rationale calls.
+
+        Returns:
+            The configured limit capped by the provider's ceiling.
+        """
+        provider_limit = _PROVIDER_RATIONALE_CONCURRENCY.get(
+            llm.provider_name, _DEFAULT_RATIONALE_CONCURRENCY
+        )
+        if self._rationale_concurrency is None:
+            return provider_limit
+        return min(self._rationale_concurrency, provider_limit)
+
+    async def _generate_rationales(
+        self,
+        scored_jobs: list[ScoredJob],
+        persona: Persona,
+        job_lookup: dict[UUID, JobPosting],
+        cached_rationales: dict[UUID, dict[str, Any]],
+    ) -> list[_Rationale]:
+        """Generate rationales for a batch with bounded concurrency.
+
+        REQ-017 §9: Each job keeps _generate_rationale's threshold, cache,
+        and fallback behavior; only the LLM calls overlap.
+
+        Args:
+            scored_jobs: Scored jobs in result order.
+            persona: Persona ORM model (for experience data).
+            job_lookup: Job postings by ID.
+            cached_rationales: Previously stored rationale entries by job ID.
+
+        Returns:
+            One rationale per scored job, in the same order.
+        """
+        if not any(s.fit_score.total >= RATIONALE_SCORE_THRESHOLD for s in scored_jobs):
+            return [_Rationale(_LOW_MATCH_RATIONALE) for _ in scored_jobs]
+
+        llm = self._llm_provider or factory.get_llm_provider()
+        batch_sem = asyncio.Semaphore(self._rationale_limit(llm))
+        provider_sem = _provider_rationale_semaphore(llm.provider_name)
+
+        async def _with_limit(scored: ScoredJob) -> _Rationale:
+            async with batch_sem, provider_sem:
+                return await self._generate_rationale(
+                    scored,
+                    persona,
+                    job_lookup.get(scored.job_id),
+                    cached=cached_rationales.get(scored.job_id),
+                )
+
+        tasks = [asyncio.ensure_future(_with_limit(s)) for s in scored_jobs]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # WHY: gather leaves sibling calls running when one raises
+            # an unexpected error; cancel them so no LLM call outlives
+            # the batch.
+            for task in tasks:
+                task.cancel()
+            raise
 
     async def _generate_rationale(
         self,
         scored: ScoredJob,
         persona: Persona,
         job: JobPosting | None,
-    ) -> str:
+        *,
+        cached: dict[str, Any] | None = None,
+    ) -> _Rationale:
         """Generate LLM rationale for a scored job.
 
-        Only calls LLM when fit_score >= RATIONALE_SCORE_THRESHOLD (65).
-        Falls back to generic message on LLM error.
+        Only calls LLM when fit_score >= RATIONALE_SCORE_THRESHOLD (65),
+        and only when the cached rationale's fingerprint no longer matches
+        the prompt inputs. Falls back to generic message on LLM error.
 
         Args:
             scored: ScoredJob with fit/stretch results.
             persona: Persona ORM model (for experience data).
             job: JobPosting ORM model (for title/company data), or None if
                 the job was not found in the lookup.
+            cached: Rationale entry from the previous score_details, if any.
 
         Returns:
-            Rationale string (LLM-generated or fallback).
+            Rationale (LLM-generated, cached, or fallback).
         """
         if scored.fit_score.total < RATIONALE_SCORE_THRESHOLD:
-            return _LOW_MATCH_RATIONALE
+            return _Rationale(_LOW_MATCH_RATIONALE)
+
+        messages = _build_rationale_messages(scored, persona, job)
+        fingerprint = _rationale_fingerprint(messages, job)
+        if (
+            cached is not None
+            and cached.get("fingerprint") == fingerprint
+            and isinstance(cached.get("text"), str)
+        ):
+            return _Rationale(cached["text"], fingerprint)
 
         try:
             llm = self._llm_provider or factory.get_llm_provider()
-
-            score_data = ScoreData(
-                fit_score=scored.fit_score.total,
-                hard_skills_pct=int(scored.fit_score.components.get("hard_skills", 0)),
-                matched_hard_skills=0,
-                required_hard_skills=0,
-                soft_skills_pct=int(scored.fit_score.components.get("soft_skills", 0)),
-                experience_match=(
-                    f"{int(scored.fit_score.components.get('experience_level', 0))}%"
-                ),
-                job_years=str(
-                    getattr(job, "years_experience_min", _NOT_AVAILABLE)
-                    or _NOT_AVAILABLE
-                ),
-                persona_years=str(
-                    getattr(persona, "years_experience", _NOT_AVAILABLE)
-                    or _NOT_AVAILABLE
-                ),
-                logistics_match=(
-                    f"{int(scored.fit_score.components.get('location_logistics', 0))}%"
-                ),
-                stretch_score=scored.stretch_score.total,
-                role_alignment_pct=int(
-                    scored.stretch_score.components.get("target_role", 0)
-                ),
-                target_skills_found=(
-                    f"{int(scored.stretch_score.components.get('target_skills', 0))}%"
-                ),
-                missing_skills="See component scores",
-                bonus_skills="See component scores",
-            )
-
-            user_prompt = build_score_rationale_prompt(
-                job_title=getattr(job, "job_title", "Unknown"),
-                company_name=getattr(job, "company_name", "Unknown"),
-                scores=score_data,
-            )
-
-            messages = [
-                LLMMessage(role="system", content=SCORE_RATIONALE_SYSTEM_PROMPT),
-                LLMMessage(  # nosemgrep: zentropy.llm-unsanitized-input  # sanitized inside build_score_rationale_prompt()
-                    role="user", content=user_prompt
-                ),
-            ]
-
             response = await llm.complete(
                 messages=messages,
                 task=TaskType.SCORE_RATIONALE,
                 max_tokens=500,
             )
-
-            return response.content or _LOW_MATCH_RATIONALE
-
         except ProviderError:
             logger.warning(
                 "Rationale generation failed for job %s, using fallback",
                 scored.job_id,
                 exc_info=True,
             )
-            return (
+            return _Rationale(
                 f"Score: {scored.fit_score.total}/100 fit, "
                 f"{scored.stretch_score.total}/100 stretch."
             )
 
+        if not response.content:
+            return _Rationale(_LOW_MATCH_RATIONALE)
+        return _Rationale(response.content, fingerprint)
+
+
+def _build_rationale_messages(
+    scored: ScoredJob,
+    persona: Persona,
+    job: JobPosting | None,
+) -> list[LLMMessage]:
+    """Build the rationale prompt messages for a scored job.
+
+    Args:
+        scored: ScoredJob with fit/stretch results.
+        persona: Persona ORM model (for experience data).
+        job: JobPosting ORM model, or None if not found.
+
+    Returns:
+        System and user messages for the SCORE_RATIONALE task.
+    """
+    score_data = ScoreData(
+        fit_score=scored.fit_score.total,
+        hard_skills_pct=int(scored.fit_score.components.get("hard_skills", 0)),
+        matched_hard_skills=0,
+        required_hard_skills=0,
+        soft_skills_pct=int(scored.fit_score.components.get("soft_skills", 0)),
+        experience_match=(
+            f"{int(scored.fit_score.components.get('experience_level', 0))}%"
+        ),
+        job_years=str(
+            getattr(job, "years_experience_min", _NOT_AVAILABLE) or _NOT_AVAILABLE
+        ),
+        persona_years=str(
+            getattr(persona, "years_experience", _NOT_AVAILABLE) or _NOT_AVAILABLE
+        ),
+        logistics_match=(
+            f"{int(scored.fit_score.components.get('location_logistics', 0))}%"
+        ),
+        stretch_score=scored.stretch_score.total,
+        role_alignment_pct=int(scored.stretch_score.components.get("target_role", 0)),
+        target_skills_found=(
+            f"{int(scored.stretch_score.components.get('target_skills', 0))}%"
+        ),
+        missing_skills="See component scores",
+        bonus_skills="See component scores",
+    )
 
-def _build_score_details(scored: ScoredJob) -> dict[str, Any]:
+    user_prompt = build_score_rationale_prompt(
+        job_title=getattr(job, "job_title", "Unknown"),
+        company_name=getattr(job, "company_name", "Unknown"),
+        scores=score_data,
+    )
+
+    return [
+        LLMMessage(role="system", content=SCORE_RATIONALE_SYSTEM_PROMPT),
+        LLMMessage(  # nosemgrep: zentropy.llm-unsanitized-input  # sanitized inside build_score_rationale_prompt()
+            role="user", content=user_prompt
+        ),
+    ]
+
+
+def _rationale_fingerprint(
+    messages: list[LLMMessage],
+    job: JobPosting | None,
+) -> str:
+    """Fingerprint the inputs that determine a rationale.
+
+    The rendered prompt already carries every persona field and score
+    component the LLM sees; the job's description_hash adds content
+    changes that leave title and company untouched. Prompt template
+    edits change the fingerprint too, so stale wording is regenerated.
+
+    Args:
+        messages: Rationale prompt messages.
+        job: JobPosting ORM model, or None if not found.
+
+    Returns:
+        SHA-256 hex digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(getattr(job, "description_hash", "") or "").encode())
+    for message in messages:
+        digest.update(b"\x00")
+        digest.update((message.content or "").encode())
+    return digest.hexdigest()
+
+
+def _build_score_details(
+    scored: ScoredJob,
+    rationale: _Rationale | None = None,
+    fingerprints: Mapping[str, str] | None = None,
+) -> dict[str, Any]:
     """Build JSONB-serializable score_details from ScoredJob.
 
     Args:
         scored: ScoredJob with fit/stretch results.
+        rationale: Rationale for the job. Stored under "rationale" only
+            when it came from the LLM, so the next rescore can reuse it.
+        fingerprints: Component input fingerprints, stored under
+            "fingerprints" for incremental rescoring.
 
     Returns:
         Dict with fit and stretch component breakdowns for
         frontend drill-down UI (REQ-012 Appendix A.3).
     """
-    return {
+    details: dict[str, Any] = {
         "fit": {
             "total": scored.fit_score.total,
             "components": dict(scored.fit_score.components),
@@ -563,3 +992,11 @@ def _build_score_details(scored: ScoredJob) -> dict[str, Any]:
             "weights": dict(scored.stretch_score.weights),
         },
     }
+    if rationale is not None and rationale.fingerprint is not None:
+        details["rationale"] = {
+            "text": rationale.text,
+            "fingerprint": rationale.fingerprint,
+        }
+    if fingerprints is not None:
+        details["fingerprints"] = dict(fingerprints)
+    return details
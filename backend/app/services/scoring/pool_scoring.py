@@ -4,6 +4,11 @@ REQ-015 §7.2, REQ-008 §4: Pure scoring functions for keyword pre-screen,
 experience alignment, work model alignment, seniority alignment, and
 keyword overlap. No database access, no side effects.
 
+SkillIndex is the pre-screen in bulk: an in-memory inverted index from
+normalized skill phrases to persona IDs, so a surfacing pass tokenizes
+each job once and looks up candidates instead of scanning the job text
+for every persona's skills.
+
 Used by pool_surfacing_service.py for background job-persona matching
 without LLM calls.
 
@@ -18,6 +23,10 @@ Coordinates with:
 Called by: discovery/pool_surfacing_service.py.
 """
 
+import re
+import uuid
+from collections.abc import Iterable
+
 from app.models.job_posting import JobPosting
 from app.models.persona import Persona
 from app.models.persona_content import Skill
@@ -47,6 +56,16 @@ _WORK_MODEL_SCORES: dict[tuple[str, str], float] = {
     (_PREF_ONSITE_OK, "Onsite"): 100.0,
 }
 
+# Skill/job text tokens: lowercase alphanumerics, keeping the symbols that
+# distinguish skill names (C++, C#, Node.js). Other punctuation separates
+# tokens, so "CI/CD" and "ci-cd" both become "ci cd". Job text is also
+# matched with dotted tokens split (see _text_phrases).
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+# Longest skill phrase (in tokens) matched against job text. Longer skill
+# names are not indexed.
+_MAX_SKILL_TOKENS = 8
+
 # Seniority ordering for distance calculation.
 _SENIORITY_ORDER: dict[str, int] = {
     "Entry": 0,
@@ -71,6 +90,47 @@ _YEARS_TO_SENIORITY: list[tuple[int, str]] = [
 # ---------------------------------------------------------------------------
 
 
+def _tokenize(text: str) -> list[str]:
+    """Split text into normalized tokens (see _TOKEN_RE)."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _skill_key(skill_name: str) -> str | None:
+    """Normalize a skill name to its index key (space-joined tokens).
+
+    Returns:
+        The key, or None if the name has no tokens or too many.
+    """
+    tokens = _tokenize(skill_name)
+    if not tokens or len(tokens) > _MAX_SKILL_TOKENS:
+        return None
+    return " ".join(tokens)
+
+
+def _text_phrases(text: str, max_tokens: int) -> set[str]:
+    """Return every phrase of 1..max_tokens consecutive tokens in text.
+
+    Phrases come from the tokens as-is (so "node.js" matches Node.js) and
+    from the tokens split at dots (so "Python.Experience", a sentence
+    break missing its space, still matches Python).
+    """
+    tokens = _tokenize(text)
+    phrases = _phrases(tokens, max_tokens)
+    if any("." in token for token in tokens):
+        split = [part for token in tokens for part in token.split(".")]
+        phrases |= _phrases(split, max_tokens)
+    return phrases
+
+
+def _phrases(tokens: list[str], max_tokens: int) -> set[str]:
+    """Return every run of 1..max_tokens consecutive tokens, space-joined."""
+    return {
+        " ".join(tokens[start : start + n])
+        for n in range(1, max_tokens + 1)
+        for start in range(len(tokens) - n + 1)
+    }
+
+
 def keyword_pre_screen(
     job_title: str,
     job_description: str,
@@ -79,7 +139,7 @@ def keyword_pre_screen(
     """Check if any persona skill appears in the job text.
 
     REQ-015 §7.4: Lightweight pre-screen before full scoring.
-    Case-insensitive substring matching.
+    Case-insensitive whole-token matching (same rules as SkillIndex).
 
     Args:
         job_title: Job title text.
@@ -89,11 +149,14 @@ def keyword_pre_screen(
     Returns:
         True if at least one skill name appears in the job text.
     """
-    if not persona_skill_names:
+    keys = {key for name in persona_skill_names if (key := _skill_key(name))}
+    if not keys:
         return False
 
-    job_text = f"{job_title} {job_description}".lower()
-    return any(skill.lower() in job_text for skill in persona_skill_names)
+    max_tokens = max(key.count(" ") + 1 for key in keys)
+    return not keys.isdisjoint(
+        _text_phrases(f"{job_title} {job_description}", max_tokens)
+    )
 
 
 def score_experience_alignment(
@@ -271,3 +334,84 @@ def calculate_lightweight_fit(
         role_title=FIT_NEUTRAL_SCORE,
         location_logistics=location_logistics,
     )
+
+
+# ---------------------------------------------------------------------------
+# Skill index (bulk keyword pre-screen)
+# ---------------------------------------------------------------------------
+
+
+class SkillIndex:
+    """Inverted index from normalized skill phrases to persona IDs.
+
+    REQ-015 §7.4: Built once per surfacing pass and updated per persona
+    (add() replaces a persona's entry, remove() drops it). candidates()
+    tokenizes a job's text once and returns every persona with at least
+    one skill in it — the same personas keyword_pre_screen() would pass.
+    """
+
+    def __init__(self) -> None:
+        self._personas_by_key: dict[str, set[uuid.UUID]] = {}
+        self._keys_by_persona: dict[uuid.UUID, set[str]] = {}
+        # Indexed keys per phrase length, to bound phrase generation.
+        self._key_count_by_length: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys_by_persona)
+
+    def add(self, persona_id: uuid.UUID, skill_names: Iterable[str]) -> None:
+        """Index a persona's skills, replacing any previous entry.
+
+        Args:
+            persona_id: Persona to index.
+            skill_names: The persona's skill names.
+        """
+        self.remove(persona_id)
+        keys = {key for name in skill_names if (key := _skill_key(name))}
+        if not keys:
+            return
+        self._keys_by_persona[persona_id] = keys
+        for key in keys:
+            personas = self._personas_by_key.setdefault(key, set())
+            if not personas:
+                length = key.count(" ") + 1
+                self._key_count_by_length[length] = (
+                    self._key_count_by_length.get(length, 0) + 1
+                )
+            personas.add(persona_id)
+
+    def remove(self, persona_id: uuid.UUID) -> None:
+        """Drop a persona from the index (no-op if absent).
+
+        Args:
+            persona_id: Persona to remove.
+        """
+        for key in self._keys_by_persona.pop(persona_id, ()):
+            personas = self._personas_by_key[key]
+            personas.discard(persona_id)
+            if not personas:
+                del self._personas_by_key[key]
+                length = key.count(" ") + 1
+                self._key_count_by_length[length] -= 1
+                if not self._key_count_by_length[length]:
+                    del self._key_count_by_length[length]
+
+    def candidates(self, job_title: str, job_description: str) -> set[uuid.UUID]:
+        """Return personas with at least one skill in the job text.
+
+        Args:
+            job_title: Job title text.
+            job_description: Job description text.
+
+        Returns:
+            IDs of personas that pass the keyword pre-screen.
+        """
+        if not self._key_count_by_length:
+            return set()
+        max_tokens = max(self._key_count_by_length)
+        matched: set[uuid.UUID] = set()
+        for phrase in _text_phrases(f"{job_title} {job_description}", max_tokens):
+            personas = self._personas_by_key.get(phrase)
+            if personas:
+                matched |= personas
+        return matched
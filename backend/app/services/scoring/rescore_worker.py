@@ -0,0 +1,324 @@
+"""Rescore queue background worker.
+
+REQ-006 §5.2, REQ-017 §6.2: asyncio background task via FastAPI lifespan
+event. Claims queued rescore_jobs rows (FOR UPDATE SKIP LOCKED), rescores
+the persona's Discovered jobs in chunks with incremental scoring, commits
+scores and progress after every chunk, and notifies the user's chat SSE
+streams (in whichever process holds them) with a data_changed event when
+the job completes or fails.
+
+A crashed worker leaves its job running with a stale heartbeat; the next
+pass requeues it (up to _MAX_ATTEMPTS), and incremental scoring makes the
+retry cheap for chunks already committed.
+
+Coordinates with:
+  - repositories/rescore_job_repository.py — imports RescoreJobRepository
+  - scoring/job_scoring_service.py — imports JobScoringService
+  - services/user_event_broker.py — imports notify_user_event
+  - providers/metered_provider.py — metered LLM/embedding wrappers
+  - schemas/chat.py — imports DataChangedEvent
+
+Called by: app/worker.py (API lifespan and worker process) and unit tests.
+"""
+
+import asyncio
+import contextlib
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.providers.embedding.base import EmbeddingProvider
+from app.providers.factory import (
+    get_embedding_provider,
+    get_llm_provider,
+    get_llm_registry,
+)
+from app.providers.llm.base import LLMProvider
+from app.providers.metered_provider import MeteredEmbeddingProvider, MeteredLLMProvider
+from app.repositories.rescore_job_repository import RescoreJobRepository
+from app.schemas.chat import DataChangedEvent
+from app.services.admin.admin_config_service import AdminConfigService
+from app.services.billing.metering_service import MeteringService
+from app.services.scoring.job_scoring_service import JobScoringService
+from app.services.user_event_broker import notify_user_event
+
+logger = logging.getLogger(__name__)
+
+# Queue poll interval — short, since a user is waiting on the result
+DEFAULT_INTERVAL_SECONDS = 5
+
+# Jobs per chunk: scores and progress are committed after each one
+_CHUNK_SIZE = 100
+
+# Max queued jobs processed per pass before sleeping again
+_MAX_JOBS_PER_PASS = 10
+
+# A running job without a progress heartbeat for this long is stale
+_STALE_AFTER = timedelta(minutes=15)
+
+# Claims allowed before a repeatedly stale job is failed
+_MAX_ATTEMPTS = 3
+
+# SSE resource name — the frontend refreshes job lists on this resource
+_SSE_RESOURCE = "job-posting"
+
+# Error stored on failed jobs and returned by GET /job-postings/rescore/{id}
+# WHY: Exception text can carry provider responses or SQL — details stay
+# in the server log only.
+_FAILED_MESSAGE = "Rescore failed"
+
+
+# ---------------------------------------------------------------------------
+# Data classes
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _ClaimedJob:
+    """Fields of a claimed rescore job, detached from its session."""
+
+    id: uuid.UUID
+    user_id: uuid.UUID
+    persona_id: uuid.UUID
+
+
+@dataclass
+class RescorePassResult:
+    """Statistics from a single worker pass.
+
+    Attributes:
+        jobs_completed: Rescore jobs that finished successfully.
+        jobs_failed: Rescore jobs that raised and were marked failed.
+        jobs_scored: Discovered jobs rescored across all rescore jobs.
+        stale_recovered: Stale running jobs requeued or failed.
+    """
+
+    jobs_completed: int = 0
+    jobs_failed: int = 0
+    jobs_scored: int = 0
+    stale_recovered: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+
+class RescoreWorker:
+    """Background worker that drains the rescore_jobs queue.
+
+    Lifecycle mirrors PoolSurfacingWorker:
+    - start() creates an asyncio task running the queue loop.
+    - stop() cancels the task and waits for graceful shutdown.
+    - run_once() executes a single pass (for testing).
+
+    Args:
+        session_factory: Async session factory for DB access.
+        interval_seconds: Seconds between queue polls when idle.
+        chunk_size: Discovered jobs scored per committed chunk.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        interval_seconds: int = DEFAULT_INTERVAL_SECONDS,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> None:
+        self._session_factory = session_factory
+        self._interval_seconds = interval_seconds
+        self._chunk_size = chunk_size
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background task is currently active."""
+        return self._running and self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background queue loop.
+
+        Creates an asyncio task. No-op if already running.
+        Must be called from an async context (running event loop).
+        """
+        if self.is_running:
+            logger.warning("Rescore worker already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("Rescore worker started (interval=%ds)", self._interval_seconds)
+
+    async def stop(self) -> None:
+        """Stop the background queue loop.
+
+        Cancels the task and waits for it to finish. An interrupted job
+        stays running and is requeued by stale-claim recovery.
+        """
+        self._running = False
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        logger.info("Rescore worker stopped")
+
+    async def run_once(self) -> RescorePassResult:
+        """Execute a single pass: recover stale jobs, then drain the queue.
+
+        Processes up to _MAX_JOBS_PER_PASS queued jobs, one at a time.
+
+        Returns:
+            RescorePassResult with per-pass statistics.
+        """
+        result = RescorePassResult()
+        async with self._session_factory() as db:
+            result.stale_recovered = await RescoreJobRepository.recover_stale(
+                db,
+                stale_before=datetime.now(UTC) - _STALE_AFTER,
+                max_attempts=_MAX_ATTEMPTS,
+            )
+            await db.commit()
+
+        for _ in range(_MAX_JOBS_PER_PASS):
+            claimed = await self._claim_next()
+            if claimed is None:
+                break
+            try:
+                result.jobs_scored += await self._process(claimed)
+            # WHY BLE001: One persona's failure is recorded on its row and
+            # must not stop the queue for other users.
+            except Exception:  # noqa: BLE001
+                logger.exception("Rescore job %s failed", claimed.id)
+                await self._finish(claimed, error=_FAILED_MESSAGE)
+                result.jobs_failed += 1
+            else:
+                await self._finish(claimed)
+                result.jobs_completed += 1
+        return result
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    async def _run_loop(self) -> None:
+        """Background loop: run_once → sleep → repeat."""
+        try:
+            while self._running:
+                try:
+                    result = await self.run_once()
+                    if result.jobs_completed or result.jobs_failed:
+                        logger.info(
+                            "Rescore pass: %d completed, %d failed, %d jobs scored",
+                            result.jobs_completed,
+                            result.jobs_failed,
+                            result.jobs_scored,
+                        )
+                # WHY BLE001: The queue loop must never crash — individual
+                # pass errors are logged and the loop continues.
+                except Exception:  # noqa: BLE001
+                    logger.exception("Error in rescore pass")
+                await asyncio.sleep(self._interval_seconds)
+        except asyncio.CancelledError:
+            logger.debug("Rescore loop cancelled")
+            raise
+
+    async def _claim_next(self) -> _ClaimedJob | None:
+        """Claim the next queued job and commit the claim."""
+        async with self._session_factory() as db:
+            job = await RescoreJobRepository.claim_next(db)
+            if job is None:
+                return None
+            claimed = _ClaimedJob(
+                id=job.id, user_id=job.user_id, persona_id=job.persona_id
+            )
+            await db.commit()
+        return claimed
+
+    async def _process(self, claimed: _ClaimedJob) -> int:
+        """Rescore a persona's Discovered jobs, committing every chunk.
+
+        Args:
+            claimed: The claimed rescore job.
+
+        Returns:
+            Number of Discovered jobs rescored.
+        """
+        processed = 0
+        async with self._session_factory() as db:
+            llm_provider, embedding_provider = _build_providers(db, claimed.user_id)
+            service = JobScoringService(
+                db,
+                llm_provider=llm_provider,
+                embedding_provider=embedding_provider,
+            )
+            async for chunk in service.rescore_discovered_in_chunks(
+                claimed.persona_id,
+                claimed.user_id,
+                chunk_size=self._chunk_size,
+            ):
+                await RescoreJobRepository.record_progress(
+                    db,
+                    claimed.id,
+                    processed_jobs=chunk.processed,
+                    total_jobs=chunk.total,
+                )
+                await db.commit()
+                processed = chunk.processed
+        return processed
+
+    async def _finish(self, claimed: _ClaimedJob, *, error: str | None = None) -> None:
+        """Record the outcome and notify the user's SSE streams on commit."""
+        async with self._session_factory() as db:
+            await RescoreJobRepository.mark_finished(db, claimed.id, error=error)
+            await notify_user_event(
+                db,
+                claimed.user_id,
+                DataChangedEvent(
+                    resource=_SSE_RESOURCE,
+                    id=str(claimed.id),
+                    action="updated",
+                ),
+            )
+            await db.commit()
+
+
+def _build_providers(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+) -> tuple[LLMProvider, EmbeddingProvider]:
+    """Build providers for a user's rescore, metered when metering is on.
+
+    REQ-020 §6.2, §6.5: The rescore was requested by the user, so its LLM
+    rationale and embedding calls are billed like the request-path calls
+    (same wiring as api/deps.get_metered_provider).
+
+    Args:
+        db: Session the metering records are written in.
+        user_id: User the usage is billed to.
+
+    Returns:
+        (LLM provider, embedding provider).
+    """
+    if not settings.metering_enabled:
+        return get_llm_provider(), get_embedding_provider()
+    admin_config = AdminConfigService(db)
+    metering_service = MeteringService(db, admin_config)
+    return (
+        MeteredLLMProvider(
+            get_llm_provider(),
+            get_llm_registry(),
+            metering_service,
+            admin_config,
+            user_id,
+            credits_enabled=settings.credits_enabled,
+        ),
+        MeteredEmbeddingProvider(
+            get_embedding_provider(), metering_service, admin_config, user_id
+        ),
+    )
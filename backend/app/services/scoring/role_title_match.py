@@ -24,6 +24,7 @@ Called by: scoring/batch_scoring.py, scoring/stretch_score.py, generation/base_r
 """
 
 import re
+from functools import lru_cache
 
 from app.services.embedding.utils import validate_embeddings
 from app.services.scoring.fit_score import FIT_NEUTRAL_SCORE
@@ -71,6 +72,23 @@ _ROLE_SYNONYMS: dict[str, str] = {
 }
 
 
+# Precompiled once: the prefix alternation keeps _SENIORITY_PREFIXES order
+# (first listed prefix wins, e.g. "sr." before "sr"), and all synonyms are
+# replaced in a single left-to-right pass.
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENIORITY_PREFIX_RE = re.compile(
+    rf"^({'|'.join(re.escape(p) for p in _SENIORITY_PREFIXES)})\.?\s+"
+)
+_ROLE_SYNONYM_RE = re.compile(
+    rf"\b(?:{'|'.join(re.escape(s) for s in _ROLE_SYNONYMS)})\b"
+)
+
+# Distinct titles remembered by normalize_title (titles repeat heavily
+# across the shared job pool)
+_NORMALIZE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_title(title: str) -> str:
     """Normalize job title for matching.
 
@@ -82,6 +100,8 @@ def normalize_title(title: str) -> str:
     - Seniority prefix normalization (Sr. → senior, Jr. → junior, etc.)
     - Role synonym normalization (SDE → software engineer, etc.)
 
+    Results are memoized.
+
     Args:
         title: Raw job title.
 
@@ -95,32 +115,16 @@ def normalize_title(title: str) -> str:
     if len(title) > _MAX_TITLE_LENGTH:
         title = title[:_MAX_TITLE_LENGTH]
 
-    # Lowercase and strip
-    normalized = title.lower().strip()
-
-    # Collapse multiple spaces to single space
-    normalized = re.sub(r"\s+", " ", normalized)
-
-    # Normalize seniority prefixes
-    for prefix, replacement in _SENIORITY_PREFIXES.items():
-        # Match at start of string, followed by space or dot
-        pattern = rf"^{re.escape(prefix)}\.?\s+"
-        if re.match(pattern, normalized):
-            normalized = re.sub(pattern, f"{replacement} ", normalized)
-            break
-
-    # Apply role synonyms (check full match and partial)
-    for synonym, canonical in _ROLE_SYNONYMS.items():
-        if normalized == synonym:
-            return canonical
-        # Replace as substring for compound titles
-        normalized = re.sub(
-            rf"\b{re.escape(synonym)}\b",
-            canonical,
-            normalized,
-        )
-
-    return normalized
+    # Lowercase, strip, and collapse multiple spaces to single space
+    normalized = _WHITESPACE_RE.sub(" ", title.lower().strip())
+
+    # Normalize seniority prefix (match at start, followed by space or dot)
+    normalized = _SENIORITY_PREFIX_RE.sub(
+        lambda m: f"{_SENIORITY_PREFIXES[m.group(1)]} ", normalized, count=1
+    )
+
+    # Apply role synonyms (full match and as substring for compound titles)
+    return _ROLE_SYNONYM_RE.sub(lambda m: _ROLE_SYNONYMS[m.group(0)], normalized)
 
 
 # =============================================================================
@@ -22,14 +22,21 @@ Coordinates with:
   - scoring/fit_score.py — imports FIT_NEUTRAL_SCORE for missing-data default
   - scoring/role_title_match.py — imports cosine_similarity for semantic title comparison
   - scoring/stretch_score.py — imports cosine_similarity for target role alignment
-  - scoring/batch_scoring.py — calls calculate_soft_skills_score for batch fit scoring
+  - scoring/batch_scoring.py — calls calculate_soft_skills_score for batch fit scoring,
+    or calculate_soft_skills_scores_batch in vectorized mode
+  - scoring/vector_similarity.py — imports batch_cosine_similarity for vectorized mode
 
 Called by: scoring/batch_scoring.py, scoring/role_title_match.py, scoring/stretch_score.py, and unit tests.
 """
 
 import math
+from collections.abc import Sequence
 
 from app.services.scoring.fit_score import FIT_NEUTRAL_SCORE
+from app.services.scoring.vector_similarity import (
+    batch_cosine_similarity,
+    stack_embeddings,
+)
 
 # =============================================================================
 # Constants
@@ -169,3 +176,48 @@ def calculate_soft_skills_score(
     # Scale from [-1, 1] to [0, 100]
     # REQ-008 §4.3.1: score = (cosine + 1) * 50
     return (similarity + 1) * 50
+
+
+def calculate_soft_skills_scores_batch(
+    persona_soft_embedding: list[float] | None,
+    job_soft_embeddings: Sequence[list[float]],
+) -> list[float]:
+    """Calculate soft skills match scores for many jobs at once (0-100 each).
+
+    REQ-008 §10.1: Vectorized counterpart of calculate_soft_skills_score.
+    All job embeddings are stacked into one matrix and compared against the
+    persona embedding with a single matrix-vector product.
+
+    Args:
+        persona_soft_embedding: Pre-computed embedding of persona soft skills.
+            None if persona has no soft skills.
+        job_soft_embeddings: Pre-computed job soft skill embeddings, one per
+            job. Missing culture should be passed as the neutral embedding.
+
+    Returns:
+        Soft skills scores in the same order as job_soft_embeddings.
+
+    Raises:
+        ValueError: If embeddings have different dimensions or exceed max size.
+    """
+    if not job_soft_embeddings:
+        return []
+
+    # REQ-008 §9.1: Missing data returns neutral score (70)
+    if persona_soft_embedding is None:
+        return [FIT_NEUTRAL_SCORE for _ in job_soft_embeddings]
+
+    if len(persona_soft_embedding) == 0:
+        msg = "Embeddings cannot be empty"
+        raise ValueError(msg)
+
+    if len(persona_soft_embedding) > _MAX_EMBEDDING_DIMENSIONS:
+        msg = f"Embeddings exceed maximum dimensions of {_MAX_EMBEDDING_DIMENSIONS}"
+        raise ValueError(msg)
+
+    matrix = stack_embeddings(job_soft_embeddings)
+    similarities = batch_cosine_similarity(persona_soft_embedding, matrix)
+
+    # Scale from [-1, 1] to [0, 100]
+    # REQ-008 §4.3.1: score = (cosine + 1) * 50
+    return [(similarity + 1) * 50 for similarity in similarities]
@@ -32,6 +32,7 @@ import math
 import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from app.services.embedding.utils import validate_embeddings
 from app.services.scoring.hard_skills_match import normalize_skill
@@ -287,13 +288,17 @@ _LEVEL_ORDER = ["junior", "mid", "senior", "lead", "director", "vp", "c_level"]
 _MAX_TITLE_LENGTH = 500
 
 
+_C_SUITE_RE = re.compile(r"\b(ceo|cto|cfo|coo)\b")
+_CHIEF_RE = re.compile(r"\bchief\b")
+
+
 def _is_c_level(normalized: str) -> bool:
     """Check if normalized title indicates C-level."""
     if "chief of staff" in normalized:
         return False
-    if re.search(r"\b(ceo|cto|cfo|coo)\b", normalized):
+    if _C_SUITE_RE.search(normalized):
         return True
-    return bool(re.search(r"\bchief\b", normalized))
+    return bool(_CHIEF_RE.search(normalized))
 
 
 def _is_vp_level(normalized: str) -> bool:
@@ -325,7 +330,12 @@ _MANAGER_PATTERNS = (
 _SENIOR_KEYWORDS = ("senior", "sr.", "sr ")
 _JUNIOR_KEYWORDS = ("junior", "jr.", "jr ", "associate", "entry-level", "intern")
 
+# Distinct titles remembered by infer_level (titles repeat heavily across
+# the shared job pool)
+_INFER_LEVEL_CACHE_SIZE = 8192
 
+
+@lru_cache(maxsize=_INFER_LEVEL_CACHE_SIZE)
 def infer_level(title: str | None) -> str | None:
     """Infer career level from job title.
 
@@ -340,6 +350,8 @@ def infer_level(title: str | None) -> str | None:
     - vp: Vice President level
     - c_level: C-suite executives (CEO, CTO, CFO, etc.)
 
+    Results are memoized.
+
     Args:
         title: Job title to analyze. None or empty returns None.
 
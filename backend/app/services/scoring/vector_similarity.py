@@ -0,0 +1,121 @@
+"""Vectorized cosine similarity for batch scoring.
+
+REQ-008 §10.1: Batch Scoring — score multiple jobs efficiently.
+
+The scalar cosine_similarity in soft_skills_match.py walks two Python
+lists element by element. When one persona vector is compared against
+every job in a batch, the whole batch can be scored with a single
+matrix-vector product instead: job vectors are stacked into one
+contiguous (n_jobs, dimensions) matrix and multiplied by the persona
+vector.
+
+WHY float64 (not float32):
+    Scores must agree with the scalar path, which computes in Python
+    floats (float64). float32 would shift component scores by ~1e-6,
+    enough to flip a rounded Fit Score total on a .5 boundary.
+
+Coordinates with:
+  - scoring/soft_skills_match.py — same validation and clamping rules as
+    cosine_similarity, applied row-wise
+  - scoring/batch_scoring.py — calls batch_cosine_similarity in vectorized mode
+
+Called by: scoring/batch_scoring.py and unit tests.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Maximum embedding dimensions (consistent with soft_skills_match)
+_MAX_EMBEDDING_DIMENSIONS = 5000
+
+
+# =============================================================================
+# Matrix Construction
+# =============================================================================
+
+
+def stack_embeddings(
+    vectors: Sequence[Sequence[float]],
+) -> npt.NDArray[np.float64]:
+    """Stack embedding vectors into a contiguous (n, dimensions) matrix.
+
+    Args:
+        vectors: Embedding vectors, all of the same length.
+
+    Returns:
+        C-contiguous float64 matrix with one row per input vector.
+
+    Raises:
+        ValueError: If vectors is empty, vectors have different lengths,
+            exceed the maximum dimensions, or contain NaN/Inf.
+    """
+    if not vectors:
+        msg = "Vectors cannot be empty"
+        raise ValueError(msg)
+
+    dimensions = len(vectors[0])
+    if dimensions == 0:
+        msg = "Vectors cannot be empty"
+        raise ValueError(msg)
+    if dimensions > _MAX_EMBEDDING_DIMENSIONS:
+        msg = f"Embeddings exceed maximum dimensions of {_MAX_EMBEDDING_DIMENSIONS}"
+        raise ValueError(msg)
+    if any(len(v) != dimensions for v in vectors):
+        msg = "Vectors must have same length"
+        raise ValueError(msg)
+
+    matrix = np.ascontiguousarray(vectors, dtype=np.float64)
+    if not np.isfinite(matrix).all():
+        msg = "Vectors must contain finite values (no NaN or Inf)"
+        raise ValueError(msg)
+    return matrix
+
+
+# =============================================================================
+# Batch Cosine Similarity
+# =============================================================================
+
+
+def batch_cosine_similarity(
+    query: Sequence[float],
+    matrix: npt.NDArray[np.float64],
+) -> list[float]:
+    """Calculate cosine similarity of one vector against every matrix row.
+
+    Row-wise equivalent of soft_skills_match.cosine_similarity: zero
+    vectors (e.g. the neutral culture embedding) yield 0.0, and results
+    are clamped to [-1.0, 1.0].
+
+    Args:
+        query: Vector to compare against (e.g. a persona embedding).
+        matrix: Stacked vectors from stack_embeddings().
+
+    Returns:
+        One similarity per matrix row, in row order.
+
+    Raises:
+        ValueError: If query dimensions don't match the matrix or query
+            contains NaN/Inf.
+    """
+    query_vec = np.asarray(query, dtype=np.float64)
+    if query_vec.ndim != 1 or query_vec.shape[0] != matrix.shape[1]:
+        msg = (
+            f"Vectors must have same length: {query_vec.shape[-1]} vs {matrix.shape[1]}"
+        )
+        raise ValueError(msg)
+    if not np.isfinite(query_vec).all():
+        msg = "Vectors must contain finite values (no NaN or Inf)"
+        raise ValueError(msg)
+
+    dots = matrix @ query_vec
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_vec)
+
+    # Zero vectors have no direction — treat as orthogonal (similarity 0)
+    similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+    return [float(s) for s in np.clip(similarities, -1.0, 1.0)]
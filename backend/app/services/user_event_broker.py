@@ -0,0 +1,327 @@
+"""Cross-process broker for per-user SSE events.
+
+REQ-006 §2.5: Background work (e.g. the rescore worker) publishes
+data_changed events for a user; each open GET /chat/stream connection
+for that user receives them alongside heartbeats.
+
+WHY POSTGRES LISTEN/NOTIFY:
+- Background workers run in every API process and in standalone
+  ``python -m app.worker`` processes, so the process that finishes a
+  job is usually not the one holding the user's SSE connection
+- notify_user_event() sends the event with pg_notify inside the
+  caller's transaction: it is delivered on commit, together with the
+  state change it announces, and never for a rolled-back one
+- Each API process runs one UserEventListener on a dedicated connection
+  and fans received events out to its local subscribers
+- Events are notifications only — durable state (e.g. rescore_jobs
+  progress) is always readable through the REST API, so a client that
+  misses an event (e.g. while the listener reconnects) still converges
+  on reconnect
+
+Cross-cutting: SSE fan-out shared by workers and the chat router.
+Too small and unique to justify its own subdirectory.
+
+Coordinates with:
+  - schemas/chat.py — SSEEvent and its concrete event types
+  - core/database.py — lock_engine (NullPool: the listener connection
+    never enters the request pool)
+
+Called by: api/v1/chat.py (SSE stream), scoring/rescore_worker.py,
+main.py (listener lifespan).
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from app.schemas.chat import (
+    ChatDoneEvent,
+    ChatTokenEvent,
+    DataChangedEvent,
+    SSEEvent,
+    ToolResultEvent,
+    ToolStartEvent,
+)
+
+logger = logging.getLogger(__name__)
+
+# Postgres NOTIFY channel shared by every process
+_CHANNEL = "user_events"
+
+# Seconds between listener connection checks, and before a reconnect
+DEFAULT_RETRY_SECONDS = 5
+
+# Concrete event types that may cross processes, by their type field
+_EVENT_TYPES: dict[str, type[SSEEvent]] = {
+    "chat_token": ChatTokenEvent,
+    "chat_done": ChatDoneEvent,
+    "tool_start": ToolStartEvent,
+    "tool_result": ToolResultEvent,
+    "data_changed": DataChangedEvent,
+}
+
+# Buffered events per subscriber before new events are dropped
+# (a stalled client must not grow server memory)
+_MAX_QUEUE_SIZE = 100
+
+# Open SSE connections per user (defense-in-depth against tab floods)
+_MAX_SUBSCRIBERS_PER_USER = 10
+
+
+class UserEventBroker:
+    """Fan-out of SSE events to a user's open stream connections.
+
+    Publishing never blocks: each subscriber has a bounded queue, and
+    events for a full queue are dropped with a warning.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[uuid.UUID, set[asyncio.Queue[SSEEvent]]] = {}
+
+    def subscriber_count(self, user_id: uuid.UUID) -> int:
+        """Number of open subscriptions for a user."""
+        return len(self._subscribers.get(user_id, ()))
+
+    @asynccontextmanager
+    async def subscribe(
+        self, user_id: uuid.UUID
+    ) -> AsyncIterator[asyncio.Queue[SSEEvent]]:
+        """Subscribe to a user's events for the lifetime of the context.
+
+        Args:
+            user_id: User whose events to receive.
+
+        Yields:
+            Queue receiving events published for the user.
+        """
+        queues = self._subscribers.setdefault(user_id, set())
+        if len(queues) >= _MAX_SUBSCRIBERS_PER_USER:
+            # Evict the oldest subscription rather than refuse the new one
+            # (abandoned tabs are the usual cause)
+            queues.pop()
+        queue: asyncio.Queue[SSEEvent] = asyncio.Queue(maxsize=_MAX_QUEUE_SIZE)
+        queues.add(queue)
+        try:
+            yield queue
+        finally:
+            queues.discard(queue)
+            if not queues:
+                self._subscribers.pop(user_id, None)
+
+    def publish(self, user_id: uuid.UUID, event: SSEEvent) -> int:
+        """Deliver an event to this process's open subscriptions of a user.
+
+        Subscriptions held by other processes are reached through
+        notify_user_event() instead.
+
+        Args:
+            user_id: Recipient user.
+            event: SSE event to deliver.
+
+        Returns:
+            Number of subscriptions the event was queued for.
+        """
+        delivered = 0
+        for queue in list(self._subscribers.get(user_id, ())):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning(
+                    "SSE queue full for user %s — dropping %s event",
+                    user_id,
+                    event.type,
+                )
+                continue
+            delivered += 1
+        return delivered
+
+
+def encode_user_event(user_id: uuid.UUID, event: SSEEvent) -> str:
+    """Serialize a user event as a NOTIFY payload.
+
+    Args:
+        user_id: Recipient user.
+        event: SSE event to deliver.
+
+    Returns:
+        JSON payload carrying the user ID and the event.
+    """
+    return json.dumps({"user_id": str(user_id), "event": event.model_dump(mode="json")})
+
+
+def decode_user_event(payload: str) -> tuple[uuid.UUID, SSEEvent] | None:
+    """Parse a NOTIFY payload written by encode_user_event().
+
+    Args:
+        payload: Notification payload.
+
+    Returns:
+        (user ID, event), or None if the payload is malformed or names an
+        unknown event type.
+    """
+    try:
+        data = json.loads(payload)
+        user_id = uuid.UUID(data["user_id"])
+        event_data = data["event"]
+        event_type = _EVENT_TYPES[event_data["type"]]
+        return user_id, event_type.model_validate(event_data)
+    except (ValueError, KeyError, TypeError, ValidationError):
+        logger.warning("Ignoring malformed user event notification")
+        return None
+
+
+async def notify_user_event(
+    db: AsyncSession, user_id: uuid.UUID, event: SSEEvent
+) -> None:
+    """Queue an event for the user's SSE streams in every process.
+
+    Postgres delivers the notification when the caller commits, and
+    drops it if the transaction rolls back.
+
+    Args:
+        db: Session whose transaction carries the notification.
+        user_id: Recipient user.
+        event: SSE event to deliver.
+    """
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": _CHANNEL, "payload": encode_user_event(user_id, event)},
+    )
+
+
+class UserEventListener:
+    """Feeds user events from other processes into the local broker.
+
+    Holds one LISTEN connection and re-opens it when lost. Lifecycle
+    mirrors the background workers (start/stop/is_running).
+
+    Args:
+        engine: Engine to open the listener connection from.
+        broker: Broker receiving the events; defaults to the singleton.
+        retry_seconds: Seconds between connection checks and reconnects.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        broker: UserEventBroker | None = None,
+        retry_seconds: float = DEFAULT_RETRY_SECONDS,
+    ) -> None:
+        self._engine = engine
+        self._broker = broker
+        self._retry_seconds = retry_seconds
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the listener task is currently active."""
+        return self._running and self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start listening. No-op if already running.
+
+        Must be called from an async context (running event loop).
+        """
+        if self.is_running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self) -> None:
+        """Stop listening and close the listener connection."""
+        self._running = False
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    def dispatch(self, payload: str) -> int:
+        """Deliver one notification payload to local subscribers.
+
+        Args:
+            payload: Notification payload (see encode_user_event).
+
+        Returns:
+            Number of local subscriptions the event was queued for.
+        """
+        decoded = decode_user_event(payload)
+        if decoded is None:
+            return 0
+        broker = self._broker if self._broker is not None else get_event_broker()
+        return broker.publish(*decoded)
+
+    async def _run_loop(self) -> None:
+        """Listen, check the connection, and reconnect after failures."""
+        while self._running:
+            conn: AsyncConnection | None = None
+            try:
+                conn = await self._listen()
+                while self._running:
+                    await asyncio.sleep(self._retry_seconds)
+                    await conn.scalar(text("SELECT 1"))
+            except asyncio.CancelledError:
+                raise
+            # WHY BLE001: A lost listener connection must not end the
+            # listener — events resume once the connection is re-opened.
+            except Exception:  # noqa: BLE001
+                logger.warning("User event listener connection lost; reconnecting")
+                await asyncio.sleep(self._retry_seconds)
+            finally:
+                if conn is not None:
+                    # Invalidating closes the connection, which ends LISTEN.
+                    with contextlib.suppress(Exception):
+                        await conn.invalidate()
+
+    async def _listen(self) -> AsyncConnection:
+        """Open a connection and LISTEN on the user event channel."""
+        conn = await self._engine.connect()
+        try:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            if driver is None:
+                raise RuntimeError("Listener connection has no driver connection")
+            await driver.add_listener(_CHANNEL, self._on_notification)
+        except BaseException:
+            await conn.invalidate()
+            raise
+        return conn
+
+    def _on_notification(
+        self, _connection: Any, _pid: int, _channel: str, payload: str
+    ) -> None:
+        """asyncpg listener callback."""
+        self.dispatch(payload)
+
+
+_broker: UserEventBroker | None = None
+
+
+def get_event_broker() -> UserEventBroker:
+    """Get the singleton event broker instance.
+
+    Returns:
+        The UserEventBroker singleton.
+    """
+    global _broker
+    if _broker is None:
+        _broker = UserEventBroker()
+    return _broker
+
+
+def reset_event_broker() -> None:
+    """Reset the event broker singleton (for testing)."""
+    global _broker
+    _broker = None
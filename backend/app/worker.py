@@ -0,0 +1,153 @@
+"""Background worker process and shared worker wiring.
+
+Builds the background workers started by the API lifespan (app/main.py)
+and by the standalone worker process:
+
+    cd backend
+    python -m app.worker
+
+The pool surfacing and reservation sweep workers scan shared tables, so
+each runs under leader election (core/leader_election.py): exactly one
+process in the fleet runs each of them, whichever mix of API and worker
+processes is deployed. The poll scheduler and rescore workers claim
+their rows with SKIP LOCKED and run in every process, sharing the work.
+
+Source API budgets (e.g. Adzuna's 25 req/min) are enforced by per-process
+token buckets (adapters/sources/rate_limit.py), and every API and worker
+process sends source requests. Set SOURCE_REQUEST_PROCESSES to the total
+number of processes so each takes its share of the budget; adding
+processes without raising it multiplies the request rate sent to every
+source.
+
+To scale the API independently, run one or more worker processes and set
+RUN_BACKGROUND_WORKERS=false on the API processes.
+
+Coordinates with:
+  - adapters/sources/http_client.py — close_source_http_client on exit
+  - core/config.py — run_background_workers, worker_leader_retry_seconds,
+    source_request_processes
+  - core/database.py — async_session_factory, engine, lock_engine
+  - core/leader_election.py — LeaderElectedWorker
+  - services/billing/reservation_sweep.py — ReservationSweepWorker
+  - services/discovery/pool_surfacing_worker.py — PoolSurfacingWorker
+  - services/discovery/poll_scheduler_worker.py — PollSchedulerWorker
+  - services/scoring/rescore_worker.py — RescoreWorker
+
+Called by: app/main.py (FastAPI lifespan), CLI (python -m app.worker),
+and unit tests.
+"""
+
+import asyncio
+import contextlib
+import logging
+import signal
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.adapters.sources.http_client import close_source_http_client
+from app.core.config import settings
+from app.core.database import async_session_factory, engine, lock_engine
+from app.core.leader_election import BackgroundWorker, LeaderElectedWorker
+from app.services.billing.reservation_sweep import ReservationSweepWorker
+from app.services.discovery.poll_scheduler_worker import PollSchedulerWorker
+from app.services.discovery.pool_surfacing_worker import PoolSurfacingWorker
+from app.services.scoring.rescore_worker import RescoreWorker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BackgroundWorkers:
+    """The background workers of one process.
+
+    Attributes:
+        surfacing: Pool surfacing worker (leader-elected).
+        sweep: Reservation sweep worker (leader-elected).
+        poll_scheduler: Poll scheduler worker (runs in every process).
+        rescore: Rescore queue worker (runs in every process).
+    """
+
+    surfacing: LeaderElectedWorker
+    sweep: LeaderElectedWorker
+    poll_scheduler: PollSchedulerWorker
+    rescore: RescoreWorker
+
+    def start(self) -> None:
+        """Start every worker (leader-elected ones begin as standbys)."""
+        self.surfacing.start()
+        self.sweep.start()
+        self.poll_scheduler.start()
+        self.rescore.start()
+
+    async def stop(self) -> None:
+        """Stop every worker; leaders release their locks."""
+        await self.rescore.stop()
+        await self.poll_scheduler.stop()
+        await self.sweep.stop()
+        await self.surfacing.stop()
+
+
+def create_background_workers(
+    session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    *,
+    election_engine: AsyncEngine = lock_engine,
+    retry_seconds: float | None = None,
+) -> BackgroundWorkers:
+    """Build the background workers, wrapping shared-table scans in elections.
+
+    Args:
+        session_factory: Async session factory for worker DB access.
+        election_engine: Engine for leader-election lock connections.
+        retry_seconds: Leader lock retry/check interval; defaults to
+            settings.worker_leader_retry_seconds.
+
+    Returns:
+        BackgroundWorkers, not yet started.
+    """
+    retry = (
+        retry_seconds
+        if retry_seconds is not None
+        else settings.worker_leader_retry_seconds
+    )
+
+    def elected(name: str, worker: BackgroundWorker) -> LeaderElectedWorker:
+        return LeaderElectedWorker(name, worker, election_engine, retry_seconds=retry)
+
+    return BackgroundWorkers(
+        surfacing=elected("pool_surfacing", PoolSurfacingWorker(session_factory)),
+        sweep=elected("reservation_sweep", ReservationSweepWorker(session_factory)),
+        poll_scheduler=PollSchedulerWorker(session_factory),
+        rescore=RescoreWorker(session_factory),
+    )
+
+
+async def run_worker_process() -> None:
+    """Run the background workers until SIGINT or SIGTERM."""
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        # WHY: add_signal_handler is unavailable on Windows event loops;
+        # Ctrl+C still ends the process there via KeyboardInterrupt.
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop_event.set)
+
+    workers = create_background_workers()
+    workers.start()
+    logger.info("Background worker process started")
+    try:
+        await stop_event.wait()
+    finally:
+        logger.info("Background worker process stopping")
+        await workers.stop()
+        await close_source_http_client()
+        await lock_engine.dispose()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=settings.log_level,
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    )
+    asyncio.run(run_worker_process())
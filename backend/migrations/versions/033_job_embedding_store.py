@@ -0,0 +1,66 @@
+"""Allow title embeddings and unique keys in job_embeddings.
+
+Revision ID: 033_job_embedding_store
+Revises: 032_search_profile_routing
+Create Date: 2026-10-16
+
+REQ-008 §6.4, §10.1: Scoring reuses persisted job embeddings instead of
+re-embedding every job on every run. Adds 'title' to the allowed
+embedding types (role title / target role matching embed the job title)
+and a unique key on (job_posting_id, embedding_type, model_name) so the
+embedding store can upsert with ON CONFLICT. Duplicate rows are derived
+data — the newest per key is kept.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "033_job_embedding_store"
+down_revision: str = "032_search_profile_routing"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "job_embeddings"
+_CK_TYPE = "ck_jobembedding_type"
+_UQ_INDEX = "uq_jobembedding_posting_type_model"
+
+
+def upgrade() -> None:
+    """Widen the embedding_type CHECK and add the upsert key."""
+    op.drop_constraint(_CK_TYPE, _TABLE, type_="check")
+    op.create_check_constraint(
+        _CK_TYPE,
+        _TABLE,
+        "embedding_type IN ('requirements', 'culture', 'title')",
+    )
+
+    # Keep only the newest row per key before enforcing uniqueness
+    op.execute(
+        sa.text(
+            "DELETE FROM job_embeddings a USING job_embeddings b "
+            "WHERE a.job_posting_id = b.job_posting_id "
+            "AND a.embedding_type = b.embedding_type "
+            "AND a.model_name = b.model_name "
+            "AND (a.created_at, a.id) < (b.created_at, b.id)"
+        )
+    )
+    op.create_index(
+        _UQ_INDEX,
+        _TABLE,
+        ["job_posting_id", "embedding_type", "model_name"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the upsert key and title embeddings, restore the CHECK."""
+    op.drop_index(_UQ_INDEX, table_name=_TABLE)
+    op.execute(sa.text("DELETE FROM job_embeddings WHERE embedding_type = 'title'"))
+    op.drop_constraint(_CK_TYPE, _TABLE, type_="check")
+    op.create_check_constraint(
+        _CK_TYPE,
+        _TABLE,
+        "embedding_type IN ('requirements', 'culture')",
+    )
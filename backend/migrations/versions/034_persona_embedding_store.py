@@ -0,0 +1,48 @@
+"""Add a unique key to persona_embeddings for the durable embedding cache.
+
+Revision ID: 034_persona_embedding_store
+Revises: 033_job_embedding_store
+Create Date: 2026-10-16
+
+REQ-008 §6.5, §10.2: persona_embeddings backs the in-process persona
+embedding cache. A unique key on (persona_id, embedding_type, model_name)
+lets the store upsert with ON CONFLICT. Duplicate rows are derived
+data — the newest per key is kept.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "034_persona_embedding_store"
+down_revision: str = "033_job_embedding_store"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "persona_embeddings"
+_UQ_INDEX = "uq_personaembedding_persona_type_model"
+
+
+def upgrade() -> None:
+    """Deduplicate rows and add the upsert key."""
+    op.execute(
+        sa.text(
+            "DELETE FROM persona_embeddings a USING persona_embeddings b "
+            "WHERE a.persona_id = b.persona_id "
+            "AND a.embedding_type = b.embedding_type "
+            "AND a.model_name = b.model_name "
+            "AND (a.created_at, a.id) < (b.created_at, b.id)"
+        )
+    )
+    op.create_index(
+        _UQ_INDEX,
+        _TABLE,
+        ["persona_id", "embedding_type", "model_name"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the upsert key."""
+    op.drop_index(_UQ_INDEX, table_name=_TABLE)
@@ -0,0 +1,115 @@
+"""Create rescore_jobs table for the background rescore queue.
+
+Revision ID: 035_rescore_jobs
+Revises: 034_persona_embedding_store
+Create Date: 2026-10-16
+
+REQ-006 §5.2, REQ-017 §6.2: POST /job-postings/rescore enqueues a row
+that the rescore worker claims with FOR UPDATE SKIP LOCKED and processes
+in chunks. A partial unique index on (persona_id) WHERE status = 'queued'
+coalesces repeated requests onto the pending job.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = "035_rescore_jobs"
+down_revision: str = "034_persona_embedding_store"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "rescore_jobs"
+_UQ_PERSONA_QUEUED = "uq_rescorejob_persona_queued"
+_IX_QUEUED_CREATED = "ix_rescorejob_queued_created"
+_IX_USER_PERSONA = "ix_rescorejob_user_persona"
+
+# Reusable SQL text fragments (extracted to avoid S1192 string-literal duplication)
+_UUID_DEFAULT = sa.text("gen_random_uuid()")
+_NOW = sa.text("now()")
+_ZERO = sa.text("0")
+_QUEUED = sa.text("status = 'queued'")
+
+
+def upgrade() -> None:
+    """Create rescore_jobs with the coalescing and claim-order indexes."""
+    op.create_table(
+        _TABLE,
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            primary_key=True,
+            server_default=_UUID_DEFAULT,
+            nullable=False,
+        ),
+        sa.Column(
+            "user_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "persona_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("personas.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            sa.String(20),
+            nullable=False,
+            server_default=sa.text("'queued'"),
+        ),
+        # NULL until the worker claims the job and counts Discovered jobs
+        sa.Column("total_jobs", sa.Integer, nullable=True),
+        sa.Column("processed_jobs", sa.Integer, nullable=False, server_default=_ZERO),
+        sa.Column("attempts", sa.Integer, nullable=False, server_default=_ZERO),
+        sa.Column("error", sa.Text, nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        # updated_at doubles as the worker heartbeat (stale-claim recovery)
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=_NOW,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=_NOW,
+        ),
+        sa.CheckConstraint(
+            "status IN ('queued', 'running', 'completed', 'failed')",
+            name="ck_rescorejob_status_valid",
+        ),
+        sa.CheckConstraint(
+            "processed_jobs >= 0",
+            name="ck_rescorejob_processed_nonneg",
+        ),
+    )
+    op.create_index(
+        _UQ_PERSONA_QUEUED,
+        _TABLE,
+        ["persona_id"],
+        unique=True,
+        postgresql_where=_QUEUED,
+    )
+    op.create_index(
+        _IX_QUEUED_CREATED,
+        _TABLE,
+        ["created_at"],
+        postgresql_where=_QUEUED,
+    )
+    op.create_index(_IX_USER_PERSONA, _TABLE, ["user_id", "persona_id"])
+
+
+def downgrade() -> None:
+    """Drop rescore_jobs and its indexes."""
+    op.drop_index(_IX_USER_PERSONA, table_name=_TABLE)
+    op.drop_index(_IX_QUEUED_CREATED, table_name=_TABLE)
+    op.drop_index(_UQ_PERSONA_QUEUED, table_name=_TABLE)
+    op.drop_table(_TABLE)
@@ -0,0 +1,50 @@
+"""Add MinHash signature and LSH band columns to job_postings.
+
+Revision ID: 036_description_minhash
+Revises: 035_rescore_jobs
+Create Date: 2026-10-16
+
+REQ-015 §6 dedup step 3: Repost candidates are retrieved by LSH band
+overlap (GIN index on description_lsh_bands) and prefiltered by the
+MinHash Jaccard estimate before the exact SequenceMatcher ratio.
+Existing rows keep NULL columns and remain candidates through the
+repository's NULL fallback; they are filled when their source re-reports them.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ARRAY
+
+revision: str = "036_description_minhash"
+down_revision: str = "035_rescore_jobs"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "job_postings"
+_IX_LSH_BANDS = "ix_job_postings_lsh_bands"
+
+
+def upgrade() -> None:
+    """Add description_minhash, description_lsh_bands, and the GIN index."""
+    op.add_column(
+        _TABLE, sa.Column("description_minhash", sa.LargeBinary, nullable=True)
+    )
+    op.add_column(
+        _TABLE,
+        sa.Column("description_lsh_bands", ARRAY(sa.BigInteger), nullable=True),
+    )
+    op.create_index(
+        _IX_LSH_BANDS,
+        _TABLE,
+        ["description_lsh_bands"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Drop the GIN index and MinHash columns."""
+    op.drop_index(_IX_LSH_BANDS, table_name=_TABLE)
+    op.drop_column(_TABLE, "description_lsh_bands")
+    op.drop_column(_TABLE, "description_minhash")
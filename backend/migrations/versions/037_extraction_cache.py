@@ -0,0 +1,47 @@
+"""Create extraction_cache table for shared LLM extraction results.
+
+Revision ID: 037_extraction_cache
+Revises: 036_description_minhash
+Create Date: 2026-10-16
+
+REQ-007 §6.4, REQ-016 §6.3: Skill/culture extraction (polling) and full
+job-data extraction (manual ingest) are looked up by (description_hash,
+prompt_version, model_name) before any LLM call. Rows are shared across
+all users and never updated; a new prompt version or model gets new keys.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "037_extraction_cache"
+down_revision: str = "036_description_minhash"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "extraction_cache"
+
+
+def upgrade() -> None:
+    """Create extraction_cache keyed by hash, prompt version, and model."""
+    op.create_table(
+        _TABLE,
+        sa.Column("description_hash", sa.String(64), nullable=False),
+        sa.Column("prompt_version", sa.String(50), nullable=False),
+        sa.Column("model_name", sa.String(100), nullable=False),
+        sa.Column("result", JSONB, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("description_hash", "prompt_version", "model_name"),
+    )
+
+
+def downgrade() -> None:
+    """Drop extraction_cache."""
+    op.drop_table(_TABLE)
@@ -0,0 +1,56 @@
+"""Add surfaced_at cursor to job_postings.
+
+Revision ID: 038_job_surfaced_at
+Revises: 037_extraction_cache
+Create Date: 2026-10-16
+
+REQ-015 §7: Pool surfacing drains jobs with surfaced_at IS NULL, oldest
+first, and stamps each job once it has been evaluated against every
+persona. The partial index keeps the backlog lookup cheap; it covers only
+active, non-quarantined rows (the ones surfacing reads), so expired or
+quarantined postings that are never stamped do not accumulate in it. A
+released or reactivated posting re-enters the index automatically.
+
+Existing jobs older than the surfacing worker's former 24-hour lookback
+are stamped with their created_at so the first pass does not re-surface
+the whole pool; newer jobs stay in the backlog (persona_jobs' UNIQUE
+constraint makes re-surfacing them harmless).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "038_job_surfaced_at"
+down_revision: str = "037_extraction_cache"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "job_postings"
+_IX_BACKLOG = "ix_job_postings_surfacing_backlog"
+
+
+def upgrade() -> None:
+    """Add surfaced_at, backfill old jobs, and create the backlog index."""
+    op.add_column(
+        _TABLE, sa.Column("surfaced_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.execute(
+        "UPDATE job_postings SET surfaced_at = created_at "
+        "WHERE created_at < now() - interval '24 hours'"
+    )
+    op.create_index(
+        _IX_BACKLOG,
+        _TABLE,
+        ["created_at", "id"],
+        postgresql_where=sa.text(
+            "surfaced_at IS NULL AND is_active IS true AND is_quarantined IS false"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the backlog index and surfaced_at."""
+    op.drop_index(_IX_BACKLOG, table_name=_TABLE)
+    op.drop_column(_TABLE, "surfaced_at")
@@ -0,0 +1,36 @@
+"""Add scheduler claim lease to polling_configurations.
+
+Revision ID: 039_polling_claims
+Revises: 038_job_surfaced_at
+Create Date: 2026-10-16
+
+REQ-034 §7.2: Poll schedulers claim due rows with FOR UPDATE SKIP LOCKED
+and stamp claimed_until, so several scheduler processes can share the
+due backlog without polling a persona twice. A claim whose lease has
+passed (crashed scheduler) is claimable again. The due-row scan uses the
+existing idx_polling_configurations_next_poll_at.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "039_polling_claims"
+down_revision: str = "038_job_surfaced_at"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "polling_configurations"
+
+
+def upgrade() -> None:
+    """Add claimed_until."""
+    op.add_column(
+        _TABLE, sa.Column("claimed_until", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Drop claimed_until."""
+    op.drop_column(_TABLE, "claimed_until")
@@ -0,0 +1,59 @@
+"""Allow at most one running rescore job per persona.
+
+Revision ID: 040_rescore_running_unique
+Revises: 039_polling_claims
+Create Date: 2026-10-16
+
+REQ-017 §6.2: claim_next skips personas with a running job, but under
+READ COMMITTED two workers can both see none and claim two queued jobs
+for the same persona. A partial unique index on (persona_id) WHERE
+status = 'running' makes the second claim fail instead. Duplicate
+running rows left by that race are failed first (all but the newest
+claim per persona).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "040_rescore_running_unique"
+down_revision: str = "039_polling_claims"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "rescore_jobs"
+_UQ_PERSONA_RUNNING = "uq_rescorejob_persona_running"
+
+
+def upgrade() -> None:
+    """Fail duplicate running jobs, then add the unique index."""
+    op.execute(
+        sa.text(
+            """
+            UPDATE rescore_jobs SET
+                status = 'failed',
+                error = 'Rescore failed',
+                finished_at = now()
+            WHERE status = 'running'
+              AND id NOT IN (
+                  SELECT DISTINCT ON (persona_id) id
+                  FROM rescore_jobs
+                  WHERE status = 'running'
+                  ORDER BY persona_id, started_at DESC NULLS LAST, id
+              )
+            """
+        )
+    )
+    op.create_index(
+        _UQ_PERSONA_RUNNING,
+        _TABLE,
+        ["persona_id"],
+        unique=True,
+        postgresql_where=sa.text("status = 'running'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the running-job unique index."""
+    op.drop_index(_UQ_PERSONA_RUNNING, table_name=_TABLE)
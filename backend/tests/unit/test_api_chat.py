@@ -9,6 +9,7 @@ These tests verify:
 - Event type schemas and formatting
 """
 
+import asyncio
 import json
 import uuid
 
@@ -21,8 +22,10 @@ from app.api.v1.chat import (
 from app.schemas.chat import (
     ChatMessageRequest,
     ChatTokenEvent,
+    DataChangedEvent,
     HeartbeatEvent,
 )
+from app.services.user_event_broker import get_event_broker
 
 # =============================================================================
 # Schema Tests - Event Type Validation
@@ -287,3 +290,30 @@ class TestSSEConnectionTimeout:
         with pytest.raises(ValueError, match="heartbeat_interval must be positive"):
             async for _ in event_generator(max_duration=1, heartbeat_interval=-1):
                 pass
+
+    @pytest.mark.asyncio
+    async def test_generator_streams_published_user_events(self):
+        """Events published for the user are streamed between heartbeats."""
+        user_id = uuid.uuid4()
+        broker = get_event_broker()
+        stream = event_generator(
+            max_duration=1.0, heartbeat_interval=10.0, user_id=user_id
+        )
+
+        first = await anext(stream)
+        assert '"heartbeat"' in first
+
+        pending = asyncio.ensure_future(anext(stream))
+        while broker.subscriber_count(user_id) == 0:
+            await asyncio.sleep(0)
+        broker.publish(
+            user_id,
+            DataChangedEvent(resource="job-posting", id="job-1", action="updated"),
+        )
+        event = await asyncio.wait_for(pending, timeout=1.0)
+        await stream.aclose()
+
+        parsed = json.loads(event[6:-2])
+        assert parsed["type"] == "data_changed"
+        assert parsed["resource"] == "job-posting"
+        assert broker.subscriber_count(user_id) == 0
@@ -3,6 +3,8 @@
 REQ-006 §5.1-5.3: URL structure, resource mapping, HTTP methods.
 """
 
+import uuid
+
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
@@ -81,6 +83,12 @@ class TestJobPostingsActionEndpoints:
         response = await client.post("/api/v1/job-postings/rescore")
         assert response.status_code == 401
 
+    @pytest.mark.asyncio
+    async def test_rescore_status_endpoint_exists(self, client):
+        """GET /api/v1/job-postings/rescore/{id} should exist."""
+        response = await client.get(f"/api/v1/job-postings/rescore/{uuid.uuid4()}")
+        assert response.status_code == 401
+
 
 class TestJobPostingsHTTPMethods:
     """Tests that job-postings router supports standard HTTP methods."""
@@ -14,6 +14,7 @@ from datetime import UTC, datetime
 
 import pytest
 
+from app.services.embedding.job_generator import JobScoringEmbeddings
 from app.services.embedding.persona_generator import (
     PersonaEmbeddingData,
     PersonaEmbeddingsResult,
@@ -835,3 +836,205 @@ class TestBatchScoringEmbeddingValidation:
                 persona_embeddings=persona_embeddings,
                 embedding_provider=provider,
             )
+
+
+# =============================================================================
+# Test: Vectorized Mode
+# =============================================================================
+
+
+class _VaryingEmbeddingProvider:
+    """Embedding provider returning a distinct vector per input text."""
+
+    async def embed(self, texts: list[str]) -> MockEmbeddingResult:
+        vectors = [
+            [((len(text) * (d + 1)) % 17 - 8) / 10.0 for d in range(768)]
+            for text in texts
+        ]
+        return MockEmbeddingResult(
+            vectors=vectors,
+            model="text-embedding-3-small",
+            dimensions=768,
+            total_tokens=len(texts) * 10,
+        )
+
+
+class TestBatchScoringVectorized:
+    """Test that vectorized mode matches the scalar scoring path."""
+
+    @pytest.mark.asyncio
+    async def test_vectorized_matches_scalar_results(self) -> None:
+        """Vectorized soft skills scores agree with per-job cosine scores."""
+        persona = make_python_engineer_persona()
+        persona_embeddings = make_mock_persona_embeddings(persona.id)
+        persona_embeddings.soft_skills.vector = [
+            ((d * 7) % 11 - 5) / 10.0 for d in range(768)
+        ]
+        jobs = [make_python_job(), make_data_scientist_job(), make_director_job()]
+        jobs[0].culture_text = "Collaborative, remote-first team"
+        jobs[1].culture_text = "Fast-paced startup culture"
+        jobs[2].culture_text = None  # Neutral (zero) embedding
+
+        scalar = await batch_score_jobs(
+            jobs=jobs,
+            persona=persona,  # pyright: ignore[reportArgumentType]
+            persona_embeddings=persona_embeddings,
+            embedding_provider=_VaryingEmbeddingProvider(),
+        )
+        vectorized = await batch_score_jobs(
+            jobs=jobs,
+            persona=persona,  # pyright: ignore[reportArgumentType]
+            persona_embeddings=persona_embeddings,
+            embedding_provider=_VaryingEmbeddingProvider(),
+            vectorized=True,
+        )
+
+        for s, v in zip(scalar, vectorized, strict=True):
+            assert v.job_id == s.job_id
+            assert v.fit_score.total == s.fit_score.total
+            assert v.stretch_score == s.stretch_score
+            for name, value in s.fit_score.components.items():
+                assert v.fit_score.components[name] == pytest.approx(value, abs=1e-9)
+
+    @pytest.mark.asyncio
+    async def test_vectorized_missing_culture_is_neutral(self) -> None:
+        """Jobs without culture text score 50 (orthogonal) in vectorized mode."""
+        persona = make_python_engineer_persona()
+        persona_embeddings = make_mock_persona_embeddings(persona.id)
+        job = make_python_job()
+        job.culture_text = None
+
+        results = await batch_score_jobs(
+            jobs=[job],
+            persona=persona,  # pyright: ignore[reportArgumentType]
+            persona_embeddings=persona_embeddings,
+            embedding_provider=MockEmbeddingProvider(),
+            vectorized=True,
+        )
+
+        assert results[0].fit_score.components["soft_skills"] == 50.0
+
+
+class TestBatchScoringPrecomputedEmbeddings:
+    """Test that stored job vectors bypass the embedding provider."""
+
+    @pytest.mark.asyncio
+    async def test_precomputed_jobs_are_not_embedded(self) -> None:
+        """Only jobs missing from job_embeddings are sent to the provider."""
+        persona = make_python_engineer_persona()
+        persona_embeddings = make_mock_persona_embeddings(persona.id)
+        stored_job = make_python_job()
+        new_job = make_data_scientist_job()
+        provider = MockEmbeddingProvider()
+
+        results = await batch_score_jobs(
+            jobs=[stored_job, new_job],
+            persona=persona,  # pyright: ignore[reportArgumentType]
+            persona_embeddings=persona_embeddings,
+            embedding_provider=provider,
+            job_embeddings={
+                stored_job.id: JobScoringEmbeddings(
+                    title=make_mock_embedding(),
+                    culture=make_mock_embedding(),
+                )
+            },
+        )
+
+        assert [r.job_id for r in results] == [stored_job.id, new_job.id]
+        assert provider.last_texts != []
+        assert stored_job.job_title not in provider.last_texts
+
+    @pytest.mark.asyncio
+    async def test_all_precomputed_skips_provider(self) -> None:
+        """A fully precomputed batch makes no embedding calls."""
+        persona = make_python_engineer_persona()
+        persona_embeddings = make_mock_persona_embeddings(persona.id)
+        job = make_python_job()
+        provider = MockEmbeddingProvider()
+
+        await batch_score_jobs(
+            jobs=[job],
+            persona=persona,  # pyright: ignore[reportArgumentType]
+            persona_embeddings=persona_embeddings,
+            embedding_provider=provider,
+            job_embeddings={
+                job.id: JobScoringEmbeddings(title=None, culture=make_mock_embedding())
+            },
+        )
+
+        assert provider.call_count == 0
+
+
+class TestBatchScoringReusedComponents:
+    """Test incremental scoring with stored component values."""
+
+    @pytest.mark.asyncio
+    async def test_reused_components_are_taken_as_is_and_reaggregated(
+        self,
+    ) -> None:
+        """Listed components keep their stored value; totals are re-aggregated."""
+        persona = make_python_engineer_persona()
+        persona_embeddings = make_mock_persona_embeddings(persona.id)
+        job = make_python_job()
+
+        full = await batch_score_jobs(
+            jobs=[job],
+            persona=persona,  # pyright: ignore[reportArgumentType]
+            persona_embeddings=persona_embeddings,
+            embedding_provider=MockEmbeddingProvider(),
+        )
+        partial = await batch_score_jobs(
+            jobs=[job],
+            persona=persona,  # pyright: ignore[reportArgumentType]
+            persona_embeddings=persona_embeddings,
+            embedding_provider=MockEmbeddingProvider(),
+            reused_components={job.id: {"hard_skills": 0.0}},
+        )
+
+        assert partial[0].fit_score.components["hard_skills"] == 0.0
+        assert (
+            partial[0].fit_score.components["experience_level"]
+            == full[0].fit_score.components["experience_level"]
+        )
+        assert partial[0].fit_score.total < full[0].fit_score.total
+
+    @pytest.mark.asyncio
+    async def test_reusing_embedding_components_skips_all_embedding_work(
+        self,
+    ) -> None:
+        """Jobs reusing every embedding component need no vectors at all."""
+        persona = make_python_engineer_persona()
+        job = make_python_job()
+        provider = MockEmbeddingProvider()
+
+        results = await batch_score_jobs(
+            jobs=[job],
+            persona=persona,  # pyright: ignore[reportArgumentType]
+            persona_embeddings=None,
+            embedding_provider=provider,
+            vectorized=True,
+            reused_components={
+                job.id: {"soft_skills": 61.0, "role_title": 72.0, "target_role": 83.0}
+            },
+        )
+
+        assert provider.call_count == 0
+        assert results[0].fit_score.components["soft_skills"] == 61.0
+        assert results[0].fit_score.components["role_title"] == 72.0
+        assert results[0].stretch_score.components["target_role"] == 83.0
+
+    @pytest.mark.asyncio
+    async def test_missing_persona_embeddings_raises_when_soft_skills_needed(
+        self,
+    ) -> None:
+        """persona_embeddings may only be None if soft skills are all reused."""
+        persona = make_python_engineer_persona()
+        job = make_python_job()
+
+        with pytest.raises(ValueError, match="persona_embeddings is required"):
+            await batch_score_jobs(
+                jobs=[job],
+                persona=persona,  # pyright: ignore[reportArgumentType]
+                persona_embeddings=None,
+                embedding_provider=MockEmbeddingProvider(),
+            )
@@ -0,0 +1,183 @@
+"""Tests for per-component input fingerprints.
+
+REQ-008 §10.1, REQ-017 §6.2: Incremental rescoring recomputes only the
+components whose inputs changed.
+"""
+
+from dataclasses import dataclass, field
+
+from app.services.scoring.component_fingerprints import (
+    compute_component_fingerprints,
+    find_reusable_components,
+)
+
+_MODEL = "text-embedding-3-small"
+
+
+@dataclass
+class _Skill:
+    skill_name: str
+    skill_type: str
+    proficiency: str = "Proficient"
+
+
+@dataclass
+class _ExtractedSkill:
+    skill_name: str
+    skill_type: str
+    is_required: bool = True
+    years_requested: int | None = None
+
+
+@dataclass
+class _Persona:
+    skills: list[_Skill] = field(
+        default_factory=lambda: [
+            _Skill("Python", "Hard", "Expert"),
+            _Skill("Leadership", "Soft"),
+        ]
+    )
+    years_experience: int | None = 5
+    current_role: str | None = "Software Engineer"
+    target_roles: list[str] = field(default_factory=lambda: ["Tech Lead"])
+    target_skills: list[str] = field(default_factory=lambda: ["Kubernetes"])
+    remote_preference: str = "Hybrid OK"
+    commutable_cities: list[str] = field(default_factory=lambda: ["Phoenix"])
+
+
+@dataclass
+class _Job:
+    job_title: str = "Senior Software Engineer"
+    extracted_skills: list[_ExtractedSkill] = field(
+        default_factory=lambda: [
+            _ExtractedSkill("Python", "Hard"),
+            _ExtractedSkill("Docker", "Hard", is_required=False),
+        ]
+    )
+    culture_text: str | None = "Collaborative team"
+    years_experience_min: int | None = 3
+    years_experience_max: int | None = 7
+    work_model: str | None = "Hybrid"
+    location: str | None = "Phoenix, AZ"
+
+
+def _changed(before: dict[str, str], after: dict[str, str]) -> set[str]:
+    return {name for name in before if before[name] != after[name]}
+
+
+def _details(fingerprints: dict[str, str], value: float = 50.0) -> dict[str, object]:
+    fit_names = {
+        "hard_skills",
+        "soft_skills",
+        "experience_level",
+        "role_title",
+        "location_logistics",
+    }
+    return {
+        "fit": {"components": {n: value for n in fingerprints if n in fit_names}},
+        "stretch": {
+            "components": {n: value for n in fingerprints if n not in fit_names}
+        },
+        "fingerprints": dict(fingerprints),
+    }
+
+
+class TestComputeComponentFingerprints:
+    """Tests for compute_component_fingerprints()."""
+
+    def test_covers_every_fit_and_stretch_component(self) -> None:
+        """One fingerprint per Fit and Stretch component."""
+        fingerprints = compute_component_fingerprints(
+            _Persona(), _Job(), embedding_model=_MODEL
+        )
+
+        assert set(fingerprints) == {
+            "hard_skills",
+            "soft_skills",
+            "experience_level",
+            "role_title",
+            "location_logistics",
+            "target_role",
+            "target_skills",
+            "growth_trajectory",
+        }
+
+    def test_commutable_city_edit_only_changes_logistics(self) -> None:
+        """Editing a commutable city touches no embedding-based component."""
+        before = compute_component_fingerprints(
+            _Persona(), _Job(), embedding_model=_MODEL
+        )
+        after = compute_component_fingerprints(
+            _Persona(commutable_cities=["Phoenix", "Tempe"]),
+            _Job(),
+            embedding_model=_MODEL,
+        )
+
+        assert _changed(before, after) == {"location_logistics"}
+
+    def test_soft_skill_edit_changes_skill_components(self) -> None:
+        """Adding a soft skill changes hard_skills and soft_skills inputs."""
+        persona = _Persona()
+        before = compute_component_fingerprints(persona, _Job(), embedding_model=_MODEL)
+        persona.skills.append(_Skill("Mentoring", "Soft"))
+        after = compute_component_fingerprints(persona, _Job(), embedding_model=_MODEL)
+
+        assert _changed(before, after) == {"hard_skills", "soft_skills"}
+
+    def test_embedding_model_change_invalidates_embedding_components(
+        self,
+    ) -> None:
+        """A new embedding model recomputes only embedding-based components."""
+        before = compute_component_fingerprints(
+            _Persona(), _Job(), embedding_model=_MODEL
+        )
+        after = compute_component_fingerprints(
+            _Persona(), _Job(), embedding_model="other-model"
+        )
+
+        assert _changed(before, after) == {"soft_skills", "role_title", "target_role"}
+
+    def test_skill_order_does_not_change_fingerprints(self) -> None:
+        """Job skill load order does not cause spurious recomputes."""
+        job = _Job()
+        before = compute_component_fingerprints(_Persona(), job, embedding_model=_MODEL)
+        job.extracted_skills.reverse()
+        after = compute_component_fingerprints(_Persona(), job, embedding_model=_MODEL)
+
+        assert before == after
+
+
+class TestFindReusableComponents:
+    """Tests for find_reusable_components()."""
+
+    def test_returns_components_whose_fingerprints_match(self) -> None:
+        """Only components with unchanged fingerprints are reused."""
+        before = compute_component_fingerprints(
+            _Persona(), _Job(), embedding_model=_MODEL
+        )
+        after = compute_component_fingerprints(
+            _Persona(commutable_cities=["Tempe"]), _Job(), embedding_model=_MODEL
+        )
+
+        reusable = find_reusable_components(_details(before, 42.0), after)
+
+        assert set(reusable) == set(before) - {"location_logistics"}
+        assert all(value == 42.0 for value in reusable.values())
+
+    def test_no_previous_details_reuses_nothing(self) -> None:
+        """Unscored jobs recompute everything."""
+        fingerprints = compute_component_fingerprints(
+            _Persona(), _Job(), embedding_model=_MODEL
+        )
+
+        assert find_reusable_components(None, fingerprints) == {}
+
+    def test_details_without_fingerprints_reuse_nothing(self) -> None:
+        """score_details written before fingerprinting recompute everything."""
+        fingerprints = compute_component_fingerprints(
+            _Persona(), _Job(), embedding_model=_MODEL
+        )
+        details = _details(fingerprints)
+        del details["fingerprints"]
+
+        assert find_reusable_components(details, fingerprints) == {}
@@ -209,6 +209,22 @@ class TestCorsWildcardValidation:
         assert s.allowed_origins == ["http://localhost:3000"]
 
 
+class TestSourceRequestProcessesValidation:
+    """REQ-034 §5.3: Source budgets are split across request processes."""
+
+    def test_rejects_zero_processes(self):
+        """At least one process must share each source budget."""
+        with pytest.raises(ValidationError) as exc_info:
+            Settings(source_request_processes=0)
+        assert "SOURCE_REQUEST_PROCESSES must be at least 1" in str(exc_info.value)
+
+    def test_defaults_to_one_process(self, monkeypatch: pytest.MonkeyPatch):
+        """A single-process deployment keeps the full budget."""
+        monkeypatch.delenv("SOURCE_REQUEST_PROCESSES", raising=False)
+        s = Settings(_env_file=None)  # pyright: ignore[reportCallIssue]
+        assert s.source_request_processes == 1
+
+
 class TestAuthConfigEnvLoading:
     """REQ-013 §11: Auth settings loaded from environment variables."""
 
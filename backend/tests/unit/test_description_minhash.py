@@ -0,0 +1,106 @@
+"""Tests for description MinHash signatures and LSH band keys.
+
+REQ-015 §6 dedup step 3: Near-duplicate candidate retrieval for repost
+detection.
+"""
+
+import pytest
+
+from app.services.discovery.description_minhash import (
+    MIN_JACCARD_ESTIMATE,
+    compute_description_minhash,
+    description_minhash_fields,
+    estimate_jaccard,
+)
+
+_DESCRIPTION = (
+    "We are hiring a senior backend engineer to design and operate "
+    "high-throughput APIs in Python. You will own services end to end, "
+    "mentor engineers, and work closely with product and data teams on "
+    "reliability, observability, and cost. Experience with PostgreSQL, "
+    "Kubernetes, and event-driven systems is a strong plus."
+)
+_UNRELATED = (
+    "Our bakery is looking for an early-morning pastry chef who loves "
+    "laminated doughs, seasonal fruit tarts, and training apprentices in "
+    "classic French technique across two busy neighborhood shops."
+)
+
+
+def _minhash(description: str):
+    result = compute_description_minhash(description)
+    assert result is not None
+    return result
+
+
+class TestComputeDescriptionMinHash:
+    """Tests for compute_description_minhash()."""
+
+    def test_signature_and_band_sizes(self) -> None:
+        result = _minhash(_DESCRIPTION)
+
+        assert len(result.signature) == 128 * 4
+        assert len(result.band_keys) == 64
+
+    def test_deterministic(self) -> None:
+        assert _minhash(_DESCRIPTION) == _minhash(_DESCRIPTION)
+
+    def test_case_and_punctuation_insensitive(self) -> None:
+        """Shingles are built from lowercased words only."""
+        noisy = _DESCRIPTION.upper().replace(",", " ;")
+
+        assert _minhash(noisy) == _minhash(_DESCRIPTION)
+
+    def test_no_words_returns_none(self) -> None:
+        assert compute_description_minhash("  ... !!") is None
+
+    def test_single_word_description(self) -> None:
+        assert compute_description_minhash("Engineer") is not None
+
+
+class TestEstimateJaccard:
+    """Tests for estimate_jaccard() and band overlap."""
+
+    def test_identical_descriptions(self) -> None:
+        result = _minhash(_DESCRIPTION)
+
+        assert estimate_jaccard(result.signature, result.signature) == 1.0
+
+    def test_minor_edit_stays_above_prefilter_and_shares_bands(self) -> None:
+        original = _minhash(_DESCRIPTION)
+        edited = _minhash(_DESCRIPTION.replace("Python", "Go"))
+
+        assert estimate_jaccard(original.signature, edited.signature) > 0.7
+        assert set(original.band_keys) & set(edited.band_keys)
+
+    def test_unrelated_descriptions_fall_below_prefilter(self) -> None:
+        original = _minhash(_DESCRIPTION)
+        other = _minhash(_UNRELATED)
+
+        assert (
+            estimate_jaccard(original.signature, other.signature) < MIN_JACCARD_ESTIMATE
+        )
+
+    def test_rejects_mismatched_lengths(self) -> None:
+        result = _minhash(_DESCRIPTION)
+
+        with pytest.raises(ValueError, match="different lengths"):
+            estimate_jaccard(result.signature, result.signature[:-4])
+
+
+class TestDescriptionMinHashFields:
+    """Tests for description_minhash_fields()."""
+
+    def test_returns_column_values(self) -> None:
+        result = _minhash(_DESCRIPTION)
+
+        assert description_minhash_fields(_DESCRIPTION) == {
+            "description_minhash": result.signature,
+            "description_lsh_bands": result.band_keys,
+        }
+
+    def test_empty_description_returns_nulls(self) -> None:
+        assert description_minhash_fields("") == {
+            "description_minhash": None,
+            "description_lsh_bands": None,
+        }
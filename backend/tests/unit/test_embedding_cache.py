@@ -8,7 +8,11 @@ from datetime import UTC, datetime
 
 import pytest
 
-from app.services.embedding.cache import PersonaEmbeddingCache
+from app.services.embedding.cache import (
+    PersonaEmbeddingCache,
+    get_persona_embedding_cache,
+    reset_persona_embedding_cache,
+)
 from app.services.embedding.persona_generator import (
     PersonaEmbeddingData,
     PersonaEmbeddingsResult,
@@ -552,3 +556,22 @@ class TestPersonaEmbeddingCacheLRU:
         assert cache.stats().size == 2
         assert cache.get(_USER_ID, persona_id_1) is not None
         assert cache.get(_USER_ID, persona_id_2) is not None
+
+
+# =============================================================================
+# Test: Process-wide Singleton
+# =============================================================================
+
+
+class TestPersonaEmbeddingCacheSingleton:
+    """Test the shared cache used by the scoring pipeline."""
+
+    def test_returns_same_instance_until_reset(self):
+        """get_persona_embedding_cache is stable until reset."""
+        reset_persona_embedding_cache()
+        first = get_persona_embedding_cache()
+        assert get_persona_embedding_cache() is first
+
+        reset_persona_embedding_cache()
+        assert get_persona_embedding_cache() is not first
+        reset_persona_embedding_cache()
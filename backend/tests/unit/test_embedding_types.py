@@ -44,6 +44,7 @@ class TestGetJobEmbeddingTypes:
 
         assert JobEmbeddingType.REQUIREMENTS in types
         assert JobEmbeddingType.CULTURE in types
+        assert JobEmbeddingType.TITLE in types
         assert PersonaEmbeddingType.HARD_SKILLS not in types
         assert PersonaEmbeddingType.SOFT_SKILLS not in types
         assert PersonaEmbeddingType.LOGISTICS not in types
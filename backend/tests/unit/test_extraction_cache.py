@@ -0,0 +1,134 @@
+"""Tests for the shared extraction cache.
+
+REQ-007 §6.4, REQ-016 §6.3: Extraction results are keyed by
+(description_hash, prompt_version, model_name) and shared across users.
+"""
+
+import hashlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.services.discovery.extraction_cache import (
+    ExtractionCache,
+    compute_description_hash,
+)
+
+_MODULE = "app.services.discovery.extraction_cache"
+_PATCH_GET = f"{_MODULE}.ExtractionCacheRepository.get_many"
+_PATCH_INSERT = f"{_MODULE}.ExtractionCacheRepository.insert_many"
+
+_PROMPT = "skills_culture:1"
+_MODEL = "mock-model"
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    """Session whose begin_nested() is an async context manager."""
+    db = MagicMock()
+    db.begin_nested = MagicMock(return_value=AsyncMock())
+    return db
+
+
+class TestComputeDescriptionHash:
+    """Tests for the cache key digest."""
+
+    def test_matches_job_posting_description_hash(self) -> None:
+        """Same SHA-256 hex digest the pool stores on job_postings."""
+        text = "Build APIs with Python"
+        assert (
+            compute_description_hash(text) == hashlib.sha256(text.encode()).hexdigest()
+        )
+
+
+class TestGetMany:
+    """Tests for ExtractionCache.get_many."""
+
+    @pytest.mark.asyncio
+    async def test_looks_up_unique_non_empty_hashes(self, mock_db: MagicMock) -> None:
+        """Duplicates and empty descriptions are not sent to the database."""
+        stored = {compute_description_hash("a"): {"required_skills": ["Go"]}}
+
+        with patch(_PATCH_GET, new_callable=AsyncMock, return_value=stored) as get:
+            result = await ExtractionCache(mock_db).get_many(
+                ["a", "a", "b", ""], prompt_version=_PROMPT, model_name=_MODEL
+            )
+
+        assert result == stored
+        hashes = get.call_args.args[1]
+        assert hashes == {compute_description_hash("a"), compute_description_hash("b")}
+        assert get.call_args.kwargs == {"prompt_version": _PROMPT, "model_name": _MODEL}
+
+    @pytest.mark.asyncio
+    async def test_no_descriptions_skips_query(self, mock_db: MagicMock) -> None:
+        """Nothing to look up means no database round trip."""
+        with patch(_PATCH_GET, new_callable=AsyncMock) as get:
+            result = await ExtractionCache(mock_db).get_many(
+                [""], prompt_version=_PROMPT, model_name=_MODEL
+            )
+
+        assert result == {}
+        get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_database_error_degrades_to_misses(self, mock_db: MagicMock) -> None:
+        """A failed lookup returns no hits instead of raising."""
+        with patch(
+            _PATCH_GET,
+            new_callable=AsyncMock,
+            side_effect=OperationalError("SELECT", {}, Exception("down")),
+        ):
+            result = await ExtractionCache(mock_db).get_many(
+                ["a"], prompt_version=_PROMPT, model_name=_MODEL
+            )
+
+        assert result == {}
+
+
+class TestPutMany:
+    """Tests for ExtractionCache.put_many."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_one_row_per_result(self, mock_db: MagicMock) -> None:
+        """Rows carry the key columns and the result."""
+        key = compute_description_hash("a")
+
+        with patch(_PATCH_INSERT, new_callable=AsyncMock) as insert:
+            await ExtractionCache(mock_db).put_many(
+                {key: {"required_skills": ["Go"]}},
+                prompt_version=_PROMPT,
+                model_name=_MODEL,
+            )
+
+        insert.assert_awaited_once()
+        assert insert.call_args.args[1] == [
+            {
+                "description_hash": key,
+                "prompt_version": _PROMPT,
+                "model_name": _MODEL,
+                "result": {"required_skills": ["Go"]},
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_database_error_is_swallowed(self, mock_db: MagicMock) -> None:
+        """A failed write never fails the caller."""
+        with patch(
+            _PATCH_INSERT,
+            new_callable=AsyncMock,
+            side_effect=OperationalError("INSERT", {}, Exception("down")),
+        ):
+            await ExtractionCache(mock_db).put_many(
+                {"h": {}}, prompt_version=_PROMPT, model_name=_MODEL
+            )
+
+    @pytest.mark.asyncio
+    async def test_empty_results_skip_insert(self, mock_db: MagicMock) -> None:
+        """No new results means no database round trip."""
+        with patch(_PATCH_INSERT, new_callable=AsyncMock) as insert:
+            await ExtractionCache(mock_db).put_many(
+                {}, prompt_version=_PROMPT, model_name=_MODEL
+            )
+
+        insert.assert_not_awaited()
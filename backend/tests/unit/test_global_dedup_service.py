@@ -4,6 +4,7 @@ REQ-015 §6: Global deduplication pipeline.
 4-step dedup: (1) source_id + external_id → UPDATE, (2) description_hash → ADD to also_found_on,
 (3) company + title + similarity → LINK as repost, (4) no match → CREATE.
 After dedup: create persona_jobs link. Race condition: ON CONFLICT recovery.
+Batch pipeline: deduplicate_and_save_batch matches the per-job outcomes.
 """
 
 import hashlib
@@ -11,6 +12,7 @@ import uuid
 from datetime import date
 from unittest.mock import AsyncMock, patch
 
+import pytest
 import pytest_asyncio
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,7 +21,11 @@ from app.models.job_posting import JobPosting
 from app.models.job_source import JobSource
 from app.models.persona import Persona
 from app.models.user import User
-from app.services.discovery.global_dedup_service import deduplicate_and_save
+from app.services.discovery.description_minhash import description_minhash_fields
+from app.services.discovery.global_dedup_service import (
+    deduplicate_and_save,
+    deduplicate_and_save_batch,
+)
 
 _TODAY = date.today()
 _DESC_A = "Build great software at Acme Corp using Python and FastAPI"
@@ -439,6 +445,65 @@ class TestStep3SimilarityMatch:
         )
         assert outcome.persona_job.job_posting_id == outcome.job_posting.id
 
+    async def test_repost_found_through_stored_minhash(
+        self,
+        db_session: AsyncSession,
+        source_linkedin: JobSource,
+        source_indeed: JobSource,
+        persona_a: Persona,
+        user_a: User,
+    ) -> None:
+        """Jobs saved by the pipeline carry MinHash bands used for matching."""
+        first = await deduplicate_and_save(
+            db_session,
+            job_data=_make_job_data(source_linkedin.id),
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+        )
+        assert first.job_posting.description_minhash is not None
+        assert first.job_posting.description_lsh_bands
+
+        similar_desc = _DESC_A.replace("FastAPI", "Django")
+        outcome = await deduplicate_and_save(
+            db_session,
+            job_data=_make_job_data(
+                source_indeed.id,
+                description=similar_desc,
+                description_hash=hashlib.sha256(similar_desc.encode()).hexdigest(),
+            ),
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+        )
+        assert outcome.action == "create_linked_repost"
+        assert outcome.matched_job_id == first.job_posting.id
+
+    async def test_candidate_with_dissimilar_minhash_is_skipped(
+        self,
+        db_session: AsyncSession,
+        existing_job: JobPosting,
+        source_indeed: JobSource,
+        persona_a: Persona,
+        user_a: User,
+    ) -> None:
+        """A stored signature for a different text excludes the candidate."""
+        other_fields = description_minhash_fields(_DESC_B)
+        existing_job.description_minhash = other_fields["description_minhash"]
+        existing_job.description_lsh_bands = other_fields["description_lsh_bands"]
+        await db_session.flush()
+
+        similar_desc = _DESC_A + " plus minor additions"
+        outcome = await deduplicate_and_save(
+            db_session,
+            job_data=_make_job_data(
+                source_indeed.id,
+                description=similar_desc,
+                description_hash=hashlib.sha256(similar_desc.encode()).hexdigest(),
+            ),
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+        )
+        assert outcome.action == "create_new"
+
 
 # ---------------------------------------------------------------------------
 # Step 4: No match → CREATE new
@@ -824,3 +889,155 @@ class TestSearchBucketPropagation:
             user_id=user_a.id,
         )
         assert outcome.persona_job.search_bucket is None
+
+
+# ---------------------------------------------------------------------------
+# Batch pipeline
+# ---------------------------------------------------------------------------
+
+
+class TestDeduplicateAndSaveBatch:
+    """deduplicate_and_save_batch: all four steps for a whole batch."""
+
+    async def test_resolves_each_step_in_input_order(
+        self,
+        db_session: AsyncSession,
+        existing_job: JobPosting,
+        source_linkedin: JobSource,
+        source_indeed: JobSource,
+        persona_a: Persona,
+        user_a: User,
+    ) -> None:
+        """Source match, hash match, repost, and new job in one batch."""
+        repost_desc = _DESC_A.replace("FastAPI", "Django")
+        jobs_data = [
+            _make_job_data(
+                source_linkedin.id,
+                external_id=_EXT_ID_LI,
+                job_title="Senior Software Engineer",
+            ),
+            _make_job_data(
+                source_indeed.id,
+                external_id="IND-REPOST",
+                description=repost_desc,
+                description_hash=hashlib.sha256(repost_desc.encode()).hexdigest(),
+            ),
+            _make_job_data(
+                source_indeed.id,
+                external_id=_EXT_ID_IND,
+                job_title="Data Scientist",
+                company_name="DataCo",
+                description=_DESC_B,
+                description_hash=_HASH_B,
+            ),
+        ]
+
+        outcomes = await deduplicate_and_save_batch(
+            db_session,
+            jobs_data=jobs_data,
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+        )
+
+        assert [o.action for o in outcomes] == [
+            "update_existing",
+            "create_linked_repost",
+            "create_new",
+        ]
+        assert outcomes[0].job_posting.id == existing_job.id
+        assert outcomes[0].job_posting.job_title == "Senior Software Engineer"
+        assert outcomes[0].job_posting.last_verified_at is not None
+        assert outcomes[1].matched_job_id == existing_job.id
+        assert outcomes[1].job_posting.repost_count == 1
+        assert outcomes[1].job_posting.previous_posting_ids == [str(existing_job.id)]
+        assert outcomes[2].job_posting.description_minhash is not None
+        assert {o.persona_job.persona_id for o in outcomes} == {persona_a.id}
+        assert len({o.persona_job.id for o in outcomes}) == 3
+
+    async def test_hash_match_adds_to_also_found_on(
+        self,
+        db_session: AsyncSession,
+        existing_job: JobPosting,
+        source_indeed: JobSource,
+        persona_a: Persona,
+        user_a: User,
+    ) -> None:
+        """Step 2 in a batch records the new source on the existing job."""
+        outcomes = await deduplicate_and_save_batch(
+            db_session,
+            jobs_data=[_make_job_data(source_indeed.id, external_id=_EXT_ID_IND)],
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+        )
+
+        assert outcomes[0].action == "add_to_also_found_on"
+        assert outcomes[0].job_posting.id == existing_job.id
+        sources = outcomes[0].job_posting.also_found_on["sources"]
+        assert [s["source_id"] for s in sources] == [str(source_indeed.id)]
+
+    async def test_in_batch_duplicates_match_earlier_job(
+        self,
+        db_session: AsyncSession,
+        source_linkedin: JobSource,
+        source_indeed: JobSource,
+        persona_a: Persona,
+        user_a: User,
+    ) -> None:
+        """A job repeated within the batch links to the posting it created."""
+        jobs_data = [
+            _make_job_data(source_linkedin.id, external_id=_EXT_ID_LI),
+            _make_job_data(source_indeed.id, external_id=_EXT_ID_IND),
+        ]
+
+        outcomes = await deduplicate_and_save_batch(
+            db_session,
+            jobs_data=jobs_data,
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+        )
+
+        assert [o.action for o in outcomes] == ["create_new", "add_to_also_found_on"]
+        assert outcomes[1].job_posting.id == outcomes[0].job_posting.id
+        assert outcomes[1].persona_job.id == outcomes[0].persona_job.id
+
+    async def test_keeps_existing_link(
+        self,
+        db_session: AsyncSession,
+        existing_job: JobPosting,
+        source_linkedin: JobSource,
+        persona_a: Persona,
+        user_a: User,
+    ) -> None:
+        """An already-linked job returns the existing persona_jobs row."""
+        first = await deduplicate_and_save(
+            db_session,
+            job_data=_make_job_data(source_linkedin.id, external_id=_EXT_ID_LI),
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+        )
+
+        outcomes = await deduplicate_and_save_batch(
+            db_session,
+            jobs_data=[_make_job_data(source_linkedin.id, external_id=_EXT_ID_LI)],
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+        )
+
+        assert outcomes[0].job_posting.id == existing_job.id
+        assert outcomes[0].persona_job.id == first.persona_job.id
+
+    async def test_rejects_unowned_persona(
+        self,
+        db_session: AsyncSession,
+        source_linkedin: JobSource,
+        persona_b: Persona,
+        user_a: User,
+    ) -> None:
+        """Linking to another user's persona raises ValueError."""
+        with pytest.raises(ValueError, match="not owned"):
+            await deduplicate_and_save_batch(
+                db_session,
+                jobs_data=[_make_job_data(source_linkedin.id, external_id="X-1")],
+                persona_id=persona_b.id,
+                user_id=user_a.id,
+            )
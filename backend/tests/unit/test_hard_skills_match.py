@@ -6,14 +6,18 @@ Tests cover:
 - Skill normalization (synonyms, case, punctuation)
 - Proficiency weighting (user experience vs. job requirements)
 - Hard skills score calculation (required vs. nice-to-have)
+- Compiled skill index path used by batch scoring
 """
 
 import pytest
 
 from app.services.scoring.hard_skills_match import (
     calculate_hard_skills_score,
+    compile_job_skills,
+    compile_persona_skill_index,
     get_proficiency_weight,
     normalize_skill,
+    score_compiled_hard_skills,
 )
 
 # =============================================================================
@@ -425,3 +429,99 @@ class TestCalculateHardSkillsScore:
 
         with pytest.raises(ValueError, match="exceed maximum size"):
             calculate_hard_skills_score(persona_skills, oversized_job)  # pyright: ignore[reportArgumentType]
+
+
+# =============================================================================
+# Compiled Skill Index Tests
+# =============================================================================
+
+_PERSONA_SKILLS = [
+    {"skill_name": "Python", "skill_type": "Hard", "proficiency": "Expert"},
+    {"skill_name": "JS", "skill_type": "Hard", "proficiency": "Familiar"},
+    {"skill_name": "k8s", "skill_type": "Hard", "proficiency": "Learning"},
+    {"skill_name": "Leadership", "skill_type": "Soft", "proficiency": "Expert"},
+]
+
+_JOB_SKILLS = [
+    {
+        "skill_name": "python",
+        "skill_type": "Hard",
+        "is_required": True,
+        "years_requested": 5,
+    },
+    {
+        "skill_name": "JavaScript",
+        "skill_type": "Hard",
+        "is_required": True,
+        "years_requested": 4,
+    },
+    {
+        "skill_name": "Go",
+        "skill_type": "Hard",
+        "is_required": True,
+        "years_requested": None,
+    },
+    {
+        "skill_name": "Kubernetes",
+        "skill_type": "Hard",
+        "is_required": False,
+        "years_requested": 2,
+    },
+    {
+        "skill_name": "Leadership",
+        "skill_type": "Soft",
+        "is_required": True,
+        "years_requested": None,
+    },
+]
+
+
+class TestCompiledHardSkills:
+    """Tests for the compiled persona index / job skills scoring path."""
+
+    def test_index_keeps_only_hard_skills_by_normalized_name(self) -> None:
+        """Index maps normalized hard skill names to proficiency years."""
+        index = compile_persona_skill_index(_PERSONA_SKILLS)  # pyright: ignore[reportArgumentType]
+
+        assert index.years_by_skill == {
+            "python": 6.0,
+            "javascript": 1.5,
+            "kubernetes": 0.5,
+        }
+
+    def test_job_skills_split_and_normalized(self) -> None:
+        """Job hard skills are split into required and nice-to-have."""
+        compiled = compile_job_skills(_JOB_SKILLS)  # pyright: ignore[reportArgumentType]
+
+        assert compiled.required == (
+            ("python", 5),
+            ("javascript", 4),
+            ("go", None),
+        )
+        assert compiled.nice_to_have == (("kubernetes", 2),)
+
+    def test_matches_uncompiled_score(self) -> None:
+        """Compiled scoring gives the same result as the direct calculation."""
+        index = compile_persona_skill_index(_PERSONA_SKILLS)  # pyright: ignore[reportArgumentType]
+        compiled = compile_job_skills(_JOB_SKILLS)  # pyright: ignore[reportArgumentType]
+
+        assert score_compiled_hard_skills(index, compiled) == pytest.approx(
+            calculate_hard_skills_score(_PERSONA_SKILLS, _JOB_SKILLS)  # pyright: ignore[reportArgumentType]
+        )
+
+    def test_no_hard_job_skills_returns_neutral(self) -> None:
+        """A job with only soft skills scores neutral."""
+        index = compile_persona_skill_index(_PERSONA_SKILLS)  # pyright: ignore[reportArgumentType]
+        compiled = compile_job_skills(_JOB_SKILLS[-1:])  # pyright: ignore[reportArgumentType]
+
+        assert score_compiled_hard_skills(index, compiled) == 70.0
+
+    def test_rejects_oversized_index_input(self) -> None:
+        """Compiling more than the maximum persona skills raises."""
+        oversized = [
+            {"skill_name": f"Skill{i}", "skill_type": "Hard", "proficiency": "Expert"}
+            for i in range(501)
+        ]
+
+        with pytest.raises(ValueError, match="exceed maximum size"):
+            compile_persona_skill_index(oversized)  # pyright: ignore[reportArgumentType]
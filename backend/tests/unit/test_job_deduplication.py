@@ -6,6 +6,7 @@ Tests verify:
 - is_duplicate() return values: update_existing, add_to_also_found_on,
   create_linked_repost, create_new
 - is_similar_title() per REQ-003 §8.1 (Levenshtein, contains, word overlap)
+- Bounded Levenshtein distance used by is_similar_title()
 - description_similarity() for >85% threshold
 - also_found_on JSONB structure per REQ-003 §9.2
 - Priority rules for merging data per REQ-003 §9.3
@@ -16,6 +17,7 @@ from datetime import UTC, datetime
 
 from app.services.discovery.job_deduplication import (
     PriorApplicationContext,
+    _bounded_levenshtein_distance,
     calculate_description_similarity,
     generate_repost_context_message,
     is_duplicate,
@@ -118,6 +120,36 @@ class TestIsSimilarTitle:
         assert is_similar_title("  Scrum  Master  ", _TITLE_SM) is True
 
 
+class TestBoundedLevenshteinDistance:
+    """Tests for _bounded_levenshtein_distance()."""
+
+    def test_exact_distance_within_bound(self) -> None:
+        """Distances up to the bound are exact."""
+        assert _bounded_levenshtein_distance("kitten", "sitting", 3) == 3
+        assert _bounded_levenshtein_distance("scrum master", "scrum masters", 3) == 1
+        assert _bounded_levenshtein_distance("same", "same", 3) == 0
+
+    def test_distance_above_bound_is_capped(self) -> None:
+        """Distances above the bound return bound + 1."""
+        assert _bounded_levenshtein_distance("qa engineer", "devops engineer", 3) == 4
+        assert _bounded_levenshtein_distance("kitten", "sitting", 2) == 3
+
+    def test_length_difference_short_circuits(self) -> None:
+        """A length gap larger than the bound is rejected without the DP."""
+        assert _bounded_levenshtein_distance("engineer", "engineer iii ii", 3) == 4
+
+    def test_empty_strings(self) -> None:
+        """Distance to an empty string is the other string's length."""
+        assert _bounded_levenshtein_distance("", "abc", 3) == 3
+        assert _bounded_levenshtein_distance("", "", 3) == 0
+
+    def test_symmetric(self) -> None:
+        """Argument order does not change the result."""
+        assert _bounded_levenshtein_distance(
+            "scrum master ii", "scrum master 2", 3
+        ) == _bounded_levenshtein_distance("scrum master 2", "scrum master ii", 3)
+
+
 # =============================================================================
 # Description Similarity Tests
 # =============================================================================
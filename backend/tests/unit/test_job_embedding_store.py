@@ -0,0 +1,146 @@
+"""Tests for the job embedding store.
+
+REQ-008 §6.5-6.6, §10.1: Scoring reuses job embeddings persisted in
+job_embeddings and only embeds missing or stale texts.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.services.embedding.job_embedding_store import JobEmbeddingStore
+from app.services.embedding.job_generator import get_neutral_embedding
+from app.services.embedding.storage import compute_source_hash
+
+_MODULE = "app.services.embedding.job_embedding_store"
+_PATCH_GET = f"{_MODULE}.JobEmbeddingRepository.get_for_jobs"
+_PATCH_UPSERT = f"{_MODULE}.JobEmbeddingRepository.upsert_many"
+
+_MODEL = "text-embedding-004"
+_DIMS = 4
+
+
+def _make_job(
+    *,
+    job_title: str = "Backend Engineer",
+    culture_text: str | None = "Remote-first team",
+) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), job_title=job_title, culture_text=culture_text)
+
+
+def _make_row(job_id: UUID, embedding_type: str, text: str, value: float) -> MagicMock:
+    row = MagicMock()
+    row.job_posting_id = job_id
+    row.embedding_type = embedding_type
+    row.source_hash = compute_source_hash(text)
+    row.vector = [value] * _DIMS
+    return row
+
+
+def _make_provider() -> MagicMock:
+    provider = MagicMock()
+    provider.config.embedding_model = _MODEL
+
+    async def _embed(texts: list[str]) -> SimpleNamespace:
+        return SimpleNamespace(vectors=[[0.5] * _DIMS for _ in texts])
+
+    provider.embed = AsyncMock(side_effect=_embed)
+    return provider
+
+
+class TestJobEmbeddingStore:
+    """Tests for JobEmbeddingStore.get_scoring_embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_rows_are_reused_without_provider_call(self) -> None:
+        """Rows whose source_hash matches are returned as-is."""
+        job = _make_job()
+        rows = [
+            _make_row(job.id, "title", "Backend Engineer", 0.1),
+            _make_row(job.id, "culture", "Remote-first team", 0.2),
+        ]
+        provider = _make_provider()
+
+        with (
+            patch(_PATCH_GET, return_value=rows) as mock_get,
+            patch(_PATCH_UPSERT) as mock_upsert,
+        ):
+            store = JobEmbeddingStore(AsyncMock(), provider)
+            result = await store.get_scoring_embeddings([job])
+
+        assert result[job.id].title == [0.1] * _DIMS
+        assert result[job.id].culture == [0.2] * _DIMS
+        provider.embed.assert_not_awaited()
+        mock_upsert.assert_not_awaited()
+        assert mock_get.call_args.kwargs["model_name"] == _MODEL
+
+    @pytest.mark.asyncio
+    async def test_missing_and_stale_rows_are_embedded_and_stored(self) -> None:
+        """Missing or stale vectors cost one batched call per type and are upserted."""
+        stale_job = _make_job(job_title="Data Engineer")
+        new_job = _make_job(job_title="ML Engineer", culture_text="Research culture")
+        rows = [
+            _make_row(stale_job.id, "title", "Old Title", 0.1),
+            _make_row(stale_job.id, "culture", "Remote-first team", 0.2),
+        ]
+        provider = _make_provider()
+
+        with (
+            patch(_PATCH_GET, return_value=rows),
+            patch(_PATCH_UPSERT) as mock_upsert,
+        ):
+            store = JobEmbeddingStore(AsyncMock(), provider)
+            result = await store.get_scoring_embeddings([stale_job, new_job])
+
+        assert provider.embed.await_count == 2
+        assert provider.embed.await_args_list[0].args[0] == [
+            "Data Engineer",
+            "ML Engineer",
+        ]
+        assert provider.embed.await_args_list[1].args[0] == ["Research culture"]
+        assert result[stale_job.id].title == [0.5] * _DIMS
+        assert result[stale_job.id].culture == [0.2] * _DIMS
+
+        upserted = mock_upsert.call_args.args[1]
+        assert {(r["job_posting_id"], r["embedding_type"]) for r in upserted} == {
+            (stale_job.id, "title"),
+            (new_job.id, "title"),
+            (new_job.id, "culture"),
+        }
+        assert all(r["model_name"] == _MODEL for r in upserted)
+
+    @pytest.mark.asyncio
+    async def test_missing_texts_use_neutral_vectors(self) -> None:
+        """Jobs without culture text get the neutral embedding and no stored row."""
+        job = _make_job(job_title="  ", culture_text=None)
+        provider = _make_provider()
+
+        with patch(_PATCH_GET, return_value=[]), patch(_PATCH_UPSERT) as mock_upsert:
+            store = JobEmbeddingStore(AsyncMock(), provider)
+            result = await store.get_scoring_embeddings([job])
+
+        assert result[job.id].title is None
+        assert result[job.id].culture == get_neutral_embedding()
+        provider.embed.assert_not_awaited()
+        mock_upsert.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_response_count_mismatch_raises(self) -> None:
+        """Provider returning the wrong number of vectors is rejected."""
+        provider = _make_provider()
+        provider.embed = AsyncMock(return_value=SimpleNamespace(vectors=[]))
+
+        with patch(_PATCH_GET, return_value=[]), patch(_PATCH_UPSERT):
+            store = JobEmbeddingStore(AsyncMock(), provider)
+            with pytest.raises(ValueError, match="count mismatch"):
+                await store.get_scoring_embeddings([_make_job()])
+
+    @pytest.mark.asyncio
+    async def test_empty_jobs_returns_empty(self) -> None:
+        """No jobs means no queries."""
+        with patch(_PATCH_GET) as mock_get:
+            store = JobEmbeddingStore(AsyncMock(), _make_provider())
+            assert await store.get_scoring_embeddings([]) == {}
+        mock_get.assert_not_awaited()
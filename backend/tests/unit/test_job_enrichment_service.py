@@ -3,7 +3,9 @@
 REQ-016 §6.3: Enriches raw job postings with extracted skills and ghost detection.
 """
 
+import asyncio
 import json
+import re
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,11 +13,18 @@ import pytest
 
 from app.providers.errors import ProviderError
 from app.providers.llm.base import LLMProvider
+from app.services.discovery.extraction_cache import compute_description_hash
 from app.services.discovery.job_enrichment_service import JobEnrichmentService
 
 _GHOST_SCORE_MOCK_TARGET = (
     "app.services.discovery.job_enrichment_service.calculate_ghost_score"
 )
+_MAX_CONCURRENT_TARGET = (
+    "app.services.discovery.job_enrichment_service._MAX_CONCURRENT_JOBS"
+)
+_STEP_TIMEOUT_TARGET = (
+    "app.services.discovery.job_enrichment_service._STEP_TIMEOUT_SECONDS"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -278,6 +287,297 @@ class TestEnrichJobs:
         assert result[0]["required_skills"] == ["Go"]
 
 
+class TestEnrichJobsConcurrency:
+    """Tests for bounded concurrency and per-step timeouts."""
+
+    async def test_extraction_and_ghost_overlap(self, mock_ghost_signals: MagicMock):
+        """A job's extraction and ghost calls are in flight together."""
+        both_started = asyncio.Event()
+        started: list[str] = []
+
+        async def _step(name: str, value: Any) -> Any:
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return value
+
+        async def _extract(*_: Any) -> Any:
+            return await _step("extract", {"required_skills": ["Go"]})
+
+        async def _ghost(**_: Any) -> Any:
+            return await _step("ghost", mock_ghost_signals)
+
+        jobs: list[dict[str, Any]] = [{"external_id": "ext-001", "description": "x"}]
+        with (
+            patch.object(
+                JobEnrichmentService, "extract_skills_and_culture", side_effect=_extract
+            ),
+            patch(_GHOST_SCORE_MOCK_TARGET, side_effect=_ghost),
+        ):
+            result = await JobEnrichmentService.enrich_jobs(jobs)
+
+        assert sorted(started) == ["extract", "ghost"]
+        assert result[0]["required_skills"] == ["Go"]
+        assert result[0]["ghost_score"] == 25
+
+    async def test_preserves_order_and_bounds_in_flight_jobs(
+        self, mock_ghost_signals: MagicMock
+    ):
+        """Output follows input order; at most the limit run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def _extract(description: str, _provider: Any) -> dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later jobs finish first
+            await asyncio.sleep(0.001 * (20 - int(description)))
+            in_flight -= 1
+            return {"required_skills": [description]}
+
+        jobs = [{"external_id": str(i), "description": str(i)} for i in range(20)]
+        with (
+            patch(_MAX_CONCURRENT_TARGET, 3),
+            patch.object(
+                JobEnrichmentService, "extract_skills_and_culture", side_effect=_extract
+            ),
+            patch(
+                _GHOST_SCORE_MOCK_TARGET,
+                new_callable=AsyncMock,
+                return_value=mock_ghost_signals,
+            ),
+        ):
+            result = await JobEnrichmentService.enrich_jobs(jobs)
+
+        assert [job["required_skills"] for job in result] == [
+            [str(i)] for i in range(20)
+        ]
+        assert peak == 3
+
+    async def test_step_timeout_fails_forward(self, mock_ghost_signals: MagicMock):
+        """A hung extraction falls back to defaults; ghost score is kept."""
+
+        async def _hang(*_: Any) -> dict[str, Any]:
+            await asyncio.sleep(10)
+            return {}
+
+        jobs: list[dict[str, Any]] = [{"external_id": "ext-001", "description": "x"}]
+        with (
+            patch(_STEP_TIMEOUT_TARGET, 0.01),
+            patch.object(
+                JobEnrichmentService, "extract_skills_and_culture", side_effect=_hang
+            ),
+            patch(
+                _GHOST_SCORE_MOCK_TARGET,
+                new_callable=AsyncMock,
+                return_value=mock_ghost_signals,
+            ),
+        ):
+            result = await JobEnrichmentService.enrich_jobs(jobs)
+
+        assert result[0]["required_skills"] == []
+        assert result[0]["extraction_failed"] is True
+        assert result[0]["ghost_score"] == 25
+
+
+class TestEnrichJobsExtractionCache:
+    """Tests for the shared extraction cache in enrich_jobs."""
+
+    @staticmethod
+    def _provider(content: dict[str, Any]) -> AsyncMock:
+        response = MagicMock()
+        response.content = json.dumps(content)
+        provider = AsyncMock(spec=LLMProvider)
+        provider.complete = AsyncMock(return_value=response)
+        provider.resolve_model_for_task = AsyncMock(return_value="extraction-model")
+        return provider
+
+    @staticmethod
+    def _cache(stored: dict[str, Any] | None = None) -> MagicMock:
+        cache = MagicMock()
+        cache.get_many = AsyncMock(return_value=stored or {})
+        cache.put_many = AsyncMock()
+        return cache
+
+    async def test_cached_descriptions_skip_extraction(
+        self, sample_jobs: list[dict[str, Any]], mock_ghost_signals: MagicMock
+    ):
+        """Hits use the stored result; only misses call the LLM."""
+        hit_hash = compute_description_hash(sample_jobs[0]["description"])
+        cache = self._cache(
+            {
+                hit_hash: {
+                    "required_skills": ["Cached"],
+                    "preferred_skills": [],
+                    "culture_text": None,
+                }
+            }
+        )
+        provider = self._provider({"required_skills": ["PyTorch"]})
+
+        with patch(
+            _GHOST_SCORE_MOCK_TARGET,
+            new_callable=AsyncMock,
+            return_value=mock_ghost_signals,
+        ):
+            result = await JobEnrichmentService.enrich_jobs(
+                sample_jobs, provider=provider, cache=cache
+            )
+
+        assert result[0]["required_skills"] == ["Cached"]
+        assert result[1]["required_skills"] == ["PyTorch"]
+        provider.complete.assert_awaited_once()
+        cache.get_many.assert_awaited_once()
+        assert cache.get_many.call_args.kwargs["model_name"] == "extraction-model"
+
+        stored = cache.put_many.call_args.args[0]
+        assert set(stored) == {compute_description_hash(sample_jobs[1]["description"])}
+
+    async def test_empty_extractions_not_stored(
+        self, sample_jobs: list[dict[str, Any]], mock_ghost_signals: MagicMock
+    ):
+        """Empty results (indistinguishable from LLM failures) are not cached."""
+        cache = self._cache()
+        provider = self._provider({"required_skills": []})
+
+        with patch(
+            _GHOST_SCORE_MOCK_TARGET,
+            new_callable=AsyncMock,
+            return_value=mock_ghost_signals,
+        ):
+            await JobEnrichmentService.enrich_jobs(
+                sample_jobs, provider=provider, cache=cache
+            )
+
+        assert cache.put_many.call_args.args[0] == {}
+
+
+class TestEnrichJobsBatchedExtraction:
+    """Tests for packing several descriptions into one extraction call."""
+
+    @staticmethod
+    def _provider(*, malformed_index: int | None = None) -> tuple[AsyncMock, list[str]]:
+        """Provider that answers batch calls by id and single calls plainly."""
+        prompts: list[str] = []
+
+        async def _complete(messages: list[Any], **_: Any) -> MagicMock:
+            content = messages[1].content
+            prompts.append(content)
+            response = MagicMock()
+            ids = re.findall(r"^=== JOB (\S+) ===$", content, re.MULTILINE)
+            if not ids:
+                response.content = json.dumps(
+                    {"required_skills": ["Single"], "preferred_skills": []}
+                )
+                return response
+            items = [
+                {
+                    "id": item_id,
+                    "required_skills": (
+                        "oops" if i == malformed_index else [f"Batch{i}"]
+                    ),
+                    "preferred_skills": [],
+                    "culture_text": None,
+                }
+                for i, item_id in enumerate(ids)
+            ]
+            response.content = json.dumps({"jobs": items})
+            return response
+
+        provider = AsyncMock(spec=LLMProvider)
+        provider.complete = AsyncMock(side_effect=_complete)
+        return provider, prompts
+
+    @staticmethod
+    def _jobs(count: int, description: str = "Short posting") -> list[dict[str, Any]]:
+        return [
+            {"external_id": f"ext-{i}", "description": f"{description} {i}"}
+            for i in range(count)
+        ]
+
+    async def test_short_descriptions_share_one_call(
+        self, mock_ghost_signals: MagicMock
+    ):
+        """Three short postings cost one extraction call, mapped by id."""
+        provider, prompts = self._provider()
+
+        with patch(
+            _GHOST_SCORE_MOCK_TARGET,
+            new_callable=AsyncMock,
+            return_value=mock_ghost_signals,
+        ):
+            result = await JobEnrichmentService.enrich_jobs(
+                self._jobs(3), provider=provider
+            )
+
+        assert len(prompts) == 1
+        assert [job["required_skills"] for job in result] == [
+            ["Batch0"],
+            ["Batch1"],
+            ["Batch2"],
+        ]
+
+    async def test_malformed_item_falls_back_to_single_call(
+        self, mock_ghost_signals: MagicMock
+    ):
+        """Only the item that fails validation is extracted again alone."""
+        provider, prompts = self._provider(malformed_index=1)
+
+        with patch(
+            _GHOST_SCORE_MOCK_TARGET,
+            new_callable=AsyncMock,
+            return_value=mock_ghost_signals,
+        ):
+            result = await JobEnrichmentService.enrich_jobs(
+                self._jobs(3), provider=provider
+            )
+
+        assert len(prompts) == 2
+        assert prompts[1].endswith("Short posting 1")
+        assert [job["required_skills"] for job in result] == [
+            ["Batch0"],
+            ["Single"],
+            ["Batch2"],
+        ]
+
+    async def test_long_descriptions_extracted_alone(
+        self, mock_ghost_signals: MagicMock
+    ):
+        """Descriptions over the batch item limit use single calls."""
+        provider, prompts = self._provider()
+
+        with patch(
+            _GHOST_SCORE_MOCK_TARGET,
+            new_callable=AsyncMock,
+            return_value=mock_ghost_signals,
+        ):
+            result = await JobEnrichmentService.enrich_jobs(
+                self._jobs(2, description="x" * 5000), provider=provider
+            )
+
+        assert len(prompts) == 2
+        assert all(job["required_skills"] == ["Single"] for job in result)
+
+    async def test_batch_size_one_disables_batching(
+        self, mock_ghost_signals: MagicMock
+    ):
+        """batch_size=1 keeps one extraction call per job."""
+        provider, prompts = self._provider()
+
+        with patch(
+            _GHOST_SCORE_MOCK_TARGET,
+            new_callable=AsyncMock,
+            return_value=mock_ghost_signals,
+        ):
+            await JobEnrichmentService.enrich_jobs(
+                self._jobs(3), provider=provider, batch_size=1
+            )
+
+        assert len(prompts) == 3
+
+
 # ---------------------------------------------------------------------------
 # extract_skills_and_culture — LLM path
 # ---------------------------------------------------------------------------
@@ -10,10 +10,14 @@ Tests verify:
 - Proper handling of edge cases (empty text, malformed responses)
 """
 
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from app.providers.llm.base import TaskType
 from app.providers.llm.mock_adapter import MockLLMProvider
+from app.services.discovery.extraction_cache import compute_description_hash
 from app.services.discovery.job_extraction import (
     _basic_extraction,
     _build_extraction_prompt,
@@ -224,6 +228,68 @@ class TestLLMExtraction:
         assert result["salary_currency"] == "USD"  # pyright: ignore[reportTypedDictNotRequiredAccess]
 
 
+# =============================================================================
+# Extraction Cache Tests
+# =============================================================================
+
+
+def _mock_cache(stored: dict[str, Any] | None = None) -> MagicMock:
+    """ExtractionCache double returning stored for every lookup."""
+    cache = MagicMock()
+    cache.get_many = AsyncMock(return_value=stored or {})
+    cache.put_many = AsyncMock()
+    return cache
+
+
+class TestExtractionCache:
+    """Tests for the shared extraction cache in extract_job_data."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_llm(self, mock_llm: MockLLMProvider) -> None:
+        """A stored result is returned without calling the LLM."""
+        key = compute_description_hash(_SAMPLE_JOB_TEXT)
+        cache = _mock_cache({key: {"job_title": "Cached", "extracted_skills": []}})
+
+        result = await extract_job_data(_SAMPLE_JOB_TEXT, mock_llm, cache=cache)
+
+        assert result["job_title"] == "Cached"  # pyright: ignore[reportTypedDictNotRequiredAccess]
+        assert result["description_snippet"] == _SAMPLE_JOB_TEXT  # pyright: ignore[reportTypedDictNotRequiredAccess]
+        assert mock_llm.calls == []
+        cache.put_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_stores_llm_result(
+        self, mock_llm: MockLLMProvider
+    ) -> None:
+        """A fresh LLM result is stored under the description hash."""
+        mock_llm.set_response(
+            TaskType.EXTRACTION,
+            '{"job_title": "Engineer", "extracted_skills": [], "culture_text": null}',
+        )
+        cache = _mock_cache()
+
+        await extract_job_data(_SAMPLE_JOB_TEXT, mock_llm, cache=cache)
+
+        cache.put_many.assert_awaited_once()
+        stored = cache.put_many.call_args.args[0]
+        entry = stored[compute_description_hash(_SAMPLE_JOB_TEXT)]
+        assert entry["job_title"] == "Engineer"
+        assert "description_snippet" not in entry
+        assert cache.put_many.call_args.kwargs["model_name"] == "mock-model"
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_not_stored(
+        self, mock_llm: MockLLMProvider
+    ) -> None:
+        """An empty parse-failure result is not cached."""
+        mock_llm.set_response(TaskType.EXTRACTION, "not json")
+        cache = _mock_cache()
+
+        await extract_job_data(_SAMPLE_JOB_TEXT, mock_llm, cache=cache)
+
+        cache.put_many.assert_not_awaited()
+
+
 # =============================================================================
 # Response Parsing Tests
 # =============================================================================
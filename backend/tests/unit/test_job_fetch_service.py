@@ -7,7 +7,7 @@ saves/links to pool, and updates poll state.
 
 from collections.abc import Callable
 from datetime import timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -253,9 +253,9 @@ class TestRunPoll:
                 return_value=source_id,
             ),
             patch(
-                f"{_POOL_REPO}.check_job_in_pool",
+                f"{_POOL_REPO}.check_jobs_in_pool",
                 new_callable=AsyncMock,
-                return_value=(False, checked_job),
+                return_value=[(False, checked_job)],
             ),
             patch(
                 f"{_ENRICHMENT}.enrich_jobs",
@@ -263,9 +263,9 @@ class TestRunPoll:
                 return_value=[enriched_job],
             ),
             patch(
-                f"{_POOL_REPO}.save_job_to_pool",
+                f"{_POOL_REPO}.save_jobs_to_pool",
                 new_callable=AsyncMock,
-                return_value="saved-id",
+                return_value=["saved-id"],
             ),
         ):
             result = await service.run_poll([_SOURCE_ADZUNA])
@@ -302,9 +302,9 @@ class TestRunPoll:
                 return_value=source_id,
             ),
             patch(
-                f"{_POOL_REPO}.check_job_in_pool",
+                f"{_POOL_REPO}.check_jobs_in_pool",
                 new_callable=AsyncMock,
-                return_value=(True, existing_job),
+                return_value=[(True, existing_job)],
             ),
             patch(
                 f"{_ENRICHMENT}.enrich_jobs",
@@ -312,9 +312,9 @@ class TestRunPoll:
                 return_value=[],
             ) as mock_enrich,
             patch(
-                f"{_POOL_REPO}.link_existing_job",
+                f"{_POOL_REPO}.link_existing_jobs",
                 new_callable=AsyncMock,
-                return_value="existing-pool-id",
+                return_value=["existing-pool-id"],
             ) as mock_link,
         ):
             result = await service.run_poll([_SOURCE_ADZUNA])
@@ -322,7 +322,7 @@ class TestRunPoll:
         assert result.new_job_count == 0
         assert result.existing_job_count == 1
         # Enrichment should only be called with new jobs (empty list)
-        mock_enrich.assert_called_once_with([], provider=None)
+        mock_enrich.assert_called_once_with([], provider=None, cache=ANY)
         mock_link.assert_called_once()
 
     async def test_partitions_mixed_new_and_existing(self, service) -> None:
@@ -347,11 +347,6 @@ class TestRunPoll:
             "pool_job_posting_id": "pool-id",
         }
 
-        async def check_mock(_db, job, _sid):
-            if job["external_id"] == "new-1":
-                return (False, new_checked)
-            return (True, old_checked)
-
         enriched = {**new_checked, "ghost_score": 20, "required_skills": []}
 
         with (
@@ -367,31 +362,39 @@ class TestRunPoll:
                 return_value=source_id,
             ),
             patch(
-                f"{_POOL_REPO}.check_job_in_pool",
+                f"{_POOL_REPO}.check_jobs_in_pool",
                 new_callable=AsyncMock,
-                side_effect=check_mock,
-            ),
+                return_value=[(False, new_checked), (True, old_checked)],
+            ) as mock_check,
             patch(
                 f"{_ENRICHMENT}.enrich_jobs",
                 new_callable=AsyncMock,
                 return_value=[enriched],
             ),
             patch(
-                f"{_POOL_REPO}.save_job_to_pool",
+                f"{_POOL_REPO}.save_jobs_to_pool",
                 new_callable=AsyncMock,
-                return_value="saved-id",
-            ),
+                return_value=["saved-id"],
+            ) as mock_save,
             patch(
-                f"{_POOL_REPO}.link_existing_job",
+                f"{_POOL_REPO}.link_existing_jobs",
                 new_callable=AsyncMock,
-                return_value="pool-id",
-            ),
+                return_value=["pool-id"],
+            ) as mock_link,
         ):
             result = await service.run_poll([_SOURCE_ADZUNA])
 
         assert result.new_job_count == 1
         assert result.existing_job_count == 1
         assert len(result.processed_jobs) == 2
+        # One bulk call per stage for the whole poll result
+        mock_check.assert_awaited_once()
+        assert mock_check.await_args.args[1] == [
+            (new_raw, source_id),
+            (old_raw, source_id),
+        ]
+        assert mock_save.await_args.args[1] == [enriched]
+        assert mock_link.await_args.args[1] == [old_checked]
 
     async def test_includes_error_sources_in_result(self, service) -> None:
         """Error sources from fetch are propagated to PollResult."""
@@ -476,7 +479,7 @@ class TestRunPoll:
         assert delta >= timedelta(days=6, hours=23)
 
     async def test_save_failure_does_not_halt_batch(self, service) -> None:
-        """If save_job_to_pool returns None, batch continues."""
+        """If save_jobs_to_pool returns None for a job, the rest still count."""
         source_id = uuid4()
         jobs = [
             {
@@ -505,9 +508,9 @@ class TestRunPoll:
                 return_value=source_id,
             ),
             patch(
-                f"{_POOL_REPO}.check_job_in_pool",
+                f"{_POOL_REPO}.check_jobs_in_pool",
                 new_callable=AsyncMock,
-                side_effect=[(False, c) for c in checked],
+                return_value=[(False, c) for c in checked],
             ),
             patch(
                 f"{_ENRICHMENT}.enrich_jobs",
@@ -515,9 +518,9 @@ class TestRunPoll:
                 return_value=enriched,
             ),
             patch(
-                f"{_POOL_REPO}.save_job_to_pool",
+                f"{_POOL_REPO}.save_jobs_to_pool",
                 new_callable=AsyncMock,
-                side_effect=save_returns,
+                return_value=save_returns,
             ),
         ):
             result = await service.run_poll([_SOURCE_ADZUNA])
@@ -171,6 +171,64 @@ class TestCheckJobInPool:
         assert enriched["location"] == "Remote"
 
 
+# ---------------------------------------------------------------------------
+# check_jobs_in_pool
+# ---------------------------------------------------------------------------
+
+
+class TestCheckJobsInPool:
+    """Tests for the batched pool existence check."""
+
+    async def test_partitions_batch_in_input_order(
+        self,
+        db_session: AsyncSession,
+        job_source: JobSource,
+        sample_job: dict[str, Any],
+    ):
+        """Tier-1, tier-2, and new jobs are resolved in one call, in order."""
+        hashed_description = "Batch description found by hash"
+        by_ext = JobPosting(
+            source_id=job_source.id,
+            external_id="ext-001",
+            job_title="Software Engineer",
+            company_name="Acme Corp",
+            description="Build great software",
+            description_hash=_HASH_A,
+            first_seen_date=_TODAY,
+        )
+        by_hash = JobPosting(
+            source_id=job_source.id,
+            external_id="other-ext",
+            job_title="Data Engineer",
+            company_name="HashCo",
+            description=hashed_description,
+            description_hash=hashlib.sha256(hashed_description.encode()).hexdigest(),
+            first_seen_date=_TODAY,
+        )
+        db_session.add_all([by_ext, by_hash])
+        await db_session.flush()
+
+        jobs: list[dict[str, Any]] = [
+            {"external_id": "brand-new", "description": "Never seen before"},
+            sample_job,
+            {"external_id": "no-match", "description": hashed_description},
+        ]
+
+        results = await JobPoolRepository.check_jobs_in_pool(
+            db_session, [(job, job_source.id) for job in jobs]
+        )
+
+        assert [is_existing for is_existing, _ in results] == [False, True, True]
+        assert "pool_job_posting_id" not in results[0][1]
+        assert results[1][1]["pool_job_posting_id"] == str(by_ext.id)
+        assert results[2][1]["pool_job_posting_id"] == str(by_hash.id)
+        assert all(r[1]["source_id"] == str(job_source.id) for r in results)
+
+    async def test_empty_batch_returns_empty(self, db_session: AsyncSession):
+        """An empty batch issues no lookups."""
+        assert await JobPoolRepository.check_jobs_in_pool(db_session, []) == []
+
+
 # ---------------------------------------------------------------------------
 # resolve_source_id
 # ---------------------------------------------------------------------------
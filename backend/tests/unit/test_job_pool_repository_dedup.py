@@ -14,6 +14,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.job_pool_repository import JobPoolRepository
 
 _DEDUP_MOCK_TARGET = "app.repositories.job_pool_repository.deduplicate_and_save"
+_BATCH_DEDUP_MOCK_TARGET = (
+    "app.repositories.job_pool_repository.deduplicate_and_save_batch"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -199,3 +202,123 @@ class TestLinkExistingJob:
 
             call_kwargs = mock_dedup.call_args.kwargs
             assert call_kwargs["discovery_method"] == "scouter"
+
+
+# ---------------------------------------------------------------------------
+# save_jobs_to_pool / link_existing_jobs
+# ---------------------------------------------------------------------------
+
+
+def _mock_outcome() -> MagicMock:
+    """Dedup outcome mock with a job posting ID."""
+    outcome = MagicMock()
+    outcome.job_posting.id = uuid.uuid4()
+    return outcome
+
+
+class TestSaveJobsToPool:
+    """Tests for saving a whole batch via the batch dedup pipeline."""
+
+    async def test_returns_ids_in_input_order(
+        self, db_session: AsyncSession, sample_job: dict[str, Any]
+    ):
+        """One batch call; invalid jobs get None without failing the rest."""
+        outcomes = [_mock_outcome(), _mock_outcome()]
+        jobs = [
+            {**sample_job, "source_id": str(uuid.uuid4())},
+            {**sample_job, "source_id": "not-a-uuid"},
+            {**sample_job, "external_id": "ext-002", "source_id": str(uuid.uuid4())},
+        ]
+
+        with patch(
+            _BATCH_DEDUP_MOCK_TARGET,
+            new_callable=AsyncMock,
+            return_value=outcomes,
+        ) as mock_batch:
+            result = await JobPoolRepository.save_jobs_to_pool(
+                db_session, jobs, uuid.uuid4(), uuid.uuid4()
+            )
+
+        mock_batch.assert_awaited_once()
+        assert len(mock_batch.call_args.kwargs["jobs_data"]) == 2
+        assert mock_batch.call_args.kwargs["discovery_method"] == "scouter"
+        assert result == [
+            str(outcomes[0].job_posting.id),
+            None,
+            str(outcomes[1].job_posting.id),
+        ]
+
+    async def test_falls_back_to_per_job_saves_on_db_error(
+        self, db_session: AsyncSession, sample_job: dict[str, Any]
+    ):
+        """A database error in the batch retries each job on its own."""
+        outcome = _mock_outcome()
+        jobs = [
+            {**sample_job, "source_id": str(uuid.uuid4())},
+            {**sample_job, "external_id": "ext-002", "source_id": str(uuid.uuid4())},
+        ]
+
+        with (
+            patch(
+                _BATCH_DEDUP_MOCK_TARGET,
+                new_callable=AsyncMock,
+                side_effect=SQLAlchemyError("batch failed"),
+            ),
+            patch(
+                _DEDUP_MOCK_TARGET,
+                new_callable=AsyncMock,
+                side_effect=[outcome, SQLAlchemyError("still failing")],
+            ) as mock_dedup,
+        ):
+            result = await JobPoolRepository.save_jobs_to_pool(
+                db_session, jobs, uuid.uuid4(), uuid.uuid4()
+            )
+
+        assert mock_dedup.await_count == 2
+        assert result == [str(outcome.job_posting.id), None]
+
+    async def test_unowned_persona_returns_all_none(
+        self, db_session: AsyncSession, sample_job: dict[str, Any]
+    ):
+        """ValueError from the batch (persona not owned) fails every job."""
+        jobs = [{**sample_job, "source_id": str(uuid.uuid4())}]
+
+        with patch(
+            _BATCH_DEDUP_MOCK_TARGET,
+            new_callable=AsyncMock,
+            side_effect=ValueError("Persona not owned by authenticated user"),
+        ):
+            result = await JobPoolRepository.save_jobs_to_pool(
+                db_session, jobs, uuid.uuid4(), uuid.uuid4()
+            )
+
+        assert result == [None]
+
+
+class TestLinkExistingJobs:
+    """Tests for linking a batch of existing pool jobs."""
+
+    async def test_returns_pool_ids(self, db_session: AsyncSession):
+        """Linked jobs return their pool_job_posting_id."""
+        pool_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        jobs: list[dict[str, Any]] = [
+            {
+                "pool_job_posting_id": pool_id,
+                "source_id": str(uuid.uuid4()),
+                "description": f"Existing job {i}",
+                "title": "Engineer",
+                "company": "PoolCo",
+            }
+            for i, pool_id in enumerate(pool_ids)
+        ]
+
+        with patch(
+            _BATCH_DEDUP_MOCK_TARGET,
+            new_callable=AsyncMock,
+            return_value=[_mock_outcome(), _mock_outcome()],
+        ):
+            result = await JobPoolRepository.link_existing_jobs(
+                db_session, jobs, uuid.uuid4(), uuid.uuid4()
+            )
+
+        assert result == pool_ids
@@ -119,6 +119,72 @@ class TestGetByDescriptionHash:
         assert result is None
 
 
+class TestGetByCompanyForSimilarity:
+    """Test JobPostingRepository.get_by_company_for_similarity()."""
+
+    async def _add_job(
+        self,
+        db: AsyncSession,
+        job_source: JobSource,
+        description_hash: str,
+        band_keys: list[int] | None,
+    ) -> JobPosting:
+        jp = JobPosting(
+            source_id=job_source.id,
+            job_title="Software Engineer",
+            company_name="Acme Corp",
+            description="Build great things",
+            description_hash=description_hash,
+            first_seen_date=_TODAY,
+            description_lsh_bands=band_keys,
+        )
+        db.add(jp)
+        await db.flush()
+        return jp
+
+    async def test_without_band_keys_returns_company_jobs(
+        self, db_session: AsyncSession, job_posting: JobPosting
+    ):
+        """Company match is case-insensitive."""
+        result = await JobPostingRepository.get_by_company_for_similarity(
+            db_session, "  ACME corp "
+        )
+        assert [j.id for j in result] == [job_posting.id]
+
+    async def test_band_keys_filter_by_overlap_and_keep_unbanded(
+        self, db_session: AsyncSession, job_source: JobSource
+    ):
+        """Jobs sharing a band are returned, then jobs without bands."""
+        shared = await self._add_job(db_session, job_source, "1" * 64, [1, 2, 3])
+        disjoint = await self._add_job(db_session, job_source, "2" * 64, [7, 8])
+        unbanded = await self._add_job(db_session, job_source, "3" * 64, None)
+
+        result = await JobPostingRepository.get_by_company_for_similarity(
+            db_session, "Acme Corp", band_keys=[3, 4]
+        )
+
+        ids = [j.id for j in result]
+        assert ids == [shared.id, unbanded.id]
+        assert disjoint.id not in ids
+
+    async def test_batch_matches_single_lookup_per_probe(
+        self, db_session: AsyncSession, job_source: JobSource
+    ):
+        """Each probe gets the candidates the single lookup would return."""
+        shared = await self._add_job(db_session, job_source, "1" * 64, [1, 2, 3])
+        disjoint = await self._add_job(db_session, job_source, "2" * 64, [7, 8])
+        unbanded = await self._add_job(db_session, job_source, "3" * 64, None)
+
+        result = await JobPostingRepository.get_candidates_for_similarity_batch(
+            db_session,
+            [("Acme Corp", [3, 4]), (" ACME corp", None), ("Other Inc", [1])],
+        )
+
+        assert [j.id for j in result[0]] == [shared.id, unbanded.id]
+        assert {j.id for j in result[1]} == {shared.id, disjoint.id, unbanded.id}
+        assert result[2] == []
+
+
 class TestCreate:
     """Test JobPostingRepository.create()."""
 
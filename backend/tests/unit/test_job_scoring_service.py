@@ -4,6 +4,7 @@ REQ-017 §6: Orchestrates non-negotiables filter + fit/stretch scoring +
 rationale generation + score persistence.
 """
 
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
@@ -22,10 +23,12 @@ _MODULE = "app.services.scoring.job_scoring_service"
 _PATCH_LOAD_PERSONA = f"{_MODULE}._load_persona"
 _PATCH_LOAD_JOBS = f"{_MODULE}._load_jobs"
 _PATCH_LOAD_DISCOVERED = f"{_MODULE}._load_discovered_job_ids"
-_PATCH_GEN_EMBEDDINGS = f"{_MODULE}.generate_persona_embeddings"
+_PATCH_GEN_EMBEDDINGS = f"{_MODULE}._get_persona_embeddings"
 _PATCH_FILTER_BATCH = f"{_MODULE}.filter_jobs_batch"
 _PATCH_BATCH_SCORE = f"{_MODULE}.batch_score_jobs"
-_PATCH_SAVE_SCORE = f"{_MODULE}._save_score"
+_PATCH_SAVE_SCORE = f"{_MODULE}._save_scores"
+_PATCH_LOAD_JOB_EMBEDDINGS = f"{_MODULE}._load_job_embeddings"
+_PATCH_LOAD_PREVIOUS_DETAILS = f"{_MODULE}._load_previous_score_details"
 
 
 # ---------------------------------------------------------------------------
@@ -80,6 +83,7 @@ def _make_job(
     culture_text: str | None = "Fast-paced startup culture",
     years_experience_min: int | None = 3,
     years_experience_max: int | None = 7,
+    description_hash: str = "a" * 64,
 ) -> MagicMock:
     """Create a mock JobPosting ORM model."""
     job = MagicMock()
@@ -93,6 +97,7 @@ def _make_job(
     job.culture_text = culture_text
     job.years_experience_min = years_experience_min
     job.years_experience_max = years_experience_max
+    job.description_hash = description_hash
     return job
 
 
@@ -157,6 +162,20 @@ def _make_llm_response(content: str = "Good match based on skills.") -> MagicMoc
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def mock_load_job_embeddings():
+    """Stub the job_embeddings lookup (no stored vectors by default)."""
+    with patch(_PATCH_LOAD_JOB_EMBEDDINGS, return_value={}) as mock_load:
+        yield mock_load
+
+
+@pytest.fixture(autouse=True)
+def mock_load_previous_details():
+    """Stub the previous score_details lookup (nothing stored by default)."""
+    with patch(_PATCH_LOAD_PREVIOUS_DETAILS, return_value={}) as mock_load:
+        yield mock_load
+
+
 @pytest.fixture
 def mock_db() -> AsyncMock:
     """Mock async database session."""
@@ -670,6 +689,97 @@ class TestRescoreAllDiscovered:
 
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_incremental_rescore_recomputes_only_changed_components(
+        self,
+        mock_db: AsyncMock,
+        user_id: UUID,
+        persona_id: UUID,
+        mock_load_previous_details: AsyncMock,
+        mock_load_job_embeddings: AsyncMock,
+    ) -> None:
+        """A commutable city edit reuses every other component, embedding-free."""
+        job_id = uuid4()
+        persona = _make_persona(persona_id=persona_id, user_id=user_id)
+        job = _make_job(job_id=job_id)
+        scored = _make_scored_job(job_id=job_id, fit_total=50)
+        mock_emb = AsyncMock()
+        mock_emb.config.embedding_model = "text-embedding-3-small"
+
+        with (
+            patch(_PATCH_LOAD_PERSONA, return_value=persona),
+            patch(_PATCH_LOAD_DISCOVERED, return_value=[job_id]),
+            patch(_PATCH_LOAD_JOBS, return_value=[job]),
+            patch(
+                _PATCH_GEN_EMBEDDINGS,
+                return_value=_make_persona_embeddings(persona_id),
+            ) as mock_gen_embeddings,
+            patch(_PATCH_FILTER_BATCH, return_value=([job], [])),
+            patch(_PATCH_BATCH_SCORE, return_value=[scored]) as mock_batch,
+            patch(_PATCH_SAVE_SCORE),
+        ):
+            svc = JobScoringService(
+                mock_db, llm_provider=AsyncMock(), embedding_provider=mock_emb
+            )
+            first = await svc.rescore_all_discovered(persona_id, user_id)
+            assert mock_batch.call_args.kwargs["reused_components"] == {}
+
+            mock_load_previous_details.return_value = {
+                job_id: first[0]["score_details"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+            }
+            mock_gen_embeddings.reset_mock()
+            mock_load_job_embeddings.reset_mock()
+            persona.commutable_cities = ["Phoenix", "Tempe"]
+            await svc.rescore_all_discovered(persona_id, user_id)
+
+        reused = mock_batch.call_args.kwargs["reused_components"][job_id]
+        assert "location_logistics" not in reused
+        assert reused["hard_skills"] == 80.0
+        assert reused["target_role"] == 65.0
+        assert len(reused) == 7
+        mock_gen_embeddings.assert_not_called()
+        mock_load_job_embeddings.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_incremental_rescore_recomputes_everything(
+        self,
+        mock_db: AsyncMock,
+        user_id: UUID,
+        persona_id: UUID,
+        mock_load_previous_details: AsyncMock,
+    ) -> None:
+        """incremental=False ignores stored fingerprints."""
+        job_id = uuid4()
+        persona = _make_persona(persona_id=persona_id, user_id=user_id)
+        job = _make_job(job_id=job_id)
+        scored = _make_scored_job(job_id=job_id, fit_total=50)
+        mock_emb = AsyncMock()
+        mock_emb.config.embedding_model = "text-embedding-3-small"
+
+        with (
+            patch(_PATCH_LOAD_PERSONA, return_value=persona),
+            patch(_PATCH_LOAD_DISCOVERED, return_value=[job_id]),
+            patch(_PATCH_LOAD_JOBS, return_value=[job]),
+            patch(
+                _PATCH_GEN_EMBEDDINGS,
+                return_value=_make_persona_embeddings(persona_id),
+            ) as mock_gen_embeddings,
+            patch(_PATCH_FILTER_BATCH, return_value=([job], [])),
+            patch(_PATCH_BATCH_SCORE, return_value=[scored]) as mock_batch,
+            patch(_PATCH_SAVE_SCORE),
+        ):
+            svc = JobScoringService(
+                mock_db, llm_provider=AsyncMock(), embedding_provider=mock_emb
+            )
+            first = await svc.rescore_all_discovered(persona_id, user_id)
+            mock_load_previous_details.return_value = {
+                job_id: first[0]["score_details"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+            }
+            await svc.rescore_all_discovered(persona_id, user_id, incremental=False)
+
+        assert mock_batch.call_args.kwargs["reused_components"] == {}
+        assert mock_gen_embeddings.await_count == 2
+
 
 # ---------------------------------------------------------------------------
 # Rationale generation
@@ -751,6 +861,210 @@ class TestRationaleGeneration:
         assert result["fit_score"] == 75  # pyright: ignore[reportTypedDictNotRequiredAccess]
         assert result["explanation"] is not None  # pyright: ignore[reportTypedDictNotRequiredAccess]
 
+    @pytest.mark.asyncio
+    async def test_rationales_run_concurrently_within_limit_and_keep_order(
+        self, mock_db: AsyncMock, user_id: UUID, persona_id: UUID
+    ) -> None:
+        """Rationale calls overlap up to the limit; results stay in job order."""
+        from app.providers import ProviderError
+
+        persona = _make_persona(persona_id=persona_id, user_id=user_id)
+        jobs = [_make_job(job_title=f"Role {i}") for i in range(6)]
+        scored = [_make_scored_job(job_id=j.id, fit_total=80) for j in jobs]
+        scored[1].fit_score.total = 40  # below threshold — no LLM call
+        in_flight = 0
+        max_in_flight = 0
+
+        async def _complete(*, messages, **_kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            prompt = messages[-1].content
+            if "Role 3" in prompt:
+                raise ProviderError("API error")
+            title = next(j.job_title for j in jobs if j.job_title in prompt)
+            return _make_llm_response(f"Rationale for {title}")
+
+        mock_llm = AsyncMock()
+        mock_llm.provider_name = "claude"
+        mock_llm.complete.side_effect = _complete
+
+        with (
+            patch(_PATCH_LOAD_PERSONA, return_value=persona),
+            patch(_PATCH_LOAD_JOBS, return_value=jobs),
+            patch(
+                _PATCH_GEN_EMBEDDINGS,
+                return_value=_make_persona_embeddings(persona_id),
+            ),
+            patch(_PATCH_FILTER_BATCH, return_value=(jobs, [])),
+            patch(_PATCH_BATCH_SCORE, return_value=scored),
+            patch(_PATCH_SAVE_SCORE),
+        ):
+            svc = JobScoringService(
+                mock_db,
+                llm_provider=mock_llm,
+                embedding_provider=AsyncMock(),
+                rationale_concurrency=2,
+            )
+            results = await svc.score_batch(persona_id, [j.id for j in jobs], user_id)
+
+        explanations = [r["explanation"] for r in results]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+        assert explanations[0] == "Rationale for Role 0"
+        assert "Low match" in explanations[1]
+        assert explanations[2] == "Rationale for Role 2"
+        assert explanations[3] == "Score: 80/100 fit, 60/100 stretch."
+        assert explanations[5] == "Rationale for Role 5"
+        assert mock_llm.complete.await_count == 5
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_inputs_reuse_cached_rationale(
+        self,
+        mock_db: AsyncMock,
+        user_id: UUID,
+        persona_id: UUID,
+        mock_load_previous_details: AsyncMock,
+    ) -> None:
+        """A stored rationale with a matching fingerprint skips the LLM."""
+        job_id = uuid4()
+        persona = _make_persona(persona_id=persona_id, user_id=user_id)
+        job = _make_job(job_id=job_id)
+        mock_llm = AsyncMock()
+        mock_llm.complete.return_value = _make_llm_response("Strong fit.")
+
+        async def _score() -> dict:
+            with (
+                patch(_PATCH_LOAD_PERSONA, return_value=persona),
+                patch(_PATCH_LOAD_JOBS, return_value=[job]),
+                patch(
+                    _PATCH_GEN_EMBEDDINGS,
+                    return_value=_make_persona_embeddings(persona_id),
+                ),
+                patch(_PATCH_FILTER_BATCH, return_value=([job], [])),
+                patch(
+                    _PATCH_BATCH_SCORE,
+                    return_value=[_make_scored_job(job_id=job_id, fit_total=80)],
+                ),
+                patch(_PATCH_SAVE_SCORE),
+            ):
+                svc = JobScoringService(
+                    mock_db, llm_provider=mock_llm, embedding_provider=AsyncMock()
+                )
+                return dict(await svc.score_job(persona_id, job_id, user_id))
+
+        first = await _score()
+        cached_entry = first["score_details"]["rationale"]
+        assert cached_entry["text"] == "Strong fit."
+
+        mock_load_previous_details.return_value = {job_id: {"rationale": cached_entry}}
+        second = await _score()
+
+        assert second["explanation"] == "Strong fit."
+        assert second["score_details"]["rationale"] == cached_entry
+        assert mock_llm.complete.await_count == 1
+
+        # A content change (new description_hash) invalidates the entry
+        job.description_hash = "b" * 64
+        await _score()
+        assert mock_llm.complete.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_rationale_is_not_cached(
+        self, mock_db: AsyncMock, user_id: UUID, persona_id: UUID
+    ) -> None:
+        """Error fallbacks are not stored, so the next rescore retries the LLM."""
+        from app.providers import ProviderError
+
+        job_id = uuid4()
+        persona = _make_persona(persona_id=persona_id, user_id=user_id)
+        job = _make_job(job_id=job_id)
+        mock_llm = AsyncMock()
+        mock_llm.complete.side_effect = ProviderError("API error")
+
+        with (
+            patch(_PATCH_LOAD_PERSONA, return_value=persona),
+            patch(_PATCH_LOAD_JOBS, return_value=[job]),
+            patch(
+                _PATCH_GEN_EMBEDDINGS,
+                return_value=_make_persona_embeddings(persona_id),
+            ),
+            patch(_PATCH_FILTER_BATCH, return_value=([job], [])),
+            patch(
+                _PATCH_BATCH_SCORE,
+                return_value=[_make_scored_job(job_id=job_id, fit_total=80)],
+            ),
+            patch(_PATCH_SAVE_SCORE),
+        ):
+            svc = JobScoringService(
+                mock_db, llm_provider=mock_llm, embedding_provider=AsyncMock()
+            )
+            result = await svc.score_job(persona_id, job_id, user_id)
+
+        assert "rationale" not in result["score_details"]  # pyright: ignore[reportTypedDictNotRequiredAccess,reportOptionalOperand]
+
+    def test_rationale_limit_is_capped_by_provider(self, mock_db: AsyncMock) -> None:
+        """Configured concurrency never exceeds the provider's ceiling."""
+        llm = MagicMock()
+        llm.provider_name = "claude"
+
+        assert JobScoringService(mock_db)._rationale_limit(llm) == 8
+        assert (
+            JobScoringService(mock_db, rationale_concurrency=3)._rationale_limit(llm)
+            == 3
+        )
+        assert (
+            JobScoringService(mock_db, rationale_concurrency=50)._rationale_limit(llm)
+            == 8
+        )
+
+    def test_non_positive_rationale_concurrency_raises(
+        self, mock_db: AsyncMock
+    ) -> None:
+        """rationale_concurrency must be positive."""
+        with pytest.raises(ValueError, match="rationale_concurrency"):
+            JobScoringService(mock_db, rationale_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_provider_limit_is_shared_across_batches(
+        self, mock_db: AsyncMock
+    ) -> None:
+        """Concurrent batches share one provider ceiling per process."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def _rationale(*_args: object, **_kwargs: object) -> MagicMock:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock()
+
+        llm = MagicMock()
+        llm.provider_name = "shared-ceiling-test"
+        scored = [
+            _make_scored_job(job_id=uuid4(), fit_total=RATIONALE_SCORE_THRESHOLD)
+            for _ in range(4)
+        ]
+        services = [JobScoringService(mock_db, llm_provider=llm) for _ in range(2)]
+
+        with patch.dict(
+            f"{_MODULE}._PROVIDER_RATIONALE_CONCURRENCY",
+            {"shared-ceiling-test": 2},
+        ):
+            for svc in services:
+                svc._generate_rationale = AsyncMock(side_effect=_rationale)  # type: ignore[method-assign]
+            await asyncio.gather(
+                *[
+                    svc._generate_rationales(scored, MagicMock(), {}, {})
+                    for svc in services
+                ]
+            )
+
+        assert max_in_flight == 2
+
 
 # ---------------------------------------------------------------------------
 # Score details / persistence
@@ -801,7 +1115,7 @@ class TestScoreDetailsAndPersistence:
     async def test_saves_score_to_persona_jobs(
         self, mock_db: AsyncMock, user_id: UUID, persona_id: UUID
     ) -> None:
-        """Scored results should be persisted via _save_score."""
+        """Scored results should be persisted via _save_scores."""
 
         job_id = uuid4()
         persona = _make_persona(persona_id=persona_id, user_id=user_id)
@@ -829,9 +1143,10 @@ class TestScoreDetailsAndPersistence:
             await svc.score_job(persona_id, job_id, user_id)
 
         mock_save.assert_called_once()
-        save_args = mock_save.call_args
-        assert save_args.kwargs["job_posting_id"] == job_id
-        assert save_args.kwargs["fit_score"] == 82
+        saved = mock_save.call_args.kwargs["scores"]
+        assert len(saved) == 1
+        assert saved[0].job_posting_id == job_id
+        assert saved[0].fit_score == 82
 
     @pytest.mark.asyncio
     async def test_saves_filtered_score_to_persona_jobs(
@@ -869,8 +1184,9 @@ class TestScoreDetailsAndPersistence:
             await svc.score_job(persona_id, job_id, user_id)
 
         mock_save.assert_called_once()
-        save_args = mock_save.call_args
-        assert save_args.kwargs["fit_score"] is None
+        saved = mock_save.call_args.kwargs["scores"]
+        assert saved[0].fit_score is None
+        assert saved[0].failed_non_negotiables == ["Salary too low"]
 
 
 # ---------------------------------------------------------------------------
@@ -936,9 +1252,12 @@ class TestErrorHandling:
         from app.providers import ProviderError
 
         persona = _make_persona(persona_id=persona_id, user_id=user_id)
+        job = _make_job()
 
         with (
             patch(_PATCH_LOAD_PERSONA, return_value=persona),
+            patch(_PATCH_LOAD_JOBS, return_value=[job]),
+            patch(_PATCH_FILTER_BATCH, return_value=([job], [])),
             patch(
                 _PATCH_GEN_EMBEDDINGS,
                 side_effect=ProviderError("Embedding API down"),
@@ -946,7 +1265,7 @@ class TestErrorHandling:
         ):
             svc = JobScoringService(mock_db, embedding_provider=AsyncMock())
             with pytest.raises(ProviderError, match="Embedding API down"):
-                await svc.score_batch(persona_id, [uuid4()], user_id)
+                await svc.score_batch(persona_id, [job.id], user_id)
 
     @pytest.mark.asyncio
     async def test_score_batch_passes_embedding_provider_to_batch_scorer(
@@ -984,3 +1303,36 @@ class TestErrorHandling:
 
         call_kwargs = mock_batch.call_args.kwargs
         assert call_kwargs["embedding_provider"] is mock_emb_provider
+
+    @pytest.mark.asyncio
+    async def test_score_batch_passes_stored_job_embeddings_to_batch_scorer(
+        self,
+        mock_db: AsyncMock,
+        user_id: UUID,
+        persona_id: UUID,
+        mock_load_job_embeddings: AsyncMock,
+    ) -> None:
+        """Stored job vectors are loaded for passing jobs and handed to the scorer."""
+        job_id = uuid4()
+        persona = _make_persona(persona_id=persona_id, user_id=user_id)
+        job = _make_job(job_id=job_id)
+        scored = _make_scored_job(job_id=job_id, fit_total=50)
+        stored = {job_id: MagicMock()}
+        mock_load_job_embeddings.return_value = stored
+
+        with (
+            patch(_PATCH_LOAD_PERSONA, return_value=persona),
+            patch(_PATCH_LOAD_JOBS, return_value=[job]),
+            patch(
+                _PATCH_GEN_EMBEDDINGS,
+                return_value=_make_persona_embeddings(persona_id),
+            ),
+            patch(_PATCH_FILTER_BATCH, return_value=([job], [])),
+            patch(_PATCH_BATCH_SCORE, return_value=[scored]) as mock_batch,
+            patch(_PATCH_SAVE_SCORE),
+        ):
+            svc = JobScoringService(mock_db, embedding_provider=AsyncMock())
+            await svc.score_batch(persona_id, [job_id], user_id)
+
+        assert mock_load_job_embeddings.call_args.args[1] == [job]
+        assert mock_batch.call_args.kwargs["job_embeddings"] is stored
@@ -0,0 +1,179 @@
+"""Tests for leader election via Postgres advisory locks.
+
+Only the lock holder runs the wrapped worker; losing the lock connection
+stops it, and stopping the election releases the lock.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.leader_election import (
+    AdvisoryLockLease,
+    LeaderElectedWorker,
+    advisory_lock_key,
+)
+
+
+class _FakeWorker:
+    """Background worker stand-in recording start/stop calls."""
+
+    def __init__(self) -> None:
+        self.is_running = False
+        self.starts = 0
+        self.stops = 0
+
+    def start(self) -> None:
+        self.is_running = True
+        self.starts += 1
+
+    async def stop(self) -> None:
+        self.is_running = False
+        self.stops += 1
+
+
+def _engine(*, acquired: bool = True) -> tuple[MagicMock, MagicMock]:
+    """Create a mock engine whose connections report the lock result."""
+    conn = MagicMock()
+    conn.execution_options = AsyncMock(return_value=conn)
+    conn.scalar = AsyncMock(return_value=acquired)
+    conn.close = AsyncMock()
+    conn.invalidate = AsyncMock()
+    engine = MagicMock()
+    engine.connect = AsyncMock(return_value=conn)
+    return engine, conn
+
+
+class TestAdvisoryLockKey:
+    """Tests for advisory_lock_key()."""
+
+    def test_is_stable_signed_bigint(self) -> None:
+        key = advisory_lock_key("pool_surfacing")
+        assert key == advisory_lock_key("pool_surfacing")
+        assert -(2**63) <= key < 2**63
+
+    def test_differs_per_worker(self) -> None:
+        assert advisory_lock_key("pool_surfacing") != advisory_lock_key(
+            "poll_scheduler"
+        )
+
+
+class TestAdvisoryLockLease:
+    """Tests for AdvisoryLockLease."""
+
+    async def test_acquire_keeps_connection_when_locked(self) -> None:
+        engine, conn = _engine(acquired=True)
+        lease = AdvisoryLockLease(engine, "w")
+
+        assert await lease.acquire() is True
+        assert lease.held is True
+        conn.execution_options.assert_awaited_once_with(isolation_level="AUTOCOMMIT")
+        conn.close.assert_not_awaited()
+
+    async def test_acquire_closes_connection_when_taken(self) -> None:
+        engine, conn = _engine(acquired=False)
+        lease = AdvisoryLockLease(engine, "w")
+
+        assert await lease.acquire() is False
+        assert lease.held is False
+        conn.close.assert_awaited_once()
+
+    async def test_check_drops_lease_when_connection_lost(self) -> None:
+        engine, conn = _engine()
+        lease = AdvisoryLockLease(engine, "w")
+        await lease.acquire()
+        conn.scalar.side_effect = ConnectionError("gone")
+
+        assert await lease.check() is False
+        assert lease.held is False
+        conn.invalidate.assert_awaited_once()
+
+    async def test_release_unlocks_and_closes(self) -> None:
+        engine, conn = _engine()
+        lease = AdvisoryLockLease(engine, "w")
+        await lease.acquire()
+
+        await lease.release()
+
+        assert lease.held is False
+        assert "pg_advisory_unlock" in str(conn.scalar.call_args.args[0])
+        conn.close.assert_awaited_once()
+
+
+class TestLeaderElectedWorker:
+    """Tests for LeaderElectedWorker."""
+
+    async def test_leader_starts_worker(self) -> None:
+        engine, _ = _engine(acquired=True)
+        worker = _FakeWorker()
+        elected = LeaderElectedWorker("w", worker, engine)
+
+        await elected.run_once()
+
+        assert elected.is_leader is True
+        assert worker.is_running is True
+
+    async def test_standby_does_not_start_worker(self) -> None:
+        engine, _ = _engine(acquired=False)
+        worker = _FakeWorker()
+        elected = LeaderElectedWorker("w", worker, engine)
+
+        await elected.run_once()
+
+        assert elected.is_leader is False
+        assert worker.starts == 0
+
+    async def test_lost_lock_stops_worker(self) -> None:
+        engine, conn = _engine(acquired=True)
+        worker = _FakeWorker()
+        elected = LeaderElectedWorker("w", worker, engine)
+        await elected.run_once()
+        conn.scalar.side_effect = ConnectionError("gone")
+
+        await elected.run_once()
+
+        assert elected.is_leader is False
+        assert worker.is_running is False
+
+    async def test_restarts_worker_that_exited_while_leading(self) -> None:
+        engine, _ = _engine(acquired=True)
+        worker = _FakeWorker()
+        elected = LeaderElectedWorker("w", worker, engine)
+        await elected.run_once()
+        worker.is_running = False
+
+        await elected.run_once()
+
+        assert worker.starts == 2
+
+    async def test_only_one_of_two_processes_leads(self) -> None:
+        """A second candidate stands by while the first holds the lock."""
+        leader_engine, _ = _engine(acquired=True)
+        standby_engine, _ = _engine(acquired=False)
+        leader_worker, standby_worker = _FakeWorker(), _FakeWorker()
+        leader = LeaderElectedWorker("w", leader_worker, leader_engine)
+        standby = LeaderElectedWorker("w", standby_worker, standby_engine)
+
+        await leader.run_once()
+        await standby.run_once()
+
+        assert leader_worker.is_running is True
+        assert standby_worker.is_running is False
+
+    @pytest.mark.parametrize("acquired", [True, False])
+    async def test_stop_stops_worker_and_releases_lock(self, acquired: bool) -> None:
+        engine, conn = _engine(acquired=acquired)
+        worker = _FakeWorker()
+        elected = LeaderElectedWorker("w", worker, engine, retry_seconds=60)
+
+        elected.start()
+        assert elected.is_running is True
+        await asyncio.sleep(0)  # let the loop take its first election step
+        await elected.stop()
+
+        assert elected.is_running is False
+        assert elected.is_leader is False
+        assert worker.is_running is False
+        if acquired:
+            assert "pg_advisory_unlock" in str(conn.scalar.call_args.args[0])
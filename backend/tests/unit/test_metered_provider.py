@@ -10,6 +10,7 @@ call but before settle() — outbox pattern for settlement retry.
 REQ-028 §4: Cross-provider dispatch via registry.
 """
 
+import asyncio
 import logging
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -238,6 +239,50 @@ class TestMeteredLLMProviderComplete:
         call_kwargs = mock_metering.reserve.call_args.kwargs
         assert call_kwargs["max_tokens"] is None
 
+    async def test_concurrent_calls_serialize_metering_but_overlap_llm(
+        self,
+        metered_llm: MeteredLLMProvider,
+        inner_llm: MockLLMProvider,
+        mock_metering: AsyncMock,
+    ) -> None:
+        """Overlapping complete() calls never overlap session work."""
+        db_in_flight = 0
+        db_max = 0
+        llm_in_flight = 0
+        llm_max = 0
+
+        async def _db_op(*_args: object, **_kwargs: object) -> MagicMock:
+            nonlocal db_in_flight, db_max
+            db_in_flight += 1
+            db_max = max(db_max, db_in_flight)
+            await asyncio.sleep(0)
+            db_in_flight -= 1
+            return MagicMock()
+
+        inner_complete = inner_llm.complete
+
+        async def _llm_call(*args: object, **kwargs: object) -> object:
+            nonlocal llm_in_flight, llm_max
+            llm_in_flight += 1
+            llm_max = max(llm_max, llm_in_flight)
+            await asyncio.sleep(0.01)
+            llm_in_flight -= 1
+            return await inner_complete(*args, **kwargs)  # type: ignore[arg-type]
+
+        mock_metering.reserve.side_effect = _db_op
+        mock_metering.settle.side_effect = _db_op
+        inner_llm.complete = _llm_call  # type: ignore[method-assign]
+
+        await asyncio.gather(
+            *[
+                metered_llm.complete(_HELLO_MESSAGES, TaskType.SCORE_RATIONALE)
+                for _ in range(3)
+            ]
+        )
+
+        assert db_max == 1
+        assert llm_max == 3
+
 
 # =============================================================================
 # MeteredLLMProvider — persist_response_metadata (REQ-030 §5.8)
@@ -493,6 +538,21 @@ class TestMeteredLLMProviderRouting:
         last_call = inner_llm.calls[-1]
         assert last_call[_KEY_KWARGS][_KEY_MODEL_OVERRIDE] is None
 
+    async def test_resolve_model_returns_routed_model(
+        self, metered_llm: MeteredLLMProvider
+    ) -> None:
+        """resolve_model_for_task() reports the DB-routed model."""
+        result = await metered_llm.resolve_model_for_task(TaskType.EXTRACTION)
+        assert result == _ROUTED_MODEL
+
+    async def test_resolve_model_without_routing_uses_inner(
+        self, metered_llm: MeteredLLMProvider, mock_admin_config: AsyncMock
+    ) -> None:
+        """Without routing, the inner provider's model is reported."""
+        mock_admin_config.get_routing_for_task.return_value = None
+        result = await metered_llm.resolve_model_for_task(TaskType.EXTRACTION)
+        assert result == _MOCK_MODEL
+
     async def test_caller_cannot_pass_model_override_keyword(
         self,
         metered_llm: MeteredLLMProvider,
@@ -899,6 +959,14 @@ class TestMeteredEmbeddingProviderDelegation:
         """provider_name returns inner provider's name."""
         assert metered_embedding.provider_name == _MOCK_PROVIDER_NAME
 
+    def test_config_delegates(
+        self,
+        metered_embedding: MeteredEmbeddingProvider,
+        inner_embedding: MockEmbeddingProvider,
+    ) -> None:
+        """config exposes inner provider's config (embedding_model lookups)."""
+        assert metered_embedding.config is inner_embedding.config
+
 
 # =============================================================================
 # Dependency injection functions
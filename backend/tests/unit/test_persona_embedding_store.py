@@ -0,0 +1,162 @@
+"""Tests for the persona embedding store.
+
+REQ-008 §6.5-6.6, §10.2: Scoring reuses persona embeddings from the
+in-process cache or persona_embeddings, embedding only changed types.
+"""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.services.embedding.cache import PersonaEmbeddingCache
+from app.services.embedding.persona_embedding_store import PersonaEmbeddingStore
+from app.services.embedding.persona_generator import (
+    build_hard_skills_text,
+    build_logistics_text,
+    build_soft_skills_text,
+)
+from app.services.embedding.storage import compute_source_hash
+
+_MODULE = "app.services.embedding.persona_embedding_store"
+_PATCH_GET = f"{_MODULE}.PersonaEmbeddingRepository.get_for_persona"
+_PATCH_UPSERT = f"{_MODULE}.PersonaEmbeddingRepository.upsert_many"
+
+_MODEL = "text-embedding-004"
+_DIMS = 4
+_USER_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+def _make_persona() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        skills=[
+            SimpleNamespace(
+                skill_name="Python", skill_type="Hard", proficiency="Expert"
+            ),
+            SimpleNamespace(
+                skill_name="Leadership", skill_type="Soft", proficiency="Proficient"
+            ),
+        ],
+        home_city="Seattle",
+        home_state="WA",
+        home_country="USA",
+        remote_preference="Hybrid OK",
+        commutable_cities=[],
+        industry_exclusions=[],
+        updated_at=datetime(2026, 1, 15, tzinfo=UTC),
+    )
+
+
+def _make_row(embedding_type: str, text: str, value: float) -> MagicMock:
+    row = MagicMock()
+    row.embedding_type = embedding_type
+    row.source_hash = compute_source_hash(text)
+    row.vector = [value] * _DIMS
+    return row
+
+
+def _fresh_rows(persona: SimpleNamespace) -> list[MagicMock]:
+    return [
+        _make_row("hard_skills", build_hard_skills_text(persona.skills), 0.1),
+        _make_row("soft_skills", build_soft_skills_text(persona.skills), 0.2),
+        _make_row("logistics", build_logistics_text(persona), 0.3),
+    ]
+
+
+def _make_provider() -> MagicMock:
+    provider = MagicMock()
+    provider.config.embedding_model = _MODEL
+
+    async def _embed(texts: list[str]) -> SimpleNamespace:
+        return SimpleNamespace(vectors=[[0.5] * _DIMS for _ in texts])
+
+    provider.embed = AsyncMock(side_effect=_embed)
+    return provider
+
+
+class TestPersonaEmbeddingStore:
+    """Tests for PersonaEmbeddingStore.get_embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_rows_are_reused_and_cached(self) -> None:
+        """Fresh stored rows skip the provider and populate the L1 cache."""
+        persona = _make_persona()
+        provider = _make_provider()
+        cache = PersonaEmbeddingCache()
+
+        with (
+            patch(_PATCH_GET, return_value=_fresh_rows(persona)) as mock_get,
+            patch(_PATCH_UPSERT) as mock_upsert,
+        ):
+            store = PersonaEmbeddingStore(AsyncMock(), provider, cache)
+            result = await store.get_embeddings(persona, _USER_ID)
+
+        assert result.hard_skills.vector == [0.1] * _DIMS
+        assert result.soft_skills.vector == [0.2] * _DIMS
+        assert result.logistics.vector == [0.3] * _DIMS
+        assert result.model_name == _MODEL
+        provider.embed.assert_not_awaited()
+        mock_upsert.assert_not_awaited()
+        assert mock_get.call_args.kwargs["model_name"] == _MODEL
+        assert cache.get(_USER_ID, persona.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database_and_provider(self) -> None:
+        """A second call for an unchanged persona is served from L1."""
+        persona = _make_persona()
+        provider = _make_provider()
+        cache = PersonaEmbeddingCache()
+
+        with (
+            patch(_PATCH_GET, return_value=_fresh_rows(persona)) as mock_get,
+            patch(_PATCH_UPSERT),
+        ):
+            store = PersonaEmbeddingStore(AsyncMock(), provider, cache)
+            first = await store.get_embeddings(persona, _USER_ID)
+            second = await store.get_embeddings(persona, _USER_ID)
+
+        assert second is first
+        assert mock_get.await_count == 1
+        provider.embed.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_only_stale_types_are_embedded(self) -> None:
+        """Changed skills re-embed only their type, in one provider call."""
+        persona = _make_persona()
+        rows = _fresh_rows(persona)
+        rows[0] = _make_row("hard_skills", "Java (Expert)", 0.1)
+        provider = _make_provider()
+
+        with (
+            patch(_PATCH_GET, return_value=rows[:2]),
+            patch(_PATCH_UPSERT) as mock_upsert,
+        ):
+            store = PersonaEmbeddingStore(
+                AsyncMock(), provider, PersonaEmbeddingCache()
+            )
+            result = await store.get_embeddings(persona, _USER_ID)
+
+        provider.embed.assert_awaited_once_with(
+            [build_hard_skills_text(persona.skills), build_logistics_text(persona)]
+        )
+        assert result.hard_skills.vector == [0.5] * _DIMS
+        assert result.soft_skills.vector == [0.2] * _DIMS
+        upserted = mock_upsert.call_args.args[1]
+        assert [r["embedding_type"] for r in upserted] == ["hard_skills", "logistics"]
+        assert all(r["persona_id"] == persona.id for r in upserted)
+
+    @pytest.mark.asyncio
+    async def test_response_count_mismatch_raises(self) -> None:
+        """Provider returning the wrong number of vectors is rejected."""
+        provider = _make_provider()
+        provider.embed = AsyncMock(return_value=SimpleNamespace(vectors=[]))
+
+        with patch(_PATCH_GET, return_value=[]), patch(_PATCH_UPSERT):
+            store = PersonaEmbeddingStore(
+                AsyncMock(), provider, PersonaEmbeddingCache()
+            )
+            with pytest.raises(ValueError, match="count mismatch"):
+                await store.get_embeddings(_make_persona(), _USER_ID)
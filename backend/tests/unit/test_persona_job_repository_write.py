@@ -6,6 +6,7 @@ shared_job, shared_job_2, pj_a, pj_other from tests/unit/conftest.py.
 """
 
 import uuid
+from datetime import UTC, datetime
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,7 +15,11 @@ from app.models.job_posting import JobPosting
 from app.models.persona import Persona
 from app.models.persona_job import PersonaJob
 from app.models.user import User
-from app.repositories.persona_job_repository import PersonaJobRepository
+from app.repositories.persona_job_repository import (
+    PersonaJobRepository,
+    PersonaJobScoreUpdate,
+    PoolLinkCreate,
+)
 
 _MISSING_UUID = uuid.UUID("99999999-9999-9999-9999-999999999999")
 
@@ -229,3 +234,234 @@ class TestBulkUpdateFavorite:
             is_favorite=True,
         )
         assert count == 0
+
+
+class TestBulkUpdateScores:
+    """Test PersonaJobRepository.bulk_update_scores()."""
+
+    async def test_writes_scored_and_filtered_rows(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,
+        user_a: User,
+        shared_job: JobPosting,
+        shared_job_2: JobPosting,
+    ):
+        """One call writes fit/stretch/details and filter reasons per job."""
+        pj1 = PersonaJob(
+            persona_id=persona_a.id,
+            job_posting_id=shared_job.id,
+            status="Discovered",
+            discovery_method="scouter",
+        )
+        pj2 = PersonaJob(
+            persona_id=persona_a.id,
+            job_posting_id=shared_job_2.id,
+            status="Discovered",
+            discovery_method="pool",
+            score_details={"stale": True},
+        )
+        db_session.add_all([pj1, pj2])
+        await db_session.flush()
+        scored_at = datetime(2026, 3, 1, tzinfo=UTC)
+
+        count = await PersonaJobRepository.bulk_update_scores(
+            db_session,
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+            scores=[
+                PersonaJobScoreUpdate(
+                    job_posting_id=shared_job.id,
+                    fit_score=82,
+                    stretch_score=40,
+                    score_details={"fit": {"total": 82}},
+                    failed_non_negotiables=None,
+                ),
+                PersonaJobScoreUpdate(
+                    job_posting_id=shared_job_2.id,
+                    fit_score=None,
+                    stretch_score=None,
+                    score_details=None,
+                    failed_non_negotiables=["Salary too low"],
+                ),
+            ],
+            scored_at=scored_at,
+        )
+
+        assert count == 2
+        await db_session.refresh(pj1)
+        await db_session.refresh(pj2)
+        assert pj1.fit_score == 82
+        assert pj1.stretch_score == 40
+        assert pj1.score_details == {"fit": {"total": 82}}
+        assert pj1.scored_at == scored_at
+        assert pj2.fit_score is None
+        assert pj2.score_details is None
+        assert pj2.failed_non_negotiables == ["Salary too low"]
+
+    @pytest.mark.parametrize(
+        ("fit_score", "stretch_score", "score_details", "failed"),
+        [
+            (75, 30, {"fit": {"total": 75}}, None),
+            (None, None, None, ["Remote only"]),
+        ],
+        ids=["all_scored", "all_filtered"],
+    )
+    async def test_writes_chunk_with_all_null_column(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,
+        user_a: User,
+        shared_job: JobPosting,
+        shared_job_2: JobPosting,
+        fit_score: int | None,
+        stretch_score: int | None,
+        score_details: dict | None,
+        failed: list[str] | None,
+    ):
+        """A column that is NULL in every row still updates (typed VALUES)."""
+        links = [
+            PersonaJob(
+                persona_id=persona_a.id,
+                job_posting_id=job.id,
+                status="Discovered",
+                discovery_method="scouter",
+            )
+            for job in (shared_job, shared_job_2)
+        ]
+        db_session.add_all(links)
+        await db_session.flush()
+
+        count = await PersonaJobRepository.bulk_update_scores(
+            db_session,
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+            scores=[
+                PersonaJobScoreUpdate(
+                    job_posting_id=job.id,
+                    fit_score=fit_score,
+                    stretch_score=stretch_score,
+                    score_details=score_details,
+                    failed_non_negotiables=failed,
+                )
+                for job in (shared_job, shared_job_2)
+            ],
+            scored_at=datetime(2026, 3, 1, tzinfo=UTC),
+        )
+
+        assert count == 2
+        for link in links:
+            await db_session.refresh(link)
+            assert link.fit_score == fit_score
+            assert link.stretch_score == stretch_score
+            assert link.score_details == score_details
+            assert link.failed_non_negotiables == failed
+
+    async def test_skips_wrong_user(
+        self,
+        db_session: AsyncSession,
+        pj_a: PersonaJob,
+        persona_a: Persona,
+        other_user: User,
+        shared_job: JobPosting,
+    ):
+        """Scores are not written for personas the user does not own."""
+        count = await PersonaJobRepository.bulk_update_scores(
+            db_session,
+            persona_id=persona_a.id,
+            user_id=other_user.id,
+            scores=[
+                PersonaJobScoreUpdate(
+                    job_posting_id=shared_job.id,
+                    fit_score=90,
+                    stretch_score=50,
+                    score_details={},
+                    failed_non_negotiables=None,
+                )
+            ],
+            scored_at=datetime.now(UTC),
+        )
+        assert count == 0
+        await db_session.refresh(pj_a)
+        assert pj_a.fit_score is None
+
+    async def test_empty_scores_returns_zero(
+        self, db_session: AsyncSession, persona_a: Persona, user_a: User
+    ):
+        """Empty score list returns 0 without a query."""
+        count = await PersonaJobRepository.bulk_update_scores(
+            db_session,
+            persona_id=persona_a.id,
+            user_id=user_a.id,
+            scores=[],
+            scored_at=datetime.now(UTC),
+        )
+        assert count == 0
+
+
+class TestCreatePoolLinks:
+    """Test PersonaJobRepository.create_pool_links()."""
+
+    async def test_inserts_links_across_personas_and_jobs(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,
+        other_persona: Persona,
+        shared_job: JobPosting,
+        shared_job_2: JobPosting,
+    ):
+        """One call links several personas to several jobs."""
+        scored_at = datetime.now(UTC)
+        links = [
+            PoolLinkCreate(persona_a.id, shared_job.id, 80),
+            PoolLinkCreate(persona_a.id, shared_job_2.id, 70),
+            PoolLinkCreate(other_persona.id, shared_job_2.id, 90),
+        ]
+
+        created = await PersonaJobRepository.create_pool_links(
+            db_session, links, scored_at=scored_at
+        )
+
+        assert created == {
+            (persona_a.id, shared_job.id),
+            (persona_a.id, shared_job_2.id),
+            (other_persona.id, shared_job_2.id),
+        }
+        pj = await PersonaJobRepository.get_by_persona_and_job(
+            db_session, persona_id=persona_a.id, job_posting_id=shared_job.id
+        )
+        assert pj is not None
+        assert pj.discovery_method == "pool"
+        assert pj.status == "Discovered"
+        assert pj.fit_score == 80
+        assert pj.scored_at is not None
+
+    async def test_existing_links_are_skipped_unchanged(
+        self,
+        db_session: AsyncSession,
+        pj_a: PersonaJob,
+        persona_a: Persona,
+        shared_job: JobPosting,
+        shared_job_2: JobPosting,
+    ):
+        """Conflicting rows are not returned and keep their fields."""
+        created = await PersonaJobRepository.create_pool_links(
+            db_session,
+            [
+                PoolLinkCreate(persona_a.id, shared_job.id, 99),
+                PoolLinkCreate(persona_a.id, shared_job_2.id, 60),
+            ],
+            scored_at=datetime.now(UTC),
+        )
+
+        assert created == {(persona_a.id, shared_job_2.id)}
+        await db_session.refresh(pj_a)
+        assert pj_a.discovery_method == "scouter"
+        assert pj_a.fit_score is None
+
+    async def test_empty_links_returns_empty(self, db_session: AsyncSession):
+        """No links means no statement and nothing created."""
+        created = await PersonaJobRepository.create_pool_links(
+            db_session, [], scored_at=datetime.now(UTC)
+        )
+        assert created == set()
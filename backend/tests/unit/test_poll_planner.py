@@ -0,0 +1,188 @@
+"""Tests for cross-persona poll planning.
+
+REQ-034 §7.2: Due personas with overlapping search buckets share one
+fetch per distinct (source, query) pair; results fan out per persona.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from app.adapters.sources.base import SearchParams
+from app.services.discovery.poll_planner import (
+    PersonaPollPlan,
+    canonical_query_key,
+    fan_out,
+    plan_shared_queries,
+    prefetch_polls,
+)
+
+_FETCH = "app.services.discovery.poll_planner.fetch_from_sources"
+_NOW = datetime.now(UTC)
+
+
+def _plan(
+    *params: SearchParams, sources: tuple[str, ...] = ("Adzuna",)
+) -> PersonaPollPlan:
+    """Create a PersonaPollPlan for a fresh persona."""
+    return PersonaPollPlan(
+        persona_id=uuid4(),
+        enabled_sources=list(sources),
+        search_params_list=list(params),
+    )
+
+
+class TestCanonicalQueryKey:
+    """Tests for query canonicalization."""
+
+    def test_keyword_order_case_and_duplicates_ignored(self) -> None:
+        """Keywords are compared as a case-folded set."""
+        a = SearchParams(keywords=["Python", "FastAPI"], location="Austin")
+        b = SearchParams(keywords=["fastapi ", "python", "Python"], location="austin")
+
+        assert canonical_query_key(a) == canonical_query_key(b)
+
+    def test_date_window_ignored(self) -> None:
+        """Personas polled at different times still share a query."""
+        a = SearchParams(keywords=["Python"], max_days_old=2)
+        b = SearchParams(keywords=["Python"], max_days_old=7)
+
+        assert canonical_query_key(a) == canonical_query_key(b)
+
+    def test_remote_flag_distinguishes_queries(self) -> None:
+        """Remote-only searches are a different query."""
+        a = SearchParams(keywords=["Python"])
+        b = SearchParams(keywords=["Python"], remote_only=True)
+
+        assert canonical_query_key(a) != canonical_query_key(b)
+
+
+class TestPlanSharedQueries:
+    """Tests for grouping buckets into shared queries."""
+
+    def test_groups_overlapping_buckets(self) -> None:
+        """Same query across personas is planned once with all sources."""
+        shared = SearchParams(keywords=["Python"])
+        plans = [
+            _plan(shared, sources=("Adzuna",)),
+            _plan(SearchParams(keywords=["python"]), sources=("RemoteOK",)),
+            _plan(SearchParams(keywords=["Go"])),
+        ]
+
+        queries = plan_shared_queries(plans)
+
+        assert len(queries) == 2
+        assert queries[canonical_query_key(shared)].sources == {"Adzuna", "RemoteOK"}
+
+    def test_uses_widest_date_window(self) -> None:
+        """The shared fetch covers every persona's window."""
+        narrow = SearchParams(
+            keywords=["Python"],
+            max_days_old=2,
+            posted_after=_NOW - timedelta(days=2),
+        )
+        wide = SearchParams(
+            keywords=["Python"],
+            max_days_old=7,
+            posted_after=_NOW - timedelta(days=7),
+        )
+
+        queries = plan_shared_queries([_plan(narrow), _plan(wide)])
+
+        (query,) = queries.values()
+        assert query.params.max_days_old == 7
+        assert query.params.posted_after == wide.posted_after
+
+
+class TestFanOut:
+    """Tests for assembling per-persona results."""
+
+    def test_merges_buckets_and_filters_sources(self) -> None:
+        """Jobs concatenate per source; other personas' sources are dropped."""
+        fit = SearchParams(keywords=["Python"])
+        stretch = SearchParams(keywords=["Go"])
+        plan = _plan(fit, stretch, sources=("Adzuna",))
+        fetched = {
+            canonical_query_key(fit): (
+                {"Adzuna": [{"external_id": "1"}], "RemoteOK": [{"external_id": "x"}]},
+                ["RemoteOK"],
+            ),
+            canonical_query_key(stretch): ({"Adzuna": [{"external_id": "2"}]}, []),
+        }
+
+        prefetched = fan_out(plan, fetched)
+
+        assert prefetched.source_results == {
+            "Adzuna": [{"external_id": "1"}, {"external_id": "2"}]
+        }
+        assert prefetched.error_sources == []
+
+    def test_drops_jobs_outside_personas_own_window(self) -> None:
+        """A shared fetch widened for another persona is trimmed back."""
+        narrow = SearchParams(
+            keywords=["Python"], max_days_old=2, posted_after=_NOW - timedelta(days=2)
+        )
+        plan = _plan(narrow)
+        recent = {"external_id": "new", "posted_date": _NOW.isoformat()}
+        old = {
+            "external_id": "old",
+            "posted_date": (_NOW - timedelta(days=6)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        undated = {"external_id": "undated"}
+        fetched = {
+            canonical_query_key(narrow): ({"Adzuna": [recent, old, undated]}, [])
+        }
+
+        prefetched = fan_out(plan, fetched)
+
+        assert prefetched.source_results == {"Adzuna": [recent, undated]}
+
+    def test_max_days_old_alone_sets_the_window(self) -> None:
+        """Without posted_after, max_days_old counts back from now."""
+        params = SearchParams(keywords=["Python"], max_days_old=3)
+        old = {"external_id": "old", "posted_date": "2020-01-01T00:00:00Z"}
+        fetched = {canonical_query_key(params): ({"Adzuna": [old]}, [])}
+
+        prefetched = fan_out(_plan(params), fetched)
+
+        assert prefetched.source_results == {"Adzuna": []}
+
+    def test_no_window_keeps_all_jobs(self) -> None:
+        """A persona without an age limit receives every shared result."""
+        params = SearchParams(keywords=["Python"])
+        old = {"external_id": "old", "posted_date": "2020-01-01T00:00:00Z"}
+        fetched = {canonical_query_key(params): ({"Adzuna": [old]}, [])}
+
+        prefetched = fan_out(_plan(params), fetched)
+
+        assert prefetched.source_results == {"Adzuna": [old]}
+
+
+class TestPrefetchPolls:
+    """Tests for the shared fetch orchestration."""
+
+    async def test_fetches_each_distinct_query_once(self) -> None:
+        """Three personas over two distinct queries cost two fetches."""
+        python = SearchParams(keywords=["Python"])
+        go = SearchParams(keywords=["Go"])
+        plans = [_plan(python), _plan(SearchParams(keywords=["PYTHON"])), _plan(go)]
+
+        with patch(
+            _FETCH,
+            new_callable=AsyncMock,
+            return_value=({"Adzuna": [{"external_id": "1"}]}, []),
+        ) as mock_fetch:
+            prefetched = await prefetch_polls(plans, max_concurrent=5)
+
+        assert mock_fetch.await_count == 2
+        assert set(prefetched) == {plan.persona_id for plan in plans}
+
+    async def test_skips_personas_without_sources(self) -> None:
+        """Personas with no enabled sources are not prefetched."""
+        plan = _plan(SearchParams(keywords=["Python"]), sources=())
+
+        with patch(_FETCH, new_callable=AsyncMock) as mock_fetch:
+            prefetched = await prefetch_polls([plan], max_concurrent=5)
+
+        assert prefetched == {}
+        mock_fetch.assert_not_awaited()
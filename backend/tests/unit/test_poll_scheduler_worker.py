@@ -9,7 +9,12 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.adapters.sources.base import SearchParams
 from app.services.discovery.job_fetch_service import PollResult
+from app.services.discovery.poll_planner import PersonaPollPlan
 from app.services.discovery.poll_scheduler_worker import (
     _CATCHUP_LOOKBACK,
     _MAX_CONCURRENT_POLLS,
@@ -57,6 +62,19 @@ def _make_poll_result(**overrides: object) -> PollResult:
     return PollResult(**defaults)  # type: ignore[arg-type]
 
 
+@pytest.fixture
+def no_shared_fetch():
+    """Stub poll planning with empty plans, so no shared fetch runs."""
+
+    async def _empty_plan(_factory: object, item: _DueItem) -> PersonaPollPlan:
+        return PersonaPollPlan(
+            persona_id=item.persona_id, enabled_sources=[], search_params_list=[]
+        )
+
+    with patch(_LOAD_PLAN, side_effect=_empty_plan) as mock_load:
+        yield mock_load
+
+
 def _setup_mock_db_session(
     worker: PollSchedulerWorker,
     rows: list[tuple[object, ...]],
@@ -111,6 +129,7 @@ class TestWorkerLifecycle:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("no_shared_fetch")
 class TestRunOnce:
     """Tests for run_once() orchestration logic."""
 
@@ -212,6 +231,7 @@ class TestRunOnce:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("no_shared_fetch")
 class TestConcurrency:
     """Tests for asyncio.Semaphore concurrency limit."""
 
@@ -221,7 +241,7 @@ class TestConcurrency:
         current_concurrent = 0
         lock = asyncio.Lock()
 
-        async def mock_poll(_item: _DueItem) -> PollResult:
+        async def mock_poll(_item: _DueItem, _prefetched: object) -> PollResult:
             nonlocal peak_concurrent, current_concurrent
             async with lock:
                 current_concurrent += 1
@@ -255,6 +275,7 @@ class TestConcurrency:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("no_shared_fetch")
 class TestFaultIsolation:
     """Tests for per-persona fault isolation."""
 
@@ -262,7 +283,7 @@ class TestFaultIsolation:
         """REQ-034 §7.2: One persona's poll failure does not affect others."""
         items = [_make_due_item(), _make_due_item(), _make_due_item()]
 
-        async def mock_poll(item: _DueItem) -> PollResult:
+        async def mock_poll(item: _DueItem, _prefetched: object) -> PollResult:
             if item is items[1]:
                 raise RuntimeError("Simulated failure")
             return _make_poll_result()
@@ -287,7 +308,7 @@ class TestFaultIsolation:
         """All poll failures are counted in the result."""
         items = [_make_due_item(), _make_due_item()]
 
-        async def mock_poll(_item: _DueItem) -> PollResult:
+        async def mock_poll(_item: _DueItem, _prefetched: object) -> PollResult:
             raise RuntimeError("All fail")
 
         worker = PollSchedulerWorker(_make_mock_session_factory())
@@ -308,6 +329,85 @@ class TestFaultIsolation:
         assert result.total_new_jobs == 0
 
 
+# ---------------------------------------------------------------------------
+# Cross-persona shared fetches
+# ---------------------------------------------------------------------------
+
+_LOAD_PLAN = "app.services.discovery.poll_scheduler_worker.load_poll_plan"
+_PLANNER_FETCH = "app.services.discovery.poll_planner.fetch_from_sources"
+
+
+class TestSharedFetch:
+    """Tests for fetching overlapping persona queries once per pass."""
+
+    async def test_overlapping_personas_share_one_fetch(self) -> None:
+        """Two personas with the same bucket trigger a single source fetch."""
+        items = [_make_due_item(), _make_due_item()]
+        job = {"external_id": "a-1", "title": "Python Developer"}
+
+        async def mock_load(_factory: object, item: _DueItem) -> PersonaPollPlan:
+            return PersonaPollPlan(
+                persona_id=item.persona_id,
+                enabled_sources=["Adzuna"],
+                search_params_list=[SearchParams(keywords=["Python"])],
+            )
+
+        worker = PollSchedulerWorker(_make_mock_session_factory())
+
+        with (
+            patch.object(
+                worker,
+                "_get_due_personas",
+                new_callable=AsyncMock,
+                return_value=items,
+            ),
+            patch(_LOAD_PLAN, side_effect=mock_load),
+            patch(
+                _PLANNER_FETCH,
+                new_callable=AsyncMock,
+                return_value=({"Adzuna": [job]}, []),
+            ) as mock_fetch,
+            patch.object(
+                worker,
+                "_poll_persona",
+                new_callable=AsyncMock,
+                return_value=_make_poll_result(),
+            ) as mock_poll,
+        ):
+            result = await worker.run_once()
+
+        assert result.personas_polled == 2
+        mock_fetch.assert_awaited_once()
+        for call in mock_poll.await_args_list:
+            prefetched = call.args[1]
+            assert prefetched.source_results == {"Adzuna": [job]}
+
+    async def test_plan_failure_falls_back_to_own_fetch(self) -> None:
+        """A persona whose plan cannot be loaded polls without prefetch."""
+        items = [_make_due_item()]
+        worker = PollSchedulerWorker(_make_mock_session_factory())
+
+        with (
+            patch.object(
+                worker,
+                "_get_due_personas",
+                new_callable=AsyncMock,
+                return_value=items,
+            ),
+            patch(_LOAD_PLAN, side_effect=RuntimeError("db down")),
+            patch.object(
+                worker,
+                "_poll_persona",
+                new_callable=AsyncMock,
+                return_value=_make_poll_result(),
+            ) as mock_poll,
+        ):
+            result = await worker.run_once()
+
+        assert result.personas_polled == 1
+        mock_poll.assert_awaited_once_with(items[0], None)
+
+
 # ---------------------------------------------------------------------------
 # First-run 24-hour catch-up window
 # ---------------------------------------------------------------------------
@@ -377,3 +477,49 @@ class TestManualOnlyExclusion:
         assert len(items) == 1
         assert items[0].persona_id == daily_id
         assert items[0].polling_frequency == "Daily"
+
+
+# ---------------------------------------------------------------------------
+# Claiming
+# ---------------------------------------------------------------------------
+
+
+def _compiled_sql(statement: object) -> str:
+    """Render a captured statement as PostgreSQL SQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+
+class TestClaiming:
+    """Tests for SKIP LOCKED claiming of due personas.
+
+    REQ-034 §7.2: Concurrent schedulers must never poll the same persona
+    twice; each claims a disjoint share of the due rows.
+    """
+
+    async def test_claims_due_rows_with_skip_locked_and_lease(self) -> None:
+        worker = PollSchedulerWorker(_make_mock_session_factory())
+        worker._last_run_at = datetime.now(UTC)  # Not the first run
+        _setup_mock_db_session(worker, [])
+
+        await worker._get_due_personas()
+
+        session = worker._session_factory.return_value
+        assert session.execute.await_count == 1
+        sql = _compiled_sql(session.execute.await_args.args[0])
+        assert "FOR UPDATE OF polling_configurations SKIP LOCKED" in sql
+        assert "SET claimed_until=" in sql
+        assert "polling_configurations.claimed_until <=" in sql
+        session.commit.assert_awaited_once()
+
+    async def test_first_run_creates_missing_configurations(self) -> None:
+        """Never-polled personas get a row so they can be claimed."""
+        worker = PollSchedulerWorker(_make_mock_session_factory())
+        _setup_mock_db_session(worker, [])
+
+        await worker._get_due_personas()
+
+        session = worker._session_factory.return_value
+        assert session.execute.await_count == 2
+        sql = _compiled_sql(session.execute.await_args_list[0].args[0])
+        assert sql.startswith("INSERT INTO polling_configurations (persona_id)")
+        assert "ON CONFLICT (persona_id) DO NOTHING" in sql
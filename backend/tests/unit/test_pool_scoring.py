@@ -5,6 +5,7 @@ work model alignment, seniority alignment, keyword overlap, lightweight fit.
 """
 
 import hashlib
+import uuid
 from datetime import date
 
 import pytest_asyncio
@@ -18,6 +19,7 @@ from app.models.persona import Persona
 from app.models.persona_content import Skill
 from app.models.user import User
 from app.services.scoring.pool_scoring import (
+    SkillIndex,
     calculate_lightweight_fit,
     keyword_pre_screen,
     score_experience_alignment,
@@ -192,6 +194,24 @@ class TestKeywordPreScreen:
             keyword_pre_screen("Python Developer", "", ["Python", "Rust", "Go"]) is True
         )
 
+    def test_matches_whole_tokens_only(self) -> None:
+        """A skill does not match inside a longer word (Java vs JavaScript)."""
+        assert keyword_pre_screen("JavaScript Developer", "", ["Java"]) is False
+
+    def test_symbol_skills_match(self) -> None:
+        assert keyword_pre_screen("Engineer", "Modern C++, Go.", ["c++"]) is True
+        assert keyword_pre_screen("Engineer", "Node.js services", ["Node.js"]) is True
+
+    def test_punctuation_separates_tokens(self) -> None:
+        assert keyword_pre_screen("DevOps", "Own CI/CD pipelines", ["ci-cd"]) is True
+
+    def test_missing_space_after_period_still_matches(self) -> None:
+        """A skill fused to the next sentence by a period still matches."""
+        description = "Strong Python.Experience with AWS required"
+        assert keyword_pre_screen("Engineer", description, ["Python"]) is True
+        assert keyword_pre_screen("Engineer", description, ["Experience"]) is True
+        assert keyword_pre_screen("Engineer", "Node.js services", ["Node"]) is True
+
 
 class TestScoreExperienceAlignment:
     """Tests for score_experience_alignment()."""
@@ -337,3 +357,69 @@ class TestCalculateLightweightFit:
         persona = await _load_persona_with_skills(db_session, persona_with_skills.id)
         fit = calculate_lightweight_fit(data_job, persona, persona.skills)
         assert fit.total < 50
+
+
+class TestSkillIndex:
+    """Tests for SkillIndex — bulk keyword pre-screen."""
+
+    def test_candidates_share_a_skill_with_the_job(self) -> None:
+        index = SkillIndex()
+        python_dev, react_dev, ml_dev = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        index.add(python_dev, ["Python", "FastAPI"])
+        index.add(react_dev, ["React", "TypeScript"])
+        index.add(ml_dev, ["Machine Learning"])
+
+        assert index.candidates(
+            "Senior Python Developer", "Experience with machine learning"
+        ) == {python_dev, ml_dev}
+
+    def test_agrees_with_keyword_pre_screen(self) -> None:
+        skills = {
+            uuid.uuid4(): ["Java"],
+            uuid.uuid4(): ["C#", ".NET"],
+            uuid.uuid4(): ["Data Analysis", "SQL"],
+            uuid.uuid4(): [],
+        }
+        index = SkillIndex()
+        for persona_id, names in skills.items():
+            index.add(persona_id, names)
+        title, description = "Backend Engineer", "JavaScript, C# and .NET; some SQL"
+
+        assert index.candidates(title, description) == {
+            persona_id
+            for persona_id, names in skills.items()
+            if keyword_pre_screen(title, description, names)
+        }
+
+    def test_dotted_tokens_match_split_and_whole(self) -> None:
+        index = SkillIndex()
+        python_dev, node_dev = uuid.uuid4(), uuid.uuid4()
+        index.add(python_dev, ["Python"])
+        index.add(node_dev, ["Node.js"])
+
+        assert index.candidates("Engineer", "Python.Experience with Node.js") == {
+            python_dev,
+            node_dev,
+        }
+
+    def test_add_replaces_previous_skills(self) -> None:
+        index = SkillIndex()
+        persona_id = uuid.uuid4()
+        index.add(persona_id, ["Python"])
+        index.add(persona_id, ["Go"])
+
+        assert index.candidates("Python Developer", "") == set()
+        assert index.candidates("Go Developer", "") == {persona_id}
+
+    def test_remove_drops_persona(self) -> None:
+        index = SkillIndex()
+        kept, removed = uuid.uuid4(), uuid.uuid4()
+        index.add(kept, ["Python"])
+        index.add(removed, ["Python", "Kubernetes Operators"])
+        index.remove(removed)
+
+        assert len(index) == 1
+        assert index.candidates("Python", "kubernetes operators") == {kept}
+
+    def test_empty_index_has_no_candidates(self) -> None:
+        assert SkillIndex().candidates("Python Developer", "Python") == set()
@@ -6,6 +6,8 @@ run_surfacing_pass, UNIQUE dedup, rate limiting.
 
 import hashlib
 from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from unittest.mock import patch
 
 import pytest_asyncio
 from sqlalchemy import select
@@ -19,13 +21,17 @@ from app.models.persona_content import Skill
 from app.models.persona_job import PersonaJob
 from app.models.user import User
 from app.services.discovery.pool_surfacing_service import (
+    _build_skill_index,
     get_active_personas_with_skills,
     get_existing_persona_ids_for_job,
     get_unsurfaced_jobs,
+    iter_persona_chunks,
+    match_job_to_personas,
     run_surfacing_pass,
     surface_job_to_personas,
 )
 
+_SERVICE = "app.services.discovery.pool_surfacing_service"
 _TODAY = date.today()
 _HASH_A = hashlib.sha256(b"Python developer at Acme").hexdigest()
 _HASH_B = hashlib.sha256(b"Data analyst at DataCo").hexdigest()
@@ -273,6 +279,33 @@ class TestGetUnsurfacedJobs:
         jobs = await get_unsurfaced_jobs(db_session, since=since)
         assert len(jobs) == 0
 
+    async def test_excludes_surfaced_jobs(
+        self,
+        db_session: AsyncSession,
+        python_job: JobPosting,
+        react_job: JobPosting,
+    ) -> None:
+        python_job.surfaced_at = datetime.now(UTC)
+        await db_session.flush()
+
+        ids = {j.id for j in await get_unsurfaced_jobs(db_session)}
+        assert python_job.id not in ids
+        assert react_job.id in ids
+
+    async def test_returns_oldest_first(
+        self,
+        db_session: AsyncSession,
+        python_job: JobPosting,
+        react_job: JobPosting,
+    ) -> None:
+        python_job.created_at = datetime.now(UTC) - timedelta(hours=2)
+        react_job.created_at = datetime.now(UTC) - timedelta(hours=3)
+        await db_session.flush()
+
+        jobs = await get_unsurfaced_jobs(db_session)
+        order = [j.id for j in jobs if j.id in {python_job.id, react_job.id}]
+        assert order == [react_job.id, python_job.id]
+
 
 class TestGetActivePersonasWithSkills:
     """Tests for get_active_personas_with_skills()."""
@@ -305,6 +338,32 @@ class TestGetActivePersonasWithSkills:
             # Skills relationship should be eagerly loaded (accessible without lazy query)
             assert p.skills is not None
 
+    async def test_keyset_pages_by_id(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,
+        persona_b: Persona,
+    ) -> None:
+        first, second = sorted([persona_a.id, persona_b.id])
+
+        page = await get_active_personas_with_skills(db_session, after_id=first)
+        ids = [p.id for p in page]
+        assert first not in ids
+        assert second in ids
+
+    async def test_iter_persona_chunks_streams_every_persona(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,
+        persona_b: Persona,
+    ) -> None:
+        chunks = [c async for c in iter_persona_chunks(db_session, chunk_size=1)]
+
+        assert all(len(c) == 1 for c in chunks)
+        ids = [p.id for c in chunks for p in c]
+        assert {persona_a.id, persona_b.id} <= set(ids)
+        assert ids == sorted(ids)
+
 
 class TestGetExistingPersonaIdsForJob:
     """Tests for get_existing_persona_ids_for_job()."""
@@ -428,6 +487,48 @@ class TestSurfaceJobToPersonas:
             assert link.scored_at is not None
 
 
+class TestMatchJobToPersonas:
+    """Tests for match_job_to_personas() (pure, no writes)."""
+
+    async def test_returns_matches_without_writing(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,
+        python_job: JobPosting,
+    ) -> None:
+        personas = await _load_all_personas_with_skills(db_session)
+        matches, _, _ = match_job_to_personas(
+            python_job,
+            personas,
+            skill_index=_build_skill_index(personas),
+            existing_persona_ids=set(),
+        )
+
+        assert [m.persona_id for m in matches] == [persona_a.id]
+        assert matches[0].job_posting_id == python_job.id
+        links = await db_session.execute(
+            select(PersonaJob).where(PersonaJob.job_posting_id == python_job.id)
+        )
+        assert links.scalars().all() == []
+
+    async def test_existing_links_are_not_matched(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,
+        python_job: JobPosting,
+    ) -> None:
+        personas = await _load_all_personas_with_skills(db_session)
+        matches, _, skipped_existing = match_job_to_personas(
+            python_job,
+            personas,
+            skill_index=_build_skill_index(personas),
+            existing_persona_ids={persona_a.id},
+        )
+
+        assert matches == []
+        assert skipped_existing == 1
+
+
 class TestRunSurfacingPass:
     """Tests for run_surfacing_pass()."""
 
@@ -471,5 +572,79 @@ class TestRunSurfacingPass:
         result1 = await run_surfacing_pass(db_session, since=since)
         result2 = await run_surfacing_pass(db_session, since=since)
 
+        assert result1.links_created >= 1
+        # The first pass advanced the durable cursor past the job.
+        assert result2.jobs_processed == 0
         assert result2.links_created == 0
-        assert result2.links_skipped_existing >= result1.links_created
+
+    async def test_marks_processed_jobs_surfaced(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,  # noqa: ARG002
+        python_job: JobPosting,
+    ) -> None:
+        await run_surfacing_pass(db_session)
+
+        await db_session.refresh(python_job)
+        assert python_job.surfaced_at is not None
+
+    async def test_backlog_drains_across_passes(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,  # noqa: ARG002
+        python_job: JobPosting,  # noqa: ARG002
+        react_job: JobPosting,  # noqa: ARG002
+        data_job: JobPosting,  # noqa: ARG002
+    ) -> None:
+        first = await run_surfacing_pass(db_session, max_jobs=2)
+        second = await run_surfacing_pass(db_session, max_jobs=2)
+        third = await run_surfacing_pass(db_session, max_jobs=2)
+
+        assert first.jobs_processed == 2
+        assert second.jobs_processed == 1
+        assert third.jobs_processed == 0
+
+    async def test_indexes_personas_once_per_pass(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,  # noqa: ARG002
+        python_job: JobPosting,  # noqa: ARG002
+        react_job: JobPosting,  # noqa: ARG002
+        data_job: JobPosting,  # noqa: ARG002
+    ) -> None:
+        """Several job chunks share one persona stream and skill index."""
+        with (
+            patch(f"{_SERVICE}._JOBS_PER_CHUNK", 1),
+            patch(
+                f"{_SERVICE}._build_skill_index", wraps=_build_skill_index
+            ) as build_index,
+        ):
+            result = await run_surfacing_pass(db_session)
+
+        assert result.jobs_processed == 3
+        build_index.assert_called_once()
+
+    async def test_failing_job_is_stamped_and_does_not_block(
+        self,
+        db_session: AsyncSession,
+        persona_a: Persona,  # noqa: ARG002
+        python_job: JobPosting,
+        react_job: JobPosting,
+    ) -> None:
+        """A job whose matching raises is skipped and stamped; others surface."""
+
+        def _match(job: JobPosting, *args: Any, **kwargs: Any) -> Any:
+            if job.id == python_job.id:
+                raise ValueError("malformed posting")
+            return match_job_to_personas(job, *args, **kwargs)
+
+        with patch(f"{_SERVICE}.match_job_to_personas", side_effect=_match):
+            result = await run_surfacing_pass(db_session)
+
+        assert result.jobs_processed == 2
+        assert result.jobs_failed == 1
+        await db_session.refresh(python_job)
+        await db_session.refresh(react_job)
+        assert python_job.surfaced_at is not None
+        assert react_job.surfaced_at is not None
+        assert (await run_surfacing_pass(db_session)).jobs_processed == 0
@@ -3,16 +3,13 @@
 REQ-015 §7.1: asyncio background task lifecycle (start/stop/run_once).
 """
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.services.discovery.pool_surfacing_service import SurfacingPassResult
-from app.services.discovery.pool_surfacing_worker import (
-    _INITIAL_LOOKBACK,
-    PoolSurfacingWorker,
-)
+from app.services.discovery.pool_surfacing_worker import PoolSurfacingWorker
 
 _PATCH_RUN_SURFACING = "app.services.discovery.pool_surfacing_worker.run_surfacing_pass"
 
@@ -114,9 +111,10 @@ class TestWorkerRunOnce:
 
         assert worker.last_run_at == mock_result.finished_at
 
-    async def test_first_run_uses_initial_lookback(
+    async def test_run_once_resumes_from_durable_cursor(
         self, mock_session_factory: MagicMock
     ) -> None:
+        """Passes rely on job_postings.surfaced_at, not a time window."""
         mock_result = _make_pass_result()
         worker = PoolSurfacingWorker(mock_session_factory, interval_seconds=60)
 
@@ -125,35 +123,8 @@ class TestWorkerRunOnce:
             new_callable=AsyncMock,
             return_value=mock_result,
         ) as mock_pass:
-            before = datetime.now(UTC)
+            await worker.run_once()
             await worker.run_once()
 
-        # The 'since' should be approximately now - 24 hours
-        call_kwargs = mock_pass.call_args
-        since_arg = call_kwargs.kwargs["since"]
-        expected_earliest = before - _INITIAL_LOOKBACK - timedelta(seconds=5)
-        assert since_arg >= expected_earliest
-
-    async def test_subsequent_run_uses_last_run_timestamp(
-        self, mock_session_factory: MagicMock
-    ) -> None:
-        mock_result = _make_pass_result()
-        worker = PoolSurfacingWorker(mock_session_factory, interval_seconds=60)
-
-        with patch(
-            _PATCH_RUN_SURFACING,
-            new_callable=AsyncMock,
-            return_value=mock_result,
-        ):
-            await worker.run_once()  # Sets last_run_at
-
-        with patch(
-            _PATCH_RUN_SURFACING,
-            new_callable=AsyncMock,
-            return_value=mock_result,
-        ) as mock_pass:
-            await worker.run_once()  # Should use last_run_at as 'since'
-
-        call_kwargs = mock_pass.call_args
-        since_arg = call_kwargs.kwargs["since"]
-        assert since_arg == mock_result.finished_at
+        for call in mock_pass.call_args_list:
+            assert "since" not in call.kwargs
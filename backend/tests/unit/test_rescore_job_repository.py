@@ -0,0 +1,331 @@
+"""Tests for RescoreJobRepository — the durable rescore queue.
+
+REQ-017 §6.2: Enqueue with per-persona coalescing, SKIP LOCKED claims,
+progress heartbeats, and stale-claim recovery.
+Fixtures: user_a, other_user, persona_a, other_persona from
+tests/unit/conftest.py.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.persona import Persona
+from app.models.rescore_job import RescoreJob
+from app.models.user import User
+from app.repositories.rescore_job_repository import RescoreJobRepository
+
+
+async def _age(db: AsyncSession, job: RescoreJob, minutes: int) -> None:
+    """Move a job's heartbeat into the past."""
+    await db.execute(
+        update(RescoreJob)
+        .where(RescoreJob.id == job.id)
+        .values(updated_at=datetime.now(UTC) - timedelta(minutes=minutes))
+    )
+    await db.flush()
+
+
+class TestEnqueue:
+    """Test RescoreJobRepository.enqueue_for_user()."""
+
+    async def test_queues_one_job_per_owned_persona(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,
+        other_persona: Persona,  # noqa: ARG002
+    ):
+        """Only the user's personas are queued."""
+        jobs = await RescoreJobRepository.enqueue_for_user(
+            db_session, user_id=user_a.id
+        )
+
+        assert [j.persona_id for j in jobs] == [persona_a.id]
+        assert jobs[0].status == "queued"
+        assert jobs[0].processed_jobs == 0
+
+    async def test_repeated_requests_coalesce(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """A second request while queued returns the same job."""
+        first = await RescoreJobRepository.enqueue_for_user(
+            db_session, user_id=user_a.id
+        )
+        second = await RescoreJobRepository.enqueue_for_user(
+            db_session, user_id=user_a.id
+        )
+
+        assert [j.id for j in second] == [j.id for j in first]
+
+    async def test_repeated_enqueues_on_one_session(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """Enqueuing past the prepared-statement generic-plan threshold works."""
+        first = await RescoreJobRepository.enqueue_for_user(
+            db_session, user_id=user_a.id
+        )
+        for _ in range(7):
+            again = await RescoreJobRepository.enqueue_for_user(
+                db_session, user_id=user_a.id
+            )
+            assert [j.id for j in again] == [j.id for j in first]
+
+    async def test_running_job_does_not_block_new_request(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """A request during a running rescore queues a follow-up."""
+        first = await RescoreJobRepository.enqueue_for_user(
+            db_session, user_id=user_a.id
+        )
+        claimed = await RescoreJobRepository.claim_next(db_session)
+        assert claimed is not None
+        assert claimed.id == first[0].id
+
+        second = await RescoreJobRepository.enqueue_for_user(
+            db_session, user_id=user_a.id
+        )
+
+        assert len(second) == 1
+        assert second[0].id != first[0].id
+
+
+class TestClaim:
+    """Test RescoreJobRepository.claim_next()."""
+
+    async def test_claims_oldest_queued_job(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """Claiming marks the job running and counts the attempt."""
+        await RescoreJobRepository.enqueue_for_user(db_session, user_id=user_a.id)
+
+        job = await RescoreJobRepository.claim_next(db_session)
+
+        assert job is not None
+        assert job.status == "running"
+        assert job.attempts == 1
+        assert job.started_at is not None
+
+    async def test_empty_queue_returns_none(self, db_session: AsyncSession):
+        """Nothing queued, nothing claimed."""
+        assert await RescoreJobRepository.claim_next(db_session) is None
+
+    async def test_skips_persona_with_running_job(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """A follow-up waits until the persona's running job finishes."""
+        await RescoreJobRepository.enqueue_for_user(db_session, user_id=user_a.id)
+        running = await RescoreJobRepository.claim_next(db_session)
+        assert running is not None
+        await RescoreJobRepository.enqueue_for_user(db_session, user_id=user_a.id)
+
+        assert await RescoreJobRepository.claim_next(db_session) is None
+
+        await RescoreJobRepository.mark_finished(db_session, running.id)
+        assert await RescoreJobRepository.claim_next(db_session) is not None
+
+    async def test_concurrent_claim_for_same_persona_is_rejected(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,
+    ):
+        """A claim racing another worker's claim for the persona backs off."""
+        await RescoreJobRepository.enqueue_for_user(db_session, user_id=user_a.id)
+        execute = db_session.execute
+
+        async def _claim_elsewhere(*args: Any, **kwargs: Any) -> Any:
+            # Another worker's claim lands after this claim's snapshot.
+            result = await execute(*args, **kwargs)
+            await execute(
+                insert(RescoreJob).values(
+                    user_id=user_a.id, persona_id=persona_a.id, status="running"
+                )
+            )
+            return result
+
+        with patch.object(db_session, "execute", side_effect=_claim_elsewhere):
+            assert await RescoreJobRepository.claim_next(db_session) is None
+
+    async def test_one_running_job_per_persona(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,
+    ):
+        """The database rejects a second running job for a persona."""
+        values = {"user_id": user_a.id, "persona_id": persona_a.id, "status": "running"}
+        await db_session.execute(insert(RescoreJob).values(**values))
+
+        with pytest.raises(IntegrityError):
+            await db_session.execute(insert(RescoreJob).values(**values))
+
+
+class TestProgressAndFinish:
+    """Test record_progress() and mark_finished()."""
+
+    async def test_records_progress_and_completion(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """Progress and final status are visible to the owner."""
+        await RescoreJobRepository.enqueue_for_user(db_session, user_id=user_a.id)
+        job = await RescoreJobRepository.claim_next(db_session)
+        assert job is not None
+
+        await RescoreJobRepository.record_progress(
+            db_session, job.id, processed_jobs=100, total_jobs=250
+        )
+        await RescoreJobRepository.mark_finished(db_session, job.id)
+        job_id, user_id = job.id, user_a.id
+        db_session.expire_all()
+
+        stored = await RescoreJobRepository.get_by_id(
+            db_session, job_id, user_id=user_id
+        )
+        assert stored is not None
+        assert stored.processed_jobs == 100
+        assert stored.total_jobs == 250
+        assert stored.status == "completed"
+        assert stored.finished_at is not None
+
+    async def test_mark_failed_stores_error(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """An error marks the job failed."""
+        await RescoreJobRepository.enqueue_for_user(db_session, user_id=user_a.id)
+        job = await RescoreJobRepository.claim_next(db_session)
+        assert job is not None
+
+        await RescoreJobRepository.mark_finished(
+            db_session, job.id, error="Rescore failed"
+        )
+        job_id, user_id = job.id, user_a.id
+        db_session.expire_all()
+
+        stored = await RescoreJobRepository.get_by_id(
+            db_session, job_id, user_id=user_id
+        )
+        assert stored is not None
+        assert stored.status == "failed"
+        assert stored.error == "Rescore failed"
+
+    async def test_get_by_id_is_scoped_to_owner(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        other_user: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """Another user's rescore job is not visible."""
+        jobs = await RescoreJobRepository.enqueue_for_user(
+            db_session, user_id=user_a.id
+        )
+
+        assert (
+            await RescoreJobRepository.get_by_id(
+                db_session, jobs[0].id, user_id=other_user.id
+            )
+            is None
+        )
+
+
+class TestRecoverStale:
+    """Test RescoreJobRepository.recover_stale()."""
+
+    async def test_requeues_stale_running_job(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """A running job without heartbeats goes back to the queue."""
+        await RescoreJobRepository.enqueue_for_user(db_session, user_id=user_a.id)
+        job = await RescoreJobRepository.claim_next(db_session)
+        assert job is not None
+        await _age(db_session, job, minutes=30)
+
+        recovered = await RescoreJobRepository.recover_stale(
+            db_session,
+            stale_before=datetime.now(UTC) - timedelta(minutes=15),
+            max_attempts=3,
+        )
+        job_id, user_id = job.id, user_a.id
+        db_session.expire_all()
+
+        assert recovered == 1
+        stored = await RescoreJobRepository.get_by_id(
+            db_session, job_id, user_id=user_id
+        )
+        assert stored is not None
+        assert stored.status == "queued"
+
+    async def test_fails_stale_job_superseded_by_queued_request(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """A newer queued request replaces a stale running job."""
+        await RescoreJobRepository.enqueue_for_user(db_session, user_id=user_a.id)
+        job = await RescoreJobRepository.claim_next(db_session)
+        assert job is not None
+        await RescoreJobRepository.enqueue_for_user(db_session, user_id=user_a.id)
+        await _age(db_session, job, minutes=30)
+
+        await RescoreJobRepository.recover_stale(
+            db_session,
+            stale_before=datetime.now(UTC) - timedelta(minutes=15),
+            max_attempts=3,
+        )
+        job_id, user_id = job.id, user_a.id
+        db_session.expire_all()
+
+        stored = await RescoreJobRepository.get_by_id(
+            db_session, job_id, user_id=user_id
+        )
+        assert stored is not None
+        assert stored.status == "failed"
+
+    async def test_fresh_running_job_is_untouched(
+        self,
+        db_session: AsyncSession,
+        user_a: User,
+        persona_a: Persona,  # noqa: ARG002
+    ):
+        """Jobs with recent heartbeats keep running."""
+        await RescoreJobRepository.enqueue_for_user(db_session, user_id=user_a.id)
+        await RescoreJobRepository.claim_next(db_session)
+
+        recovered = await RescoreJobRepository.recover_stale(
+            db_session,
+            stale_before=datetime.now(UTC) - timedelta(minutes=15),
+            max_attempts=3,
+        )
+
+        assert recovered == 0
@@ -0,0 +1,171 @@
+"""Tests for the rescore queue worker.
+
+REQ-017 §6.2: Lifecycle (start/stop), per-chunk progress commits,
+failure isolation, and SSE notification on completion.
+"""
+
+import uuid
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.schemas.chat import DataChangedEvent
+from app.services.scoring.job_scoring_service import RescoreChunk
+from app.services.scoring.rescore_worker import RescoreWorker
+
+_MODULE = "app.services.scoring.rescore_worker"
+_PATCH_REPO = f"{_MODULE}.RescoreJobRepository"
+_PATCH_SERVICE = f"{_MODULE}.JobScoringService"
+_PATCH_PROVIDERS = f"{_MODULE}._build_providers"
+_PATCH_NOTIFY = f"{_MODULE}.notify_user_event"
+
+_USER_ID = uuid.uuid4()
+_PERSONA_ID = uuid.uuid4()
+
+
+def _make_job() -> MagicMock:
+    """Create a claimed RescoreJob stand-in."""
+    job = MagicMock()
+    job.id = uuid.uuid4()
+    job.user_id = _USER_ID
+    job.persona_id = _PERSONA_ID
+    return job
+
+
+def _chunks(*chunks: RescoreChunk) -> MagicMock:
+    """Build a rescore_discovered_in_chunks stand-in yielding chunks."""
+
+    async def _gen(*_args: object, **_kwargs: object) -> AsyncIterator[RescoreChunk]:
+        for chunk in chunks:
+            yield chunk
+
+    return MagicMock(side_effect=_gen)
+
+
+@pytest.fixture
+def mock_session_factory() -> MagicMock:
+    """Create a mock async session factory with context manager support."""
+    mock_session = AsyncMock()
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=mock_session)
+
+
+@pytest.fixture
+def mock_repo():
+    """Patch RescoreJobRepository with an empty queue by default."""
+    with patch(_PATCH_REPO) as repo:
+        repo.recover_stale = AsyncMock(return_value=0)
+        repo.claim_next = AsyncMock(return_value=None)
+        repo.record_progress = AsyncMock()
+        repo.mark_finished = AsyncMock()
+        yield repo
+
+
+@pytest.fixture
+def mock_service():
+    """Patch JobScoringService and provider construction."""
+    with (
+        patch(_PATCH_SERVICE) as service_cls,
+        patch(_PATCH_PROVIDERS, return_value=(MagicMock(), MagicMock())),
+    ):
+        yield service_cls.return_value
+
+
+@pytest.fixture
+def mock_notify():
+    """Patch the cross-process SSE notification."""
+    with patch(_PATCH_NOTIFY, new_callable=AsyncMock) as notify:
+        yield notify
+
+
+class TestWorkerLifecycle:
+    """Tests for RescoreWorker start/stop."""
+
+    async def test_start_and_stop(self) -> None:
+        worker = RescoreWorker(MagicMock(), interval_seconds=60)
+
+        with patch.object(worker, "_run_loop", new_callable=AsyncMock):
+            worker.start()
+            assert worker.is_running is True
+            await worker.stop()
+            assert worker.is_running is False
+
+    async def test_stop_without_start_is_safe(self) -> None:
+        worker = RescoreWorker(MagicMock(), interval_seconds=60)
+        await worker.stop()  # Should not raise
+
+
+class TestWorkerRunOnce:
+    """Tests for RescoreWorker.run_once()."""
+
+    async def test_empty_queue_does_nothing(
+        self, mock_session_factory: MagicMock, mock_repo: MagicMock
+    ) -> None:
+        worker = RescoreWorker(mock_session_factory)
+
+        result = await worker.run_once()
+
+        assert result.jobs_completed == 0
+        mock_repo.recover_stale.assert_awaited_once()
+        mock_repo.mark_finished.assert_not_awaited()
+
+    async def test_records_progress_per_chunk_and_completes(
+        self,
+        mock_session_factory: MagicMock,
+        mock_repo: MagicMock,
+        mock_service: MagicMock,
+        mock_notify: AsyncMock,
+    ) -> None:
+        job = _make_job()
+        mock_repo.claim_next.side_effect = [job, None]
+        mock_service.rescore_discovered_in_chunks = _chunks(
+            RescoreChunk(results=[], processed=100, total=150),
+            RescoreChunk(results=[], processed=150, total=150),
+        )
+        worker = RescoreWorker(mock_session_factory, chunk_size=100)
+
+        result = await worker.run_once()
+
+        assert result.jobs_completed == 1
+        assert result.jobs_scored == 150
+        progress = [
+            c.kwargs["processed_jobs"]
+            for c in mock_repo.record_progress.await_args_list
+        ]
+        assert progress == [100, 150]
+        mock_repo.mark_finished.assert_awaited_once()
+        assert mock_repo.mark_finished.await_args.kwargs["error"] is None
+
+        _db, user_id, event = mock_notify.await_args.args
+        assert user_id == _USER_ID
+        assert isinstance(event, DataChangedEvent)
+        assert event.resource == "job-posting"
+        assert event.id == str(job.id)
+
+    async def test_failure_is_recorded_and_queue_continues(
+        self,
+        mock_session_factory: MagicMock,
+        mock_repo: MagicMock,
+        mock_service: MagicMock,
+        mock_notify: AsyncMock,
+    ) -> None:
+        failing, succeeding = _make_job(), _make_job()
+        mock_repo.claim_next.side_effect = [failing, succeeding, None]
+
+        async def _gen(_persona_id, *_args, **_kwargs):
+            if mock_service.rescore_discovered_in_chunks.call_count == 1:
+                raise ValueError("boom")
+            yield RescoreChunk(results=[], processed=1, total=1)
+
+        mock_service.rescore_discovered_in_chunks = MagicMock(side_effect=_gen)
+        worker = RescoreWorker(mock_session_factory)
+
+        result = await worker.run_once()
+
+        assert result.jobs_failed == 1
+        assert result.jobs_completed == 1
+        errors = [c.kwargs["error"] for c in mock_repo.mark_finished.await_args_list]
+        assert errors == ["Rescore failed", None]
+        assert mock_notify.await_count == 2
@@ -115,6 +115,29 @@ class TestNormalizeTitle:
         assert len(result) == 500
         assert result == "a" * 500
 
+    def test_first_listed_prefix_wins(self) -> None:
+        """'Sr' without a dot and a doubled dot both normalize like 'Sr.'."""
+        assert normalize_title("Sr Engineer") == "senior engineer"
+        assert normalize_title("Sr.. Engineer") == "senior engineer"
+
+    def test_prefix_requires_following_word(self) -> None:
+        """Prefix words inside a title are not replaced."""
+        assert normalize_title("Leadership Coach") == "leadership coach"
+        assert normalize_title("Team Lead") == "team lead"
+
+    def test_synonym_inside_compound_title(self) -> None:
+        """Synonyms are replaced as whole words within longer titles."""
+        assert normalize_title("Senior SWE, Payments") == (
+            "senior software engineer, payments"
+        )
+        assert normalize_title("Dev Lead") == "developer lead"
+        assert normalize_title("Developer Advocate") == "developer advocate"
+
+    def test_repeated_calls_return_same_result(self) -> None:
+        """Memoized results match the first computation."""
+        first = normalize_title("Sr. Software Developer")
+        assert normalize_title("Sr. Software Developer") == first
+
 
 # =============================================================================
 # Exact Match Tests (REQ-008 §4.5.1)
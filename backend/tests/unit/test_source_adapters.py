@@ -480,7 +480,6 @@ class TestAdzunaFetchJobs:
                 "app.adapters.sources.adzuna.httpx.AsyncClient",
                 return_value=mock_client,
             ),
-            patch("app.adapters.sources.adzuna.asyncio.sleep", new_callable=AsyncMock),
         ):
             result = await adapter.fetch_jobs(params)
 
@@ -505,7 +504,6 @@ class TestAdzunaFetchJobs:
                 "app.adapters.sources.adzuna.httpx.AsyncClient",
                 return_value=mock_client,
             ),
-            patch("app.adapters.sources.adzuna.asyncio.sleep", new_callable=AsyncMock),
         ):
             result = await adapter.fetch_jobs(params)
 
@@ -1843,3 +1841,67 @@ class TestUSAJobsFetchJobs:
             await adapter.fetch_jobs(params)
 
         assert exc_info.value.error_type == SourceErrorType.NETWORK_ERROR
+
+
+# =============================================================================
+# Shared HTTP Client Tests
+# =============================================================================
+
+
+class TestSharedHttpClient:
+    """Tests for the pooled HTTP client shared by all source adapters."""
+
+    async def test_injected_client_is_used_and_not_closed(self) -> None:
+        """An adapter given a client reuses it instead of opening its own."""
+        from app.adapters.sources.adzuna import AdzunaAdapter
+
+        shared = MagicMock()
+        shared.get = AsyncMock(
+            return_value=_make_http_response(
+                json_body={"results": [_make_adzuna_job("1")]}
+            )
+        )
+        shared.aclose = AsyncMock()
+        adapter = AdzunaAdapter(http_client=shared)
+
+        params = _make_search_params(keywords=["python"])
+        with (
+            patch("app.adapters.sources.adzuna.settings", _adzuna_settings_mock()),
+            patch("app.adapters.sources.base.httpx.AsyncClient") as client_cls,
+        ):
+            result = await adapter.fetch_jobs(params)
+
+        assert [job.external_id for job in result] == ["1"]
+        shared.get.assert_awaited_once()
+        shared.aclose.assert_not_awaited()
+        client_cls.assert_not_called()
+
+    async def test_shared_client_is_reused_until_closed(self) -> None:
+        """get_source_http_client returns one client until shutdown closes it."""
+        from app.adapters.sources.http_client import (
+            close_source_http_client,
+            get_source_http_client,
+        )
+
+        first = get_source_http_client()
+        try:
+            assert get_source_http_client() is first
+        finally:
+            await close_source_http_client()
+
+        assert first.is_closed
+        second = get_source_http_client()
+        try:
+            assert second is not first
+        finally:
+            await close_source_http_client()
+
+    def test_factory_injects_shared_client(self) -> None:
+        """get_source_adapter builds adapters around the shared client."""
+        from app.adapters.sources import get_source_adapter
+
+        shared = MagicMock()
+        with patch("app.adapters.sources.get_source_http_client", return_value=shared):
+            adapter = get_source_adapter("Adzuna")
+
+        assert adapter._http_client is shared
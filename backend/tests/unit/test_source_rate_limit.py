@@ -0,0 +1,278 @@
+"""Tests for source rate limiting and concurrent pagination.
+
+REQ-034 §5.3: Each source has one token bucket shared by every poll, and
+paginated adapters keep several page requests in flight within it.
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.adapters.sources.pagination import fetch_pages
+from app.adapters.sources.rate_limit import (
+    RateBudget,
+    TokenBucket,
+    get_source_rate_limiter,
+)
+
+
+class _FakeTime:
+    """Clock whose sleep() advances time instead of waiting."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket.acquire."""
+
+    async def test_burst_is_free_then_paced_at_rate(self) -> None:
+        """Capacity tokens go out at once; later ones wait 1/rate each."""
+        t = _FakeTime()
+        bucket = TokenBucket(rate=0.5, capacity=2, clock=t.clock, sleep=t.sleep)
+
+        for _ in range(4):
+            await bucket.acquire()
+
+        assert t.sleeps == [pytest.approx(2.0), pytest.approx(2.0)]
+        assert t.now == pytest.approx(4.0)
+
+    async def test_idle_time_refills_up_to_capacity(self) -> None:
+        """Tokens accumulate while idle, but never beyond capacity."""
+        t = _FakeTime()
+        bucket = TokenBucket(rate=1.0, capacity=2, clock=t.clock, sleep=t.sleep)
+        await bucket.acquire()
+        await bucket.acquire()
+
+        t.now += 100
+        for _ in range(3):
+            await bucket.acquire()
+
+        assert t.sleeps == [pytest.approx(1.0)]
+
+    async def test_concurrent_waiters_share_the_rate(self) -> None:
+        """Acquires from concurrent polls are paced together."""
+        t = _FakeTime()
+        bucket = TokenBucket(rate=2.0, capacity=1, clock=t.clock, sleep=t.sleep)
+
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+        assert t.now == pytest.approx(2.0)
+
+    def test_rejects_invalid_budget(self) -> None:
+        """Zero rate or capacity would block forever."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1.0, capacity=0)
+
+
+class TestGetSourceRateLimiter:
+    """Tests for the process-wide limiter registry."""
+
+    def test_one_bucket_per_source(self) -> None:
+        """Every adapter instance of a source shares one bucket."""
+        budget = RateBudget(source="test-source", requests_per_second=1.0)
+
+        assert get_source_rate_limiter(budget) is get_source_rate_limiter(budget)
+
+    def test_none_budget_is_unthrottled(self) -> None:
+        """Sources without a budget get no limiter."""
+        assert get_source_rate_limiter(None) is None
+
+    def test_budget_is_split_across_processes(self) -> None:
+        """N processes each get 1/N of the budget, so the fleet stays within it."""
+        budget = RateBudget(source="split-source", requests_per_second=0.6, burst=4)
+
+        bucket = get_source_rate_limiter(budget, processes=3)
+
+        assert bucket is not None
+        assert bucket._rate == pytest.approx(0.2)
+        assert bucket._capacity == 1
+
+    def test_process_count_defaults_to_settings(self) -> None:
+        budget = RateBudget(source="settings-source", requests_per_second=1.0)
+
+        with patch(
+            "app.adapters.sources.rate_limit.settings.source_request_processes", 4
+        ):
+            bucket = get_source_rate_limiter(budget)
+
+        assert bucket is not None
+        assert bucket._rate == pytest.approx(0.25)
+
+
+class TestFetchPages:
+    """Tests for fetch_pages."""
+
+    async def test_remaining_pages_fetched_concurrently(self) -> None:
+        """Once the page count is known, later pages overlap in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def fetch_page(page: int) -> dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"page": page, "pages": 6}
+
+        pages = await fetch_pages(
+            fetch_page,
+            lambda _page, data: data["pages"],
+            first_page=1,
+            max_pages=None,
+            max_in_flight=3,
+        )
+
+        assert [p["page"] for p in pages] == [1, 2, 3, 4, 5, 6]
+        assert peak == 3
+
+    async def test_max_pages_caps_requests(self) -> None:
+        """A reported page count beyond max_pages is cut off."""
+        fetched: list[int] = []
+
+        async def fetch_page(page: int) -> int:
+            fetched.append(page)
+            return page
+
+        await fetch_pages(
+            fetch_page,
+            lambda _page, _: 50,
+            first_page=0,
+            max_pages=4,
+            max_in_flight=2,
+        )
+
+        assert sorted(fetched) == [0, 1, 2, 3]
+
+    async def test_open_ended_source_walks_one_page_at_a_time(self) -> None:
+        """Without a page count, each page decides whether another follows."""
+        sizes = {1: 2, 2: 2, 3: 1}
+
+        async def fetch_page(page: int) -> int:
+            return sizes[page]
+
+        pages = await fetch_pages(
+            fetch_page,
+            lambda page, size: page + 1 if size == 2 else page,
+            first_page=1,
+            max_pages=10,
+            max_in_flight=3,
+        )
+
+        assert pages == [2, 2, 1]
+
+    async def test_results_after_terminal_page_are_dropped(self) -> None:
+        """An empty page mid-batch ends the result set."""
+
+        async def fetch_page(page: int) -> list[int]:
+            return [] if page == 2 else [page]
+
+        pages = await fetch_pages(
+            fetch_page,
+            lambda page, items: page if not items else 4,
+            first_page=1,
+            max_pages=None,
+            max_in_flight=4,
+        )
+
+        assert pages == [[1], []]
+
+    async def test_page_error_cancels_pending_pages(self) -> None:
+        """One failed page fails the fetch and cancels the rest."""
+        cancelled: list[int] = []
+
+        async def fetch_page(page: int) -> int:
+            if page == 2:
+                raise RuntimeError("boom")
+            if page > 2:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(page)
+                    raise
+            return page
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await fetch_pages(
+                fetch_page,
+                lambda _page, _: 4,
+                first_page=1,
+                max_pages=None,
+                max_in_flight=4,
+            )
+
+        await asyncio.sleep(0)
+        assert sorted(cancelled) == [3, 4]
+
+
+class TestAdapterPagination:
+    """Tests for adapters paging through the shared limiter."""
+
+    async def test_adzuna_uses_count_and_takes_a_token_per_request(self) -> None:
+        """Adzuna requests every page implied by count, each behind a token."""
+        from app.adapters.sources.adzuna import AdzunaAdapter
+        from app.adapters.sources.base import SearchParams
+
+        def page(page_number: int) -> MagicMock:
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "count": 5,
+                "results": [
+                    {
+                        "id": f"{page_number}-{i}",
+                        "title": "Dev",
+                        "company": {"display_name": "Co"},
+                        "description": "Build",
+                        "redirect_url": "https://adzuna.com/jobs/1",
+                    }
+                    for i in range(2 if page_number < 3 else 1)
+                ],
+            }
+            return response
+
+        async def get(url: str, **_kwargs: Any) -> MagicMock:
+            return page(int(url.rsplit("/", 1)[1]))
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=get)
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+        settings = MagicMock()
+        settings.adzuna_app_id = "id"
+        settings.adzuna_app_key.get_secret_value.return_value = "key"
+
+        adapter = AdzunaAdapter(http_client=client, rate_limiter=limiter)
+        with patch("app.adapters.sources.adzuna.settings", settings):
+            jobs = await adapter.fetch_jobs(
+                SearchParams(keywords=["python"], results_per_page=2)
+            )
+
+        assert [j.external_id for j in jobs] == ["1-0", "1-1", "2-0", "2-1", "3-0"]
+        assert client.get.await_count == 3
+        assert limiter.acquire.await_count == 3
+
+    def test_factory_injects_source_rate_limiter(self) -> None:
+        """Adapters from the factory share their source's bucket."""
+        from app.adapters.sources import get_source_adapter
+        from app.adapters.sources.adzuna import AdzunaAdapter
+
+        first = get_source_adapter("Adzuna")
+        second = get_source_adapter("Adzuna")
+
+        assert first._rate_limiter is not None
+        assert first._rate_limiter is second._rate_limiter
+        assert first._rate_limiter is get_source_rate_limiter(AdzunaAdapter.rate_budget)
@@ -0,0 +1,263 @@
+"""Tests for the source adapter response cache.
+
+REQ-034 §5.3: Identical source requests are served from the cache,
+revalidated with conditional requests, and fetched once when issued
+concurrently.
+"""
+
+import asyncio
+import zlib
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from app.adapters.sources.response_cache import (
+    CachedResponse,
+    SourceResponseCache,
+    cache_key,
+)
+
+_URL = "https://api.example.com/jobs"
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(
+    status_code: int = 200,
+    json_body: Any = None,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    if json_body is None:
+        return httpx.Response(status_code, headers=headers)
+    return httpx.Response(status_code, json=json_body, headers=headers)
+
+
+def _client(*responses: httpx.Response) -> MagicMock:
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=list(responses))
+    return client
+
+
+class TestCacheKey:
+    """Tests for request normalization."""
+
+    def test_param_order_does_not_matter(self) -> None:
+        """Same params in a different order map to the same key."""
+        assert cache_key(_URL, {"a": 1, "b": "x"}) == cache_key(
+            _URL, {"b": "x", "a": 1}
+        )
+
+    def test_different_params_differ(self) -> None:
+        """Different queries never share an entry."""
+        assert cache_key(_URL, {"page": 1}) != cache_key(_URL, {"page": 2})
+
+    def test_key_does_not_contain_secrets(self) -> None:
+        """API keys in params are hashed, not stored."""
+        assert "s3cret" not in cache_key(_URL, {"app_key": "s3cret"})
+
+
+class TestSourceResponseCache:
+    """Tests for SourceResponseCache.get."""
+
+    async def test_fresh_hit_skips_network(self) -> None:
+        """A second identical request within the TTL is served from memory."""
+        client = _client(_response(json_body=[{"id": 1}]))
+        cache = SourceResponseCache(clock=_Clock())
+
+        first = await cache.get(client, _URL, params={"tag": "python"})
+        second = await cache.get(client, _URL, params={"tag": "python"})
+
+        assert first.json() == [{"id": 1}]
+        assert isinstance(second, CachedResponse)
+        assert second.json() == [{"id": 1}]
+        assert client.get.await_count == 1
+
+    async def test_cached_payload_is_parsed_once(self) -> None:
+        """Repeated hits reuse the payload decoded on the first hit."""
+        client = _client(_response(json_body=[{"id": 1}]))
+        cache = SourceResponseCache(clock=_Clock())
+        await cache.get(client, _URL, params={})
+
+        first = await cache.get(client, _URL, params={})
+        payload = first.json()
+        second = await cache.get(client, _URL, params={})
+
+        with patch(
+            "app.adapters.sources.response_cache.json.loads", side_effect=AssertionError
+        ):
+            assert second.json() is payload
+
+    async def test_parsed_payload_counts_against_budget(self) -> None:
+        """Decoding an entry charges its uncompressed size to the budget."""
+        body = [{"id": i, "title": f"Job {i}"} for i in range(50)]
+        raw = _response(json_body=body).content
+        compressed = len(zlib.compress(raw))
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=lambda *_a, **_k: _response(json_body=body))
+        cache = SourceResponseCache(
+            max_total_bytes=2 * compressed + len(raw), clock=_Clock()
+        )
+        await cache.get(client, _URL, params={"page": 0})
+        await cache.get(client, _URL, params={"page": 1})
+        assert len(cache) == 2
+
+        (await cache.get(client, _URL, params={"page": 1})).json()
+
+        assert len(cache) == 2
+        (await cache.get(client, _URL, params={"page": 0})).json()
+        assert len(cache) == 1
+
+    async def test_max_age_expiry_refetches(self) -> None:
+        """Without validators, an expired entry is dropped and refetched."""
+        clock = _Clock()
+        client = _client(
+            _response(json_body={"v": 1}, headers={"Cache-Control": "max-age=60"}),
+            _response(json_body={"v": 2}),
+        )
+        cache = SourceResponseCache(clock=clock)
+
+        await cache.get(client, _URL, params={})
+        clock.now += 61
+        result = await cache.get(client, _URL, params={})
+
+        assert result.json() == {"v": 2}
+        assert "headers" not in client.get.call_args.kwargs
+
+    async def test_stale_entry_is_revalidated_with_validators(self) -> None:
+        """An expired entry sends If-None-Match / If-Modified-Since."""
+        clock = _Clock()
+        client = _client(
+            _response(
+                json_body={"v": 1},
+                headers={
+                    "Cache-Control": "max-age=60",
+                    "ETag": '"abc"',
+                    "Last-Modified": "Wed, 14 Oct 2026 10:00:00 GMT",
+                },
+            ),
+            _response(304, headers={"Cache-Control": "max-age=60"}),
+        )
+        cache = SourceResponseCache(clock=clock)
+
+        await cache.get(client, _URL, params={}, headers={"User-Agent": "t"})
+        clock.now += 61
+        result = await cache.get(client, _URL, params={}, headers={"User-Agent": "t"})
+
+        sent = client.get.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"abc"'
+        assert sent["If-Modified-Since"] == "Wed, 14 Oct 2026 10:00:00 GMT"
+        assert sent["User-Agent"] == "t"
+        assert isinstance(result, CachedResponse)
+        assert result.status_code == 200
+        assert result.json() == {"v": 1}
+
+        # The 304 renewed freshness: no third request.
+        await cache.get(client, _URL, params={})
+        assert client.get.await_count == 2
+
+    async def test_no_store_is_not_cached(self) -> None:
+        """Cache-Control: no-store responses always go to the network."""
+        client = _client(
+            _response(json_body={"v": 1}, headers={"Cache-Control": "no-store"}),
+            _response(json_body={"v": 2}, headers={"Cache-Control": "no-store"}),
+        )
+        cache = SourceResponseCache(clock=_Clock())
+
+        await cache.get(client, _URL, params={})
+        result = await cache.get(client, _URL, params={})
+
+        assert result.json() == {"v": 2}
+        assert len(cache) == 0
+
+    async def test_error_responses_are_returned_and_not_cached(self) -> None:
+        """Non-200 responses pass through untouched for adapter handling."""
+        error = _response(429, headers={"Retry-After": "30"})
+        client = _client(error, _response(json_body={"v": 1}))
+        cache = SourceResponseCache(clock=_Clock())
+
+        first = await cache.get(client, _URL, params={})
+        second = await cache.get(client, _URL, params={})
+
+        assert first is error
+        assert second.json() == {"v": 1}
+
+    async def test_concurrent_identical_requests_share_one_fetch(self) -> None:
+        """Requests issued while a fetch is in flight wait for it."""
+        release = asyncio.Event()
+
+        async def slow_get(*_args: Any, **_kwargs: Any) -> httpx.Response:
+            await release.wait()
+            return _response(json_body={"v": 1})
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=slow_get)
+        cache = SourceResponseCache(clock=_Clock())
+
+        tasks = [
+            asyncio.ensure_future(cache.get(client, _URL, params={"q": "x"}))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert [r.json() for r in results] == [{"v": 1}] * 3
+        assert client.get.await_count == 1
+
+    async def test_lru_eviction_respects_byte_budget(self) -> None:
+        """Least recently used entries are evicted beyond the budget."""
+        body = [{"id": i, "title": f"Job {i}"} for i in range(50)]
+        compressed = len(zlib.compress(_response(json_body=body).content))
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=lambda *_a, **_k: _response(json_body=body))
+        cache = SourceResponseCache(max_total_bytes=3 * compressed, clock=_Clock())
+
+        for page in range(10):
+            await cache.get(client, _URL, params={"page": page})
+
+        assert len(cache) == 3
+        await cache.get(client, _URL, params={"page": 9})
+        assert client.get.await_count == 10
+        await cache.get(client, _URL, params={"page": 0})
+        assert client.get.await_count == 11
+
+
+class TestAdapterUsesCache:
+    """Tests for adapter integration through JobSourceAdapter._get."""
+
+    async def test_remoteok_feed_fetched_once(self) -> None:
+        """Two polls of the same RemoteOK feed make one network call."""
+        from app.adapters.sources.base import SearchParams
+        from app.adapters.sources.remoteok import RemoteOKAdapter
+
+        feed = [
+            {"legal": "notice"},
+            {
+                "id": "1",
+                "position": "Dev",
+                "company": "Co",
+                "description": "Build",
+                "url": "https://remoteok.com/jobs/1",
+            },
+        ]
+        client = _client(_response(json_body=feed))
+        adapter = RemoteOKAdapter(
+            http_client=client, response_cache=SourceResponseCache(clock=_Clock())
+        )
+        params = SearchParams(keywords=["python"])
+
+        first = await adapter.fetch_jobs(params)
+        second = await adapter.fetch_jobs(params)
+
+        assert [j.external_id for j in first] == ["1"]
+        assert [j.external_id for j in second] == ["1"]
+        assert client.get.await_count == 1
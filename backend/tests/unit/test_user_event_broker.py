@@ -0,0 +1,217 @@
+"""Tests for the cross-process per-user SSE event broker.
+
+REQ-006 §2.5: Background work publishes data_changed events to the
+user's open chat streams, in whichever process holds them.
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.schemas.chat import DataChangedEvent, ToolResultEvent
+from app.services.user_event_broker import (
+    UserEventBroker,
+    UserEventListener,
+    decode_user_event,
+    encode_user_event,
+    get_event_broker,
+    notify_user_event,
+    reset_event_broker,
+)
+
+_EVENT = DataChangedEvent(resource="job-posting", id="abc", action="updated")
+_USER = "00000000-0000-0000-0000-000000000001"
+
+
+class TestUserEventBroker:
+    """Tests for UserEventBroker subscribe/publish."""
+
+    async def test_publish_reaches_only_that_users_subscribers(self) -> None:
+        broker = UserEventBroker()
+        user_id, other_id = uuid.uuid4(), uuid.uuid4()
+
+        async with (
+            broker.subscribe(user_id) as queue,
+            broker.subscribe(other_id) as other_queue,
+        ):
+            delivered = broker.publish(user_id, _EVENT)
+
+            assert delivered == 1
+            assert queue.get_nowait() == _EVENT
+            assert other_queue.empty()
+
+    async def test_publish_without_subscribers_is_noop(self) -> None:
+        broker = UserEventBroker()
+
+        assert broker.publish(uuid.uuid4(), _EVENT) == 0
+
+    async def test_unsubscribe_on_exit(self) -> None:
+        broker = UserEventBroker()
+        user_id = uuid.uuid4()
+
+        async with broker.subscribe(user_id):
+            assert broker.subscriber_count(user_id) == 1
+
+        assert broker.subscriber_count(user_id) == 0
+
+    async def test_full_queue_drops_event(self) -> None:
+        broker = UserEventBroker()
+        user_id = uuid.uuid4()
+
+        async with broker.subscribe(user_id) as queue:
+            while not queue.full():
+                queue.put_nowait(_EVENT)
+
+            assert broker.publish(user_id, _EVENT) == 0
+
+    async def test_subscriber_limit_evicts_existing(self) -> None:
+        broker = UserEventBroker()
+        user_id = uuid.uuid4()
+        contexts = [broker.subscribe(user_id) for _ in range(11)]
+
+        for ctx in contexts:
+            await ctx.__aenter__()
+        try:
+            assert broker.subscriber_count(user_id) == 10
+        finally:
+            for ctx in contexts:
+                await ctx.__aexit__(None, None, None)
+        assert broker.subscriber_count(user_id) == 0
+
+
+class TestSingleton:
+    """Tests for get_event_broker/reset_event_broker."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        reset_event_broker()
+        yield
+        reset_event_broker()
+
+    def test_returns_same_instance(self) -> None:
+        assert get_event_broker() is get_event_broker()
+
+    def test_reset_creates_new_instance(self) -> None:
+        first = get_event_broker()
+        reset_event_broker()
+        assert get_event_broker() is not first
+
+
+async def test_subscriber_receives_event_published_while_waiting() -> None:
+    broker = UserEventBroker()
+    user_id = uuid.uuid4()
+
+    async with broker.subscribe(user_id) as queue:
+        waiter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        broker.publish(user_id, _EVENT)
+
+        assert await asyncio.wait_for(waiter, timeout=1) == _EVENT
+
+
+class TestNotificationPayload:
+    """Tests for encode_user_event/decode_user_event."""
+
+    def test_round_trip_keeps_event_type(self) -> None:
+        user_id = uuid.uuid4()
+        event = ToolResultEvent(tool="search", success=True, result={"n": 1})
+
+        decoded = decode_user_event(encode_user_event(user_id, event))
+
+        assert decoded == (user_id, event)
+        assert isinstance(decoded[1], ToolResultEvent)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            "not json",
+            "{}",
+            '{"user_id": "nope", "event": {"type": "data_changed"}}',
+            f'{{"user_id": "{_USER}", "event": {{"type": "unknown"}}}}',
+            f'{{"user_id": "{_USER}", "event": {{"type": "data_changed"}}}}',
+        ],
+    )
+    def test_malformed_payload_is_ignored(self, payload: str) -> None:
+        assert decode_user_event(payload) is None
+
+
+async def test_notify_user_event_sends_pg_notify_in_callers_session() -> None:
+    db = AsyncMock()
+    user_id = uuid.uuid4()
+
+    await notify_user_event(db, user_id, _EVENT)
+
+    statement, params = db.execute.await_args.args
+    assert "pg_notify" in str(statement)
+    assert decode_user_event(params["payload"]) == (user_id, _EVENT)
+    db.commit.assert_not_awaited()
+
+
+def _listener_engine() -> tuple[MagicMock, MagicMock, MagicMock]:
+    """Create a mock engine whose connection exposes an asyncpg driver."""
+    driver = MagicMock()
+    driver.add_listener = AsyncMock()
+    conn = MagicMock()
+    conn.execution_options = AsyncMock(return_value=conn)
+    conn.get_raw_connection = AsyncMock(
+        return_value=MagicMock(driver_connection=driver)
+    )
+    conn.scalar = AsyncMock(return_value=1)
+    conn.invalidate = AsyncMock()
+    engine = MagicMock()
+    engine.connect = AsyncMock(return_value=conn)
+    return engine, conn, driver
+
+
+class TestUserEventListener:
+    """Tests for UserEventListener."""
+
+    async def test_dispatch_delivers_to_local_subscribers(self) -> None:
+        broker = UserEventBroker()
+        listener = UserEventListener(MagicMock(), broker=broker)
+        user_id = uuid.uuid4()
+
+        async with broker.subscribe(user_id) as queue:
+            delivered = listener.dispatch(encode_user_event(user_id, _EVENT))
+
+            assert delivered == 1
+            assert queue.get_nowait() == _EVENT
+
+    async def test_dispatch_ignores_malformed_payload(self) -> None:
+        listener = UserEventListener(MagicMock(), broker=UserEventBroker())
+
+        assert listener.dispatch("not json") == 0
+
+    async def test_listens_and_closes_connection_on_stop(self) -> None:
+        engine, conn, driver = _listener_engine()
+        broker = UserEventBroker()
+        listener = UserEventListener(engine, broker=broker, retry_seconds=60)
+        user_id = uuid.uuid4()
+
+        listener.start()
+        await asyncio.sleep(0.01)
+        assert listener.is_running is True
+        conn.execution_options.assert_awaited_once_with(isolation_level="AUTOCOMMIT")
+        channel, callback = driver.add_listener.await_args.args
+
+        async with broker.subscribe(user_id) as queue:
+            callback(driver, 1, channel, encode_user_event(user_id, _EVENT))
+            assert queue.get_nowait() == _EVENT
+
+        await listener.stop()
+        assert listener.is_running is False
+        conn.invalidate.assert_awaited_once()
+
+    async def test_reconnects_after_connection_loss(self) -> None:
+        engine, conn, driver = _listener_engine()
+        conn.scalar.side_effect = [ConnectionError("gone"), 1, 1, 1]
+        listener = UserEventListener(engine, retry_seconds=0.01)
+
+        listener.start()
+        await asyncio.sleep(0.1)
+        await listener.stop()
+
+        assert engine.connect.await_count >= 2
+        assert driver.add_listener.await_count >= 2
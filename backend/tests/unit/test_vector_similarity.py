@@ -0,0 +1,143 @@
+"""Unit tests for vectorized cosine similarity.
+
+REQ-008 §10.1: Batch Scoring — vectorized similarity for whole batches.
+
+Tests cover:
+- Agreement with scalar cosine_similarity
+- Zero vectors and clamping
+- Input validation (dimensions, NaN/Inf, empty input)
+- Batch soft skills scores
+"""
+
+import math
+
+import pytest
+
+from app.services.scoring.fit_score import FIT_NEUTRAL_SCORE
+from app.services.scoring.soft_skills_match import (
+    calculate_soft_skills_score,
+    calculate_soft_skills_scores_batch,
+    cosine_similarity,
+)
+from app.services.scoring.vector_similarity import (
+    batch_cosine_similarity,
+    stack_embeddings,
+)
+
+# =============================================================================
+# Matrix Construction Tests
+# =============================================================================
+
+
+class TestStackEmbeddings:
+    """Tests for stacking vectors into a matrix."""
+
+    def test_shape_matches_input(self) -> None:
+        """Matrix has one row per vector and one column per dimension."""
+        matrix = stack_embeddings([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        assert matrix.shape == (2, 3)
+        assert matrix.flags["C_CONTIGUOUS"]
+
+    def test_empty_input_raises(self) -> None:
+        """Empty vector list is rejected."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            stack_embeddings([])
+
+    def test_ragged_vectors_raise(self) -> None:
+        """Vectors of different lengths are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            stack_embeddings([[1.0, 2.0], [1.0]])
+
+    def test_non_finite_values_raise(self) -> None:
+        """NaN and Inf values are rejected."""
+        with pytest.raises(ValueError, match="finite"):
+            stack_embeddings([[1.0, math.nan]])
+        with pytest.raises(ValueError, match="finite"):
+            stack_embeddings([[math.inf, 1.0]])
+
+    def test_oversized_dimensions_raise(self) -> None:
+        """Vectors over the dimension limit are rejected."""
+        with pytest.raises(ValueError, match="maximum dimensions"):
+            stack_embeddings([[0.1] * 5001])
+
+
+# =============================================================================
+# Batch Cosine Similarity Tests
+# =============================================================================
+
+
+class TestBatchCosineSimilarity:
+    """Tests for one-vs-many cosine similarity."""
+
+    def test_matches_scalar_cosine(self) -> None:
+        """Each row agrees with the scalar cosine_similarity."""
+        query = [0.3, -0.2, 0.9, 0.1]
+        rows = [
+            [0.1, 0.2, 0.3, 0.4],
+            [-0.5, 0.5, -0.5, 0.5],
+            [0.3, -0.2, 0.9, 0.1],
+        ]
+        result = batch_cosine_similarity(query, stack_embeddings(rows))
+        expected = [cosine_similarity(query, row) for row in rows]
+        assert result == pytest.approx(expected, abs=1e-12)
+
+    def test_zero_row_returns_zero(self) -> None:
+        """Zero vectors are treated as orthogonal."""
+        result = batch_cosine_similarity(
+            [1.0, 0.0], stack_embeddings([[0.0, 0.0], [1.0, 0.0]])
+        )
+        assert result == [0.0, pytest.approx(1.0)]
+
+    def test_zero_query_returns_zeros(self) -> None:
+        """A zero query vector gives 0.0 for every row."""
+        result = batch_cosine_similarity(
+            [0.0, 0.0], stack_embeddings([[1.0, 0.0], [0.0, 1.0]])
+        )
+        assert result == [0.0, 0.0]
+
+    def test_results_clamped(self) -> None:
+        """Results never leave [-1, 1]."""
+        vec = [0.1] * 768
+        result = batch_cosine_similarity(vec, stack_embeddings([vec]))
+        assert -1.0 <= result[0] <= 1.0
+
+    def test_dimension_mismatch_raises(self) -> None:
+        """Query must match matrix dimensions."""
+        with pytest.raises(ValueError, match="same length"):
+            batch_cosine_similarity([1.0, 0.0, 0.0], stack_embeddings([[1.0, 0.0]]))
+
+    def test_non_finite_query_raises(self) -> None:
+        """NaN in the query is rejected."""
+        with pytest.raises(ValueError, match="finite"):
+            batch_cosine_similarity([math.nan, 0.0], stack_embeddings([[1.0, 0.0]]))
+
+
+# =============================================================================
+# Batch Soft Skills Score Tests
+# =============================================================================
+
+
+class TestSoftSkillsScoresBatch:
+    """Tests for calculate_soft_skills_scores_batch."""
+
+    def test_matches_scalar_scores(self) -> None:
+        """Batch scores agree with calculate_soft_skills_score per job."""
+        persona = [0.2, 0.4, -0.1]
+        jobs = [[0.2, 0.4, -0.1], [0.0, 0.0, 0.0], [-0.2, -0.4, 0.1]]
+        result = calculate_soft_skills_scores_batch(persona, jobs)
+        expected = [calculate_soft_skills_score(persona, job) for job in jobs]
+        assert result == pytest.approx(expected, abs=1e-9)
+
+    def test_missing_persona_embedding_returns_neutral(self) -> None:
+        """No persona embedding gives the neutral score for every job."""
+        result = calculate_soft_skills_scores_batch(None, [[0.1], [0.2]])
+        assert result == [FIT_NEUTRAL_SCORE, FIT_NEUTRAL_SCORE]
+
+    def test_no_jobs_returns_empty(self) -> None:
+        """Empty batch returns an empty list."""
+        assert calculate_soft_skills_scores_batch([0.1], []) == []
+
+    def test_empty_persona_embedding_raises(self) -> None:
+        """Empty persona embedding is rejected."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            calculate_soft_skills_scores_batch([], [[0.1]])